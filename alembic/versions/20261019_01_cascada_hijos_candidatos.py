@@ -0,0 +1,50 @@
+"""ON DELETE CASCADE en las tablas hijas de candidatos
+
+Revision ID: 20261019_01
+Revises:
+Create Date: 2026-10-19 09:00:00.000000
+
+Las llaves foráneas de educacion, experiencia_laboral y preferencias_disponibilidad
+hacia candidatos se recrean con ON DELETE CASCADE (candidato_conocimientos ya lo
+tenía), para que el borrado de candidatos no dependa de la cascada del ORM.
+
+Las bases creadas con `Base.metadata.create_all` ya incluyen la cascada desde los
+modelos; en SQLite esta migración no hace nada.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_01"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLAS_HIJAS = ("educacion", "experiencia_laboral", "preferencias_disponibilidad")
+
+
+def _recrear_llave(tabla: str, ondelete: Union[str, None]) -> None:
+    nombre = f"{tabla}_id_candidato_fkey"
+    op.execute(f"ALTER TABLE {tabla} DROP CONSTRAINT IF EXISTS {nombre}")
+    op.create_foreign_key(
+        nombre, tabla, "candidatos", ["id_candidato"], ["id_candidato"], ondelete=ondelete
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for tabla in TABLAS_HIJAS:
+        _recrear_llave(tabla, "CASCADE")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for tabla in TABLAS_HIJAS:
+        _recrear_llave(tabla, None)
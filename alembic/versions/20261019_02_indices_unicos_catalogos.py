@@ -0,0 +1,45 @@
+"""Índices únicos sin distinguir mayúsculas en los catálogos
+
+Revision ID: 20261019_02
+Revises: 20261019_01
+Create Date: 2026-10-19 12:00:00.000000
+
+Reemplazan las consultas `ilike` previas a cada inserción: la creación de
+catálogos hace un único `INSERT ... RETURNING` y el duplicado se detecta por la
+violación del índice. Si la tabla ya contiene nombres repetidos (ignorando
+mayúsculas), deben depurarse antes de aplicar esta migración.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_02"
+down_revision: Union[str, None] = "20261019_01"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDICES = [
+    ("uq_departamentos_nombre_lower", "departamentos", ["lower(trim(nombre_departamento))"]),
+    ("uq_ciudades_nombre_lower_departamento", "ciudades", ["lower(nombre_ciudad)", "id_departamento"]),
+    ("uq_centros_costos_nombre_lower", "centros_costos", ["lower(nombre_centro_costos)"]),
+    ("uq_habilidades_blandas_nombre_lower", "habilidades_blandas", ["lower(nombre_habilidad_blanda)"]),
+    ("uq_habilidades_tecnicas_nombre_lower", "habilidades_tecnicas", ["lower(nombre_habilidad_tecnica)"]),
+    ("uq_herramientas_nombre_lower", "herramientas", ["lower(nombre_herramienta)"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for nombre, tabla, expresiones in INDICES:
+        op.create_index(
+            nombre, tabla, [sa.text(e) for e in expresiones], unique=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for nombre, tabla, _ in reversed(INDICES):
+        op.drop_index(nombre, table_name=tabla, if_exists=True)
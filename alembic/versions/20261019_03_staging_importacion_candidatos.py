@@ -0,0 +1,87 @@
+"""Tablas de staging para la importación masiva de candidatos
+
+Revision ID: 20261019_03
+Revises: 20261019_02
+Create Date: 2026-10-19 15:00:00.000000
+
+En PostgreSQL se crean UNLOGGED: sus filas solo viven durante una importación,
+así que no necesitan WAL ni sobrevivir a una caída del servidor.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_03"
+down_revision: Union[str, None] = "20261019_02"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNAS_TEXTO = (
+    "nombre_completo", "correo_electronico", "cc", "telefono", "departamento", "ciudad",
+    "cargo", "descripcion_perfil", "nombre_referido", "nivel_educacion", "titulo",
+    "institucion", "nivel_ingles", "rango_experiencia", "ultima_empresa", "ultimo_cargo",
+    "funciones", "disponibilidad_inicio", "rango_salarial", "motivo_salida",
+)
+COLUMNAS_FECHA = ("fecha_nacimiento", "fecha_inicio", "fecha_fin")
+COLUMNAS_BOOLEANAS = (
+    "trabaja_actualmente_joyco", "ha_trabajado_joyco", "tiene_referido",
+    "acepta_politica_datos", "disponibilidad_viajar", "trabaja_actualmente",
+)
+COLUMNAS_ENTERAS = (
+    "anio_graduacion", "id_ciudad", "id_cargo", "id_nivel_educacion", "id_titulo",
+    "id_institucion", "id_nivel_ingles", "id_rango_experiencia", "id_disponibilidad_inicio",
+    "id_rango_salarial", "id_motivo_salida",
+)
+
+
+def _prefijos() -> list:
+    return ["UNLOGGED"] if op.get_bind().dialect.name == "postgresql" else []
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "staging_candidatos",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("id_importacion", sa.String(36), nullable=False),
+        sa.Column("fila", sa.Integer(), nullable=False),
+        sa.Column("errores", sa.Text(), nullable=True),
+        sa.Column("id_candidato", sa.Integer(), nullable=True),
+        *(sa.Column(c, sa.Text()) for c in COLUMNAS_TEXTO),
+        *(sa.Column(c, sa.Date()) for c in COLUMNAS_FECHA),
+        *(sa.Column(c, sa.Boolean()) for c in COLUMNAS_BOOLEANAS),
+        *(sa.Column(c, sa.Integer()) for c in COLUMNAS_ENTERAS),
+        prefixes=_prefijos(),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_staging_candidatos_importacion_fila", "staging_candidatos",
+        ["id_importacion", "fila"], if_not_exists=True,
+    )
+
+    op.create_table(
+        "staging_conocimientos",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("id_importacion", sa.String(36), nullable=False),
+        sa.Column("fila", sa.Integer(), nullable=False),
+        sa.Column("tipo_conocimiento", sa.String(50), nullable=False),
+        sa.Column("nombre", sa.Text(), nullable=False),
+        sa.Column("id_habilidad_blanda", sa.Integer()),
+        sa.Column("id_habilidad_tecnica", sa.Integer()),
+        sa.Column("id_herramienta", sa.Integer()),
+        prefixes=_prefijos(),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_staging_conocimientos_importacion_fila", "staging_conocimientos",
+        ["id_importacion", "fila"], if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("staging_conocimientos", if_exists=True)
+    op.drop_table("staging_candidatos", if_exists=True)
@@ -0,0 +1,45 @@
+"""Tabla de claves de idempotencia
+
+Revision ID: 20261019_04
+Revises: 20261019_03
+Create Date: 2026-10-19 17:00:00.000000
+
+Guarda, por cada encabezado `Idempotency-Key`, el hash de la solicitud y la
+respuesta original, para que los reintentos no vuelvan a ejecutar el endpoint.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_04"
+down_revision: Union[str, None] = "20261019_03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "claves_idempotencia",
+        sa.Column("clave", sa.String(255), primary_key=True),
+        sa.Column("ruta", sa.String(255), nullable=False),
+        sa.Column("hash_solicitud", sa.String(64), nullable=False),
+        sa.Column("codigo_estado", sa.Integer(), nullable=True),
+        sa.Column("tipo_contenido", sa.String(100), nullable=True),
+        sa.Column("cuerpo_respuesta", sa.LargeBinary(), nullable=True),
+        sa.Column("fecha_creacion", sa.TIMESTAMP(), nullable=False),
+        sa.Column("fecha_expiracion", sa.TIMESTAMP(), nullable=False),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_claves_idempotencia_fecha_expiracion", "claves_idempotencia",
+        ["fecha_expiracion"], if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("claves_idempotencia", if_exists=True)
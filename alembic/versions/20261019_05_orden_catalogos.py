@@ -0,0 +1,65 @@
+"""Columna generada es_otro e índice de orden en los catálogos
+
+Revision ID: 20261019_05
+Revises: 20261019_04
+Create Date: 2026-10-19 16:00:00.000000
+
+`ordenar_por_nombre` ordenaba con un `CASE ... ILIKE 'otro'` que ningún índice
+puede resolver. La columna `es_otro` es generada (STORED): PostgreSQL la calcula
+para las filas existentes al agregarla y la mantiene en cada INSERT/UPDATE. Con el
+índice (`es_otro`, nombre) las lecturas ordenadas de los catálogos son recorridos
+de índice.
+
+Si la columna ya existe (la creó `create_all` en `python -m app.cli.cargar_catalogos`)
+no se vuelve a agregar.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_05"
+down_revision: Union[str, None] = "20261019_04"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CATALOGOS = [
+    ("ciudades", "nombre_ciudad"),
+    ("cargos_ofrecidos", "nombre_cargo"),
+    ("centros_costos", "nombre_centro_costos"),
+    ("titulos_obtenidos", "nombre_titulo"),
+    ("instituciones_academicas", "nombre_institucion"),
+    ("habilidades_blandas", "nombre_habilidad_blanda"),
+    ("habilidades_tecnicas", "nombre_habilidad_tecnica"),
+    ("herramientas", "nombre_herramienta"),
+    ("motivos_salida", "descripcion_motivo"),
+]
+
+
+def _tiene_columna(tabla: str, columna: str) -> bool:
+    return any(c["name"] == columna for c in sa.inspect(op.get_bind()).get_columns(tabla))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for tabla, campo in CATALOGOS:
+        if not _tiene_columna(tabla, "es_otro"):
+            op.add_column(
+                tabla,
+                sa.Column(
+                    "es_otro",
+                    sa.Boolean(),
+                    sa.Computed(f"lower({campo}) IN ('otro', 'otros')", persisted=True),
+                ),
+            )
+        op.create_index(f"ix_{tabla}_orden", tabla, ["es_otro", campo], if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for tabla, _ in reversed(CATALOGOS):
+        op.drop_index(f"ix_{tabla}_orden", table_name=tabla, if_exists=True)
+        if _tiene_columna(tabla, "es_otro"):
+            op.drop_column(tabla, "es_otro")
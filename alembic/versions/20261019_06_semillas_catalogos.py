@@ -0,0 +1,38 @@
+"""Tabla de checksums de la carga de catálogos
+
+Revision ID: 20261019_06
+Revises: 20261019_05
+Create Date: 2026-10-19 18:00:00.000000
+
+La carga de catálogos (`python -m app.cli.cargar_catalogos`) guarda el checksum de
+cada CSV para no volver a procesar los archivos que no cambiaron.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_06"
+down_revision: Union[str, None] = "20261019_05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "semillas_catalogos",
+        sa.Column("archivo", sa.String(100), primary_key=True),
+        sa.Column("tabla", sa.String(100), nullable=False),
+        sa.Column("checksum", sa.String(64), nullable=False),
+        sa.Column("filas_insertadas", sa.Integer(), nullable=False),
+        sa.Column("fecha_carga", sa.TIMESTAMP(), nullable=False),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("semillas_catalogos", if_exists=True)
@@ -0,0 +1,76 @@
+"""Tablas de trabajos de exportación, ejecuciones de jobs y versión de datos
+
+Revision ID: 20261019_07
+Revises: 20261019_06
+Create Date: 2026-10-19 19:00:00.000000
+
+`export_jobs` (exportaciones en segundo plano), `ejecuciones_jobs` (historial de
+los jobs programados) y `version_datos` (clave de la caché de reportes) solo se
+creaban con `create_all`. Como las demás migraciones, no falla si las tablas ya
+existen.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_07"
+down_revision: Union[str, None] = "20261019_06"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "export_jobs",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("tipo", sa.String(10), nullable=False),
+        sa.Column("año", sa.Integer(), nullable=True),
+        sa.Column("estado", sa.String(20), nullable=False),
+        sa.Column("progreso", sa.Integer(), nullable=False),
+        sa.Column("ruta_archivo", sa.String(500), nullable=True),
+        sa.Column("nombre_archivo", sa.String(255), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("fecha_creacion", sa.TIMESTAMP(), server_default=sa.func.current_timestamp()),
+        sa.Column("fecha_actualizacion", sa.TIMESTAMP(), server_default=sa.func.current_timestamp()),
+        sa.Column("fecha_expiracion", sa.TIMESTAMP(), nullable=True),
+        if_not_exists=True,
+    )
+    op.create_index("ix_export_jobs_estado", "export_jobs", ["estado"], if_not_exists=True)
+    op.create_index(
+        "ix_export_jobs_fecha_expiracion", "export_jobs", ["fecha_expiracion"], if_not_exists=True
+    )
+
+    op.create_table(
+        "ejecuciones_jobs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("nombre_job", sa.String(100), nullable=False),
+        sa.Column("estado", sa.String(20), nullable=False),
+        sa.Column("fecha_inicio", sa.TIMESTAMP(), server_default=sa.func.current_timestamp()),
+        sa.Column("fecha_fin", sa.TIMESTAMP(), nullable=True),
+        sa.Column("duracion_ms", sa.Integer(), nullable=True),
+        sa.Column("filas_afectadas", sa.Integer(), nullable=False),
+        sa.Column("detalle", sa.Text(), nullable=True),
+        if_not_exists=True,
+    )
+    op.create_index("ix_ejecuciones_jobs_id", "ejecuciones_jobs", ["id"], if_not_exists=True)
+    op.create_index(
+        "ix_ejecuciones_jobs_nombre_job", "ejecuciones_jobs", ["nombre_job"], if_not_exists=True
+    )
+
+    op.create_table(
+        "version_datos",
+        sa.Column("ambito", sa.String(50), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("version_datos", if_exists=True)
+    op.drop_table("ejecuciones_jobs", if_exists=True)
+    op.drop_table("export_jobs", if_exists=True)
@@ -0,0 +1,37 @@
+"""Propietario de los trabajos de exportación
+
+Revision ID: 20261019_08
+Revises: 20261019_07
+Create Date: 2026-10-19 20:00:00.000000
+
+El worker que toma un trabajo de exportación queda registrado en `propietario`;
+solo él puede completarlo o marcarlo como fallido, de modo que un trabajo que la
+recuperación de estancados ya dio por FALLIDO no vuelve a COMPLETADO.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_08"
+down_revision: Union[str, None] = "20261019_07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _tiene_columna(tabla: str, columna: str) -> bool:
+    return any(c["name"] == columna for c in sa.inspect(op.get_bind()).get_columns(tabla))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _tiene_columna("export_jobs", "propietario"):
+        op.add_column("export_jobs", sa.Column("propietario", sa.String(100), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _tiene_columna("export_jobs", "propietario"):
+        op.drop_column("export_jobs", "propietario")
@@ -0,0 +1,42 @@
+"""Crea las tablas que falten y carga los catálogos desde sus archivos CSV.
+
+Paso único por despliegue (la API ya no lo hace al iniciar). Los archivos cuyo
+checksum no cambió desde la última carga se omiten.
+
+Uso::
+
+    python -m app.cli.cargar_catalogos
+    python -m app.cli.cargar_catalogos --directorio /srv/catalogos --forzar
+"""
+
+import argparse
+import sys
+import time
+
+from app.core.init_db import init_db
+from app.core.populate_catalogs import DATA_DIR
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--directorio", default=DATA_DIR, help="Directorio de los CSV de catálogos")
+    parser.add_argument("--forzar", action="store_true", help="Procesa los archivos aunque no hayan cambiado")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    resultados = init_db(args.directorio, args.forzar)
+    if not resultados:
+        return 1
+
+    insertadas = sum(r.insertadas for r in resultados)
+    cargados = sum(1 for r in resultados if r.estado == "cargado")
+    omitidos = sum(1 for r in resultados if r.estado == "sin_cambios")
+    print(
+        f"Catálogos: {cargados} archivos cargados, {omitidos} sin cambios, "
+        f"{insertadas} filas insertadas ({int((time.perf_counter() - inicio) * 1000)} ms)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Importa candidatos de forma masiva desde un archivo CSV o Excel (XLSX).
+
+Usa el mismo servicio que el endpoint `POST /candidatos/importar`; las columnas
+reconocidas están documentadas en `app.services.importacion_candidatos_service`.
+
+Uso::
+
+    python -m app.cli.importar_candidatos feria_2026.xlsx
+    python -m app.cli.importar_candidatos legado.csv --reporte rechazadas.csv
+"""
+
+import argparse
+import csv
+import os
+import sys
+
+from fastapi import HTTPException
+
+from app.core.database import SessionLocal
+import app.models  # noqa: F401  (registra todos los modelos)
+import app.models.catalogs  # noqa: F401
+from app.services.importacion_candidatos_service import importar_candidatos
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("archivo", help="Ruta del archivo .csv o .xlsx")
+    parser.add_argument("--reporte", help="Escribe las filas rechazadas en este CSV (fila, errores)")
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        with open(args.archivo, "rb") as archivo:
+            resultado = importar_candidatos(db, archivo, os.path.basename(args.archivo))
+    except HTTPException as e:
+        print(f"Error ({e.status_code}): {e.detail}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+
+    print(
+        f"Importación {resultado.id_importacion}: {resultado.importados} candidatos creados, "
+        f"{resultado.invalidas} filas rechazadas de {resultado.total_filas} "
+        f"({resultado.segundos}s)"
+    )
+    if args.reporte and resultado.filas_invalidas:
+        with open(args.reporte, "w", newline="", encoding="utf-8") as salida:
+            writer = csv.writer(salida)
+            writer.writerow(["fila", "errores"])
+            for fila in resultado.filas_invalidas:
+                writer.writerow([fila.fila, "; ".join(fila.errores)])
+        print(f"Filas rechazadas escritas en {args.reporte}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,12 @@
 from jose import jwt
 from cachetools import TTLCache
 from typing import Dict, Any
+import logging
 import requests
 import os
 
+logger = logging.getLogger(__name__)
+
 AZURE_CLIENT_ID = os.getenv("AZURE_CLIENT_ID")
 AZURE_TENANT_ID = os.getenv("AZURE_TENANT_ID")
 AZURE_AUTHORITY = os.getenv("AZURE_AUTHORITY")  # Debe terminar en /v2.0
@@ -35,12 +38,11 @@ def get_signing_keys(version="v2") -> Dict[str, Any]:
 def validar_token(token: str) -> Dict[str, Any]:
     """Valida un token JWT de Azure y devuelve su payload decodificado."""
     
-    # 👇 imprimimos el payload sin validar
     unverified_claims = jwt.get_unverified_claims(token)
-    print("🧾 ISSUER del token:", unverified_claims.get("iss"))
-    print("🎯 AUDIENCE del token:", unverified_claims.get("aud"))
-    print("🔍 VERSION del token:", unverified_claims.get("ver"))
-    print("🔍 TOKEN ID:", unverified_claims.get("tid"))
+    logger.debug(
+        "Validando token: iss=%s aud=%s ver=%s",
+        unverified_claims.get("iss"), unverified_claims.get("aud"), unverified_claims.get("ver"),
+    )
     
     # Determinar versión del token por el issuer
     token_issuer = unverified_claims.get("iss")
@@ -62,9 +64,6 @@ def validar_token(token: str) -> Dict[str, Any]:
     if AZURE_CLIENT_ID.startswith("api://"):
         valid_audiences.append(AZURE_CLIENT_ID.replace("api://", ""))
     
-    print(f"🔍 Issuers válidos: {valid_issuers}")
-    print(f"🔍 Audiences válidos: {valid_audiences}")
-    
     # Obtener claves de firma (v1 y v2 usan las mismas claves)
     try:
         signing_keys = get_signing_keys("v2")
@@ -87,7 +86,6 @@ def validar_token(token: str) -> Dict[str, Any]:
     for issuer in valid_issuers:
         for audience in valid_audiences:
             try:
-                print(f"🔄 Intentando validar con issuer: {issuer}, audience: {audience}")
                 payload = jwt.decode(
                     token,
                     key,
@@ -95,10 +93,10 @@ def validar_token(token: str) -> Dict[str, Any]:
                     audience=audience,
                     issuer=issuer,
                 )
-                print(f"✅ Token válido con issuer: {issuer}, audience: {audience}")
+                logger.debug("Token válido con issuer %s y audience %s", issuer, audience)
                 return payload
             except jwt.JWTError as e:
-                print(f"❌ Falló con issuer: {issuer}, audience: {audience} - {str(e)}")
+                logger.debug("Falló con issuer %s y audience %s: %s", issuer, audience, e)
                 last_error = e
                 continue
     
@@ -125,15 +123,10 @@ def debug_token(token: str) -> Dict[str, Any]:
         header = jwt.get_unverified_header(token)
         payload = jwt.get_unverified_claims(token)
         
-        print("=" * 50)
-        print("🔍 DEBUG TOKEN COMPLETO")
-        print("=" * 50)
-        print(f"HEADER: {header}")
-        print(f"PAYLOAD: {payload}")
-        print("=" * 50)
+        logger.debug("Token decodificado sin validar", extra={"encabezado": header, "payload": payload})
         
         return payload
     except Exception as e:
-        print(f"❌ Error decodificando token: {e}")
+        logger.debug("Error decodificando token: %s", e)
         return {}
     
@@ -0,0 +1,110 @@
+"""Bloqueos a nivel de clúster para tareas que solo debe ejecutar un proceso a la vez."""
+
+import logging
+import threading
+import zlib
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.pool import NullPool
+
+from app.core.database import DATABASE_URL, engine
+
+logger = logging.getLogger(__name__)
+
+# Alternativa local (por proceso) para motores sin advisory locks, como SQLite
+_bloqueos_locales: dict = {}
+_lock_registro = threading.Lock()
+
+# Los bloqueos se mantienen en conexiones propias, fuera del pool de las peticiones:
+# un bloqueo de larga duración (ej. el líder del planificador) no ocupa un cupo del
+# pool, y al cerrar la conexión PostgreSQL libera el bloqueo.
+_motor_bloqueos = (
+    create_engine(DATABASE_URL, poolclass=NullPool) if engine.dialect.name == "postgresql" else None
+)
+
+
+def clave_bloqueo(nombre: str) -> int:
+    """Convierte el nombre del bloqueo en una clave entera estable para `pg_try_advisory_lock`."""
+    return zlib.crc32(nombre.encode("utf-8"))
+
+
+class BloqueoAsesor:
+    """
+    Resultado de `bloqueo_asesor`. Es verdadero si se obtuvo el bloqueo, y
+    `vigente()` comprueba que se siga teniendo (la conexión pudo haberse perdido).
+    """
+
+    def __init__(self, adquirido: bool, conexion: Optional[Connection] = None, clave: Optional[int] = None):
+        self.adquirido = adquirido
+        self._conexion = conexion
+        self._clave = clave
+
+    def __bool__(self) -> bool:
+        return self.adquirido
+
+    def vigente(self) -> bool:
+        """
+        Indica si el bloqueo sigue tomado por esta conexión.
+
+        En PostgreSQL consulta `pg_locks`; si la conexión se cayó (y con ella el
+        bloqueo) retorna False. La consulta también mantiene activa la conexión.
+        """
+        if not self.adquirido:
+            return False
+        if self._conexion is None:
+            return True
+        try:
+            # Una clave bigint menor a 2^32 queda en objid, con classid 0 y objsubid 1
+            tomado = self._conexion.execute(
+                text(
+                    "SELECT count(*) FROM pg_locks WHERE locktype = 'advisory' "
+                    "AND pid = pg_backend_pid() AND classid = 0 AND objid::bigint = :clave "
+                    "AND objsubid = 1 AND granted"
+                ),
+                {"clave": self._clave},
+            ).scalar()
+            self._conexion.commit()
+            return bool(tomado)
+        except Exception:
+            logger.warning("No se pudo verificar el advisory lock; se considera perdido", exc_info=True)
+            return False
+
+
+@contextmanager
+def bloqueo_asesor(nombre: str) -> Iterator[BloqueoAsesor]:
+    """
+    Intenta tomar un advisory lock de PostgreSQL sin esperar.
+
+    El bloqueo es de sesión y se mantiene en una conexión dedicada (fuera del pool)
+    mientras dura el bloque `with`, de modo que las transacciones cortas del trabajo
+    no lo liberan. Si la conexión se pierde, PostgreSQL libera el bloqueo
+    automáticamente; quien lo mantenga por mucho tiempo debe consultar `vigente()`.
+
+    Args:
+        nombre (str): Nombre lógico del bloqueo (ej. nombre del job).
+
+    Yields:
+        BloqueoAsesor: Verdadero si se obtuvo el bloqueo; falso si otro proceso ya lo tiene.
+    """
+    if _motor_bloqueos is None:
+        with _lock_registro:
+            lock = _bloqueos_locales.setdefault(nombre, threading.Lock())
+        adquirido = lock.acquire(blocking=False)
+        try:
+            yield BloqueoAsesor(adquirido)
+        finally:
+            if adquirido:
+                lock.release()
+        return
+
+    clave = clave_bloqueo(nombre)
+    # Al cerrar la conexión (no vuelve a ningún pool) se libera el bloqueo
+    with _motor_bloqueos.connect() as conexion:
+        adquirido = conexion.execute(
+            text("SELECT pg_try_advisory_lock(:clave)"), {"clave": clave}
+        ).scalar()
+        conexion.commit()
+        yield BloqueoAsesor(bool(adquirido), conexion, clave)
@@ -0,0 +1,155 @@
+"""
+Registro de consultas lentas con captura de su plan de ejecución.
+
+Toda sentencia que tarde más de `CONSULTA_LENTA_UMBRAL_MS` se guarda en un buffer
+circular en memoria (las últimas `CONSULTAS_LENTAS_CAPACIDAD`) con su forma
+normalizada, los tipos de sus parámetros (nunca sus valores), la duración y la
+ruta que la ejecutó. También se registra una advertencia en el log.
+
+En PostgreSQL, para las consultas de lectura se obtiene además
+`EXPLAIN (ANALYZE, BUFFERS)` en un hilo aparte y con otra conexión del pool, como
+máximo uno cada `EXPLAIN_INTERVALO_SEGUNDOS` y uno a la vez: EXPLAIN ANALYZE vuelve
+a ejecutar la consulta, así que no debe multiplicar la carga que la hizo lenta.
+
+Los datos son por proceso y se consultan en `GET /diagnostico/consultas-lentas`.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Deque, List, Optional
+
+from app.core.database import engine
+from app.core.instrumentacion import consultas_peticion, normalizar_sql, observar_sentencias
+
+logger = logging.getLogger(__name__)
+
+# Duración (ms) a partir de la cual una sentencia se considera lenta
+CONSULTA_LENTA_UMBRAL_MS = int(os.getenv("CONSULTA_LENTA_UMBRAL_MS", "500"))
+
+# Cantidad de consultas lentas que se conservan por proceso
+CONSULTAS_LENTAS_CAPACIDAD = int(os.getenv("CONSULTAS_LENTAS_CAPACIDAD", "200"))
+
+# Permite desactivar la captura de planes (solo aplica en PostgreSQL)
+EXPLAIN_HABILITADO = os.getenv("EXPLAIN_HABILITADO", "true").lower() in ("1", "true", "si", "yes")
+
+# Segundos mínimos entre dos EXPLAIN ANALYZE del mismo proceso
+EXPLAIN_INTERVALO_SEGUNDOS = int(os.getenv("EXPLAIN_INTERVALO_SEGUNDOS", "60"))
+
+# Límite (ms) para la ejecución del EXPLAIN ANALYZE
+EXPLAIN_TIEMPO_LIMITE_MS = int(os.getenv("EXPLAIN_TIEMPO_LIMITE_MS", "30000"))
+
+# Etiqueta de las sentencias ejecutadas fuera de una petición HTTP (jobs, CLI)
+SIN_PETICION = "sin_peticion"
+
+# Solo las lecturas se explican: EXPLAIN ANALYZE ejecuta la sentencia
+_SENTENCIA_LECTURA = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+_SENTENCIA_EXPLAIN = re.compile(r"^\s*EXPLAIN\b", re.IGNORECASE)
+
+
+@dataclass
+class ConsultaLenta:
+    """Sentencia que superó el umbral, con su plan si se obtuvo."""
+    fecha: datetime
+    ruta: str
+    duracion_ms: float
+    sql: str
+    parametros: str
+    plan: Optional[str] = None
+    # Sentencia y parámetros originales, solo para el EXPLAIN (no se exponen)
+    _sentencia: str = field(default="", repr=False)
+    _valores: Any = field(default=None, repr=False)
+
+
+_consultas: Deque[ConsultaLenta] = deque(maxlen=CONSULTAS_LENTAS_CAPACIDAD)
+_lock_consultas = threading.Lock()
+
+_explain_en_curso = threading.Lock()
+_ultimo_explain = float("-inf")
+
+
+def forma_parametros(parametros: Any, executemany: bool = False) -> str:
+    """
+    Describe los parámetros por su tipo, sin sus valores
+    (ej. `{id_candidato: int, correo: str}` o `3 x (int, str)`).
+    """
+    if executemany and isinstance(parametros, (list, tuple)) and parametros:
+        return f"{len(parametros)} x {forma_parametros(parametros[0])}"
+    if isinstance(parametros, dict):
+        return "{" + ", ".join(f"{nombre}: {type(valor).__name__}" for nombre, valor in parametros.items()) + "}"
+    if isinstance(parametros, (list, tuple)):
+        return "(" + ", ".join(type(valor).__name__ for valor in parametros) + ")"
+    return type(parametros).__name__
+
+
+def listar_consultas_lentas(limite: int = 50) -> List[ConsultaLenta]:
+    """Retorna las consultas lentas registradas, de la más reciente a la más antigua."""
+    with _lock_consultas:
+        return list(reversed(_consultas))[:limite]
+
+
+def _reservar_explain() -> bool:
+    """Toma el turno de EXPLAIN si no hay otro en curso y ya pasó el intervalo."""
+    global _ultimo_explain
+    if not _explain_en_curso.acquire(blocking=False):
+        return False
+    ahora = time.monotonic()
+    if ahora - _ultimo_explain < EXPLAIN_INTERVALO_SEGUNDOS:
+        _explain_en_curso.release()
+        return False
+    _ultimo_explain = ahora
+    return True
+
+
+def _capturar_plan(consulta: ConsultaLenta) -> None:
+    """Ejecuta EXPLAIN (ANALYZE, BUFFERS) en otra conexión y guarda el plan en la consulta."""
+    try:
+        with engine.connect() as conexion:
+            # SET LOCAL y la transacción se descartan al cerrar la conexión (rollback)
+            conexion.exec_driver_sql(f"SET LOCAL statement_timeout = {EXPLAIN_TIEMPO_LIMITE_MS}")
+            filas = conexion.exec_driver_sql(
+                f"EXPLAIN (ANALYZE, BUFFERS) {consulta._sentencia}", consulta._valores
+            ).all()
+        consulta.plan = "\n".join(fila[0] for fila in filas)
+    except Exception:
+        logger.exception("No se pudo obtener el plan de una consulta lenta", extra={"sql": consulta.sql})
+    finally:
+        consulta._sentencia, consulta._valores = "", None
+        _explain_en_curso.release()
+
+
+@observar_sentencias
+def _registrar_si_lenta(sentencia: str, parametros: Any, executemany: bool, duracion: float) -> None:
+    duracion_ms = duracion * 1000
+    if duracion_ms < CONSULTA_LENTA_UMBRAL_MS or _SENTENCIA_EXPLAIN.match(sentencia):
+        return
+
+    consultas = consultas_peticion.get()
+    consulta = ConsultaLenta(
+        fecha=datetime.now(timezone.utc),
+        ruta=consultas.ruta if consultas is not None else SIN_PETICION,
+        duracion_ms=round(duracion_ms, 1),
+        sql=normalizar_sql(sentencia),
+        parametros=forma_parametros(parametros, executemany),
+    )
+    with _lock_consultas:
+        _consultas.append(consulta)
+    logger.warning(
+        "Consulta lenta",
+        extra={"ruta": consulta.ruta, "duracion_ms": consulta.duracion_ms, "sql": consulta.sql},
+    )
+
+    if (
+        EXPLAIN_HABILITADO
+        and engine.dialect.name == "postgresql"
+        and not executemany
+        and _SENTENCIA_LECTURA.match(sentencia)
+        and _reservar_explain()
+    ):
+        consulta._sentencia, consulta._valores = sentencia, parametros
+        threading.Thread(target=_capturar_plan, args=(consulta,), name="explain-consulta-lenta", daemon=True).start()
@@ -1,8 +1,14 @@
 """Configuración de la base de datos para el proyecto Gestión de Candidatos."""
 
 import os
-from sqlalchemy import create_engine
+import time
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from app.core.metricas import contador, histograma
 
 # Solo cargar .env si estás en desarrollo local
 if os.getenv("ENV") != "production":
@@ -12,22 +18,81 @@ if os.getenv("ENV") != "production":
 # URL de conexión a la base de datos (PostgreSQL)
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# Conexiones que el pool mantiene abiertas y cuántas más puede abrir en picos
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+# Segundos tras los cuales una conexión se recicla (evita cortes por inactividad)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+# Segundos que una petición espera una conexión libre antes de fallar
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+# Mostrar cada sentencia SQL en consola. Desactivado por defecto también en
+# desarrollo: el log síncrono distorsiona los tiempos de staging y benchmarks.
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() in ("1", "true", "si", "yes")
+
+ESPERA_POOL = histograma(
+    "db_pool_espera_conexion_segundos",
+    "Tiempo para obtener una conexión del pool (espera y, si hace falta, apertura)",
+)
+TIMEOUTS_POOL = contador(
+    "db_pool_timeouts_total",
+    "Peticiones que agotaron DB_POOL_TIMEOUT esperando una conexión",
+)
+
+
+class QueuePoolMedido(QueuePool):
+    """QueuePool que registra cuánto tarda cada checkout en obtener una conexión."""
+
+    def _do_get(self):
+        inicio = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            TIMEOUTS_POOL.incrementar()
+            raise
+        finally:
+            ESPERA_POOL.observar(time.perf_counter() - inicio)
+
+
+# SQLite (pruebas y benchmarks) usa su propio pool, sin estos parámetros
+_opciones_pool = {} if make_url(DATABASE_URL).get_backend_name() == "sqlite" else {
+    "poolclass": QueuePoolMedido,
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_timeout": DB_POOL_TIMEOUT,
+}
+
 # Motor de conexión a la base de datos
 engine = create_engine(
     DATABASE_URL,
-    echo=os.getenv("ENV") != "production",  # Mostrar SQL solo en desarrollo
-    pool_pre_ping=True
+    echo=DB_ECHO,
+    pool_pre_ping=True,
+    **_opciones_pool,
 )
 
-# Configuración de sesiones de base de datos
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# SQLite (usado en pruebas y benchmarks) no aplica las llaves foráneas ni sus
+# ON DELETE CASCADE a menos que se active por conexión
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _activar_llaves_foraneas_sqlite(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+# Configuración de sesiones de base de datos.
+# expire_on_commit=False: los objetos siguen siendo utilizables después del commit,
+# así los servicios no necesitan un db.refresh (un SELECT extra) por cada escritura.
+# Los valores por defecto del servidor se obtienen con RETURNING (eager_defaults).
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Base declarativa para los modelos
 Base = declarative_base()
 
 def get_db():
     """Generador de sesión de base de datos para inyectar en rutas o servicios."""
-    print(f"📡 Conectado a: {DATABASE_URL}") 
     db = SessionLocal()
     try:
         yield db
@@ -1,3 +1,5 @@
+import logging
+
 from fastapi import Header, HTTPException, status, Depends
 from sqlalchemy.orm import Session
 from typing import Optional
@@ -7,54 +9,63 @@ from app.core.database import get_db
 from app.services.usuario_service import get_usuario_by_correo
 from app.models.usuario import Usuario
 
+logger = logging.getLogger(__name__)
+
 async def obtener_usuario_actual(
     authorization: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ) -> Usuario:
     """
     Verifica el token, valida al usuario en base de datos y lo retorna.
+
+    Nunca registra el token ni su payload; el detalle de la validación queda en
+    nivel DEBUG (`LOG_NIVELES=app.core.dependencies=DEBUG`).
     """
-    
     if not authorization or not authorization.startswith("Bearer "):
-        print("❌ Token no proporcionado o malformado")
+        logger.info("Token no proporcionado o malformado")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token de autorización no proporcionado o inválido.",
         )
-    
+
     token = authorization.replace("Bearer ", "").strip()
-    print(f"🔒 Token recibido: {token[:40]}...")  # Mostramos parte del token
-    
+
     try:
         payload = validar_token(token)
-        print("✅ Token válido. Payload decodificado:")
-        print(payload)
-        
-        # Usar la nueva función para extraer el correo
         correo = extraer_correo_token(payload)
-        print(f"📧 Correo extraído del token: {correo}")
-        
         if not correo:
-            print("❌ No se pudo extraer el correo del token")
-            print(f"🔍 Campos disponibles en el token: {list(payload.keys())}")
+            logger.debug("Token sin correo; campos disponibles: %s", list(payload.keys()))
             raise ValueError("No se pudo extraer el correo del token.")
-            
+
     except ValueError as e:
-        print(f"❌ Token inválido: {str(e)}")
+        logger.info("Token inválido: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Token inválido: {str(e)}",
         )
-    
+
     usuario = get_usuario_by_correo(db, correo.lower())
-    print(f"🔍 Usuario encontrado en base de datos: {usuario}")
-    
+
     if not usuario or not usuario.activo:
-        print("🚫 Usuario no autorizado o inactivo.")
+        logger.info("Usuario no autorizado o inactivo", extra={"correo": correo.lower()})
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Usuario no autorizado o inactivo.",
         )
-    
-    print("✅ Usuario autorizado. Retornando objeto Usuario.")
-    return usuario
\ No newline at end of file
+
+    logger.debug("Usuario autorizado", extra={"id_usuario": usuario.id})
+    return usuario
+
+
+async def obtener_usuario_admin(
+    usuario: Usuario = Depends(obtener_usuario_actual)
+) -> Usuario:
+    """
+    Verifica que el usuario autenticado tenga rol de administrador.
+    """
+    if usuario.rol != "ADMIN":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Se requiere rol de administrador.",
+        )
+    return usuario
@@ -0,0 +1,111 @@
+"""
+Detector de N+1 y explosión de consultas para desarrollo y pruebas.
+
+Por cada petición cuenta las sentencias SQL y cuántas veces se repite cada forma
+normalizada (la misma consulta con distinto ID dentro de un bucle es el síntoma
+típico de N+1). Si la petición supera el presupuesto configurado se registra una
+advertencia o, con `DETECTOR_CONSULTAS_MODO=error`, se lanza
+`PresupuestoConsultasExcedido` para que la prueba falle.
+
+Además agrega a la respuesta `X-DB-Queries` (sentencias) y `X-DB-Time` (ms en base
+de datos). Por defecto solo está activo fuera de producción.
+
+Los encabezados se escriben al iniciar la respuesta, así que en una respuesta en
+streaming (ej. la exportación CSV) no incluyen las consultas que se hacen mientras
+se envía el cuerpo. El presupuesto, en cambio, se revisa con el último fragmento
+del cuerpo y sí las cuenta. El `SET LOCAL statement_timeout` de cada transacción no
+cuenta como forma repetida.
+
+Requiere que `MetricasHTTPMiddleware` envuelva a este middleware: reutiliza su
+`ConsultasPeticion` en lugar de escuchar de nuevo los eventos del motor.
+"""
+
+import logging
+import os
+from collections import Counter
+
+from starlette.datastructures import MutableHeaders
+
+from app.core.instrumentacion import ConsultasPeticion, consultas_peticion
+
+logger = logging.getLogger(__name__)
+
+# Activo por defecto en todo entorno que no sea producción
+DETECTOR_CONSULTAS_HABILITADO = os.getenv(
+    "DETECTOR_CONSULTAS_HABILITADO", str(os.getenv("ENV") != "production")
+).lower() in ("1", "true", "si", "yes")
+
+# 'log' registra una advertencia; 'error' lanza una excepción (útil en pruebas)
+DETECTOR_CONSULTAS_MODO = os.getenv("DETECTOR_CONSULTAS_MODO", "log").lower()
+
+# Máximo de sentencias SQL por petición
+PRESUPUESTO_SENTENCIAS_PETICION = int(os.getenv("PRESUPUESTO_SENTENCIAS_PETICION", "50"))
+
+# Máximo de veces que una misma forma de sentencia puede repetirse en una petición
+PRESUPUESTO_SENTENCIAS_REPETIDAS = int(os.getenv("PRESUPUESTO_SENTENCIAS_REPETIDAS", "5"))
+
+
+class PresupuestoConsultasExcedido(RuntimeError):
+    """La petición ejecutó más sentencias SQL de las permitidas."""
+
+
+def revisar_presupuesto(metodo: str, consultas: ConsultasPeticion) -> None:
+    """
+    Compara las sentencias de la petición con los presupuestos configurados.
+
+    Args:
+        metodo (str): Método HTTP de la petición.
+        consultas (ConsultasPeticion): Sentencias registradas durante la petición.
+
+    Raises:
+        PresupuestoConsultasExcedido: Si se excede un presupuesto y el modo es 'error'.
+    """
+    forma, repeticiones = consultas.formas.most_common(1)[0] if consultas.formas else ("", 0)
+    if consultas.sentencias <= PRESUPUESTO_SENTENCIAS_PETICION and repeticiones <= PRESUPUESTO_SENTENCIAS_REPETIDAS:
+        return
+
+    mensaje = (
+        f"{metodo} {consultas.ruta} ejecutó {consultas.sentencias} sentencias SQL "
+        f"(presupuesto {PRESUPUESTO_SENTENCIAS_PETICION}); la más repetida se ejecutó "
+        f"{repeticiones} veces (presupuesto {PRESUPUESTO_SENTENCIAS_REPETIDAS})"
+    )
+    if DETECTOR_CONSULTAS_MODO == "error":
+        raise PresupuestoConsultasExcedido(f"{mensaje}: {forma}")
+    logger.warning(
+        mensaje,
+        extra={
+            "ruta": consultas.ruta,
+            "sentencias": consultas.sentencias,
+            "tiempo_db_ms": round(consultas.tiempo * 1000, 1),
+            "forma_repetida": forma,
+            "repeticiones": repeticiones,
+        },
+    )
+
+
+class DetectorConsultasMiddleware:
+    """Middleware ASGI que revisa el presupuesto de consultas y agrega `X-DB-Queries`/`X-DB-Time`."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        consultas = consultas_peticion.get() if scope["type"] == "http" else None
+        if consultas is None:
+            await self.app(scope, receive, send)
+            return
+
+        consultas.formas = Counter()
+
+        async def enviar(mensaje):
+            # Al iniciar la respuesta un endpoint normal ya terminó sus consultas; uno en
+            # streaming puede seguir consultando hasta el último fragmento del cuerpo
+            if mensaje["type"] == "http.response.start":
+                encabezados = MutableHeaders(scope=mensaje)
+                encabezados["X-DB-Queries"] = str(consultas.sentencias)
+                encabezados["X-DB-Time"] = f"{consultas.tiempo * 1000:.1f}"
+            elif mensaje["type"] == "http.response.body" and not mensaje.get("more_body", False):
+                revisar_presupuesto(scope["method"], consultas)
+            await send(mensaje)
+
+        await self.app(scope, receive, enviar)
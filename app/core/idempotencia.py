@@ -0,0 +1,98 @@
+"""Middleware de idempotencia para las solicitudes de creación (POST)."""
+
+import hashlib
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+
+from app.core.database import SessionLocal
+from app.services.idempotencia_service import guardar_respuesta, liberar_clave, reservar_clave
+
+ENCABEZADO_IDEMPOTENCIA = "Idempotency-Key"
+ENCABEZADO_REPETIDA = "Idempotent-Replayed"
+LONGITUD_MAXIMA_CLAVE = 255
+
+
+def _con_sesion(funcion, *args):
+    """Ejecuta una función del servicio con una sesión propia (el middleware no usa `get_db`)."""
+    db = SessionLocal()
+    try:
+        return funcion(db, *args)
+    finally:
+        db.close()
+
+
+class IdempotenciaMiddleware(BaseHTTPMiddleware):
+    """
+    Hace idempotentes los POST que incluyen el encabezado `Idempotency-Key`.
+
+    - La primera solicitud con una clave se procesa normalmente y su respuesta se guarda.
+    - Un reintento con la misma clave recibe la respuesta guardada sin volver a ejecutar
+      el endpoint (y sin tocar las tablas de candidatos).
+    - Si la solicitud original sigue en curso, el reintento recibe 409 (salvo que la
+      reserva supere `IDEMPOTENCIA_RESERVA_MINUTOS`: se da por abandonada y se retoma).
+    - Si la clave se reutiliza con otra ruta u otro cuerpo, se responde 422.
+    - Las respuestas 5xx no se guardan: la clave se libera para poder reintentar.
+
+    Las solicitudes sin el encabezado no se ven afectadas.
+    """
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        clave = request.headers.get(ENCABEZADO_IDEMPOTENCIA)
+        if request.method != "POST" or not clave:
+            return await call_next(request)
+
+        if len(clave) > LONGITUD_MAXIMA_CLAVE:
+            return JSONResponse(
+                status_code=400,
+                content={"detail": f"El encabezado {ENCABEZADO_IDEMPOTENCIA} supera {LONGITUD_MAXIMA_CLAVE} caracteres"},
+            )
+
+        ruta = f"{request.method} {request.url.path}"
+        hash_solicitud = hashlib.sha256(await request.body()).hexdigest()
+
+        reservada, registro = await run_in_threadpool(
+            _con_sesion, reservar_clave, clave, ruta, hash_solicitud
+        )
+        if not reservada:
+            if registro.ruta != ruta or registro.hash_solicitud != hash_solicitud:
+                return JSONResponse(
+                    status_code=422,
+                    content={"detail": "La clave de idempotencia ya se usó con una solicitud diferente"},
+                )
+            if registro.codigo_estado is None:
+                return JSONResponse(
+                    status_code=409,
+                    content={"detail": "Una solicitud con esta clave de idempotencia sigue en proceso"},
+                )
+            return Response(
+                content=registro.cuerpo_respuesta,
+                status_code=registro.codigo_estado,
+                media_type=registro.tipo_contenido,
+                headers={ENCABEZADO_REPETIDA: "true"},
+            )
+
+        fecha_reserva = registro.fecha_creacion
+        try:
+            respuesta = await call_next(request)
+        except Exception:
+            await run_in_threadpool(_con_sesion, liberar_clave, clave, fecha_reserva)
+            raise
+
+        if respuesta.status_code >= 500:
+            await run_in_threadpool(_con_sesion, liberar_clave, clave, fecha_reserva)
+            return respuesta
+
+        cuerpo = b"".join([fragmento async for fragmento in respuesta.body_iterator])
+        await run_in_threadpool(
+            _con_sesion, guardar_respuesta, clave, fecha_reserva, respuesta.status_code,
+            respuesta.headers.get("content-type"), cuerpo,
+        )
+        return Response(
+            content=cuerpo,
+            status_code=respuesta.status_code,
+            headers=dict(respuesta.headers),
+        )
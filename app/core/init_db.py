@@ -1,6 +1,6 @@
 # app/core/init_db.py
 from app.core.database import Base, engine
-from .populate_catalogs import cargar_catalogos
+from .populate_catalogs import DATA_DIR, cargar_catalogos
 
 # Importar modelos generales
 from app.models import (
@@ -11,6 +11,13 @@ from app.models import (
     PreferenciaDisponibilidad,
     Usuario,
     SolicitudEliminacion,
+    ExportJob,
+    VersionDatos,
+    EjecucionJob,
+    StagingCandidato,
+    StagingConocimiento,
+    ClaveIdempotencia,
+    SemillaCatalogo,
 )
 
 # Importar modelos de catálogos
@@ -39,7 +46,11 @@ def create_tables():
     """Crea todas las tablas si no existen en la base de datos."""
     Base.metadata.create_all(bind=engine)
 
-def init_db():
-    """Inicializa la base de datos completa (creación de tablas)."""
+def init_db(directorio: str = DATA_DIR, forzar: bool = False):
+    """
+    Inicializa la base de datos completa (creación de tablas y carga de catálogos).
+
+    Se ejecuta desde `python -m app.cli.cargar_catalogos`, no al iniciar la API.
+    """
     create_tables()
-    cargar_catalogos()
+    return cargar_catalogos(directorio, forzar)
@@ -0,0 +1,186 @@
+"""
+Instrumentación de la API para `/metrics`: peticiones HTTP, sentencias SQL y pool de
+conexiones.
+
+- `MetricasHTTPMiddleware` mide la latencia y el código de estado de cada petición
+  por plantilla de ruta (ej. `/candidatos/{id_candidato}`), para no crear una serie
+  por cada ID.
+- Los eventos `before_cursor_execute`/`after_cursor_execute` del motor cuentan las
+  sentencias y su tiempo, en total y por petición (vía `consultas_peticion`).
+- Los medidores del pool se calculan al exponer las métricas.
+- Si un middleware activa `formas` en la petición (detector de consultas), también
+  se cuentan las sentencias por forma normalizada (`normalizar_sql`).
+- Otros módulos reciben cada sentencia con su duración mediante `observar_sentencias`
+  (ej. el registro de consultas lentas), sin volver a medirla.
+
+Cada evento cuesta un par de `perf_counter` y un incremento bajo lock.
+"""
+
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional
+
+from sqlalchemy import event
+
+from app.core.database import engine
+from app.core.metricas import contador, histograma, medidor
+
+# Límites de los histogramas de sentencias por petición
+BUCKETS_SENTENCIAS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+# Etiqueta de las peticiones que no coinciden con ninguna ruta (404)
+RUTA_DESCONOCIDA = "sin_ruta"
+
+PETICIONES_HTTP = contador("http_peticiones_total", "Peticiones HTTP atendidas por ruta, método y estado")
+DURACION_HTTP = histograma("http_duracion_peticion_segundos", "Latencia de las peticiones HTTP por ruta")
+SENTENCIAS_SQL = contador("db_sentencias_total", "Sentencias SQL ejecutadas")
+TIEMPO_SQL = contador("db_tiempo_sentencias_segundos_total", "Tiempo acumulado de las sentencias SQL")
+SENTENCIAS_POR_PETICION = histograma(
+    "db_sentencias_por_peticion", "Sentencias SQL ejecutadas por petición HTTP", BUCKETS_SENTENCIAS
+)
+TIEMPO_SQL_POR_PETICION = histograma(
+    "db_tiempo_por_peticion_segundos", "Tiempo en base de datos por petición HTTP"
+)
+
+
+@dataclass
+class ConsultasPeticion:
+    """Sentencias SQL ejecutadas durante una petición HTTP."""
+    scope: dict = field(repr=False)
+    sentencias: int = 0
+    tiempo: float = 0.0
+    # Sentencias por forma normalizada; None si nadie lo solicitó (evita normalizar cada SQL)
+    formas: Optional[Counter] = None
+
+    @property
+    def ruta(self) -> str:
+        return plantilla_ruta(self.scope)
+
+
+consultas_peticion: ContextVar[Optional[ConsultasPeticion]] = ContextVar("consultas_peticion", default=None)
+
+
+def plantilla_ruta(scope: dict) -> str:
+    """Plantilla de la ruta resuelta por el router, o `sin_ruta` si no hubo coincidencia."""
+    ruta = scope.get("route")
+    return getattr(ruta, "path", RUTA_DESCONOCIDA)
+
+
+# ──────────────── HTTP ────────────────
+
+class MetricasHTTPMiddleware:
+    """Middleware ASGI que registra latencia, estado y sentencias SQL de cada petición."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        consultas = ConsultasPeticion(scope)
+        token = consultas_peticion.set(consultas)
+        estado = 500
+
+        async def enviar(mensaje):
+            nonlocal estado
+            if mensaje["type"] == "http.response.start":
+                estado = mensaje["status"]
+            await send(mensaje)
+
+        inicio = time.perf_counter()
+        try:
+            await self.app(scope, receive, enviar)
+        finally:
+            duracion = time.perf_counter() - inicio
+            consultas_peticion.reset(token)
+            ruta = consultas.ruta
+            PETICIONES_HTTP.incrementar(metodo=scope["method"], ruta=ruta, estado=str(estado))
+            DURACION_HTTP.observar(duracion, metodo=scope["method"], ruta=ruta)
+            SENTENCIAS_POR_PETICION.observar(consultas.sentencias, ruta=ruta)
+            TIEMPO_SQL_POR_PETICION.observar(consultas.tiempo, ruta=ruta)
+
+
+# ──────────────── SQL ────────────────
+
+_LITERALES_SQL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b|%\(\w+\)s|(?<!:):\w+\b|\$\d+")
+_LISTA_PARAMETROS = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_LISTAS_REPETIDAS = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_ESPACIOS = re.compile(r"\s+")
+
+# Funciones llamadas con (sentencia, parámetros, executemany, duración) tras cada sentencia
+_observadores: List[Callable[[str, Any, bool, float], None]] = []
+
+
+# Sentencias de configuración de la transacción (ej. el `SET LOCAL statement_timeout`
+# de cada transacción): se repiten por diseño y no cuentan como formas repetidas
+_SENTENCIAS_CONFIGURACION = re.compile(r"^\s*SET\s+LOCAL\s+statement_timeout\b", re.IGNORECASE)
+
+
+def normalizar_sql(sentencia: str) -> str:
+    """
+    Forma de una sentencia sin sus valores: literales y parámetros pasan a `?` y las
+    listas `IN (...)` o `VALUES (...), (...)` quedan como un solo `(?)`, de modo que
+    la misma consulta con distintos IDs o tamaños de lista tenga la misma forma.
+    """
+    forma = _LITERALES_SQL.sub("?", sentencia)
+    forma = _LISTA_PARAMETROS.sub("(?)", forma)
+    forma = _LISTAS_REPETIDAS.sub("(?)", forma)
+    return _ESPACIOS.sub(" ", forma).strip()
+
+
+def observar_sentencias(funcion: Callable[[str, Any, bool, float], None]) -> Callable[[str, Any, bool, float], None]:
+    """
+    Registra una función que recibe cada sentencia ejecutada por el motor con sus
+    parámetros, si fue `executemany` y su duración en segundos. Se puede usar como
+    decorador; corre en el hilo de la sentencia, así que debe ser rápida.
+    """
+    _observadores.append(funcion)
+    return funcion
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _inicio_sentencia(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("inicios_sentencias", []).append(time.perf_counter())
+
+
+@event.listens_for(engine, "after_cursor_execute")
+def _fin_sentencia(conn, cursor, statement, parameters, context, executemany):
+    duracion = time.perf_counter() - conn.info["inicios_sentencias"].pop()
+    SENTENCIAS_SQL.incrementar()
+    TIEMPO_SQL.incrementar(duracion)
+    consultas = consultas_peticion.get()
+    if consultas is not None:
+        consultas.sentencias += 1
+        consultas.tiempo += duracion
+        if consultas.formas is not None and not _SENTENCIAS_CONFIGURACION.match(statement):
+            consultas.formas[normalizar_sql(statement)] += 1
+    for observador in _observadores:
+        observador(statement, parameters, executemany, duracion)
+
+
+@event.listens_for(engine, "handle_error")
+def _error_sentencia(contexto):
+    # La sentencia falló: after_cursor_execute no se ejecuta y su inicio queda pendiente
+    inicios = contexto.connection.info.get("inicios_sentencias") if contexto.connection else None
+    if inicios:
+        inicios.pop()
+
+
+# ──────────────── POOL ────────────────
+
+def _valor_pool(metodo: str):
+    def calcular():
+        funcion = getattr(engine.pool, metodo, None)
+        return {(): funcion()} if callable(funcion) else {}
+    return calcular
+
+
+medidor("db_pool_conexiones_en_uso", "Conexiones del pool prestadas en este momento", _valor_pool("checkedout"))
+medidor("db_pool_conexiones_disponibles", "Conexiones abiertas y libres en el pool", _valor_pool("checkedin"))
+medidor("db_pool_overflow", "Conexiones abiertas por encima de DB_POOL_SIZE (negativo si hay cupo)",
+        _valor_pool("overflow"))
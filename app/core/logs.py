@@ -0,0 +1,105 @@
+"""
+Configuración de logging de la aplicación.
+
+- Una línea JSON por evento (`LOG_FORMATO=texto` para lectura en desarrollo), con
+  los campos pasados en `extra=` como claves adicionales.
+- Nivel global con `LOG_NIVEL` y por módulo con `LOG_NIVELES`
+  (ej. `app.core.dependencies=DEBUG,sqlalchemy.engine=INFO`).
+- Los hilos de las peticiones solo encolan el registro (`QueueHandler`); un hilo
+  aparte (`QueueListener`) lo formatea y escribe en stdout.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+# Nivel de los loggers sin nivel propio
+LOG_NIVEL = os.getenv("LOG_NIVEL", "INFO").upper()
+
+# Niveles por módulo: "modulo=NIVEL,otro.modulo=NIVEL"
+LOG_NIVELES = os.getenv("LOG_NIVELES", "")
+
+# Niveles aplicados salvo que LOG_NIVELES indique otro (APScheduler registra cada job en INFO)
+_NIVELES_POR_DEFECTO = {"apscheduler": "WARNING"}
+
+# 'json' (por defecto) o 'texto'
+LOG_FORMATO = os.getenv("LOG_FORMATO", "json").lower()
+
+# Atributos propios de LogRecord: todo lo demás viene de `extra=`
+_ATRIBUTOS_REGISTRO = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "taskName"}
+
+_listener: Optional[QueueListener] = None
+
+
+class FormateadorJSON(logging.Formatter):
+    """Formatea cada registro como un objeto JSON en una sola línea."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        evento = {
+            "fecha": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "nivel": record.levelname,
+            "logger": record.name,
+            "mensaje": record.getMessage(),
+        }
+        for clave, valor in record.__dict__.items():
+            if clave not in _ATRIBUTOS_REGISTRO and not clave.startswith("_"):
+                evento[clave] = valor
+        if record.exc_info:
+            evento["excepcion"] = self.formatException(record.exc_info)
+        return json.dumps(evento, ensure_ascii=False, default=str)
+
+
+class ManejadorCola(QueueHandler):
+    """
+    `QueueHandler` que no formatea en el hilo que registra: solo fija el mensaje con
+    sus argumentos y conserva `exc_info`, para que el formateador lo reciba estructurado.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def niveles_por_modulo(valor: str) -> Dict[str, str]:
+    """Interpreta `LOG_NIVELES` ('a=DEBUG,b.c=WARNING') como diccionario módulo → nivel."""
+    niveles = {}
+    for parte in valor.split(","):
+        modulo, _, nivel = parte.partition("=")
+        if modulo.strip() and nivel.strip():
+            niveles[modulo.strip()] = nivel.strip().upper()
+    return niveles
+
+
+def configurar_logging() -> None:
+    """
+    Configura el logger raíz con un `QueueHandler` y arranca el hilo que escribe los
+    registros. Llamarla más de una vez no tiene efecto.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    salida = logging.StreamHandler(sys.stdout)
+    if LOG_FORMATO == "texto":
+        salida.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    else:
+        salida.setFormatter(FormateadorJSON())
+
+    cola: queue.SimpleQueue = queue.SimpleQueue()
+    raiz = logging.getLogger()
+    raiz.handlers = [ManejadorCola(cola)]
+    raiz.setLevel(LOG_NIVEL)
+    for modulo, nivel in {**_NIVELES_POR_DEFECTO, **niveles_por_modulo(LOG_NIVELES)}.items():
+        logging.getLogger(modulo).setLevel(nivel)
+
+    _listener = QueueListener(cola, salida, respect_handler_level=True)
+    _listener.start()
+    # Al terminar el proceso se vacía la cola antes de salir
+    atexit.register(_listener.stop)
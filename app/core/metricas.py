@@ -0,0 +1,324 @@
+"""
+Métricas del proceso en memoria (contadores, histogramas y medidores) y su
+exposición en el formato de texto de Prometheus.
+
+Cada worker lleva sus propios valores; son acumulados desde que inició el proceso.
+Con varios workers detrás del mismo puerto cada scrape llega a uno cualquiera, así
+que si se configura `METRICAS_DIR_MULTIPROCESO` cada worker vuelca sus valores en
+ese directorio y `/metrics` expone la suma de todos (ver `exponer_prometheus`).
+Los nombres y unidades siguen las convenciones de Prometheus (`_total`, `_segundos`).
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Directorio compartido por los workers de un mismo servidor para agregar sus métricas
+# (vacío = cada worker expone solo las suyas). Debe vaciarse antes de iniciar el servidor.
+METRICAS_DIR_MULTIPROCESO = os.getenv("METRICAS_DIR_MULTIPROCESO", "")
+
+# Segundos entre volcados de las métricas de cada worker al directorio compartido
+METRICAS_VOLCADO_SEGUNDOS = float(os.getenv("METRICAS_VOLCADO_SEGUNDOS", "5"))
+
+# Límites por defecto de los histogramas de latencia (segundos)
+BUCKETS_LATENCIA = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+Etiquetas = Tuple[Tuple[str, str], ...]
+
+
+def _clave_etiquetas(etiquetas: Dict[str, str]) -> Etiquetas:
+    return tuple(sorted((k, str(v)) for k, v in etiquetas.items()))
+
+
+class Contador:
+    """Contador monotónico, opcionalmente separado por etiquetas."""
+
+    tipo = "counter"
+
+    def __init__(self, nombre: str, descripcion: str):
+        self.nombre = nombre
+        self.descripcion = descripcion
+        self._valores: Dict[Etiquetas, float] = {}
+        self._lock = threading.Lock()
+
+    def incrementar(self, valor: float = 1, **etiquetas: str) -> None:
+        clave = _clave_etiquetas(etiquetas)
+        with self._lock:
+            self._valores[clave] = self._valores.get(clave, 0) + valor
+
+    def valores(self) -> Dict[Etiquetas, float]:
+        with self._lock:
+            return dict(self._valores)
+
+
+class Histograma:
+    """Histograma acumulado con límites fijos, opcionalmente separado por etiquetas."""
+
+    tipo = "histogram"
+
+    def __init__(self, nombre: str, descripcion: str, buckets: Sequence[float] = BUCKETS_LATENCIA):
+        self.nombre = nombre
+        self.descripcion = descripcion
+        self.buckets = tuple(sorted(buckets))
+        # etiquetas -> (conteo por bucket, suma, conteo total)
+        self._series: Dict[Etiquetas, Tuple[List[int], float, int]] = {}
+        self._lock = threading.Lock()
+
+    def observar(self, valor: float, **etiquetas: str) -> None:
+        clave = _clave_etiquetas(etiquetas)
+        posicion = bisect_left(self.buckets, valor)
+        with self._lock:
+            conteos, suma, total = self._series.get(clave) or ([0] * len(self.buckets), 0.0, 0)
+            if posicion < len(conteos):
+                conteos[posicion] += 1
+            self._series[clave] = (conteos, suma + valor, total + 1)
+
+    def series(self) -> Dict[Etiquetas, Tuple[List[int], float, int]]:
+        """Retorna, por etiquetas, los conteos acumulados por límite, la suma y el total."""
+        with self._lock:
+            resultado = {}
+            for clave, (conteos, suma, total) in self._series.items():
+                acumulados, acumulado = [], 0
+                for conteo in conteos:
+                    acumulado += conteo
+                    acumulados.append(acumulado)
+                resultado[clave] = (acumulados, suma, total)
+            return resultado
+
+
+class Medidor:
+    """Valor instantáneo que se calcula al exponer las métricas (ej. conexiones en uso)."""
+
+    tipo = "gauge"
+
+    def __init__(self, nombre: str, descripcion: str, calcular: Callable[[], Dict[Etiquetas, float]]):
+        self.nombre = nombre
+        self.descripcion = descripcion
+        self._calcular = calcular
+
+    def valores(self) -> Dict[Etiquetas, float]:
+        return self._calcular()
+
+
+Metrica = Union[Contador, Histograma, Medidor]
+
+_registro: Dict[str, Metrica] = {}
+_lock_registro = threading.Lock()
+
+
+def _registrar(metrica: Metrica) -> Metrica:
+    with _lock_registro:
+        existente = _registro.get(metrica.nombre)
+        if existente is not None:
+            if type(existente) is not type(metrica):
+                raise ValueError(f"La métrica '{metrica.nombre}' ya existe con otro tipo")
+            return existente
+        _registro[metrica.nombre] = metrica
+        return metrica
+
+
+def contador(nombre: str, descripcion: str) -> Contador:
+    """Retorna el contador registrado con ese nombre, creándolo si no existe."""
+    return _registrar(Contador(nombre, descripcion))
+
+
+def histograma(nombre: str, descripcion: str, buckets: Sequence[float] = BUCKETS_LATENCIA) -> Histograma:
+    """Retorna el histograma registrado con ese nombre, creándolo si no existe."""
+    return _registrar(Histograma(nombre, descripcion, buckets))
+
+
+def medidor(nombre: str, descripcion: str, calcular: Callable[[], Dict[Etiquetas, float]]) -> Medidor:
+    """
+    Registra un medidor. `calcular` retorna el valor por etiquetas, por ejemplo
+    `{(): 3}` o `{(("cache", "catalogos"),): 0.9}`.
+    """
+    return _registrar(Medidor(nombre, descripcion, calcular))
+
+
+def metricas_registradas() -> List[Metrica]:
+    """Retorna todas las métricas registradas, ordenadas por nombre."""
+    with _lock_registro:
+        return [_registro[nombre] for nombre in sorted(_registro)]
+
+
+# ──────────────── CACHÉS ────────────────
+
+ACIERTOS_CACHE = contador("cache_aciertos_total", "Lecturas servidas desde una caché")
+FALLOS_CACHE = contador("cache_fallos_total", "Lecturas que tuvieron que cargar o generar el contenido")
+
+
+def registrar_acceso_cache(cache: str, acierto: bool) -> None:
+    """Cuenta una lectura de la caché indicada como acierto o fallo."""
+    (ACIERTOS_CACHE if acierto else FALLOS_CACHE).incrementar(cache=cache)
+
+
+def _tasas_aciertos() -> Dict[Etiquetas, float]:
+    aciertos, fallos = ACIERTOS_CACHE.valores(), FALLOS_CACHE.valores()
+    return {
+        clave: aciertos.get(clave, 0) / (aciertos.get(clave, 0) + fallos.get(clave, 0))
+        for clave in set(aciertos) | set(fallos)
+    }
+
+
+medidor("cache_tasa_aciertos", "Proporción de lecturas servidas desde la caché", _tasas_aciertos)
+
+
+# ──────────────── FORMATO PROMETHEUS ────────────────
+
+def _numero(valor: float) -> str:
+    if math.isinf(valor):
+        return "+Inf" if valor > 0 else "-Inf"
+    return repr(float(valor)) if not float(valor).is_integer() else str(int(valor))
+
+
+def _escapar(valor: str) -> str:
+    return valor.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _etiquetas(etiquetas: Etiquetas, extra: Etiquetas = ()) -> str:
+    pares = etiquetas + extra
+    if not pares:
+        return ""
+    return "{" + ",".join(f'{k}="{_escapar(v)}"' for k, v in pares) + "}"
+
+
+def _renderizar(instantanea: Dict[str, dict]) -> str:
+    lineas = []
+    for nombre in sorted(instantanea):
+        metrica = instantanea[nombre]
+        descripcion = metrica["descripcion"].replace("\\", "\\\\").replace("\n", "\\n")
+        lineas.append(f"# HELP {nombre} {descripcion}")
+        lineas.append(f"# TYPE {nombre} {metrica['tipo']}")
+        if metrica["tipo"] == Histograma.tipo:
+            for etiquetas, (acumulados, suma, total) in sorted(metrica["series"].items()):
+                for limite, acumulado in zip(metrica["buckets"], acumulados):
+                    lineas.append(f"{nombre}_bucket{_etiquetas(etiquetas, (('le', _numero(limite)),))} {acumulado}")
+                lineas.append(f"{nombre}_bucket{_etiquetas(etiquetas, (('le', '+Inf'),))} {total}")
+                lineas.append(f"{nombre}_sum{_etiquetas(etiquetas)} {_numero(suma)}")
+                lineas.append(f"{nombre}_count{_etiquetas(etiquetas)} {total}")
+        else:
+            for etiquetas, valor in sorted(metrica["series"].items()):
+                lineas.append(f"{nombre}{_etiquetas(etiquetas)} {_numero(valor)}")
+    return "\n".join(lineas) + "\n"
+
+
+def _instantanea() -> Dict[str, dict]:
+    """Valores actuales de las métricas de este proceso, por nombre."""
+    instantanea = {}
+    for metrica in metricas_registradas():
+        instantanea[metrica.nombre] = {
+            "tipo": metrica.tipo,
+            "descripcion": metrica.descripcion,
+            "buckets": list(metrica.buckets) if isinstance(metrica, Histograma) else None,
+            "series": metrica.series() if isinstance(metrica, Histograma) else metrica.valores(),
+        }
+    return instantanea
+
+
+def exponer_prometheus() -> str:
+    """
+    Retorna las métricas en el formato de texto de Prometheus (0.0.4).
+
+    Sin `METRICAS_DIR_MULTIPROCESO` son las de este proceso. Con él, se suman los
+    contadores e histogramas volcados por todos los workers (también los que ya
+    terminaron, para que los totales no retrocedan), y los medidores de los workers
+    vivos se exponen por separado con la etiqueta `pid`. Los valores de los otros
+    workers tienen hasta `METRICAS_VOLCADO_SEGUNDOS` de retraso.
+    """
+    if not METRICAS_DIR_MULTIPROCESO:
+        return _renderizar(_instantanea())
+    volcar_metricas()
+    return _renderizar(_agregar_volcados())
+
+
+# ──────────────── AGREGACIÓN ENTRE WORKERS ────────────────
+
+def _ruta_volcado(pid: int) -> str:
+    return os.path.join(METRICAS_DIR_MULTIPROCESO, f"metricas_{pid}.json")
+
+
+def volcar_metricas() -> None:
+    """Escribe las métricas de este proceso en el directorio compartido (reemplazo atómico)."""
+    serializable = {
+        nombre: {**metrica, "series": [[list(map(list, k)), v] for k, v in metrica["series"].items()]}
+        for nombre, metrica in _instantanea().items()
+    }
+    ruta = _ruta_volcado(os.getpid())
+    os.makedirs(METRICAS_DIR_MULTIPROCESO, exist_ok=True)
+    with open(f"{ruta}.tmp", "w", encoding="utf-8") as archivo:
+        json.dump(serializable, archivo)
+    os.replace(f"{ruta}.tmp", ruta)
+
+
+def _agregar_volcados() -> Dict[str, dict]:
+    """Combina los volcados de todos los workers del directorio compartido."""
+    agregado: Dict[str, dict] = {}
+    vigencia = time.time() - 3 * METRICAS_VOLCADO_SEGUNDOS
+    for nombre_archivo in sorted(os.listdir(METRICAS_DIR_MULTIPROCESO)):
+        if not (nombre_archivo.startswith("metricas_") and nombre_archivo.endswith(".json")):
+            continue
+        ruta = os.path.join(METRICAS_DIR_MULTIPROCESO, nombre_archivo)
+        try:
+            vivo = os.path.getmtime(ruta) >= vigencia
+            with open(ruta, encoding="utf-8") as archivo:
+                volcado = json.load(archivo)
+        except (OSError, ValueError):
+            # El worker lo está reemplazando o ya se limpió: se toma en el próximo scrape
+            continue
+        pid = nombre_archivo[len("metricas_"):-len(".json")]
+
+        for nombre, metrica in volcado.items():
+            destino = agregado.setdefault(nombre, {**metrica, "series": {}})
+            if destino["tipo"] != metrica["tipo"] or destino["buckets"] != metrica["buckets"]:
+                # Volcado de otra versión de la aplicación con la métrica definida distinto
+                continue
+            for etiquetas, valor in metrica["series"]:
+                clave = tuple(tuple(par) for par in etiquetas)
+                if metrica["tipo"] == Medidor.tipo:
+                    if vivo:
+                        destino["series"][clave + (("pid", pid),)] = valor
+                elif metrica["tipo"] == Histograma.tipo:
+                    acumulados, suma, total = destino["series"].get(clave) or ([0] * len(valor[0]), 0.0, 0)
+                    destino["series"][clave] = (
+                        [a + b for a, b in zip(acumulados, valor[0])], suma + valor[1], total + valor[2]
+                    )
+                else:
+                    destino["series"][clave] = destino["series"].get(clave, 0) + valor
+    return agregado
+
+
+_detener_volcado: Optional[threading.Event] = None
+
+
+def iniciar_volcado_metricas() -> None:
+    """Vuelca las métricas de este worker cada `METRICAS_VOLCADO_SEGUNDOS` (si hay directorio compartido)."""
+    global _detener_volcado
+    if not METRICAS_DIR_MULTIPROCESO or _detener_volcado is not None:
+        return
+    detener = _detener_volcado = threading.Event()
+
+    def volcar_periodicamente():
+        while not detener.wait(METRICAS_VOLCADO_SEGUNDOS):
+            try:
+                volcar_metricas()
+            except Exception:
+                logger.warning("No se pudieron volcar las métricas al directorio compartido", exc_info=True)
+
+    threading.Thread(target=volcar_periodicamente, name="metricas-volcado", daemon=True).start()
+
+
+def detener_volcado_metricas() -> None:
+    """Detiene el volcado periódico y escribe los valores finales del worker."""
+    global _detener_volcado
+    if _detener_volcado is None:
+        return
+    _detener_volcado.set()
+    _detener_volcado = None
+    volcar_metricas()
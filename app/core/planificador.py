@@ -0,0 +1,181 @@
+"""
+Planificador de jobs periódicos con un único líder por clúster.
+
+Cada worker de la API crea un `Planificador`, pero solo el que obtiene el advisory
+lock `scheduler:lider` inicia el `BackgroundScheduler`. Los demás reintentan tomar el
+bloqueo cada `SCHEDULER_REINTENTO_LIDER_SEGUNDOS`: si el líder termina o pierde su
+conexión, PostgreSQL libera el bloqueo y otro worker toma su lugar.
+
+El líder comprueba cada `SCHEDULER_VERIFICACION_LIDER_SEGUNDOS` que sigue teniendo
+el bloqueo; si lo perdió (ej. se cortó su conexión), apaga su scheduler y vuelve a
+competir. Mientras lo detecta pueden coexistir dos schedulers, pero cada job corre
+bajo su propio advisory lock (`ejecutar_job_registrado`), de modo que un cambio de
+líder nunca produce dos ejecuciones simultáneas del mismo job.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from apscheduler.schedulers.background import BackgroundScheduler
+
+from app.core.bloqueos import BloqueoAsesor, bloqueo_asesor
+from app.core.metricas import contador, histograma
+from app.jobs.limpieza_candidatos import limpiar_candidatos_incompletos_job
+from app.jobs.limpieza_exportaciones import limpiar_exportaciones_expiradas_job
+from app.jobs.limpieza_idempotencia import limpiar_claves_idempotencia_job
+from app.models.ejecucion_job_model import EjecucionJob
+
+logger = logging.getLogger(__name__)
+
+# Permite desactivar el planificador en un worker (ej. réplicas solo de lectura)
+SCHEDULER_HABILITADO = os.getenv("SCHEDULER_HABILITADO", "true").lower() in ("1", "true", "si", "yes")
+
+# Segundos aleatorios que se suman a cada ejecución para que no coincidan entre jobs
+SCHEDULER_JITTER_SEGUNDOS = int(os.getenv("SCHEDULER_JITTER_SEGUNDOS", "300"))
+
+# Cada cuántos segundos un worker que no es líder vuelve a intentar serlo
+SCHEDULER_REINTENTO_LIDER_SEGUNDOS = int(os.getenv("SCHEDULER_REINTENTO_LIDER_SEGUNDOS", "60"))
+
+# Cada cuántos segundos el líder verifica que conserva el bloqueo
+SCHEDULER_VERIFICACION_LIDER_SEGUNDOS = int(os.getenv("SCHEDULER_VERIFICACION_LIDER_SEGUNDOS", "30"))
+
+# Nombre del advisory lock que identifica al líder
+NOMBRE_BLOQUEO_LIDER = "scheduler:lider"
+
+DURACION_JOBS = histograma(
+    "scheduler_job_duracion_segundos",
+    "Duración de las ejecuciones de los jobs programados",
+    (0.1, 0.5, 1, 5, 10, 30, 60, 300, 900),
+)
+EJECUCIONES_JOBS = contador(
+    "scheduler_job_ejecuciones_total", "Ejecuciones de los jobs programados por resultado"
+)
+
+
+@dataclass(frozen=True)
+class JobProgramado:
+    """
+    Job periódico: identificador, función y variable de entorno con su intervalo en horas.
+
+    La función retorna el registro de la ejecución (`ejecutar_job_registrado`), o None
+    si se omitió porque otro proceso tenía el bloqueo del job.
+    """
+    id: str
+    funcion: Callable[[], Optional[EjecucionJob]]
+    variable_intervalo: str
+    horas_por_defecto: float
+
+    @property
+    def horas(self) -> float:
+        return float(os.getenv(self.variable_intervalo, str(self.horas_por_defecto)))
+
+
+JOBS_PROGRAMADOS: List[JobProgramado] = [
+    JobProgramado("limpieza_candidatos_incompletos", limpiar_candidatos_incompletos_job,
+                  "INTERVALO_LIMPIEZA_CANDIDATOS_HORAS", 6),
+    JobProgramado("limpieza_exportaciones_expiradas", limpiar_exportaciones_expiradas_job,
+                  "INTERVALO_LIMPIEZA_EXPORTACIONES_HORAS", 1),
+    JobProgramado("limpieza_claves_idempotencia", limpiar_claves_idempotencia_job,
+                  "INTERVALO_LIMPIEZA_IDEMPOTENCIA_HORAS", 1),
+]
+
+
+def _medido(job: JobProgramado) -> Callable[[], None]:
+    """
+    Envuelve la función del job para registrar su duración y resultado en las métricas.
+
+    `ejecutar_job_registrado` captura los errores de la tarea y los deja en el estado
+    de la ejecución, así que el resultado sale de ese estado: FALLIDO es `error` y
+    una ejecución omitida por el bloqueo es `omitido`.
+    """
+    def ejecutar():
+        inicio = time.perf_counter()
+        resultado = "error"
+        try:
+            ejecucion = job.funcion()
+            if ejecucion is None:
+                resultado = "omitido"
+            elif ejecucion.estado != "FALLIDO":
+                resultado = "ok"
+        finally:
+            DURACION_JOBS.observar(time.perf_counter() - inicio, job=job.id)
+            EJECUCIONES_JOBS.incrementar(job=job.id, resultado=resultado)
+    return ejecutar
+
+
+def crear_scheduler(jobs: List[JobProgramado] = JOBS_PROGRAMADOS) -> BackgroundScheduler:
+    """
+    Crea el scheduler con los jobs indicados (sin iniciarlo).
+
+    Las ejecuciones atrasadas se agrupan en una sola (`coalesce`) y un job nunca se
+    solapa consigo mismo dentro del proceso (`max_instances=1`).
+    """
+    scheduler = BackgroundScheduler(job_defaults={"coalesce": True, "max_instances": 1})
+    for job in jobs:
+        scheduler.add_job(
+            _medido(job), "interval", id=job.id, name=job.id, hours=job.horas, jitter=SCHEDULER_JITTER_SEGUNDOS
+        )
+    return scheduler
+
+
+class Planificador:
+    """
+    Ejecuta los jobs programados solo mientras este proceso sea el líder del clúster.
+
+    `iniciar()` lanza un hilo que intenta obtener el liderazgo; `detener()` apaga el
+    scheduler (si estaba corriendo), libera el bloqueo y espera al hilo.
+    """
+
+    def __init__(self, jobs: List[JobProgramado] = JOBS_PROGRAMADOS):
+        self.jobs = jobs
+        self.scheduler: Optional[BackgroundScheduler] = None
+        self._detener = threading.Event()
+        self._hilo: Optional[threading.Thread] = None
+
+    @property
+    def es_lider(self) -> bool:
+        return self.scheduler is not None and self.scheduler.running
+
+    def iniciar(self) -> None:
+        """Inicia el hilo de elección de líder."""
+        if not SCHEDULER_HABILITADO or self._hilo is not None:
+            return
+        self._hilo = threading.Thread(target=self._ejecutar, name="planificador-lider", daemon=True)
+        self._hilo.start()
+
+    def detener(self, timeout: float = 10) -> None:
+        """Detiene el scheduler y libera el liderazgo."""
+        self._detener.set()
+        if self._hilo is not None:
+            self._hilo.join(timeout)
+            self._hilo = None
+
+    def _ejecutar(self) -> None:
+        while not self._detener.is_set():
+            try:
+                with bloqueo_asesor(NOMBRE_BLOQUEO_LIDER) as bloqueo:
+                    if bloqueo:
+                        self._liderar(bloqueo)
+            except Exception:
+                logger.exception("Error en la elección de líder del planificador")
+            self._detener.wait(SCHEDULER_REINTENTO_LIDER_SEGUNDOS)
+
+    def _liderar(self, bloqueo: BloqueoAsesor) -> None:
+        """Corre el scheduler hasta que se pida detener el planificador o se pierda el bloqueo."""
+        self.scheduler = crear_scheduler(self.jobs)
+        self.scheduler.start()
+        logger.info(f"Planificador iniciado como líder en el proceso {os.getpid()}")
+        try:
+            while not self._detener.wait(SCHEDULER_VERIFICACION_LIDER_SEGUNDOS):
+                if not bloqueo.vigente():
+                    logger.warning(f"El proceso {os.getpid()} perdió el liderazgo del planificador")
+                    break
+        finally:
+            # Sin esperar a los jobs en curso: su advisory lock propio evita que el
+            # siguiente líder los repita mientras terminan.
+            self.scheduler.shutdown(wait=False)
+            self.scheduler = None
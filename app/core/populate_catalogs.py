@@ -1,7 +1,32 @@
 # app/core/populate_catalogs.py
+"""
+Carga de los 15 catálogos desde los CSV de `app/data/` (o `CATALOGOS_DATA_DIR`).
+
+Se ejecuta una sola vez por despliegue con `python -m app.cli.cargar_catalogos`, no
+al iniciar los workers. Cada archivo se procesa en su propia transacción:
+
+- Si su checksum coincide con el de la última carga (tabla `semillas_catalogos`),
+  se omite sin leer la tabla.
+- Si no, se insertan en bloque solo las filas que aún no existen (comparando el
+  nombre sin mayúsculas): con `COPY` cuando la tabla está vacía y con
+  `INSERT ... ON CONFLICT DO NOTHING` en otro caso.
+"""
+
 import csv
+import hashlib
+import io
 import os
-from app.core.database import SessionLocal
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+
+from app.core.bloqueos import bloqueo_asesor
+from app.core.database import engine
 from app.models.catalogs import (
     Departamento,
     Ciudad,
@@ -12,7 +37,7 @@ from app.models.catalogs import (
     InstitucionAcademica,
     NivelIngles,
     RangoExperiencia,
-)  # y los demás catálogos...
+)
 from app.models import (
     MotivoSalida,
     HabilidadBlanda,
@@ -20,361 +45,240 @@ from app.models import (
     Herramienta,
     Disponibilidad,
     RangoSalarial,
+    SemillaCatalogo,
 )
+from app.models.version_datos_model import incrementar_version_datos
+from app.utils.carga_masiva import copiar_filas
 
-# Rutas de archivos
-BASE_DIR = os.path.dirname(__file__)
-DEPTOS_CSV = os.path.join(BASE_DIR, "../data/departamentos.csv")
-CIUDADES_CSV = os.path.join(BASE_DIR, "../data/ciudades.csv")
-CARGOS_CSV = os.path.join(BASE_DIR, "../data/cargos-ofrecidos.csv")
-CENTROS_CSV = os.path.join(BASE_DIR, "../data/centros-costos.csv")
-MOTIVOS_CSV = os.path.join(BASE_DIR, "../data/motivos-salida.csv")
-NIVEL_EDU_CSV = os.path.join(BASE_DIR, "../data/nivel-educacion.csv")
-TITULOS_CSV = os.path.join(BASE_DIR, "../data/titulos.csv")
-INSTITUCION_CSV = os.path.join(BASE_DIR, "../data/instituciones.csv")
-NIVE_INGLES_CSV = os.path.join(BASE_DIR, "../data/nivel-ingles.csv")
-RANGOS_EXP_CSV = os.path.join(BASE_DIR, "../data/rangos-experiencia.csv")
-HAB_TEC_CSV = os.path.join(BASE_DIR, "../data/habilidades-tecnicas.csv")
-HAB_BLAN_CSV = os.path.join(BASE_DIR, "../data/habilidades-blandas.csv")
-HERRAMIENTAS_CSV = os.path.join(BASE_DIR, "../data/herramientas.csv")
-DISPONIBILIDAD_CSV = os.path.join(BASE_DIR, "../data/disponibilidad.csv")
-RANGO_SALARIAL_CSV = os.path.join(BASE_DIR, "../data/rangos-salariales.csv")
-
-"""
-Función que inserta los catalogos (Son 15 catálogos)
-"""
-def cargar_catalogos():
-    db = SessionLocal()
-    try:
-        insertar_departamentos(db)
-        insertar_ciudades(db)
-        insertar_cargos_ofrecidos(db)
-        insertar_centros_costos(db)
-        insertar_motivos_salida(db)
-        insertar_nivel_educacion(db)
-        insertar_titulos_obtenidos(db)
-        insertar_instituciones(db)
-        insertar_niveles_ingles(db)
-        insertar_rangos_experiencia(db)
-        insertar_habilidades_blandas(db)
-        insertar_habilidades_tecnicas(db)
-        insertar_herramientas(db)
-        insertar_disponibilidades(db)
-        insertar_rangos_salariales(db)
-    finally:
-        db.close()
-
-
-# -----------------------------
-# FUNCIONES MODULARES POR CATÁLOGO
-# -----------------------------
-
-
-def insertar_departamentos(db):
-    if db.query(Departamento).count() == 0:
-        print("✅ Insertando departamentos desde CSV...")
-        with open(DEPTOS_CSV, mode="r", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
-            departamentos = [
-                Departamento(nombre_departamento=row["nombre_departamento"])
-                for row in reader
-            ]
-        db.add_all(departamentos)
-        db.commit()
-        print(f"✅ {len(departamentos)} departamentos insertados.")
-    else:
-        print("ℹ️ Departamentos ya existen. No se insertó nada.")
-
-
-def insertar_ciudades(db):
-    if db.query(Ciudad).count() == 0:
-        print("✅ Insertando ciudades desde CSV...")
-        with open(CIUDADES_CSV, mode="r", encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file, delimiter=";")
-            ciudades = []
-            for row in reader:
-                departamento = (
-                    db.query(Departamento)
-                    .filter_by(nombre_departamento=row["nombre_departamento"])
-                    .first()
-                )
-                if departamento:
-                    ciudad = Ciudad(
-                        nombre_ciudad=row["nombre_ciudad"],
-                        id_departamento=departamento.id_departamento,
-                    )
-                    ciudades.append(ciudad)
-                else:
-                    print(
-                        f"⚠️ Departamento no encontrado: {row['nombre_departamento']} (ciudad: {row['nombre_ciudad']})"
-                    )
-        db.add_all(ciudades)
-        db.commit()
-        print(f"✅ {len(ciudades)} ciudades insertadas.")
-    else:
-        print("ℹ️ Ciudades ya existen. No se insertó nada.")
-
-
-def insertar_cargos_ofrecidos(db):
-    if db.query(CargoOfrecido).count() == 0:
-        print("✅ Insertando cargos ofrecidos desde CSV...")
-
-        with open(CARGOS_CSV, mode="r", encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file, delimiter=";")  # o "," si usaste coma
-            cargos = [
-                CargoOfrecido(nombre_cargo=row["nombre_cargo"].strip())
-                for row in reader
-            ]
-
-        db.add_all(cargos)
-        db.commit()
-        print(f"✅ Se insertaron {len(cargos)} cargos ofrecidos.")
-    else:
-        print("ℹ️ La tabla 'cargos_ofrecidos' ya contiene datos. No se insertó nada.")
-
-
-def insertar_centros_costos(db):
-    if db.query(CentroCostos).count() == 0:
-        print("✅ Insertando centros de costos desde CSV...")
-
-        with open(CENTROS_CSV, mode="r", encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file, delimiter=";")  # o "," si usaste coma
-            centros = [
-                CentroCostos(nombre_centro_costos=row["nombre_centro_costos"].strip())
-                for row in reader
-            ]
-
-        db.add_all(centros)
-        db.commit()
-        print(f"✅ Se insertaron {len(centros)} Centros de Costos.")
-    else:
-        print("ℹ️ La tabla 'centros_costos' ya contiene datos. No se insertó nada.")
-
-
-def insertar_motivos_salida(db):
-    if db.query(MotivoSalida).count() == 0:
-        print("✅ Insertando motivos de salida desde CSV...")
-
-        with open(MOTIVOS_CSV, mode="r", encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file, delimiter=";")  # o "," si usaste coma
-            motivos = [
-                MotivoSalida(descripcion_motivo=row["descripcion_motivo"].strip())
-                for row in reader
-            ]
-
-        db.add_all(motivos)
-        db.commit()
-        print(f"✅ Se insertaron {len(motivos)} Motivos de Salida.")
-    else:
-        print("ℹ️ La tabla 'motivos_salida' ya contiene datos. No se insertó nada.")
-
-
-# -----------------------------
-# CATÁLOGOS DE EDUCACIÓN
-# -----------------------------
-def insertar_nivel_educacion(db):
-    if db.query(NivelEducacion).count() == 0:
-        print("✅ Insertando niveles de educación desde CSV...")
-
-        with open(NIVEL_EDU_CSV, mode="r", encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file, delimiter=";")  # o "," si usaste coma
-            nivel = [
-                NivelEducacion(descripcion_nivel=row["descripcion_nivel"].strip())
-                for row in reader
-            ]
-
-        db.add_all(nivel)
-        db.commit()
-        print(f"✅ Se insertaron {len(nivel)} niveles de educación.")
-    else:
-        print("ℹ️ La tabla 'nivel_educacion' ya contiene datos. No se insertó nada.")
-
-
-def insertar_titulos_obtenidos(db):
-    if db.query(TituloObtenido).count() == 0:
-        print("✅ Insertando títulos obtenidos desde CSV...")
-
-        with open(TITULOS_CSV, mode="r", encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file, delimiter=";")
-            titulos = []
-            print("Encabezados detectados:", reader.fieldnames)
-            for row in reader:
-                nivel = (
-                    db.query(NivelEducacion)
-                    .filter_by(descripcion_nivel=row["descripcion_nivel"])
-                    .first()
-                )
-                if nivel:
-                    titulo = TituloObtenido(
-                        nombre_titulo=row["nombre_titulo"].strip(),
-                        id_nivel_educacion=nivel.id_nivel_educacion,
-                    )
-                    titulos.append(titulo)
-                else:
-                    print(
-                        f"⚠️ Nivel educativo no encontrado: {row['descripcion_nivel']} (título: {row['nombre_titulo']})"
-                    )
-
-        db.add_all(titulos)
-        db.commit()
-        print(f"✅ {len(titulos)} títulos insertados.")
-    else:
-        print("ℹ️ La tabla 'titulos_obtenidos' ya contiene datos. No se insertó nada.")
-
-
-def insertar_instituciones(db):
-    if db.query(InstitucionAcademica).count() == 0:
-        print("✅ Insertando instituciones desde CSV...")
+# Directorio de los CSV de catálogos
+DATA_DIR = os.getenv(
+    "CATALOGOS_DATA_DIR", os.path.join(os.path.dirname(__file__), "..", "data")
+)
 
-        with open(INSTITUCION_CSV, mode="r", encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file, delimiter=";")  # o "," si usaste coma
-            institucion = [
-                InstitucionAcademica(
-                    nombre_institucion=row["nombre_institucion"].strip()
+# Nombre del advisory lock que evita dos cargas simultáneas
+NOMBRE_BLOQUEO = "carga_catalogos"
+
+
+@dataclass(frozen=True)
+class Referencia:
+    """Columna FK que se resuelve por nombre (ej. la ciudad llega con el nombre de su departamento)."""
+    columna: str
+    modelo: type
+    columna_nombre: str
+    encabezado: str
+
+
+@dataclass(frozen=True)
+class CatalogoCSV:
+    """
+    Archivo CSV de un catálogo.
+
+    `columnas` asocia cada columna del modelo con su encabezado en el CSV; la primera
+    es el nombre del elemento, que junto con la referencia (si hay) identifica la fila.
+    """
+    modelo: type
+    archivo: str
+    columnas: Dict[str, str]
+    delimitador: str = ";"
+    codificacion: str = "utf-8-sig"
+    referencia: Optional[Referencia] = None
+
+
+@dataclass
+class ResultadoCarga:
+    """Resultado de cargar un archivo de catálogo."""
+    archivo: str
+    estado: str  # 'cargado', 'sin_cambios' o 'sin_archivo'
+    insertadas: int
+    duracion_ms: int
+
+
+# Orden de carga: los catálogos referenciados van antes que los que los referencian
+CATALOGOS_CSV: List[CatalogoCSV] = [
+    CatalogoCSV(Departamento, "departamentos.csv", {"nombre_departamento": "nombre_departamento"},
+                delimitador=",", codificacion="utf-8"),
+    CatalogoCSV(Ciudad, "ciudades.csv", {"nombre_ciudad": "nombre_ciudad"},
+                referencia=Referencia("id_departamento", Departamento, "nombre_departamento", "nombre_departamento")),
+    CatalogoCSV(CargoOfrecido, "cargos-ofrecidos.csv", {"nombre_cargo": "nombre_cargo"}),
+    CatalogoCSV(CentroCostos, "centros-costos.csv", {"nombre_centro_costos": "nombre_centro_costos"}),
+    CatalogoCSV(MotivoSalida, "motivos-salida.csv", {"descripcion_motivo": "descripcion_motivo"}),
+    CatalogoCSV(NivelEducacion, "nivel-educacion.csv", {"descripcion_nivel": "descripcion_nivel"}),
+    CatalogoCSV(TituloObtenido, "titulos.csv", {"nombre_titulo": "nombre_titulo"},
+                referencia=Referencia("id_nivel_educacion", NivelEducacion, "descripcion_nivel", "descripcion_nivel")),
+    CatalogoCSV(InstitucionAcademica, "instituciones.csv", {"nombre_institucion": "nombre_institucion"}),
+    CatalogoCSV(NivelIngles, "nivel-ingles.csv", {"nivel": "nivel"}),
+    CatalogoCSV(RangoExperiencia, "rangos-experiencia.csv", {"descripcion_rango": "descripcion_rango"}),
+    CatalogoCSV(HabilidadBlanda, "habilidades-blandas.csv", {"nombre_habilidad_blanda": "nombre_habilidad_blanda"}),
+    CatalogoCSV(HabilidadTecnica, "habilidades-tecnicas.csv", {"nombre_habilidad_tecnica": "nombre_habilidad_tecnica"}),
+    CatalogoCSV(Herramienta, "herramientas.csv", {"nombre_herramienta": "nombre_herramienta"}),
+    CatalogoCSV(Disponibilidad, "disponibilidad.csv", {"descripcion_disponibilidad": "descripcion_disponibilidad"}),
+    CatalogoCSV(RangoSalarial, "rangos-salariales.csv", {"descripcion_rango": "descripcion_rango"}),
+]
+
+
+# ──────────────── LECTURA DE ARCHIVOS ────────────────
+
+def _leer_filas(catalogo: CatalogoCSV, contenido: bytes) -> List[Dict[str, str]]:
+    """Lee las filas del CSV con los encabezados del catálogo, sin espacios sobrantes."""
+    texto = io.StringIO(contenido.decode(catalogo.codificacion))
+    filas = []
+    for row in csv.DictReader(texto, delimiter=catalogo.delimitador):
+        fila = {columna: (row.get(encabezado) or "").strip() for columna, encabezado in catalogo.columnas.items()}
+        if catalogo.referencia:
+            fila[catalogo.referencia.encabezado] = (row.get(catalogo.referencia.encabezado) or "").strip()
+        filas.append(fila)
+    return filas
+
+
+def _clave(nombre: str, referencia: Optional[int] = None) -> Tuple[str, Optional[int]]:
+    return nombre.strip().lower(), referencia
+
+
+# ──────────────── CARGA POR CATÁLOGO ────────────────
+
+def _filas_nuevas(conexion: Connection, catalogo: CatalogoCSV, filas: List[Dict[str, str]]) -> List[Dict]:
+    """
+    Resuelve las referencias por nombre y descarta las filas vacías, repetidas en el
+    archivo o ya existentes en la tabla.
+    """
+    tabla = catalogo.modelo.__table__
+    columna_nombre = next(iter(catalogo.columnas))
+    referencia = catalogo.referencia
+
+    ids_referencia: Dict[str, int] = {}
+    if referencia:
+        tabla_ref = referencia.modelo.__table__
+        id_ref = list(tabla_ref.primary_key.columns)[0]
+        ids_referencia = {
+            nombre.strip().lower(): id_
+            for id_, nombre in conexion.execute(select(id_ref, tabla_ref.c[referencia.columna_nombre]))
+        }
+
+    columnas_clave = [tabla.c[columna_nombre]] + ([tabla.c[referencia.columna]] if referencia else [])
+    existentes = {_clave(*fila) for fila in conexion.execute(select(*columnas_clave))}
+
+    nuevas = []
+    for fila in filas:
+        if not fila[columna_nombre]:
+            continue
+        valores = {columna: fila[columna] for columna in catalogo.columnas}
+        id_ref = None
+        if referencia:
+            id_ref = ids_referencia.get(fila[referencia.encabezado].lower())
+            if id_ref is None:
+                print(
+                    f"⚠️ {referencia.modelo.__tablename__} no encontrado: "
+                    f"{fila[referencia.encabezado]} ({catalogo.archivo}: {fila[columna_nombre]})"
                 )
-                for row in reader
-            ]
-
-        db.add_all(institucion)
-        db.commit()
-        print(f"✅ Se insertaron {len(institucion)} instituciones.")
-    else:
-        print(
-            "ℹ️ La tabla 'instituciones_academicas' ya contiene datos. No se insertó nada."
-        )
-
-
-def insertar_niveles_ingles(db):
-    if db.query(NivelIngles).count() == 0:
-        print("✅ Insertando niveles de ingles desde CSV...")
-
-        with open(NIVE_INGLES_CSV, mode="r", encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file, delimiter=";")  # o "," si usaste coma
-            niveles = [NivelIngles(nivel=row["nivel"].strip()) for row in reader]
-
-        db.add_all(niveles)
-        db.commit()
-        print(f"✅ Se insertaron {len(niveles)} niveles de ingles.")
-    else:
-        print("ℹ️ La tabla 'nivel_ingles' ya contiene datos. No se insertó nada.")
-
-
-# -----------------------------
-# CATÁLOGOS DE EXPERIENCIA
-# -----------------------------
-
-
-def insertar_rangos_experiencia(db):
-    if db.query(RangoExperiencia).count() == 0:
-        print("✅ Insertando rangos de experiencia desde CSV...")
-
-        with open(RANGOS_EXP_CSV, mode="r", encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file, delimiter=";")  # o "," si usaste coma
-            rangos = [
-                RangoExperiencia(descripcion_rango=row["descripcion_rango"].strip())
-                for row in reader
-            ]
-
-        db.add_all(rangos)
-        db.commit()
-        print(f"✅ Se insertaron {len(rangos)} rangos de experiencia.")
-    else:
-        print("ℹ️ La tabla 'rangos_experiencia' ya contiene datos. No se insertó nada.")
-
-
-# -----------------------------
-# CATÁLOGOS DE CONOCIMIENTOS
-# -----------------------------
-
-def insertar_habilidades_tecnicas(db):
-    if db.query(HabilidadTecnica).count() == 0:
-        print("✅ Insertando habilidades técnicas desde CSV...")
-
-        with open(HAB_TEC_CSV, mode="r", encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file, delimiter=";")  # o "," si usaste coma
-            habilidades = [
-                HabilidadTecnica(nombre_habilidad_tecnica=row["nombre_habilidad_tecnica"].strip())
-                for row in reader
-            ]
-
-        db.add_all(habilidades)
-        db.commit()
-        print(f"✅ Se insertaron {len(habilidades)} habilidades técnicas.")
-    else:
-        print("ℹ️ La tabla 'habilidades_tecnicas' ya contiene datos. No se insertó nada.")
-
-
-def insertar_habilidades_blandas(db):
-    if db.query(HabilidadBlanda).count() == 0:
-        print("✅ Insertando habilidades blandas desde CSV...")
-
-        with open(HAB_BLAN_CSV, mode="r", encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file, delimiter=";")  # o "," si usaste coma
-            habilidades = [
-                HabilidadBlanda(nombre_habilidad_blanda=row["nombre_habilidad_blanda"].strip())
-                for row in reader
-            ]
-
-        db.add_all(habilidades)
-        db.commit()
-        print(f"✅ Se insertaron {len(habilidades)} habilidades blandas.")
-    else:
-        print("ℹ️ La tabla 'habilidades_blandas' ya contiene datos. No se insertó nada.")
-        
-        
-def insertar_herramientas(db):
-    if db.query(Herramienta).count() == 0:
-        print("✅ Insertando herramientas desde CSV...")
-
-        with open(HERRAMIENTAS_CSV, mode="r", encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file, delimiter=";")  # o "," si usaste coma
-            herramientas = [
-                Herramienta(nombre_herramienta=row["nombre_herramienta"].strip())
-                for row in reader
-            ]
-
-        db.add_all(herramientas)
-        db.commit()
-        print(f"✅ Se insertaron {len(herramientas)} herramientas.")
-    else:
-        print("ℹ️ La tabla 'herramientas' ya contiene datos. No se insertó nada.")
-
-# -----------------------------
-# CATÁLOGOS DE PREFERENCIAS
-# -----------------------------
-
-def insertar_disponibilidades(db):
-    if db.query(Disponibilidad).count() == 0:
-        print("✅ Insertando disponibilidades desde CSV...")
-
-        with open(DISPONIBILIDAD_CSV, mode="r", encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file, delimiter=";")  # o "," si usaste coma
-            disponibilidad = [
-                Disponibilidad(descripcion_disponibilidad=row["descripcion_disponibilidad"].strip())
-                for row in reader
-            ]
-
-        db.add_all(disponibilidad)
-        db.commit()
-        print(f"✅ Se insertaron {len(disponibilidad)} disponibilidades.")
+                continue
+            valores[referencia.columna] = id_ref
+
+        clave = _clave(fila[columna_nombre], id_ref)
+        if clave in existentes:
+            continue
+        existentes.add(clave)
+        nuevas.append(valores)
+    return nuevas
+
+
+def _insertar(conexion: Connection, catalogo: CatalogoCSV, filas: List[Dict], tabla_vacia: bool) -> None:
+    """Inserta las filas con COPY si la tabla está vacía, o con ON CONFLICT DO NOTHING si no."""
+    tabla = catalogo.modelo.__table__
+    if tabla_vacia:
+        copiar_filas(conexion, tabla, filas)
+        return
+
+    nombre_dialecto = conexion.dialect.name
+    if nombre_dialecto in ("postgresql", "sqlite"):
+        insert = postgresql.insert if nombre_dialecto == "postgresql" else sqlite.insert
+        conexion.execute(insert(tabla).on_conflict_do_nothing(), filas)
     else:
-        print("ℹ️ La tabla 'disponibilidades' ya contiene datos. No se insertó nada.")
-        
-        
-
-def insertar_rangos_salariales(db):
-    if db.query(RangoSalarial).count() == 0:
-        print("✅ Insertando rangos salariales desde CSV...")
-
-        with open(RANGO_SALARIAL_CSV, mode="r", encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file, delimiter=";")  # o "," si usaste coma
-            rangos = [
-                RangoSalarial(descripcion_rango=row["descripcion_rango"].strip())
-                for row in reader
-            ]
-
-        db.add_all(rangos)
-        db.commit()
-        print(f"✅ Se insertaron {len(rangos)} rangos salarialess.")
+        conexion.execute(tabla.insert(), filas)
+
+
+def cargar_catalogo(
+    conexion: Connection, catalogo: CatalogoCSV, directorio: str = DATA_DIR, forzar: bool = False
+) -> ResultadoCarga:
+    """
+    Carga un archivo de catálogo si cambió desde la última carga.
+
+    Args:
+        conexion (Connection): Conexión dentro de una transacción.
+        catalogo (CatalogoCSV): Catálogo a cargar.
+        directorio (str): Directorio de los CSV.
+        forzar (bool): Procesa el archivo aunque su checksum no haya cambiado.
+
+    Returns:
+        ResultadoCarga: Estado, filas insertadas y duración.
+    """
+    inicio = time.perf_counter()
+    ruta = os.path.join(directorio, catalogo.archivo)
+
+    def _resultado(estado: str, insertadas: int = 0) -> ResultadoCarga:
+        return ResultadoCarga(catalogo.archivo, estado, insertadas, int((time.perf_counter() - inicio) * 1000))
+
+    if not os.path.exists(ruta):
+        print(f"⚠️ No se encontró {ruta}. Se omite {catalogo.modelo.__tablename__}.")
+        return _resultado("sin_archivo")
+
+    with open(ruta, "rb") as archivo:
+        contenido = archivo.read()
+    checksum = hashlib.sha256(contenido).hexdigest()
+
+    semillas = SemillaCatalogo.__table__
+    anterior = conexion.execute(
+        select(semillas.c.checksum).where(semillas.c.archivo == catalogo.archivo)
+    ).scalar()
+    if anterior == checksum and not forzar:
+        return _resultado("sin_cambios")
+
+    tabla = catalogo.modelo.__table__
+    tabla_vacia = conexion.execute(select(func.count()).select_from(tabla)).scalar() == 0
+    nuevas = _filas_nuevas(conexion, catalogo, _leer_filas(catalogo, contenido))
+    if nuevas:
+        _insertar(conexion, catalogo, nuevas, tabla_vacia)
+
+    valores = {
+        "tabla": tabla.name,
+        "checksum": checksum,
+        "filas_insertadas": len(nuevas),
+        "fecha_carga": datetime.now(),
+    }
+    if anterior is None:
+        conexion.execute(semillas.insert().values(archivo=catalogo.archivo, **valores))
     else:
-        print("ℹ️ La tabla 'rangos_salariales' ya contiene datos. No se insertó nada.")
+        conexion.execute(semillas.update().where(semillas.c.archivo == catalogo.archivo).values(**valores))
+    return _resultado("cargado", len(nuevas))
+
+
+def cargar_catalogos(directorio: str = DATA_DIR, forzar: bool = False) -> List[ResultadoCarga]:
+    """
+    Carga todos los catálogos, cada archivo en su propia transacción.
+
+    Args:
+        directorio (str): Directorio de los CSV.
+        forzar (bool): Procesa todos los archivos aunque no hayan cambiado.
+
+    Returns:
+        List[ResultadoCarga]: Resultado por archivo (vacío si otra carga está en curso).
+    """
+    with bloqueo_asesor(NOMBRE_BLOQUEO) as adquirido:
+        if not adquirido:
+            print("ℹ️ Otra carga de catálogos está en curso. No se hizo nada.")
+            return []
+
+        resultados = []
+        for catalogo in CATALOGOS_CSV:
+            with engine.begin() as conexion:
+                resultado = cargar_catalogo(conexion, catalogo, directorio, forzar)
+            resultados.append(resultado)
+            print(
+                f"{catalogo.modelo.__tablename__}: {resultado.estado}, "
+                f"{resultado.insertadas} filas ({resultado.duracion_ms} ms)"
+            )
+
+        # Una sola invalidación de los reportes en caché, después de confirmar las cargas
+        if any(resultado.insertadas for resultado in resultados):
+            with engine.begin() as conexion:
+                incrementar_version_datos(conexion)
+        return resultados
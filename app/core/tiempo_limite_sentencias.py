@@ -0,0 +1,185 @@
+"""
+Tiempo máximo por sentencia SQL (`statement_timeout` de PostgreSQL) según la clase de ruta.
+
+Las rutas del formulario público y los catálogos deben responder rápido; las
+exportaciones y las operaciones masivas (importación, eliminación por lotes) pueden
+tardar minutos. El middleware guarda la petición en una variable de contexto y, al
+iniciar cada transacción de una sesión, se aplica `SET LOCAL statement_timeout` con
+el límite de la clase de la ruta (solo vale para esa transacción, no queda en la
+conexión del pool).
+
+La clase se decide por método y plantilla exacta de la ruta ya resuelta (ej.
+`PUT /candidatos/{id_candidato}`), no por prefijo: bajo `/candidatos` conviven el
+formulario, los listados administrativos y la importación masiva. Lo que no está en
+ninguna lista es 'general'.
+
+Fuera de una petición (jobs, CLI) no se fija ninguna clase y rige el valor del servidor.
+"""
+
+import os
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Límite (ms) para el formulario público y los catálogos
+STATEMENT_TIMEOUT_FORMULARIO_MS = int(os.getenv("STATEMENT_TIMEOUT_FORMULARIO_MS", "5000"))
+
+# Límite (ms) para el resto de rutas (administración, estadísticas)
+STATEMENT_TIMEOUT_GENERAL_MS = int(os.getenv("STATEMENT_TIMEOUT_GENERAL_MS", "30000"))
+
+# Límite (ms) para importaciones y eliminaciones por lotes
+STATEMENT_TIMEOUT_LOTE_MS = int(os.getenv("STATEMENT_TIMEOUT_LOTE_MS", "600000"))
+
+# Límite (ms) para las exportaciones (Excel, PDF, CSV y trabajos en segundo plano)
+STATEMENT_TIMEOUT_EXPORTACION_MS = int(os.getenv("STATEMENT_TIMEOUT_EXPORTACION_MS", "600000"))
+
+TIEMPOS_LIMITE_MS = {
+    "formulario": STATEMENT_TIMEOUT_FORMULARIO_MS,
+    "general": STATEMENT_TIMEOUT_GENERAL_MS,
+    "lote": STATEMENT_TIMEOUT_LOTE_MS,
+    "exportacion": STATEMENT_TIMEOUT_EXPORTACION_MS,
+}
+
+# Prefijos de las plantillas de ruta de exportación (todas sus rutas son exportaciones)
+PREFIJOS_EXPORTACION = ("/reportes/exportar", "/reportes/exportaciones")
+
+# Operaciones masivas de administración
+RUTAS_LOTE = {
+    ("POST", "/candidatos/importar"),
+    ("POST", "/candidatos/eliminar-lote"),
+    ("DELETE", "/candidatos/limpiar-incompletos"),
+    ("POST", "/solicitudes-eliminacion/eliminar-lote"),
+}
+
+# Catálogos que consume el formulario público
+_CATALOGOS_FORMULARIO = (
+    "/departamentos",
+    "/ciudades",
+    "/cargo-ofrecido",
+    "/centros-costos",
+    "/nivel-educacion",
+    "/titulos",
+    "/instituciones",
+    "/nivel-ingles",
+    "/rangos-experiencia",
+    "/conocimientos/habilidades-blandas",
+    "/conocimientos/habilidades-tecnicas",
+    "/conocimientos/herramientas",
+    "/disponibilidades",
+    "/rangos-salariales",
+    "/motivos-salida",
+)
+
+# Rutas del formulario público: sus secciones y las lecturas de catálogos
+RUTAS_FORMULARIO = {
+    # Secciones del formulario
+    ("POST", "/candidatos/"),
+    ("POST", "/candidatos/postulacion"),
+    ("GET", "/candidatos/{id_candidato}"),
+    ("PUT", "/candidatos/{id_candidato}"),
+    ("PUT", "/candidatos/{id_candidato}/completar"),
+    ("POST", "/educaciones/"),
+    ("PUT", "/educaciones/{id}"),
+    ("POST", "/experiencias/"),
+    ("PUT", "/experiencias/{id}"),
+    ("POST", "/conocimientos-candidato/"),
+    ("PUT", "/conocimientos-candidato/candidato/{id_candidato}"),
+    ("POST", "/preferencias/"),
+    ("PUT", "/preferencias/{id_candidato}"),
+    ("POST", "/solicitudes-eliminacion/"),
+    # Catálogos
+    ("GET", "/catalogos/bundle"),
+    ("GET", "/ciudades/departamento/{id_departamento}"),
+    ("GET", "/titulos/nivel/{id_nivel_educacion}"),
+    *(("GET", f"{catalogo}/todas") for catalogo in _CATALOGOS_FORMULARIO),
+    ("GET", "/ciudades/sugerencias"),
+    ("GET", "/cargo-ofrecido/sugerencias"),
+    ("GET", "/titulos/sugerencias"),
+    ("GET", "/instituciones/sugerencias"),
+}
+
+_clase_sentencias: ContextVar[Optional[str]] = ContextVar("clase_sentencias", default=None)
+_scope_peticion: ContextVar[Optional[dict]] = ContextVar("scope_peticion", default=None)
+
+
+def clase_de_ruta(metodo: str, plantilla: str) -> str:
+    """
+    Retorna la clase de límite de una ruta.
+
+    Args:
+        metodo (str): Método HTTP.
+        plantilla (str): Plantilla de la ruta (ej. `/candidatos/{id_candidato}`).
+
+    Returns:
+        str: 'formulario', 'general', 'lote' o 'exportacion'.
+    """
+    if plantilla.startswith(PREFIJOS_EXPORTACION):
+        return "exportacion"
+    if (metodo, plantilla) in RUTAS_LOTE:
+        return "lote"
+    if (metodo, plantilla) in RUTAS_FORMULARIO:
+        return "formulario"
+    return "general"
+
+
+def clase_actual() -> Optional[str]:
+    """
+    Clase de límite del contexto actual: la fijada explícitamente o, dentro de una
+    petición ya enrutada, la de su ruta. Antes del enrutamiento (ej. middlewares)
+    es 'general'; fuera de una petición, None.
+    """
+    clase = _clase_sentencias.get()
+    if clase is not None:
+        return clase
+    scope = _scope_peticion.get()
+    if scope is None:
+        return None
+    ruta = scope.get("route")
+    if ruta is None:
+        return "general"
+    return clase_de_ruta(scope["method"], ruta.path)
+
+
+def fijar_clase_sentencias(clase: str) -> None:
+    """
+    Fija la clase de límite en el contexto actual.
+
+    Pensado para hilos de trabajo (ej. `initializer` de un pool de hilos), que no
+    heredan la variable de contexto de la petición que los encoló.
+    """
+    _clase_sentencias.set(clase)
+
+
+class TiempoLimiteSentenciasMiddleware:
+    """
+    Middleware ASGI que deja la petición HTTP en contexto para decidir su clase de límite.
+
+    Guarda el `scope` (y no la clase) porque la ruta solo se conoce cuando el router
+    la resuelve, después de este middleware. Es ASGI puro (no `BaseHTTPMiddleware`)
+    para que la variable de contexto también esté presente mientras se envían las
+    respuestas en streaming.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _scope_peticion.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _scope_peticion.reset(token)
+
+
+@event.listens_for(Session, "after_begin")
+def _aplicar_tiempo_limite(session, transaction, connection):
+    """Aplica el límite de la clase actual a la transacción que empieza (solo PostgreSQL)."""
+    clase = clase_actual()
+    if clase is None or connection.dialect.name != "postgresql":
+        return
+    connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(TIEMPOS_LIMITE_MS[clase])}")
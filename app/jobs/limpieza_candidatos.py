@@ -1,21 +1,39 @@
 """Job programado para eliminar candidatos con formularios incompletos."""
 
-from datetime import datetime, timezone
+import logging
+from typing import Optional
 
-from app.core.database import SessionLocal
+from app.models.ejecucion_job_model import EjecucionJob
 from app.services.candidato_service import eliminar_candidatos_incompletos
+from app.services.ejecuciones_jobs_service import ejecutar_job_registrado
 
-def limpiar_candidatos_incompletos_job():
+logger = logging.getLogger(__name__)
+
+NOMBRE_JOB = "limpieza_candidatos_incompletos"
+
+
+def limpiar_candidatos_incompletos_job() -> Optional[EjecucionJob]:
     """
     Tarea programada que elimina periódicamente los candidatos con registros incompletos.
 
-    Utiliza una sesión de base de datos para ejecutar la función correspondiente
-    del servicio `eliminar_candidatos_incompletos`, e imprime el número de eliminados
-    con marca de tiempo UTC en consola.
+    La programa solo el worker líder (ver `app.core.planificador`) y además se ejecuta
+    bajo un advisory lock, por lo que nunca corre dos veces a la vez; cada ejecución
+    queda registrada en `ejecuciones_jobs` y su resultado en el log.
     """
-    db = SessionLocal()
-    try:
-        resultado = eliminar_candidatos_incompletos(db)
-        print(f"[{datetime.now(timezone.utc)}] Candidatos eliminados: {resultado['eliminados']}")
-    finally:
-        db.close()
+    ejecucion = ejecutar_job_registrado(
+        NOMBRE_JOB,
+        lambda db, registrar_avance: eliminar_candidatos_incompletos(
+            db, registrar_avance=registrar_avance
+        )["eliminados"],
+    )
+    if ejecucion:
+        logger.info(
+            "Candidatos incompletos eliminados",
+            extra={
+                "job": NOMBRE_JOB,
+                "estado": ejecucion.estado,
+                "filas_afectadas": ejecucion.filas_afectadas,
+                "duracion_ms": ejecucion.duracion_ms,
+            },
+        )
+    return ejecucion
@@ -0,0 +1,43 @@
+"""Job programado para eliminar los archivos de exportación expirados y recuperar trabajos abandonados."""
+
+import logging
+from typing import Optional
+
+from app.models.ejecucion_job_model import EjecucionJob
+from app.services.dashboard.export_jobs_service import (
+    eliminar_export_jobs_expirados,
+    recuperar_export_jobs_estancados,
+)
+from app.services.ejecuciones_jobs_service import ejecutar_job_registrado
+
+logger = logging.getLogger(__name__)
+
+NOMBRE_JOB = "limpieza_exportaciones_expiradas"
+
+
+def _limpiar_y_recuperar(db, registrar_avance) -> int:
+    recuperados = recuperar_export_jobs_estancados(db)
+    registrar_avance(recuperados["reencolados"] + recuperados["fallidos"])
+    eliminados = eliminar_export_jobs_expirados(db)["eliminados"]
+    return eliminados + recuperados["reencolados"] + recuperados["fallidos"]
+
+
+def limpiar_exportaciones_expiradas_job() -> Optional[EjecucionJob]:
+    """
+    Tarea programada que elimina los trabajos de exportación expirados y sus archivos,
+    y recupera los que quedaron PENDIENTE o EN_PROCESO tras reiniciarse un worker.
+
+    Se ejecuta bajo advisory lock y queda registrada en `ejecuciones_jobs`.
+    """
+    ejecucion = ejecutar_job_registrado(NOMBRE_JOB, _limpiar_y_recuperar)
+    if ejecucion:
+        logger.info(
+            "Exportaciones expiradas eliminadas",
+            extra={
+                "job": NOMBRE_JOB,
+                "estado": ejecucion.estado,
+                "filas_afectadas": ejecucion.filas_afectadas,
+                "duracion_ms": ejecucion.duracion_ms,
+            },
+        )
+    return ejecucion
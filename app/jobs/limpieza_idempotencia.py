@@ -0,0 +1,32 @@
+"""Job programado para purgar las claves de idempotencia expiradas."""
+
+import logging
+from typing import Optional
+
+from app.models.ejecucion_job_model import EjecucionJob
+from app.services.ejecuciones_jobs_service import ejecutar_job_registrado
+from app.services.idempotencia_service import eliminar_claves_expiradas
+
+logger = logging.getLogger(__name__)
+
+NOMBRE_JOB = "limpieza_claves_idempotencia"
+
+
+def limpiar_claves_idempotencia_job() -> Optional[EjecucionJob]:
+    """
+    Tarea programada que elimina las claves de idempotencia cuyo TTL ya venció.
+
+    Se ejecuta bajo advisory lock y queda registrada en `ejecuciones_jobs`.
+    """
+    ejecucion = ejecutar_job_registrado(NOMBRE_JOB, lambda db, _: eliminar_claves_expiradas(db))
+    if ejecucion:
+        logger.info(
+            "Claves de idempotencia expiradas eliminadas",
+            extra={
+                "job": NOMBRE_JOB,
+                "estado": ejecucion.estado,
+                "filas_afectadas": ejecucion.filas_afectadas,
+                "duracion_ms": ejecucion.duracion_ms,
+            },
+        )
+    return ejecucion
@@ -1,14 +1,22 @@
 """Módulo principal para levantar la API de Gestión de Candidatos."""
 
+import logging
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from apscheduler.schedulers.background import BackgroundScheduler
+from sqlalchemy.engine import make_url
 
 # Jobs
 from app.core.database import DATABASE_URL
-from app.jobs.limpieza_candidatos import limpiar_candidatos_incompletos_job
-from app.core.init_db import init_db
+from app.core.planificador import Planificador
+from app.core.detector_consultas import DETECTOR_CONSULTAS_HABILITADO, DetectorConsultasMiddleware
+from app.core.idempotencia import IdempotenciaMiddleware
+from app.core.instrumentacion import MetricasHTTPMiddleware
+from app.core.logs import configurar_logging
+from app.core.metricas import detener_volcado_metricas, iniciar_volcado_metricas
+from app.core.tiempo_limite_sentencias import TiempoLimiteSentenciasMiddleware
+from app.services.dashboard.export_pdf_service import cerrar_pool_pdf
 
 # Rutas generales
 from app.routes import (
@@ -19,10 +27,14 @@ from app.routes import (
     preferencias_route,
     solicitudes_eliminacion_route,
     usuario_route,
+    jobs_route,
+    metricas_route,
+    diagnostico_route,
 )
 
 # Rutas de catálogos
 from app.routes.catalogs import (
+    bundle,
     centro_costos,
     ciudades,
     cargos_ofrecidos,
@@ -49,64 +61,122 @@ from app.routes.Dashboard import (
     stats_proceso,
     export_report,
     export_pdf,
+    export_jobs,
     stats_routes,
 )
 
-# Inicializar aplicación FastAPI
-app = FastAPI(title="Gestión de Candidatos - Backend")
+logger = logging.getLogger(__name__)
 
-init_db()  # Inicializa la Base de Datos
 
-frontend_origin = os.getenv("FRONTEND_ORIGIN", "*")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Ciclo de vida de la aplicación: inicia el planificador de jobs y el volcado de
+    métricas al arrancar el servidor y, al detenerlo, los apaga junto con el pool
+    de renderizado PDF.
+
+    Importar `app.main` no inicia el planificador ni procesos; eso ocurre solo aquí. Cada
+    worker tiene su planificador, pero solo el líder del clúster ejecuta los jobs.
+    """
+    logger.info(
+        "API iniciada",
+        extra={"base_datos": make_url(DATABASE_URL).render_as_string(hide_password=True)},
+    )
+    planificador = Planificador()
+    planificador.iniciar()
+    app.state.planificador = planificador
+    iniciar_volcado_metricas()
+    try:
+        yield
+    finally:
+        planificador.detener()
+        detener_volcado_metricas()
+        cerrar_pool_pdf()
+
+
+def crear_app() -> FastAPI:
+    """
+    Construye la aplicación FastAPI con sus middlewares y rutas.
+
+    Returns:
+        FastAPI: Aplicación lista para servirse (el planificador inicia en `lifespan`).
+    """
+    configurar_logging()
+    app = FastAPI(title="Gestión de Candidatos - Backend", lifespan=lifespan)
+
+    # Las tablas y los catálogos se preparan una vez por despliegue con
+    # `python -m app.cli.cargar_catalogos`; los workers no escriben al iniciar.
+
+    # Reintentos de POST con el mismo Idempotency-Key reciben la respuesta original.
+    # Se registra antes que CORS para que CORS quede como capa externa y también
+    # agregue sus encabezados a las respuestas repetidas.
+    app.add_middleware(IdempotenciaMiddleware)
+
+    frontend_origin = os.getenv("FRONTEND_ORIGIN", "*")
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=[frontend_origin],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Externa a los demás: sus consultas antes del enrutamiento (ej. idempotencia)
+    # usan el límite 'general'; las del endpoint, el de la clase de su ruta.
+    app.add_middleware(TiempoLimiteSentenciasMiddleware)
+
+    # Fuera de producción: presupuesto de consultas por petición y X-DB-Queries/X-DB-Time
+    # (debe quedar dentro de MetricasHTTPMiddleware, que lleva la cuenta)
+    if DETECTOR_CONSULTAS_HABILITADO:
+        app.add_middleware(DetectorConsultasMiddleware)
+
+    # Latencia, estado y sentencias SQL por ruta para /metrics (abarca todo lo anterior)
+    app.add_middleware(MetricasHTTPMiddleware)
+
+    # Registro de rutas generales
+    app.include_router(usuario_route.router)
+    app.include_router(candidato_route.router)
+    app.include_router(educacion_route.router)
+    app.include_router(experiencia_route.router)
+    app.include_router(conocimientos_candidato_route.router)
+    app.include_router(preferencias_route.router)
+    app.include_router(solicitudes_eliminacion_route.router)
+    app.include_router(jobs_route.router)
+    app.include_router(metricas_route.router)
+    app.include_router(diagnostico_route.router)
+
+    # Registro de rutas de catálogos
+    app.include_router(departamentos.router)
+    app.include_router(ciudades.router)
+    app.include_router(cargos_ofrecidos.router)
+    app.include_router(centro_costos.router)
+    app.include_router(nivel_educacion.router)
+    app.include_router(titulo.router)
+    app.include_router(instituciones.router)
+    app.include_router(nivel_ingles.router)
+    app.include_router(rangos_experiencia.router)
+    app.include_router(conocimientos_routes.router)
+    app.include_router(disponibilidad.router)
+    app.include_router(rangos_salariales.router)
+    app.include_router(motivo_salida.router)
+    app.include_router(bundle.router)
+
+    # Registro de rutas del dashboard
+    app.include_router(stats_general.router)
+    app.include_router(stats_educacion.router)
+    app.include_router(stats_personal.router)
+    app.include_router(stats_experiencia.router)
+    app.include_router(stats_conocimientos.router)
+    app.include_router(stats_preferencias.router)
+    app.include_router(stats_proceso.router)
+    app.include_router(export_report.router)
+    app.include_router(export_pdf.router)
+    app.include_router(export_jobs.router)
+    app.include_router(stats_routes.router)
+
+    return app
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[frontend_origin],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
-# Registro de rutas generales
-app.include_router(usuario_route.router)
-app.include_router(candidato_route.router)
-app.include_router(educacion_route.router)
-app.include_router(experiencia_route.router)
-app.include_router(conocimientos_candidato_route.router)
-app.include_router(preferencias_route.router)
-app.include_router(solicitudes_eliminacion_route.router)
-
-# Registro de rutas de catálogos
-app.include_router(departamentos.router)
-app.include_router(ciudades.router)
-app.include_router(cargos_ofrecidos.router)
-app.include_router(centro_costos.router)
-app.include_router(nivel_educacion.router)
-app.include_router(titulo.router)
-app.include_router(instituciones.router)
-app.include_router(nivel_ingles.router)
-app.include_router(rangos_experiencia.router)
-app.include_router(conocimientos_routes.router)
-app.include_router(disponibilidad.router)
-app.include_router(rangos_salariales.router)
-app.include_router(motivo_salida.router)
-
-# Registro de rutas del dashboard
-app.include_router(stats_general.router)
-app.include_router(stats_educacion.router)
-app.include_router(stats_personal.router)
-app.include_router(stats_experiencia.router)
-app.include_router(stats_conocimientos.router)
-app.include_router(stats_preferencias.router)
-app.include_router(stats_proceso.router)
-app.include_router(export_report.router)
-app.include_router(export_pdf.router)
-app.include_router(stats_routes.router)
-
-
-print(f"🚀 BASE DE DATOS ACTUAL: {DATABASE_URL}")
-
-# Programación de job periódico para limpiar candidatos incompletos
-scheduler = BackgroundScheduler()
-scheduler.add_job(limpiar_candidatos_incompletos_job, "interval", hours=6)
-scheduler.start()
+# Instancia usada por `uvicorn app.main:app`
+app = crear_app()
@@ -5,3 +5,9 @@ from .conocimientos_model import CandidatoConocimiento, HabilidadBlanda, Habilid
 from .preferencias import PreferenciaDisponibilidad, Disponibilidad, MotivoSalida, RangoSalarial
 from .usuario import Usuario
 from .solicitud_eliminacion_model import SolicitudEliminacion
+from .export_job_model import ExportJob
+from .version_datos_model import VersionDatos
+from .ejecucion_job_model import EjecucionJob
+from .importacion_model import StagingCandidato, StagingConocimiento
+from .clave_idempotencia_model import ClaveIdempotencia
+from .semilla_catalogo_model import SemillaCatalogo
@@ -54,6 +54,8 @@ class Candidato(Base):
         preferencias (List[PreferenciaDisponibilidad]): Preferencias laborales.
     """
     __tablename__ = "candidatos"
+    # Recupera los valores por defecto del servidor con RETURNING al insertar
+    __mapper_args__ = {"eager_defaults": True}
 
     id_candidato = Column(Integer, primary_key=True, index=True)
     nombre_completo = Column(String(255), nullable=False)
@@ -85,16 +87,20 @@ class Candidato(Base):
     centro_costos = relationship("CentroCostos", back_populates="candidatos")
 
 
-    # Relaciones con tablas dependientes
+    # Relaciones con tablas dependientes (el borrado en cascada lo hace la base de datos)
     educaciones = relationship(
-        "Educacion", back_populates="candidato", cascade="all, delete-orphan"
+        "Educacion", back_populates="candidato", cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     experiencias = relationship(
-        "ExperienciaLaboral", back_populates="candidato", cascade="all, delete-orphan"
+        "ExperienciaLaboral", back_populates="candidato", cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     conocimientos = relationship(
-        "CandidatoConocimiento", back_populates="candidato", cascade="all, delete-orphan"
+        "CandidatoConocimiento", back_populates="candidato", cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     preferencias = relationship(
-        "PreferenciaDisponibilidad", back_populates="candidato", cascade="all, delete-orphan"
+        "PreferenciaDisponibilidad", back_populates="candidato", cascade="all, delete-orphan",
+        passive_deletes=True,
     )
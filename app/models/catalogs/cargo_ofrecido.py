@@ -3,6 +3,7 @@
 from sqlalchemy import Column, Integer, String
 from sqlalchemy.orm import relationship
 from app.core.database import Base
+from app.utils.orden_catalogos import columna_es_otro, indice_orden
 
 class CargoOfrecido(Base):
     """
@@ -11,12 +12,18 @@ class CargoOfrecido(Base):
     Atributos:
         id_cargo (int): Identificador único del cargo.
         nombre_cargo (str): Nombre del cargo ofrecido.
+        es_otro (bool): Si el nombre es 'Otro' u 'Otros' (columna generada, para el orden).
         candidatos (List[Candidato]): Relación con los candidatos que aplican a este cargo.
     """
     __tablename__ = "cargos_ofrecidos"
 
     id_cargo = Column(Integer, primary_key=True, index=True)
     nombre_cargo = Column(String(100), nullable=False, unique=True)
+    es_otro = columna_es_otro("nombre_cargo")  # 'Otro' / 'Otros' se listan de últimos
+
+    __table_args__ = (
+        indice_orden("cargos_ofrecidos", "nombre_cargo"),
+    )
 
     # Relación con la tabla de candidatos
     candidatos = relationship("Candidato", back_populates="cargo")
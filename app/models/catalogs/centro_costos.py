@@ -1,8 +1,9 @@
 """Modelo de la tabla 'centros_costos'."""
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, Index, func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
+from app.utils.orden_catalogos import columna_es_otro, indice_orden
 
 
 class CentroCostos(Base):
@@ -12,12 +13,20 @@ class CentroCostos(Base):
     Atributos:
         id_centro_costos (int): Identificador único del centro de costos.
         nombre_centro_costos (str): Nombre del centro de costos.
+        es_otro (bool): Si el nombre es 'Otro' u 'Otros' (columna generada, para el orden).
         candidatos (List[Candidato]): Candidatos que pertenecen a este centro.
     """
     __tablename__ = "centros_costos"
 
     id_centro_costos = Column(Integer, primary_key=True, index=True)
     nombre_centro_costos = Column(String(150), nullable=False, unique=True)
+    es_otro = columna_es_otro("nombre_centro_costos")  # 'Otro' / 'Otros' se listan de últimos
+
+    # Unicidad sin distinguir mayúsculas
+    __table_args__ = (
+        Index("uq_centros_costos_nombre_lower", func.lower(nombre_centro_costos), unique=True),
+        indice_orden("centros_costos", "nombre_centro_costos"),
+    )
 
     # Relación inversa con candidatos
     candidatos = relationship("Candidato", back_populates="centro_costos")
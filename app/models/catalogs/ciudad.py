@@ -1,8 +1,9 @@
 """Modelos de las tablas 'ciudades' y 'departamentos'."""
 
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
+from app.utils.orden_catalogos import columna_es_otro, indice_orden
 
 class Departamento(Base):
     """
@@ -18,6 +19,11 @@ class Departamento(Base):
     id_departamento = Column(Integer, primary_key=True, index=True)
     nombre_departamento = Column(String(100), nullable=False, unique=False)
 
+    # Unicidad sin distinguir mayúsculas ni espacios extremos
+    __table_args__ = (
+        Index("uq_departamentos_nombre_lower", func.lower(func.trim(nombre_departamento)), unique=True),
+    )
+
     # Relación uno a muchos con Ciudad
     ciudades = relationship("Ciudad", back_populates="departamento")
 
@@ -29,6 +35,7 @@ class Ciudad(Base):
     Atributos:
         id_ciudad (int): Identificador único de la ciudad.
         nombre_ciudad (str): Nombre de la ciudad.
+        es_otro (bool): Si el nombre es 'Otro' u 'Otros' (columna generada, para el orden).
         id_departamento (int): Departamento al que pertenece la ciudad.
         departamento (Departamento): Relación con el departamento.
         candidatos (List[Candidato]): Relación con los candidatos asociados a esta ciudad.
@@ -37,10 +44,17 @@ class Ciudad(Base):
 
     id_ciudad = Column(Integer, primary_key=True, index=True)
     nombre_ciudad = Column(String(100), nullable=False)
+    es_otro = columna_es_otro("nombre_ciudad")  # 'Otro' / 'Otros' se listan de últimos
 
     # FK hacia Departamento
     id_departamento = Column(Integer, ForeignKey("departamentos.id_departamento"), nullable=False)
 
+    # Unicidad del nombre (sin distinguir mayúsculas) dentro de cada departamento
+    __table_args__ = (
+        Index("uq_ciudades_nombre_lower_departamento", func.lower(nombre_ciudad), id_departamento, unique=True),
+        indice_orden("ciudades", "nombre_ciudad"),
+    )
+
     # Relación con Departamento
     departamento = relationship("Departamento", back_populates="ciudades")
 
@@ -2,6 +2,7 @@
 
 from sqlalchemy import Column, Integer, String
 from app.core.database import Base
+from app.utils.orden_catalogos import columna_es_otro, indice_orden
 
 class InstitucionAcademica(Base):
     """
@@ -10,8 +11,14 @@ class InstitucionAcademica(Base):
     Atributos:
         id_institucion (int): Identificador único de la institución.
         nombre_institucion (str): Nombre de la institución académica.
+        es_otro (bool): Si el nombre es 'Otro' u 'Otros' (columna generada, para el orden).
     """
     __tablename__ = "instituciones_academicas"
     
     id_institucion = Column(Integer, primary_key=True, index=True)
     nombre_institucion = Column(String(150), nullable=False, unique=True)
+    es_otro = columna_es_otro("nombre_institucion")  # 'Otro' / 'Otros' se listan de últimos
+
+    __table_args__ = (
+        indice_orden("instituciones_academicas", "nombre_institucion"),
+    )
@@ -3,6 +3,7 @@
 from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.core.database import Base
+from app.utils.orden_catalogos import columna_es_otro, indice_orden
 
 class TituloObtenido(Base):
     """
@@ -11,6 +12,7 @@ class TituloObtenido(Base):
     Atributos:
         id_titulo (int): Identificador único del título.
         nombre_titulo (str): Nombre del título obtenido.
+        es_otro (bool): Si el nombre es 'Otro' u 'Otros' (columna generada, para el orden).
         id_nivel_educacion (int): Clave foránea al nivel de educación correspondiente.
         nivel_educacion (NivelEducacion): Relación con el nivel de educación asociado.
 
@@ -21,6 +23,7 @@ class TituloObtenido(Base):
 
     id_titulo = Column(Integer, primary_key=True, index=True)
     nombre_titulo = Column(String(100), nullable=False)
+    es_otro = columna_es_otro("nombre_titulo")  # 'Otro' / 'Otros' se listan de últimos
     id_nivel_educacion = Column(
         Integer, ForeignKey("nivel_educacion.id_nivel_educacion"), nullable=False
     )
@@ -30,4 +33,5 @@ class TituloObtenido(Base):
 
     __table_args__ = (
         UniqueConstraint("nombre_titulo", "id_nivel_educacion", name="uq_titulo_nivel"),
+        indice_orden("titulos_obtenidos", "nombre_titulo"),
     )
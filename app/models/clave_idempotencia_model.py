@@ -0,0 +1,34 @@
+"""Modelo de la tabla 'claves_idempotencia'."""
+
+from sqlalchemy import Column, Integer, LargeBinary, String, TIMESTAMP
+from app.core.database import Base
+
+
+class ClaveIdempotencia(Base):
+    """
+    Respuesta registrada para una solicitud enviada con el encabezado `Idempotency-Key`.
+
+    Mientras la solicitud original se procesa, `codigo_estado` es nulo; al terminar se
+    guarda la respuesta para devolverla tal cual a los reintentos con la misma clave.
+
+    Atributos:
+        clave (str): Valor del encabezado `Idempotency-Key`.
+        ruta (str): Método y ruta de la solicitud original (ej. 'POST /candidatos/').
+        hash_solicitud (str): SHA-256 del cuerpo de la solicitud original.
+        codigo_estado (int): Código HTTP de la respuesta (nulo mientras está en curso).
+        tipo_contenido (str): Content-Type de la respuesta.
+        cuerpo_respuesta (bytes): Cuerpo de la respuesta.
+        fecha_creacion (timestamp): Momento en que se reservó la clave; identifica la
+            reserva vigente y permite retomar las abandonadas.
+        fecha_expiracion (timestamp): A partir de cuándo la clave puede purgarse.
+    """
+    __tablename__ = "claves_idempotencia"
+
+    clave = Column(String(255), primary_key=True)
+    ruta = Column(String(255), nullable=False)
+    hash_solicitud = Column(String(64), nullable=False)
+    codigo_estado = Column(Integer, nullable=True)
+    tipo_contenido = Column(String(100), nullable=True)
+    cuerpo_respuesta = Column(LargeBinary, nullable=True)
+    fecha_creacion = Column(TIMESTAMP, nullable=False)
+    fecha_expiracion = Column(TIMESTAMP, nullable=False, index=True)
@@ -1,8 +1,9 @@
 """Modelos para la gestión de conocimientos del candidato."""
 
-from sqlalchemy import Column, Integer, String, ForeignKey, CheckConstraint
+from sqlalchemy import Column, Integer, String, ForeignKey, CheckConstraint, Index, func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
+from app.utils.orden_catalogos import columna_es_otro, indice_orden
 
 
 class HabilidadBlanda(Base):
@@ -12,11 +13,19 @@ class HabilidadBlanda(Base):
     Atributos:
         id_habilidad_blanda (int): Identificador único.
         nombre_habilidad_blanda (str): Nombre de la habilidad blanda.
+        es_otro (bool): Si el nombre es 'Otro' u 'Otros' (columna generada, para el orden).
     """
     __tablename__ = "habilidades_blandas"
 
     id_habilidad_blanda = Column(Integer, primary_key=True, index=True)
     nombre_habilidad_blanda = Column(String(100), unique=True, nullable=False)
+    es_otro = columna_es_otro("nombre_habilidad_blanda")  # 'Otro' / 'Otros' se listan de últimos
+
+    # Unicidad sin distinguir mayúsculas
+    __table_args__ = (
+        Index("uq_habilidades_blandas_nombre_lower", func.lower(nombre_habilidad_blanda), unique=True),
+        indice_orden("habilidades_blandas", "nombre_habilidad_blanda"),
+    )
 
 
 class HabilidadTecnica(Base):
@@ -26,11 +35,19 @@ class HabilidadTecnica(Base):
     Atributos:
         id_habilidad_tecnica (int): Identificador único.
         nombre_habilidad_tecnica (str): Nombre de la habilidad técnica.
+        es_otro (bool): Si el nombre es 'Otro' u 'Otros' (columna generada, para el orden).
     """
     __tablename__ = "habilidades_tecnicas"
 
     id_habilidad_tecnica = Column(Integer, primary_key=True, index=True)
     nombre_habilidad_tecnica = Column(String(100), unique=True, nullable=False)
+    es_otro = columna_es_otro("nombre_habilidad_tecnica")  # 'Otro' / 'Otros' se listan de últimos
+
+    # Unicidad sin distinguir mayúsculas
+    __table_args__ = (
+        Index("uq_habilidades_tecnicas_nombre_lower", func.lower(nombre_habilidad_tecnica), unique=True),
+        indice_orden("habilidades_tecnicas", "nombre_habilidad_tecnica"),
+    )
 
 
 class Herramienta(Base):
@@ -40,11 +57,19 @@ class Herramienta(Base):
     Atributos:
         id_herramienta (int): Identificador único.
         nombre_herramienta (str): Nombre de la herramienta.
+        es_otro (bool): Si el nombre es 'Otro' u 'Otros' (columna generada, para el orden).
     """
     __tablename__ = "herramientas"
 
     id_herramienta = Column(Integer, primary_key=True, index=True)
     nombre_herramienta = Column(String(100), unique=True, nullable=False)
+    es_otro = columna_es_otro("nombre_herramienta")  # 'Otro' / 'Otros' se listan de últimos
+
+    # Unicidad sin distinguir mayúsculas
+    __table_args__ = (
+        Index("uq_herramientas_nombre_lower", func.lower(nombre_herramienta), unique=True),
+        indice_orden("herramientas", "nombre_herramienta"),
+    )
 
 
 class CandidatoConocimiento(Base):
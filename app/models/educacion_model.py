@@ -30,7 +30,7 @@ class Educacion(Base):
 
     id_educacion = Column(Integer, primary_key=True, index=True)
     id_candidato = Column(
-        Integer, ForeignKey("candidatos.id_candidato"), nullable=False
+        Integer, ForeignKey("candidatos.id_candidato", ondelete="CASCADE"), nullable=False
     )
     id_nivel_educacion = Column(
         Integer, ForeignKey("nivel_educacion.id_nivel_educacion"), nullable=False
@@ -0,0 +1,33 @@
+"""Modelo de la tabla 'ejecuciones_jobs'."""
+
+from sqlalchemy import Column, Integer, String, Text, TIMESTAMP
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class EjecucionJob(Base):
+    """
+    Representa una ejecución de un job programado (ej. limpieza de candidatos incompletos).
+
+    Atributos:
+        id (int): Identificador único de la ejecución.
+        nombre_job (str): Nombre del job ejecutado.
+        estado (str): Estado de la ejecución (EN_CURSO, COMPLETADO o FALLIDO).
+        fecha_inicio (timestamp): Momento en que inició la ejecución.
+        fecha_fin (timestamp): Momento en que terminó (nulo mientras está en curso).
+        duracion_ms (int): Duración total en milisegundos.
+        filas_afectadas (int): Registros procesados o eliminados.
+        detalle (str): Información adicional o error de la ejecución.
+    """
+    __tablename__ = "ejecuciones_jobs"
+    # Recupera los valores por defecto del servidor con RETURNING al insertar
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(Integer, primary_key=True, index=True)
+    nombre_job = Column(String(100), nullable=False, index=True)
+    estado = Column(String(20), nullable=False, default="EN_CURSO")
+    fecha_inicio = Column(TIMESTAMP, server_default=func.current_timestamp())
+    fecha_fin = Column(TIMESTAMP, nullable=True)
+    duracion_ms = Column(Integer, nullable=True)
+    filas_afectadas = Column(Integer, nullable=False, default=0)
+    detalle = Column(Text, nullable=True)
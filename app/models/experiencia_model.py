@@ -26,7 +26,7 @@ class ExperienciaLaboral(Base):
 
     id_experiencia = Column(Integer, primary_key=True, index=True)
     id_candidato = Column(
-        Integer, ForeignKey("candidatos.id_candidato"), nullable=False
+        Integer, ForeignKey("candidatos.id_candidato", ondelete="CASCADE"), nullable=False
     )
     id_rango_experiencia = Column(
         Integer, ForeignKey("rangos_experiencia.id_rango_experiencia"), nullable=False
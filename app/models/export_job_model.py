@@ -0,0 +1,45 @@
+"""Modelo de la tabla 'export_jobs'."""
+
+from sqlalchemy import Column, Integer, String, Text, TIMESTAMP
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class ExportJob(Base):
+    """
+    Representa un trabajo de exportación (Excel o PDF) ejecutado en segundo plano.
+
+    El registro se persiste en base de datos para que cualquier worker de la API
+    pueda consultar el estado del trabajo y servir el archivo generado.
+
+    Atributos:
+        id (str): Identificador único (UUID) del trabajo.
+        tipo (str): Tipo de reporte ('excel' o 'pdf').
+        año (int): Año usado como filtro (opcional).
+        estado (str): Estado del trabajo (PENDIENTE, EN_PROCESO, COMPLETADO, FALLIDO).
+        progreso (int): Porcentaje de avance (0 a 100).
+        ruta_archivo (str): Ruta en disco del archivo generado.
+        nombre_archivo (str): Nombre sugerido para la descarga.
+        error (str): Detalle del error si el trabajo falló.
+        propietario (str): Worker que tomó el trabajo (host, pid y token); solo él
+            puede actualizarlo mientras está EN_PROCESO.
+        fecha_creacion (timestamp): Fecha de creación del trabajo.
+        fecha_actualizacion (timestamp): Última actualización del estado.
+        fecha_expiracion (timestamp): Fecha a partir de la cual el archivo se elimina.
+    """
+    __tablename__ = "export_jobs"
+    # Recupera los valores por defecto del servidor con RETURNING al insertar
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(String(36), primary_key=True)
+    tipo = Column(String(10), nullable=False)
+    año = Column(Integer, nullable=True)
+    estado = Column(String(20), nullable=False, default="PENDIENTE", index=True)
+    progreso = Column(Integer, nullable=False, default=0)
+    ruta_archivo = Column(String(500), nullable=True)
+    nombre_archivo = Column(String(255), nullable=True)
+    error = Column(Text, nullable=True)
+    propietario = Column(String(100), nullable=True)
+    fecha_creacion = Column(TIMESTAMP, server_default=func.current_timestamp())
+    fecha_actualizacion = Column(TIMESTAMP, server_default=func.current_timestamp())
+    fecha_expiracion = Column(TIMESTAMP, nullable=True, index=True)
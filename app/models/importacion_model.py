@@ -0,0 +1,112 @@
+"""Modelos de las tablas de staging usadas por la importación masiva de candidatos."""
+
+from sqlalchemy import Boolean, Column, Date, Index, Integer, String, Text
+from app.core.database import Base
+
+
+class StagingCandidato(Base):
+    """
+    Fila de un archivo de importación (CSV/XLSX) cargada tal como llegó, con los
+    IDs de catálogo resueltos y los errores de validación encontrados.
+
+    Las filas de una importación se identifican por `id_importacion` y se borran
+    al terminar; la tabla solo existe para resolver y validar en bloque con SQL.
+
+    Atributos:
+        id (int): Identificador interno de la fila de staging.
+        id_importacion (str): Identificador de la importación a la que pertenece.
+        fila (int): Número de fila en el archivo original (la cabecera es la fila 1).
+        errores (str): Errores de validación separados por '; ' (nulo si es válida).
+        id_candidato (int): Candidato creado a partir de la fila.
+        Demás columnas: datos del candidato, su educación, experiencia y preferencias;
+        los catálogos llegan por nombre y se resuelven a su `id_*`.
+    """
+    __tablename__ = "staging_candidatos"
+
+    id = Column(Integer, primary_key=True)
+    id_importacion = Column(String(36), nullable=False)
+    fila = Column(Integer, nullable=False)
+    errores = Column(Text, nullable=True)
+    id_candidato = Column(Integer, nullable=True)
+
+    # Candidato
+    nombre_completo = Column(Text)
+    correo_electronico = Column(Text)
+    cc = Column(Text)
+    fecha_nacimiento = Column(Date)
+    telefono = Column(Text)
+    departamento = Column(Text)
+    ciudad = Column(Text)
+    cargo = Column(Text)
+    descripcion_perfil = Column(Text)
+    trabaja_actualmente_joyco = Column(Boolean)
+    ha_trabajado_joyco = Column(Boolean)
+    tiene_referido = Column(Boolean)
+    nombre_referido = Column(Text)
+    acepta_politica_datos = Column(Boolean)
+
+    # Educación
+    nivel_educacion = Column(Text)
+    titulo = Column(Text)
+    institucion = Column(Text)
+    anio_graduacion = Column(Integer)
+    nivel_ingles = Column(Text)
+
+    # Experiencia
+    rango_experiencia = Column(Text)
+    ultima_empresa = Column(Text)
+    ultimo_cargo = Column(Text)
+    funciones = Column(Text)
+    fecha_inicio = Column(Date)
+    fecha_fin = Column(Date)
+
+    # Preferencias
+    disponibilidad_viajar = Column(Boolean)
+    disponibilidad_inicio = Column(Text)
+    rango_salarial = Column(Text)
+    trabaja_actualmente = Column(Boolean)
+    motivo_salida = Column(Text)
+
+    # IDs resueltos
+    id_ciudad = Column(Integer)
+    id_cargo = Column(Integer)
+    id_nivel_educacion = Column(Integer)
+    id_titulo = Column(Integer)
+    id_institucion = Column(Integer)
+    id_nivel_ingles = Column(Integer)
+    id_rango_experiencia = Column(Integer)
+    id_disponibilidad_inicio = Column(Integer)
+    id_rango_salarial = Column(Integer)
+    id_motivo_salida = Column(Integer)
+
+    __table_args__ = (
+        Index("ix_staging_candidatos_importacion_fila", "id_importacion", "fila"),
+    )
+
+
+class StagingConocimiento(Base):
+    """
+    Conocimiento (habilidad blanda, técnica o herramienta) de una fila de importación.
+
+    Atributos:
+        id (int): Identificador interno.
+        id_importacion (str): Importación a la que pertenece.
+        fila (int): Fila del archivo de la que proviene.
+        tipo_conocimiento (str): 'blanda', 'tecnica' o 'herramienta'.
+        nombre (str): Nombre tal como llegó en el archivo.
+        id_habilidad_blanda / id_habilidad_tecnica / id_herramienta (int): ID resuelto según el tipo.
+    """
+    __tablename__ = "staging_conocimientos"
+
+    id = Column(Integer, primary_key=True)
+    id_importacion = Column(String(36), nullable=False)
+    fila = Column(Integer, nullable=False)
+    tipo_conocimiento = Column(String(50), nullable=False)
+    nombre = Column(Text, nullable=False)
+    id_habilidad_blanda = Column(Integer)
+    id_habilidad_tecnica = Column(Integer)
+    id_herramienta = Column(Integer)
+
+    __table_args__ = (
+        Index("ix_staging_conocimientos_importacion_fila", "id_importacion", "fila"),
+    )
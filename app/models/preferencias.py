@@ -3,6 +3,7 @@
 from sqlalchemy import Column, Integer, String, Boolean, Text, ForeignKey
 from sqlalchemy.orm import relationship
 from app.core.database import Base
+from app.utils.orden_catalogos import columna_es_otro, indice_orden
 
 
 class Disponibilidad(Base):
@@ -50,6 +51,7 @@ class MotivoSalida(Base):
     Atributos:
         id_motivo_salida (int): Identificador único.
         descripcion_motivo (str): Descripción del motivo.
+        es_otro (bool): Si el nombre es 'Otro' u 'Otros' (columna generada, para el orden).
         preferencias (List[PreferenciaDisponibilidad]): Preferencias laborales asociadas.
         candidato (Candidato): Candidato que reportó este motivo.
     """
@@ -57,6 +59,11 @@ class MotivoSalida(Base):
 
     id_motivo_salida = Column(Integer, primary_key=True, index=True)
     descripcion_motivo = Column(String(100), nullable=False, unique=True)
+    es_otro = columna_es_otro("descripcion_motivo")  # 'Otro' / 'Otros' se listan de últimos
+
+    __table_args__ = (
+        indice_orden("motivos_salida", "descripcion_motivo"),
+    )
 
     preferencias = relationship(
         "PreferenciaDisponibilidad", back_populates="motivo_salida"
@@ -88,7 +95,7 @@ class PreferenciaDisponibilidad(Base):
 
     id_preferencia = Column(Integer, primary_key=True, index=True)
     id_candidato = Column(
-        Integer, ForeignKey("candidatos.id_candidato"), nullable=False
+        Integer, ForeignKey("candidatos.id_candidato", ondelete="CASCADE"), nullable=False
     )
     disponibilidad_viajar = Column(Boolean, nullable=False)
     id_disponibilidad_inicio = Column(
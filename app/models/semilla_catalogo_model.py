@@ -0,0 +1,27 @@
+"""Modelo de la tabla 'semillas_catalogos'."""
+
+from sqlalchemy import Column, Integer, String, TIMESTAMP
+from app.core.database import Base
+
+
+class SemillaCatalogo(Base):
+    """
+    Registro de la última carga de cada archivo CSV de catálogos.
+
+    La carga de catálogos compara el checksum del archivo con el guardado aquí y
+    omite los archivos que no cambiaron.
+
+    Atributos:
+        archivo (str): Nombre del archivo CSV (ej. 'ciudades.csv').
+        tabla (str): Tabla del catálogo que se cargó desde el archivo.
+        checksum (str): SHA-256 del contenido del archivo en la última carga.
+        filas_insertadas (int): Filas nuevas insertadas en la última carga.
+        fecha_carga (timestamp): Momento de la última carga.
+    """
+    __tablename__ = "semillas_catalogos"
+
+    archivo = Column(String(100), primary_key=True)
+    tabla = Column(String(100), nullable=False)
+    checksum = Column(String(64), nullable=False)
+    filas_insertadas = Column(Integer, nullable=False, default=0)
+    fecha_carga = Column(TIMESTAMP, nullable=False)
@@ -18,6 +18,8 @@ class SolicitudEliminacion(Base):
         fecha_solicitud (timestamp): Fecha en que se registró la solicitud.
     """
     __tablename__ = "solicitudes_eliminacion"
+    # Recupera los valores por defecto del servidor con RETURNING al insertar
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     nombre_completo = Column(String(255), nullable=False)
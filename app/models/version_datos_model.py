@@ -0,0 +1,143 @@
+"""Modelo de la tabla 'version_datos' y eventos que mantienen su contador."""
+
+from sqlalchemy import Column, Integer, String, event, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.core.database import Base
+
+
+class VersionDatos(Base):
+    """
+    Contador de versión de los datos usados en reportes.
+
+    Cada vez que una sesión confirma cambios en candidatos, sus tablas hijas o los
+    catálogos, el contador del ámbito se incrementa en la misma transacción, como
+    última sentencia antes del commit. Los
+    reportes generados se indexan por esta versión, de modo que un archivo en
+    caché solo se reutiliza mientras los datos no hayan cambiado.
+
+    Atributos:
+        ambito (str): Nombre del conjunto de datos versionado (ej. 'candidatos').
+        version (int): Número de versión actual.
+    """
+    __tablename__ = "version_datos"
+
+    ambito = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+# Ámbito usado por los reportes de candidatos y estadísticas
+AMBITO_CANDIDATOS = "candidatos"
+
+# Tablas cuyo contenido aparece en los reportes exportados
+TABLAS_VERSIONADAS = {
+    "candidatos",
+    "educacion",
+    "experiencia_laboral",
+    "candidato_conocimientos",
+    "preferencias_disponibilidad",
+    "departamentos",
+    "ciudades",
+    "cargos_ofrecidos",
+    "centros_costos",
+    "nivel_educacion",
+    "titulos_obtenidos",
+    "instituciones_academicas",
+    "nivel_ingles",
+    "rangos_experiencia",
+    "habilidades_blandas",
+    "habilidades_tecnicas",
+    "herramientas",
+    "disponibilidad",
+    "rangos_salariales",
+    "motivos_salida",
+}
+
+
+def incrementar_version_datos(connection, ambito: str = AMBITO_CANDIDATOS) -> None:
+    """
+    Incrementa la versión de un ámbito usando la conexión de la transacción actual.
+
+    Usa un upsert en PostgreSQL y SQLite; en otros motores actualiza y, si la
+    fila aún no existe, la inserta.
+    """
+    nombre_dialecto = connection.dialect.name
+    if nombre_dialecto in ("postgresql", "sqlite"):
+        insert = postgresql.insert if nombre_dialecto == "postgresql" else sqlite.insert
+        stmt = insert(VersionDatos).values(ambito=ambito, version=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[VersionDatos.ambito],
+            set_={"version": VersionDatos.version + 1},
+        )
+        connection.execute(stmt)
+        return
+
+    resultado = connection.execute(
+        update(VersionDatos)
+        .where(VersionDatos.ambito == ambito)
+        .values(version=VersionDatos.version + 1)
+    )
+    if resultado.rowcount == 0:
+        connection.execute(VersionDatos.__table__.insert().values(ambito=ambito, version=1))
+
+
+# ──────────────── EVENTOS DE SESIÓN ────────────────
+#
+# Las sesiones solo marcan que modificaron datos versionados; el contador se
+# incrementa con un único upsert al final de la transacción, justo antes del
+# commit. La fila de `version_datos` queda bloqueada solo entre ese upsert y el
+# commit (no durante las escrituras del formulario o de los catálogos), no se usa
+# una segunda conexión del pool y, si el upsert falla, falla el commit: los datos
+# nunca cambian sin que cambie su versión.
+
+_CLAVE_CAMBIOS = "datos_versionados_modificados"
+
+
+def marcar_datos_modificados(session: Session) -> None:
+    """
+    Indica que la transacción de la sesión modificó datos de los reportes.
+
+    Los eventos de la sesión ya detectan el ORM y las sentencias `insert`/`update`/
+    `delete` sobre tablas versionadas; esta función es para escrituras que no pasan
+    por ellos (ej. `text()` o `COPY` sobre la conexión de la sesión).
+    """
+    session.info[_CLAVE_CAMBIOS] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _marcar_tras_flush(session, flush_context):
+    """Marca la sesión si el flush tocó alguna tabla versionada."""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if getattr(obj, "__tablename__", None) in TABLAS_VERSIONADAS:
+            marcar_datos_modificados(session)
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _marcar_sentencias_masivas(orm_execute_state):
+    """Marca la sesión ante INSERT/UPDATE/DELETE masivos (ORM o Core) sobre tablas versionadas."""
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    tabla = getattr(orm_execute_state.statement, "table", None)
+    if getattr(tabla, "name", None) in TABLAS_VERSIONADAS:
+        marcar_datos_modificados(orm_execute_state.session)
+
+
+@event.listens_for(Session, "before_commit")
+def _versionar_antes_del_commit(session):
+    """Incrementa la versión en la transacción de la sesión si esta modificó datos versionados."""
+    # `before_commit` ocurre antes del flush final del commit: se hace aquí para
+    # que los objetos aún pendientes también marquen la sesión
+    if session.new or session.dirty or session.deleted:
+        session.flush()
+    if session.info.pop(_CLAVE_CAMBIOS, False):
+        incrementar_version_datos(session.connection())
+
+
+@event.listens_for(Session, "after_rollback")
+def _descartar_tras_rollback(session):
+    session.info.pop(_CLAVE_CAMBIOS, None)
@@ -0,0 +1,97 @@
+"""Rutas para exportar reportes en segundo plano con consulta de estado y descarga."""
+
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.dependencies import obtener_usuario_actual
+from app.schemas.dashboard.export_job_schema import ExportJobCreate, ExportJobResponse
+from app.services.dashboard.export_jobs_service import (
+    MEDIA_TYPES,
+    crear_export_job,
+    mapear_export_job,
+    obtener_archivo_export_job,
+    obtener_export_job,
+)
+
+router = APIRouter(
+    prefix="/reportes/exportaciones",
+    tags=["Reportes – Exportación en segundo plano"]
+)
+
+
+@router.post(
+    "/",
+    response_model=ExportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Crear un trabajo de exportación (Excel o PDF)"
+)
+def crear_exportacion(
+    data: ExportJobCreate,
+    db: Session = Depends(get_db),
+    usuario = Depends(obtener_usuario_actual)
+):
+    """
+    Crea un trabajo de exportación que se procesa en segundo plano.
+
+    Args:
+        data (ExportJobCreate): Tipo de reporte y filtro opcional por año.
+        db (Session): Sesión de base de datos inyectada.
+
+    Returns:
+        ExportJobResponse: Trabajo creado con su ID para consultar el estado.
+    """
+    job = crear_export_job(db, data)
+    return mapear_export_job(job)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=ExportJobResponse,
+    summary="Consultar el estado de un trabajo de exportación"
+)
+def consultar_exportacion(
+    job_id: str,
+    db: Session = Depends(get_db),
+    usuario = Depends(obtener_usuario_actual)
+):
+    """
+    Retorna el estado y el progreso de un trabajo de exportación.
+
+    Args:
+        job_id (str): ID del trabajo.
+        db (Session): Sesión de base de datos inyectada.
+
+    Returns:
+        ExportJobResponse: Estado actual del trabajo.
+    """
+    job = obtener_export_job(db, job_id)
+    return mapear_export_job(job)
+
+
+@router.get(
+    "/{job_id}/descarga",
+    summary="Descargar el archivo generado por un trabajo de exportación"
+)
+def descargar_exportacion(
+    job_id: str,
+    db: Session = Depends(get_db),
+    usuario = Depends(obtener_usuario_actual)
+):
+    """
+    Sirve el archivo generado cuando el trabajo está completado.
+
+    Args:
+        job_id (str): ID del trabajo.
+        db (Session): Sesión de base de datos inyectada.
+
+    Returns:
+        FileResponse: Archivo Excel o PDF como descarga.
+    """
+    job = obtener_archivo_export_job(db, job_id)
+    return FileResponse(
+        job.ruta_archivo,
+        media_type=MEDIA_TYPES[job.tipo],
+        filename=job.nombre_archivo,
+    )
@@ -1,15 +1,22 @@
 """Ruta para exportar estadísticas en formato PDF utilizando ReportLab."""
 
-from io import BytesIO
+import os
 from typing import Optional
 
-from fastapi import APIRouter, Depends
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Header, Response
+from fastapi.responses import FileResponse
+from starlette.background import BackgroundTask
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from app.core.database import get_db
 from app.core.dependencies import obtener_usuario_actual
+from app.services.dashboard.cache_reportes_service import (
+    clave_reporte_actual,
+    construir_etag,
+    etag_coincide,
+    obtener_o_generar_reporte,
+)
 
 from app.services.dashboard.export_pdf_service import exportar_estadisticas_pdf_reportlab
 
@@ -34,6 +41,7 @@ class PDFExportRequest(BaseModel):
 )
 def exportar_estadisticas_pdf_endpoint(
     request: PDFExportRequest,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     usuario = Depends(obtener_usuario_actual)
 ):
@@ -48,19 +56,40 @@ def exportar_estadisticas_pdf_endpoint(
       - Preferencias y disponibilidad
       - Proceso de selección
 
+    El PDF se sirve desde la caché de reportes mientras los datos no cambien.
+    Si el cliente envía un `If-None-Match` vigente se responde 304 sin contenido.
+
     Args:
         request (PDFExportRequest): Filtro opcional por año.
+        if_none_match (Optional[str]): ETag del archivo que el cliente ya tiene.
         db (Session): Sesión de base de datos inyectada.
 
     Returns:
-        StreamingResponse: PDF generado como archivo descargable.
+        FileResponse: PDF generado como archivo descargable.
     """
-    pdf_io: BytesIO = exportar_estadisticas_pdf_reportlab(db, año=request.año)
+    filtros_reporte = {"año": request.año}
+    clave = clave_reporte_actual(db, "pdf", filtros_reporte)
+    etag = construir_etag(clave)
+    if etag_coincide(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    artefacto = obtener_o_generar_reporte(
+        db,
+        "pdf",
+        filtros_reporte,
+        "pdf",
+        lambda: exportar_estadisticas_pdf_reportlab(db, año=request.año),
+        clave=clave,
+    )
     headers = {
-        "Content-Disposition": "attachment; filename=estadisticas_report.pdf"
+        "Content-Disposition": "attachment; filename=estadisticas_report.pdf",
+        "ETag": artefacto.etag,
+        "Cache-Control": "private, no-cache",
     }
-    return StreamingResponse(
-        pdf_io,
+    return FileResponse(
+        artefacto.ruta,
         media_type="application/pdf",
-        headers=headers
+        headers=headers,
+        # Generado mientras cambiaban los datos: no quedó en caché y se elimina al enviarlo
+        background=BackgroundTask(os.remove, artefacto.ruta) if artefacto.temporal else None,
     )
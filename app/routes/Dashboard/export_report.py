@@ -1,14 +1,25 @@
-"""Ruta para exportar todos los candidatos detallados en archivo Excel."""
+"""Ruta para exportar todos los candidatos detallados en archivo Excel, CSV o Parquet."""
 
-from io import BytesIO
-from typing import Optional
+import os
+from typing import Literal, Optional
 
-from fastapi import APIRouter, Depends, Body
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Body, Header, Query, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.services.dashboard.cache_reportes_service import (
+    clave_reporte_actual,
+    construir_etag,
+    etag_coincide,
+    obtener_o_generar_reporte,
+)
+from app.services.dashboard.export_datos_service import (
+    exportar_candidatos_csv,
+    exportar_candidatos_parquet,
+)
 from app.services.dashboard.export_service import exportar_candidatos_detallados_excel
 
 router = APIRouter(
@@ -28,28 +39,72 @@ class ExportFiltroRequest(BaseModel):
 
 @router.post(
     "/exportar-candidatos",
-    summary="Exportar todos los candidatos detallados en un archivo Excel"
+    summary="Exportar todos los candidatos detallados en Excel, CSV o Parquet"
 )
 def exportar_candidatos_excel(
     filtros: ExportFiltroRequest = Body(...),
+    formato: Literal["excel", "csv", "parquet"] = Query("excel"),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
     """
-    Genera un archivo Excel con la información detallada de todos los candidatos.
+    Genera un archivo con la información detallada de todos los candidatos.
+
+    - `excel` (por defecto): archivo con estilos, servido desde la caché de reportes
+      mientras los datos no cambien. Con un `If-None-Match` vigente se responde 304.
+    - `csv`: volcado plano transmitido directamente desde la base de datos.
+    - `parquet`: volcado plano en formato columnar, escrito por grupos de filas.
+
+    Todos los formatos comparten las mismas columnas.
 
     Args:
         filtros (ExportFiltroRequest): Filtro opcional por año de registro.
+        formato (str): Formato de salida ('excel', 'csv' o 'parquet').
+        if_none_match (Optional[str]): ETag del archivo que el cliente ya tiene.
         db (Session): Sesión de base de datos inyectada.
 
     Returns:
-        StreamingResponse: Archivo Excel como descarga.
+        FileResponse | StreamingResponse: Archivo como descarga.
     """
-    output: BytesIO = exportar_candidatos_detallados_excel(db, filtros.año)
+    if formato == "csv":
+        return StreamingResponse(
+            exportar_candidatos_csv(db, filtros.año),
+            media_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": "attachment; filename=candidatos_detallados.csv"},
+        )
+
+    if formato == "parquet":
+        ruta = exportar_candidatos_parquet(db, filtros.año)
+        return FileResponse(
+            ruta,
+            media_type="application/vnd.apache.parquet",
+            filename="candidatos_detallados.parquet",
+            background=BackgroundTask(os.remove, ruta),
+        )
+
+    filtros_reporte = {"año": filtros.año}
+    clave = clave_reporte_actual(db, "excel", filtros_reporte)
+    etag = construir_etag(clave)
+    if etag_coincide(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    artefacto = obtener_o_generar_reporte(
+        db,
+        "excel",
+        filtros_reporte,
+        "xlsx",
+        lambda: exportar_candidatos_detallados_excel(db, filtros.año),
+        clave=clave,
+    )
     headers = {
-        "Content-Disposition": "attachment; filename=candidatos_detallados.xlsx"
+        "Content-Disposition": "attachment; filename=candidatos_detallados.xlsx",
+        "ETag": artefacto.etag,
+        "Cache-Control": "private, no-cache",
     }
-    return StreamingResponse(
-        output,
+    return FileResponse(
+        artefacto.ruta,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers=headers
+        headers=headers,
+        # Generado mientras cambiaban los datos: no quedó en caché y se elimina al enviarlo
+        background=BackgroundTask(os.remove, artefacto.ruta) if artefacto.temporal else None,
     )
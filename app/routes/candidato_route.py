@@ -1,10 +1,11 @@
 """Rutas para la gestión de candidatos, incluyendo creación, actualización, consulta, eliminación y estadísticas."""
 
 from typing import Optional
-from fastapi import APIRouter, Body, Depends, Query, status
+from fastapi import APIRouter, Body, Depends, File, Query, UploadFile, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.dependencies import obtener_usuario_admin
 from app.services.candidato_service import (
     create_candidato,
     eliminar_candidatos_incompletos,
@@ -30,6 +31,10 @@ from app.schemas.candidato_schema import (
     EstadisticasCandidatosResponse,
     CandidatoResumenPaginatedResponse,
 )
+from app.schemas.postulacion_schema import PostulacionCreate, PostulacionResponse
+from app.services.postulacion_service import crear_postulacion
+from app.schemas.importacion_schema import ImportacionCandidatosResponse
+from app.services.importacion_candidatos_service import importar_candidatos
 
 router = APIRouter(prefix="/candidatos", tags=["Candidatos"])
 
@@ -47,6 +52,20 @@ def create_candidato_endpoint(
     return create_candidato(db, candidato_data)
 
 
+@router.post("/postulacion", response_model=PostulacionResponse, status_code=status.HTTP_201_CREATED)
+def crear_postulacion_endpoint(
+    postulacion: PostulacionCreate, db: Session = Depends(get_db)
+):
+    """
+    Registra la postulación completa (candidato, educación, experiencia,
+    conocimientos y preferencias) en una sola petición y una sola transacción.
+
+    Returns:
+        PostulacionResponse: IDs de los registros creados.
+    """
+    return crear_postulacion(db, postulacion)
+
+
 @router.get("/resumen", response_model=CandidatoResumenPaginatedResponse)
 def obtener_resumen_candidatos(
     db: Session = Depends(get_db),
@@ -278,6 +297,29 @@ def limpiar_candidatos_incompletos(db: Session = Depends(get_db)):
     return eliminar_candidatos_incompletos(db)
 
 
+@router.post("/importar", response_model=ImportacionCandidatosResponse)
+def importar_candidatos_endpoint(
+    archivo: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    usuario = Depends(obtener_usuario_admin)
+):
+    """
+    Importa candidatos de forma masiva desde un archivo CSV o Excel (XLSX).
+
+    Los catálogos se indican por nombre. Las filas inválidas se reportan y no
+    impiden importar las demás.
+
+    Args:
+        archivo (UploadFile): Archivo `.csv` o `.xlsx` con una fila de cabecera.
+        db (Session): Sesión de base de datos inyectada.
+        usuario: Usuario administrador autenticado.
+
+    Returns:
+        ImportacionCandidatosResponse: Candidatos creados y detalle de las filas rechazadas.
+    """
+    return importar_candidatos(db, archivo.file, archivo.filename)
+
+
 @router.post("/eliminar-lote", response_model=EliminacionCandidatosResponse)
 def eliminar_candidatos_lote_endpoint(
     payload: CandidatosEliminarRequest = Body(...),
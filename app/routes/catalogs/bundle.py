@@ -0,0 +1,37 @@
+"""Ruta del bundle con todos los catálogos del formulario público."""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Query
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.services.catalogs.bundle_catalogos_service import respuesta_bundle
+
+router = APIRouter(prefix="/catalogos", tags=["Catálogos"])
+
+
+@router.get("/bundle")
+def obtener_bundle_catalogos(
+    v: Optional[str] = Query(None, description="Versión del bundle (X-Catalogos-Version)"),
+    accept_encoding: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Retorna en un solo documento todos los catálogos que necesita el formulario público.
+
+    El contenido se sirve precomprimido (Brotli o gzip, según `Accept-Encoding`). La
+    versión vigente viaja en el encabezado `X-Catalogos-Version` y en el campo `version`;
+    pedir `/catalogos/bundle?v=<version>` permite cachear la respuesta indefinidamente.
+
+    Args:
+        v (Optional[str]): Versión del bundle que el cliente quiere.
+        accept_encoding (Optional[str]): Codificaciones aceptadas por el cliente.
+        if_none_match (Optional[str]): ETag del bundle que el cliente ya tiene.
+        db (Session): Sesión de base de datos inyectada.
+
+    Returns:
+        Response: JSON `{"version": ..., "catalogos": {...}}`, o 304 si no cambió.
+    """
+    return respuesta_bundle(db, v, accept_encoding, if_none_match)
@@ -1,10 +1,13 @@
 """Rutas para la gestión de cargos ofrecidos."""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.database import get_db
+from app.schemas.catalogs.sugerencias import SugerenciaCatalogo
+from app.services.catalogs.cache_catalogos_service import respuesta_catalogo
+from app.services.catalogs.sugerencias_service import sugerir
 from app.schemas.catalogs.cargo_ofrecido import (
     CargoOfrecidoCreate,
     CargoOfrecidoPaginatedResponse,
@@ -22,8 +25,10 @@ from app.services.catalogs.cargos_ofrecidos_service import (
 router = APIRouter(prefix="/cargo-ofrecido", tags=["Cargo Ofrecido"])
 
 @router.get("/todas", response_model=List[CargoOfrecidoResponse])
-def listar_cargos(db: Session = Depends(get_db)):
-    return obtener_cargos_ofrecidos(db)
+def listar_cargos(if_none_match: Optional[str] = Header(None), db: Session = Depends(get_db)):
+    return respuesta_catalogo(
+        if_none_match, "cargos_ofrecidos", lambda: obtener_cargos_ofrecidos(db), CargoOfrecidoResponse
+    )
 
 
 @router.get("/", response_model=CargoOfrecidoPaginatedResponse)
@@ -39,6 +44,26 @@ def listar_cargos_ofrecidos_con_paginacion(
     return get_cargos_con_paginacion(db=db, skip=skip, limit=limit, search=search)
 
 
+@router.get("/sugerencias", response_model=List[SugerenciaCatalogo])
+def sugerir_cargos(
+    q: str = Query(..., min_length=1, description="Texto escrito por el usuario"),
+    limite: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+):
+    """
+    Sugiere cargos ofrecidos para el texto escrito, sin distinguir mayúsculas ni tildes.
+
+    Args:
+        q (str): Texto a buscar (prefijo del nombre o de cualquiera de sus palabras).
+        limite (int): Número máximo de sugerencias.
+        db (Session): Sesión de base de datos inyectada.
+
+    Returns:
+        List[SugerenciaCatalogo]: Sugerencias ordenadas por relevancia.
+    """
+    return sugerir(db, "cargos", q, limite)
+
+
 @router.get("/{id_cargo}", response_model=CargoOfrecidoResponse)
 def obtener_cargo(id_cargo: int, db: Session = Depends(get_db)):
     """
@@ -1,10 +1,11 @@
 """Rutas para la gestión del catálogo de centros de costos."""
 
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.services.catalogs.cache_catalogos_service import respuesta_catalogo
 from app.schemas.catalogs.centro_costos import CentroCostosCreate, CentroCostosPaginatedResponse, CentroCostosResponse
 from app.services.catalogs.centro_costos_service import (
     get_centros_costos,
@@ -20,8 +21,10 @@ router = APIRouter(prefix="/centros-costos", tags=["Centros de Costos"])
 
 
 @router.get("/todas", response_model=list[CentroCostosResponse])
-def listar_centros_costos(db: Session = Depends(get_db)):
-    return get_centros_costos(db)
+def listar_centros_costos(if_none_match: Optional[str] = Header(None), db: Session = Depends(get_db)):
+    return respuesta_catalogo(
+        if_none_match, "centros_costos", lambda: get_centros_costos(db), CentroCostosResponse
+    )
 
 
 @router.get("/", response_model=CentroCostosPaginatedResponse)
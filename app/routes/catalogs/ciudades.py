@@ -1,6 +1,6 @@
 """Rutas para la gestión del catálogo de ciudades."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -14,6 +14,9 @@ from app.services.catalogs.ciudades_service import (
     delete_ciudad,
 )
 from app.core.database import get_db
+from app.schemas.catalogs.sugerencias import SugerenciaCatalogo
+from app.services.catalogs.cache_catalogos_service import respuesta_catalogo
+from app.services.catalogs.sugerencias_service import sugerir
 
 router = APIRouter(prefix="/ciudades", tags=["Ciudades"])
 
@@ -40,8 +43,31 @@ def listar_ciudades_con_filtros(
     )
     
 @router.get("/todas", response_model=List[CiudadResponse])
-def listar_ciudades(db: Session = Depends(get_db)):
-    return get_ciudades(db)
+def listar_ciudades(if_none_match: Optional[str] = Header(None), db: Session = Depends(get_db)):
+    return respuesta_catalogo(
+        if_none_match, "ciudades", lambda: get_ciudades(db), CiudadResponse,
+        tablas=("ciudades", "departamentos"),
+    )
+
+
+@router.get("/sugerencias", response_model=List[SugerenciaCatalogo])
+def sugerir_ciudades(
+    q: str = Query(..., min_length=1, description="Texto escrito por el usuario"),
+    limite: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+):
+    """
+    Sugiere ciudades (con su departamento como detalle) para el texto escrito, sin distinguir mayúsculas ni tildes.
+
+    Args:
+        q (str): Texto a buscar (prefijo del nombre o de cualquiera de sus palabras).
+        limite (int): Número máximo de sugerencias.
+        db (Session): Sesión de base de datos inyectada.
+
+    Returns:
+        List[SugerenciaCatalogo]: Sugerencias ordenadas por relevancia.
+    """
+    return sugerir(db, "ciudades", q, limite)
 
 
 @router.get("/{ciudad_id}", response_model=CiudadResponse)
@@ -1,10 +1,11 @@
 """Rutas para consultar los catálogos de conocimientos (habilidades y herramientas)."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Header, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.database import get_db
+from app.services.catalogs.cache_catalogos_service import respuesta_catalogo
 from app.services.catalogs.conocimientos_service import (
     create_habilidad_blanda,
     create_habilidad_tecnica,
@@ -41,17 +42,20 @@ router = APIRouter(prefix="/conocimientos", tags=["Conocimientos"])
 # ----------------------------
 
 @router.get("/habilidades-blandas/todas", response_model=List[HabilidadBlandaResponse])
-def obtener_habilidades_blandas(db: Session = Depends(get_db)):
+def obtener_habilidades_blandas(if_none_match: Optional[str] = Header(None), db: Session = Depends(get_db)):
     """
-    Lista todas las habilidades blandas disponibles.
+    Lista todas las habilidades blandas disponibles (desde la caché de catálogos).
 
     Args:
+        if_none_match (Optional[str]): ETag del listado que el cliente ya tiene.
         db (Session): Sesión de base de datos inyectada.
 
     Returns:
-        List[HabilidadBlandaResponse]: Lista de habilidades blandas.
+        List[HabilidadBlandaResponse]: Lista de habilidades blandas, o 304 si no cambió.
     """
-    return get_habilidades_blandas(db)
+    return respuesta_catalogo(
+        if_none_match, "habilidades_blandas", lambda: get_habilidades_blandas(db), HabilidadBlandaResponse
+    )
 
 
 @router.get("/habilidades-blandas", response_model=HabilidadBlandaPaginatedResponse)
@@ -86,8 +90,10 @@ def eliminar_habilidad_blanda(id_habilidad: int, db: Session = Depends(get_db)):
 # ----------------------------
 
 @router.get("/habilidades-tecnicas/todas", response_model=List[HabilidadTecnicaResponse])
-def obtener_habilidades_tecnicas(db: Session = Depends(get_db)):
-    return get_habilidades_tecnicas(db)
+def obtener_habilidades_tecnicas(if_none_match: Optional[str] = Header(None), db: Session = Depends(get_db)):
+    return respuesta_catalogo(
+        if_none_match, "habilidades_tecnicas", lambda: get_habilidades_tecnicas(db), HabilidadTecnicaResponse
+    )
 
 @router.get("/habilidades-tecnicas", response_model=HabilidadTecnicaPaginatedResponse)
 def listar_habilidades_tecnicas(
@@ -120,8 +126,10 @@ def eliminar_habilidad_tecnica(id_habilidad: int, db: Session = Depends(get_db))
 
 
 @router.get("/herramientas/todas", response_model=List[HerramientaResponse])
-def obtener_herramientas(db: Session = Depends(get_db)):
-    return get_herramientas(db)
+def obtener_herramientas(if_none_match: Optional[str] = Header(None), db: Session = Depends(get_db)):
+    return respuesta_catalogo(
+        if_none_match, "herramientas", lambda: get_herramientas(db), HerramientaResponse
+    )
 
 @router.get("/herramientas", response_model=HerramientaPaginatedResponse)
 def listar_herramientas(
@@ -1,6 +1,6 @@
 """Rutas para la gestión de departamentos."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -18,12 +18,16 @@ from app.services.catalogs.departamentos_service import (
     obtener_todos_departamentos,
 )
 from app.core.database import get_db
+from app.services.catalogs.cache_catalogos_service import respuesta_catalogo
 
 router = APIRouter(prefix="/departamentos", tags=["Departamentos"])
 
 @router.get("/todas", response_model=List[DepartamentoResponse])
-def listar_departamentos(db: Session = Depends(get_db)):
-    return obtener_todos_departamentos(db)
+def listar_departamentos(if_none_match: Optional[str] = Header(None), db: Session = Depends(get_db)):
+    return respuesta_catalogo(
+        if_none_match, "departamentos", lambda: obtener_todos_departamentos(db), DepartamentoResponse,
+        tablas=("departamentos", "ciudades"),
+    )
 
 
 @router.post("/", response_model=DepartamentoResponse, status_code=status.HTTP_201_CREATED)
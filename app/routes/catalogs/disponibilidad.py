@@ -1,11 +1,12 @@
 """Rutas para la gestión del catálogo de disponibilidades laborales."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Header, Query
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import NoResultFound
 from typing import List, Optional
 
 from app.core.database import get_db
+from app.services.catalogs.cache_catalogos_service import respuesta_catalogo
 from app.services.catalogs.disponibilidad_service import (
     get_all_disponibilidades,
     get_disponabilidad_con_paginacion,
@@ -26,8 +27,10 @@ router = APIRouter(prefix="/disponibilidades", tags=["Disponibilidad"])
 
 
 @router.get("/todas", response_model=List[DisponibilidadResponse])
-def listar_disponibilidades(db: Session = Depends(get_db)):
-    return get_all_disponibilidades(db)
+def listar_disponibilidades(if_none_match: Optional[str] = Header(None), db: Session = Depends(get_db)):
+    return respuesta_catalogo(
+        if_none_match, "disponibilidad", lambda: get_all_disponibilidades(db), DisponibilidadResponse
+    )
 
 @router.get("/", response_model=DisponibilidadPaginatedResponse)
 def listar_disponabilidad_con_paginacion(
@@ -1,10 +1,13 @@
 """Rutas para la gestión del catálogo de instituciones académicas."""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.database import get_db
+from app.schemas.catalogs.sugerencias import SugerenciaCatalogo
+from app.services.catalogs.cache_catalogos_service import LIMITE_MAXIMO_TODAS, respuesta_catalogo
+from app.services.catalogs.sugerencias_service import sugerir
 from app.schemas.catalogs.instituciones import (
     InstitucionAcademicaCreate,
     InstitucionAcademicaPaginatedResponse,
@@ -24,8 +27,16 @@ router = APIRouter(prefix="/instituciones", tags=["Instituciones Académicas"])
 
 
 @router.get("/todas", response_model=List[InstitucionAcademicaResponse])
-def read_instituciones(skip: int = 0, limit: int = 300, db: Session = Depends(get_db)):
-    return get_instituciones(db, skip, limit)
+def read_instituciones(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(300, ge=1, le=LIMITE_MAXIMO_TODAS),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    return respuesta_catalogo(
+        if_none_match, "instituciones_academicas", lambda: get_instituciones(db, skip, limit),
+        InstitucionAcademicaResponse, parametros=(skip, limit),
+    )
 
 
 @router.get("/", response_model=InstitucionAcademicaPaginatedResponse)
@@ -43,6 +54,26 @@ def listar_instituciones_academicas_con_paginacion(
     )
 
 
+@router.get("/sugerencias", response_model=List[SugerenciaCatalogo])
+def sugerir_instituciones(
+    q: str = Query(..., min_length=1, description="Texto escrito por el usuario"),
+    limite: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+):
+    """
+    Sugiere instituciones académicas para el texto escrito, sin distinguir mayúsculas ni tildes.
+
+    Args:
+        q (str): Texto a buscar (prefijo del nombre o de cualquiera de sus palabras).
+        limite (int): Número máximo de sugerencias.
+        db (Session): Sesión de base de datos inyectada.
+
+    Returns:
+        List[SugerenciaCatalogo]: Sugerencias ordenadas por relevancia.
+    """
+    return sugerir(db, "instituciones", q, limite)
+
+
 @router.get("/{institucion_id}", response_model=InstitucionAcademicaResponse)
 def read_institucion(institucion_id: int, db: Session = Depends(get_db)):
     """
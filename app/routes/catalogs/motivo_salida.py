@@ -1,10 +1,11 @@
 """Rutas para la gestión del catálogo de motivos de salida laboral."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Header, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.database import get_db
+from app.services.catalogs.cache_catalogos_service import respuesta_catalogo
 from app.schemas.catalogs.motivo_salida import (
     MotivoSalidaCreate,
     MotivoSalidaPaginatedResponse,
@@ -24,8 +25,10 @@ router = APIRouter(prefix="/motivos-salida", tags=["Motivos de Salida"])
 
 
 @router.get("/todas", response_model=List[MotivoSalidaResponse])
-def obtener_motivos_salida(db: Session = Depends(get_db)):
-    return get_motivos_salida(db)
+def obtener_motivos_salida(if_none_match: Optional[str] = Header(None), db: Session = Depends(get_db)):
+    return respuesta_catalogo(
+        if_none_match, "motivos_salida", lambda: get_motivos_salida(db), MotivoSalidaResponse
+    )
 
 
 @router.get("/", response_model=MotivoSalidaPaginatedResponse)
@@ -1,10 +1,11 @@
 """Rutas para la gestión del catálogo de niveles de educación."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Header, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.database import get_db
+from app.services.catalogs.cache_catalogos_service import LIMITE_MAXIMO_TODAS, respuesta_catalogo
 from app.schemas.catalogs.nivel_educacion import (
     NivelEducacionCreate,
     NivelEducacionPaginatedResponse,
@@ -23,8 +24,16 @@ from app.services.catalogs.nivel_educacion_service import (
 router = APIRouter(prefix="/nivel-educacion", tags=["Nivel Educación"])
 
 @router.get("/todas", response_model=List[NivelEducacionResponse])
-def listar_niveles_educacion(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
-    return get_niveles_educacion(db, skip, limit)
+def listar_niveles_educacion(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=LIMITE_MAXIMO_TODAS),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    return respuesta_catalogo(
+        if_none_match, "nivel_educacion", lambda: get_niveles_educacion(db, skip, limit),
+        NivelEducacionResponse, parametros=(skip, limit),
+    )
 
 
 @router.get("/", response_model=NivelEducacionPaginatedResponse)
@@ -1,10 +1,11 @@
 """Rutas para la gestión del catálogo de niveles de inglés."""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.database import get_db
+from app.services.catalogs.cache_catalogos_service import respuesta_catalogo
 from app.schemas.catalogs.nivel_ingles import (
     NivelInglesPaginatedResponse,
     NivelInglesResponse,
@@ -25,8 +26,10 @@ router = APIRouter(prefix="/nivel-ingles", tags=["Nivel de Inglés"])
 
 
 @router.get("/todas", response_model=List[NivelInglesResponse])
-def listar_niveles_ingles(db: Session = Depends(get_db)):
-    return get_niveles_ingles(db)
+def listar_niveles_ingles(if_none_match: Optional[str] = Header(None), db: Session = Depends(get_db)):
+    return respuesta_catalogo(
+        if_none_match, "nivel_ingles", lambda: get_niveles_ingles(db), NivelInglesResponse
+    )
 
 
 @router.get("/", response_model=NivelInglesPaginatedResponse)
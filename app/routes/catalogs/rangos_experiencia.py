@@ -1,10 +1,11 @@
 """Rutas para la gestión del catálogo de rangos de experiencia laboral."""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.database import get_db
+from app.services.catalogs.cache_catalogos_service import respuesta_catalogo
 from app.schemas.catalogs.rango_experiencia import (
     RangoExperienciaPaginatedResponse,
     RangoExperienciaResponse,
@@ -25,17 +26,20 @@ router = APIRouter(prefix="/rangos-experiencia", tags=["Rangos de Experiencia"])
 
 
 @router.get("/todas", response_model=List[RangoExperienciaResponse])
-def listar_rangos_experiencia(db: Session = Depends(get_db)):
+def listar_rangos_experiencia(if_none_match: Optional[str] = Header(None), db: Session = Depends(get_db)):
     """
-    Lista todos los rangos de experiencia registrados.
+    Lista todos los rangos de experiencia registrados (desde la caché de catálogos).
 
     Args:
+        if_none_match (Optional[str]): ETag del listado que el cliente ya tiene.
         db (Session): Sesión de base de datos inyectada.
 
     Returns:
-        List[RangoExperienciaResponse]: Lista de rangos de experiencia.
+        List[RangoExperienciaResponse]: Lista de rangos de experiencia, o 304 si no cambió.
     """
-    return get_rangos_experiencia(db)
+    return respuesta_catalogo(
+        if_none_match, "rangos_experiencia", lambda: get_rangos_experiencia(db), RangoExperienciaResponse
+    )
 
 
 @router.get("/", response_model=RangoExperienciaPaginatedResponse)
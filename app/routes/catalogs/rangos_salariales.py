@@ -1,11 +1,12 @@
 """Rutas para la gestión del catálogo de rangos salariales."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Header, Query
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import NoResultFound
 from typing import List, Optional
 
 from app.core.database import get_db
+from app.services.catalogs.cache_catalogos_service import respuesta_catalogo
 from app.schemas.preferencias_schema import (
     RangoSalarialCreate,
     RangoSalarialPaginatedResponse,
@@ -24,8 +25,10 @@ from app.services.catalogs.rangos_salariales_service import (
 router = APIRouter(prefix="/rangos-salariales", tags=["Rangos Salariales"])
 
 @router.get("/todas", response_model=List[RangoSalarialResponse])
-def listar_rangos_salariales(db: Session = Depends(get_db)):
-    return get_all_rangos_salariales(db)
+def listar_rangos_salariales(if_none_match: Optional[str] = Header(None), db: Session = Depends(get_db)):
+    return respuesta_catalogo(
+        if_none_match, "rangos_salariales", lambda: get_all_rangos_salariales(db), RangoSalarialResponse
+    )
 
 
 
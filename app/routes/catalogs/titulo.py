@@ -1,10 +1,13 @@
 """Rutas para la gestión del catálogo de títulos obtenidos."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Header, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.database import get_db
+from app.schemas.catalogs.sugerencias import SugerenciaCatalogo
+from app.services.catalogs.cache_catalogos_service import LIMITE_MAXIMO_TODAS, respuesta_catalogo
+from app.services.catalogs.sugerencias_service import sugerir
 from app.schemas.catalogs.titulo import (
     TituloObtenidoCreate,
     TituloObtenidoPaginatedResponse,
@@ -25,8 +28,16 @@ router = APIRouter(prefix="/titulos", tags=["Títulos Obtenidos"])
 
 
 @router.get("/todas", response_model=List[TituloObtenidoResponse])
-def read_titulos(skip: int = 0, limit: int = 300, db: Session = Depends(get_db)):
-    return get_titulos(db, skip, limit)
+def read_titulos(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(300, ge=1, le=LIMITE_MAXIMO_TODAS),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    return respuesta_catalogo(
+        if_none_match, "titulos_obtenidos", lambda: get_titulos(db, skip, limit),
+        TituloObtenidoResponse, tablas=("titulos_obtenidos", "nivel_educacion"), parametros=(skip, limit),
+    )
 
 @router.get("/", response_model=TituloObtenidoPaginatedResponse)
 def listar_titulos_con_filtros(
@@ -48,6 +59,26 @@ def listar_titulos_con_filtros(
     )
 
 
+@router.get("/sugerencias", response_model=List[SugerenciaCatalogo])
+def sugerir_titulos(
+    q: str = Query(..., min_length=1, description="Texto escrito por el usuario"),
+    limite: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+):
+    """
+    Sugiere títulos obtenidos (con su nivel educativo como detalle) para el texto escrito, sin distinguir mayúsculas ni tildes.
+
+    Args:
+        q (str): Texto a buscar (prefijo del nombre o de cualquiera de sus palabras).
+        limite (int): Número máximo de sugerencias.
+        db (Session): Sesión de base de datos inyectada.
+
+    Returns:
+        List[SugerenciaCatalogo]: Sugerencias ordenadas por relevancia.
+    """
+    return sugerir(db, "titulos", q, limite)
+
+
 @router.get("/{titulo_id}", response_model=TituloObtenidoResponse)
 def read_titulo(titulo_id: int, db: Session = Depends(get_db)):
     """
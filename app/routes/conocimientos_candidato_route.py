@@ -1,19 +1,22 @@
 """Rutas para la gestión de conocimientos asociados a un candidato."""
 
 from typing import List
-from fastapi.responses import JSONResponse
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.schemas.conocimientos_candidato_schema import (
     CandidatoConocimientoCreate,
-    CandidatoConocimientoResponse
+    CandidatoConocimientoItem,
+    CandidatoConocimientoResponse,
+    ConocimientosLoteResponse,
+    ConocimientosReemplazoResponse,
 )
 from app.services.conocimientos_candidato_service import (
     get_conocimiento,
-    create_conocimiento,
-    delete_conocimiento
+    crear_conocimientos_lote,
+    delete_conocimiento,
+    reemplazar_conocimientos_candidato,
 )
 
 router = APIRouter(
@@ -22,23 +25,46 @@ router = APIRouter(
 )
 
 
-@router.post("/", status_code=201)
+@router.post("/", status_code=201, response_model=ConocimientosLoteResponse)
 def create_conocimientos_endpoint(
     conocimientos: List[CandidatoConocimientoCreate],
     db: Session = Depends(get_db)
 ):
     """
-    Crea múltiples conocimientos asociados a un candidato.
+    Crea múltiples conocimientos asociados a un candidato, en bloque y en una sola transacción.
 
     Args:
         conocimientos (List[CandidatoConocimientoCreate]): Lista de conocimientos a registrar.
         db (Session): Sesión de base de datos inyectada.
 
     Returns:
-        JSONResponse: Número de conocimientos creados exitosamente.
+        ConocimientosLoteResponse: Número de conocimientos creados y sus IDs.
     """
-    creados = [create_conocimiento(db, conocimiento) for conocimiento in conocimientos]
-    return JSONResponse(content={"detalles": f"{len(creados)} conocimientos creados con éxito"})
+    ids = crear_conocimientos_lote(db, conocimientos)
+    return ConocimientosLoteResponse(
+        detalles=f"{len(ids)} conocimientos creados con éxito",
+        ids_conocimientos=ids,
+    )
+
+
+@router.put("/candidato/{id_candidato}", response_model=ConocimientosReemplazoResponse)
+def reemplazar_conocimientos_endpoint(
+    id_candidato: int,
+    conocimientos: List[CandidatoConocimientoItem],
+    db: Session = Depends(get_db)
+):
+    """
+    Reemplaza todos los conocimientos de un candidato por la lista enviada.
+
+    Args:
+        id_candidato (int): ID del candidato.
+        conocimientos (List[CandidatoConocimientoItem]): Conjunto final de conocimientos.
+        db (Session): Sesión de base de datos inyectada.
+
+    Returns:
+        ConocimientosReemplazoResponse: Conocimientos agregados, eliminados e IDs vigentes.
+    """
+    return reemplazar_conocimientos_candidato(db, id_candidato, conocimientos)
 
 
 @router.get("/{conocimiento_id}", response_model=CandidatoConocimientoResponse)
@@ -0,0 +1,31 @@
+"""Rutas administrativas de diagnóstico del rendimiento de la base de datos."""
+
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+
+from app.core.consultas_lentas import listar_consultas_lentas
+from app.core.dependencies import obtener_usuario_admin
+from app.schemas.consulta_lenta_schema import ConsultaLentaResponse
+
+router = APIRouter(prefix="/diagnostico", tags=["Diagnóstico"])
+
+
+@router.get("/consultas-lentas", response_model=List[ConsultaLentaResponse])
+def listar_consultas_lentas_endpoint(
+    limite: int = Query(50, ge=1, le=500),
+    usuario = Depends(obtener_usuario_admin)
+):
+    """
+    Retorna las últimas consultas lentas registradas por este worker, con su plan de
+    ejecución cuando se pudo capturar.
+
+    Args:
+        limite (int): Máximo de consultas a retornar (más recientes primero).
+        usuario: Usuario administrador autenticado.
+
+    Returns:
+        List[ConsultaLentaResponse]: Consultas lentas con SQL normalizado, tipos de
+        parámetros, duración, ruta y plan.
+    """
+    return listar_consultas_lentas(limite)
@@ -0,0 +1,31 @@
+"""Rutas administrativas para consultar las ejecuciones de los jobs programados."""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.dependencies import obtener_usuario_admin
+from app.schemas.ejecucion_job_schema import EjecucionJobResponse
+from app.services.ejecuciones_jobs_service import obtener_ultima_ejecucion
+
+router = APIRouter(prefix="/jobs", tags=["Jobs programados"])
+
+
+@router.get("/{nombre_job}/ultima-ejecucion", response_model=EjecucionJobResponse)
+def obtener_ultima_ejecucion_endpoint(
+    nombre_job: str,
+    db: Session = Depends(get_db),
+    usuario = Depends(obtener_usuario_admin)
+):
+    """
+    Retorna la última ejecución registrada de un job (ej. `limpieza_candidatos_incompletos`).
+
+    Args:
+        nombre_job (str): Nombre del job.
+        db (Session): Sesión de base de datos inyectada.
+        usuario: Usuario administrador autenticado.
+
+    Returns:
+        EjecucionJobResponse: Estado, duración y filas afectadas de la ejecución.
+    """
+    return obtener_ultima_ejecucion(db, nombre_job)
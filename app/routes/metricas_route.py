@@ -0,0 +1,38 @@
+"""Ruta con las métricas de la API en formato Prometheus."""
+
+import os
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Response, status
+
+from app.core.metricas import exponer_prometheus
+
+# Token que debe enviar el scraper como `Authorization: Bearer <token>` (vacío = sin token)
+METRICAS_TOKEN = os.getenv("METRICAS_TOKEN", "")
+
+router = APIRouter(tags=["Métricas"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def obtener_metricas(authorization: Optional[str] = Header(None)):
+    """
+    Expone las métricas en el formato de texto de Prometheus.
+
+    Con varios workers el scrape llega a uno cualquiera: para que refleje todo el
+    servidor, configura `METRICAS_DIR_MULTIPROCESO` con un directorio compartido
+    (vacío al arrancar) y este worker sumará los valores que vuelcan los demás. Sin
+    él, los valores son solo los del worker que atendió la petición.
+
+    Args:
+        authorization (Optional[str]): `Bearer <METRICAS_TOKEN>` si el token está configurado.
+
+    Returns:
+        Response: Métricas en `text/plain; version=0.0.4`.
+
+    Raises:
+        HTTPException: 401 si se configuró `METRICAS_TOKEN` y no coincide.
+    """
+    if METRICAS_TOKEN and not secrets.compare_digest(authorization or "", f"Bearer {METRICAS_TOKEN}"):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token de métricas inválido.")
+    return Response(content=exponer_prometheus(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,19 @@
+"""Esquemas Pydantic para las sugerencias (autocompletado) de catálogos."""
+
+from typing import Optional
+from pydantic import BaseModel
+
+
+class SugerenciaCatalogo(BaseModel):
+    """
+    Elemento sugerido al escribir en un campo de catálogo.
+
+    Atributos:
+        id (int): Identificador del elemento en su catálogo.
+        nombre (str): Nombre a mostrar.
+        detalle (Optional[str]): Dato que lo distingue (departamento de la ciudad,
+            nivel educativo del título), si aplica.
+    """
+    id: int
+    nombre: str
+    detalle: Optional[str] = None
@@ -1,7 +1,7 @@
 """Esquemas Pydantic para los conocimientos asociados a un candidato."""
 
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 
 class CandidatoConocimientoBase(BaseModel):
@@ -42,3 +42,37 @@ class CandidatoConocimientoResponse(CandidatoConocimientoBase):
 
     class Config:
         from_attributes = True  # Compatible con modelos ORM
+
+
+class CandidatoConocimientoItem(CandidatoConocimientoBase):
+    """
+    Conocimiento sin el ID del candidato (se toma de la ruta), usado al reemplazar
+    todos los conocimientos de un candidato.
+    """
+    id_candidato: Optional[int] = Field(None, exclude=True)
+
+
+class ConocimientosLoteResponse(BaseModel):
+    """
+    Resultado de la creación en bloque de conocimientos.
+
+    Atributos:
+        detalles (str): Mensaje descriptivo.
+        ids_conocimientos (List[int]): IDs de los conocimientos creados.
+    """
+    detalles: str
+    ids_conocimientos: List[int]
+
+
+class ConocimientosReemplazoResponse(BaseModel):
+    """
+    Resultado de reemplazar todos los conocimientos de un candidato.
+
+    Atributos:
+        agregados (int): Conocimientos nuevos insertados.
+        eliminados (int): Conocimientos que ya no estaban en la lista y se borraron.
+        ids_conocimientos (List[int]): IDs vigentes del candidato tras el reemplazo.
+    """
+    agregados: int
+    eliminados: int
+    ids_conocimientos: List[int]
@@ -0,0 +1,29 @@
+"""Esquemas Pydantic para el registro de consultas lentas."""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ConsultaLentaResponse(BaseModel):
+    """
+    Esquema de respuesta para una consulta lenta.
+
+    Atributos:
+        fecha (datetime): Momento en que terminó la sentencia (UTC).
+        ruta (str): Plantilla de la ruta que la ejecutó, o `sin_peticion`.
+        duracion_ms (float): Duración en milisegundos.
+        sql (str): Sentencia normalizada, sin valores.
+        parametros (str): Tipos de los parámetros enlazados.
+        plan (Optional[str]): Salida de EXPLAIN (ANALYZE, BUFFERS), si se capturó.
+    """
+    fecha: datetime
+    ruta: str
+    duracion_ms: float
+    sql: str
+    parametros: str
+    plan: Optional[str] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,53 @@
+"""Esquemas Pydantic para los trabajos de exportación en segundo plano."""
+
+from datetime import datetime
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+
+# ──────────────── CREACIÓN DE TRABAJO ────────────────
+
+class ExportJobCreate(BaseModel):
+    """
+    Esquema para solicitar un nuevo trabajo de exportación.
+
+    Atributos:
+        tipo (str): Tipo de reporte a generar ('excel' o 'pdf').
+        año (Optional[int]): Año opcional para filtrar los datos exportados.
+    """
+    tipo: Literal["excel", "pdf"]
+    año: Optional[int] = None
+
+
+# ──────────────── RESPUESTA DE ESTADO ────────────────
+
+class ExportJobResponse(BaseModel):
+    """
+    Esquema de respuesta con el estado de un trabajo de exportación.
+
+    Atributos:
+        id (str): Identificador del trabajo.
+        tipo (str): Tipo de reporte.
+        año (Optional[int]): Año filtrado.
+        estado (str): PENDIENTE, EN_PROCESO, COMPLETADO o FALLIDO.
+        progreso (int): Porcentaje de avance.
+        error (Optional[str]): Detalle del error si el trabajo falló.
+        fecha_creacion (Optional[datetime]): Fecha de creación.
+        fecha_actualizacion (Optional[datetime]): Última actualización.
+        fecha_expiracion (Optional[datetime]): Fecha de expiración del archivo.
+        url_descarga (Optional[str]): Ruta de descarga cuando el trabajo está completado.
+    """
+    id: str
+    tipo: str
+    año: Optional[int] = None
+    estado: str
+    progreso: int
+    error: Optional[str] = None
+    fecha_creacion: Optional[datetime] = None
+    fecha_actualizacion: Optional[datetime] = None
+    fecha_expiracion: Optional[datetime] = None
+    url_descarga: Optional[str] = None
+
+    class Config:
+        from_attributes = True
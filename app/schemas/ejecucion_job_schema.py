@@ -0,0 +1,33 @@
+"""Esquemas Pydantic para el historial de ejecuciones de jobs programados."""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class EjecucionJobResponse(BaseModel):
+    """
+    Esquema de respuesta para una ejecución de un job.
+
+    Atributos:
+        id (int): Identificador de la ejecución.
+        nombre_job (str): Nombre del job.
+        estado (str): EN_CURSO, COMPLETADO o FALLIDO.
+        fecha_inicio (Optional[datetime]): Inicio de la ejecución.
+        fecha_fin (Optional[datetime]): Fin de la ejecución.
+        duracion_ms (Optional[int]): Duración en milisegundos.
+        filas_afectadas (int): Registros procesados o eliminados.
+        detalle (Optional[str]): Información adicional o error.
+    """
+    id: int
+    nombre_job: str
+    estado: str
+    fecha_inicio: Optional[datetime] = None
+    fecha_fin: Optional[datetime] = None
+    duracion_ms: Optional[int] = None
+    filas_afectadas: int
+    detalle: Optional[str] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,38 @@
+"""Esquemas Pydantic para la importación masiva de candidatos desde CSV/Excel."""
+
+from typing import List
+
+from pydantic import BaseModel
+
+
+class FilaInvalidaImportacion(BaseModel):
+    """
+    Fila del archivo que no se importó.
+
+    Atributos:
+        fila (int): Número de fila en el archivo (la cabecera es la fila 1).
+        errores (List[str]): Motivos por los que la fila fue rechazada.
+    """
+    fila: int
+    errores: List[str]
+
+
+class ImportacionCandidatosResponse(BaseModel):
+    """
+    Resultado de una importación masiva de candidatos.
+
+    Atributos:
+        id_importacion (str): Identificador de la importación.
+        total_filas (int): Filas de datos leídas del archivo.
+        importados (int): Candidatos creados.
+        invalidas (int): Filas rechazadas.
+        filas_invalidas (List[FilaInvalidaImportacion]): Detalle de las filas rechazadas
+            (acotado a las primeras `LIMITE_REPORTE_IMPORTACION`).
+        segundos (float): Duración total de la importación.
+    """
+    id_importacion: str
+    total_filas: int
+    importados: int
+    invalidas: int
+    filas_invalidas: List[FilaInvalidaImportacion]
+    segundos: float
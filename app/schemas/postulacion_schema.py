@@ -0,0 +1,66 @@
+"""Esquemas Pydantic para la postulación completa de un candidato en una sola petición."""
+
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+from app.schemas.candidato_schema import CandidatoCreate
+from app.schemas.educacion_schema import EducacionCreate
+from app.schemas.experiencia_schema import ExperienciaLaboralCreate
+from app.schemas.conocimientos_candidato_schema import CandidatoConocimientoBase
+from app.schemas.preferencias_schema import PreferenciaDisponibilidadCreate
+
+
+# ──────────────── SECCIONES DEL FORMULARIO ────────────────
+# Reutilizan los esquemas de creación (y sus validaciones); el ID del candidato
+# no se envía porque se asigna al guardar la postulación.
+
+class EducacionPostulacion(EducacionCreate):
+    """Educación del candidato dentro de la postulación."""
+    id_candidato: Optional[int] = Field(None, exclude=True)
+
+
+class ExperienciaPostulacion(ExperienciaLaboralCreate):
+    """Experiencia laboral del candidato dentro de la postulación."""
+    id_candidato: Optional[int] = Field(None, exclude=True)
+
+
+class ConocimientoPostulacion(CandidatoConocimientoBase):
+    """Conocimiento (habilidad blanda, técnica o herramienta) dentro de la postulación."""
+    id_candidato: Optional[int] = Field(None, exclude=True)
+
+
+class PreferenciaPostulacion(PreferenciaDisponibilidadCreate):
+    """Preferencias y disponibilidad del candidato dentro de la postulación."""
+    id_candidato: Optional[int] = Field(None, exclude=True)
+
+
+# ──────────────── POSTULACIÓN ────────────────
+
+class PostulacionCreate(BaseModel):
+    """
+    Formulario público completo, enviado como un único documento.
+
+    Atributos:
+        candidato (CandidatoCreate): Información personal.
+        educacion (EducacionPostulacion): Formación académica.
+        experiencia (Optional[ExperienciaPostulacion]): Experiencia laboral (si tiene).
+        conocimientos (List[ConocimientoPostulacion]): Habilidades y herramientas.
+        preferencias (PreferenciaPostulacion): Preferencias y disponibilidad.
+    """
+    candidato: CandidatoCreate
+    educacion: EducacionPostulacion
+    experiencia: Optional[ExperienciaPostulacion] = None
+    conocimientos: List[ConocimientoPostulacion] = []
+    preferencias: PreferenciaPostulacion
+
+
+class PostulacionResponse(BaseModel):
+    """
+    Resultado de la postulación: IDs de todos los registros creados.
+    """
+    id_candidato: int
+    id_educacion: int
+    id_experiencia: Optional[int] = None
+    ids_conocimientos: List[int]
+    id_preferencia: int
+    formulario_completo: bool
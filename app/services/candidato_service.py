@@ -1,9 +1,9 @@
 from datetime import datetime, timedelta, timezone
 import logging
-from typing import Optional
+from typing import Callable, Optional
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import desc, extract, func, or_
+from sqlalchemy import delete, desc, extract, func, or_, select
 from fastapi import HTTPException
 from app.models.candidato_model import Candidato
 from app.models.catalogs.ciudad import Ciudad
@@ -19,6 +19,8 @@ from app.models.experiencia_model import ExperienciaLaboral
 from app.models.conocimientos_model import CandidatoConocimiento
 from app.models.preferencias import PreferenciaDisponibilidad
 from app.models.catalogs.cargo_ofrecido import CargoOfrecido
+from app.utils.integridad import insertar_retornando, restriccion_violada
+from app.utils.lotes import TAMANO_LOTE_IDS, condicion_ids, en_lotes, ids_unicos
 from app.services.mappers.candidato_mapper import (
     mapear_candidato_detalle,
     mapear_candidato_resumen,
@@ -29,28 +31,35 @@ from app.services.mappers.candidato_mapper import (
 logger = logging.getLogger(__name__)
 
 
-def create_candidato(db: Session, candidato_data: CandidatoCreate):
-    if (
-        db.query(Candidato)
-        .filter(Candidato.correo_electronico == candidato_data.correo_electronico)
-        .first()
-    ):
-        raise HTTPException(
-            status_code=400, detail="El correo electrónico ya está registrado"
-        )
+# Restricciones únicas de candidatos → mensaje del 409 correspondiente
+RESTRICCIONES_UNICAS_CANDIDATO = {
+    "candidatos_correo_electronico_key": "El correo electrónico ya está registrado",
+    "candidatos_cc_key": "La cédula ya está registrada",
+}
+
+
+def conflicto_unicidad_candidato(error: IntegrityError) -> Optional[HTTPException]:
+    """Traduce una violación de unicidad del candidato (correo o cédula) en un 409."""
+    mensaje = RESTRICCIONES_UNICAS_CANDIDATO.get(restriccion_violada(error))
+    if mensaje:
+        return HTTPException(status_code=409, detail=mensaje)
+    return None
 
+
+def create_candidato(db: Session, candidato_data: CandidatoCreate):
     campos = candidato_data.model_dump()
-    nuevo_candidato = Candidato(**campos)
 
     try:
-        db.add(nuevo_candidato)
+        # Un solo INSERT ... RETURNING: la unicidad de correo y cédula la garantiza la base de datos
+        nuevo_candidato = insertar_retornando(db, Candidato, **campos)
         db.commit()
-        db.refresh(nuevo_candidato)  # 🔥 Esto recupera el ID generado
-        print(f"Nuevo ID generado: {nuevo_candidato.id_candidato}")  # ✅ Debug
         return nuevo_candidato
     except IntegrityError as e:
-        logger.error(f"Error de integridad al insertar candidato: {e}")
         db.rollback()
+        conflicto = conflicto_unicidad_candidato(e)
+        if conflicto:
+            raise conflicto
+        logger.error(f"Error de integridad al insertar candidato: {e}")
         raise HTTPException(
             status_code=500, detail="Error al insertar el candidato en la base de datos"
         )
@@ -81,7 +90,6 @@ def update_candidato(db: Session, id_candidato: int, candidato_data: CandidatoUp
 
     try:
         db.commit()
-        db.refresh(candidato)
         return candidato
     except IntegrityError as e:
         logger.error(f"Error al actualizar candidato: {e}")
@@ -505,26 +513,51 @@ def marcar_formulario_completo(db: Session, id_candidato: int) -> Candidato:
 
     candidato.formulario_completo = True
     db.commit()
-    db.refresh(candidato)
     return candidato
 
 
-def eliminar_candidatos_incompletos(db: Session) -> dict:
+def eliminar_candidatos_incompletos(
+    db: Session,
+    tamano_lote: Optional[int] = None,
+    registrar_avance: Optional[Callable[[int], None]] = None,
+) -> dict:
+    """
+    Elimina los candidatos con formulario incompleto registrados hace más de 6 horas.
+
+    Se borra por lotes acotados (`DELETE ... WHERE id IN (SELECT ... LIMIT n)`), con
+    una transacción corta por lote; los registros hijos los borra la base de datos.
+
+    Args:
+        db (Session): Sesión de base de datos.
+        tamano_lote (Optional[int]): Candidatos por lote (por defecto, `TAMANO_LOTE_IDS`).
+        registrar_avance (Optional[Callable[[int], None]]): Recibe el total eliminado
+            tras confirmar cada lote, para conservarlo si un lote posterior falla.
+
+    Returns:
+        dict: Cantidad de candidatos eliminados.
+    """
     limite = datetime.now(timezone.utc) - timedelta(hours=6)
-    candidatos = (
-        db.query(Candidato)
-        .filter(
-            Candidato.formulario_completo == False, Candidato.fecha_registro < limite
-        )
-        .all()
-    )
+    tamano_lote = tamano_lote or TAMANO_LOTE_IDS
 
     eliminados = 0
-    for candidato in candidatos:
-        db.delete(candidato)
-        eliminados += 1
+    while True:
+        lote = (
+            select(Candidato.id_candidato)
+            .where(Candidato.formulario_completo == False, Candidato.fecha_registro < limite)
+            .limit(tamano_lote)
+            .scalar_subquery()
+        )
+        borrados = db.execute(
+            delete(Candidato).where(Candidato.id_candidato.in_(lote)).returning(Candidato.id_candidato),
+            execution_options={"synchronize_session": False},
+        ).scalars().all()
+        db.commit()
+        eliminados += len(borrados)
+        if registrar_avance:
+            registrar_avance(eliminados)
+        if len(borrados) < tamano_lote:
+            break
 
-    db.commit()
     return {"eliminados": eliminados}
 
 
@@ -535,16 +568,29 @@ def eliminar_candidatos_por_lote(
     if not payload.ids_candidatos:
         raise HTTPException(status_code=400, detail="La lista de candidatos está vacía.")
 
-    eliminados = []
-    for id_candidato in payload.ids_candidatos:
-        candidato = db.query(Candidato).filter(Candidato.id_candidato == id_candidato).first()
-        if candidato:
-            db.delete(candidato)
-            eliminados.append(id_candidato)
+    # DELETE ... RETURNING por lotes; los registros hijos los borra la base de datos (ON DELETE CASCADE)
+    ids = ids_unicos(payload.ids_candidatos)
+    dialecto = db.get_bind().dialect.name
+    borrados = set()
+    try:
+        for lote in en_lotes(ids):
+            resultado = db.execute(
+                delete(Candidato)
+                .where(condicion_ids(Candidato.id_candidato, lote, dialecto))
+                .returning(Candidato.id_candidato),
+                execution_options={"synchronize_session": False},
+            )
+            borrados.update(resultado.scalars())
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error al eliminar candidatos por lote: {e}")
+        raise HTTPException(status_code=500, detail="Error al eliminar los candidatos seleccionados.")
 
-    if not eliminados:
+    if not borrados:
+        db.rollback()
         raise HTTPException(status_code=404, detail="No se encontró ningún candidato válido para eliminar.")
 
+    eliminados = [id_candidato for id_candidato in ids if id_candidato in borrados]
     try:
         db.commit()
         return EliminacionCandidatosResponse(eliminados=len(eliminados), detalles=eliminados)
@@ -0,0 +1,232 @@
+"""
+Servicio del bundle de catálogos: todos los catálogos que usa el formulario público
+en un único documento JSON, precomprimido con gzip y Brotli.
+
+El bundle se arma con las mismas entradas de la caché de catálogos que sirven los
+endpoints `/todas`, y solo se vuelve a serializar y comprimir cuando alguna de ellas
+cambia. Su versión es un hash del contenido, igual en todos los procesos, por lo que
+la URL `/catalogos/bundle?v=<version>` puede cachearse indefinidamente.
+"""
+
+import gzip
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Type
+
+import brotli
+from fastapi import HTTPException, Response
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.core.metricas import registrar_acceso_cache
+from app.schemas.catalogs.cargo_ofrecido import CargoOfrecidoResponse
+from app.schemas.catalogs.centro_costos import CentroCostosResponse
+from app.schemas.catalogs.ciudad import CiudadResponse, DepartamentoResponse
+from app.schemas.catalogs.conocimientos_schema import (
+    HabilidadBlandaResponse,
+    HabilidadTecnicaResponse,
+    HerramientaResponse,
+)
+from app.schemas.catalogs.instituciones import InstitucionAcademicaResponse
+from app.schemas.catalogs.motivo_salida import MotivoSalidaResponse
+from app.schemas.catalogs.nivel_educacion import NivelEducacionResponse
+from app.schemas.catalogs.nivel_ingles import NivelInglesResponse
+from app.schemas.catalogs.rango_experiencia import RangoExperienciaResponse
+from app.schemas.catalogs.titulo import TituloObtenidoResponse
+from app.schemas.preferencias_schema import DisponibilidadResponse, RangoSalarialResponse
+from app.services.catalogs.cache_catalogos_service import CatalogoSerializado, obtener_catalogo
+from app.services.catalogs.cargos_ofrecidos_service import obtener_cargos_ofrecidos
+from app.services.catalogs.centro_costos_service import get_centros_costos
+from app.services.catalogs.ciudades_service import get_ciudades
+from app.services.catalogs.conocimientos_service import (
+    get_habilidades_blandas,
+    get_habilidades_tecnicas,
+    get_herramientas,
+)
+from app.services.catalogs.departamentos_service import obtener_todos_departamentos
+from app.services.catalogs.disponibilidad_service import get_all_disponibilidades
+from app.services.catalogs.instituciones_service import get_instituciones
+from app.services.catalogs.motivo_salida_service import get_motivos_salida
+from app.services.catalogs.nivel_educacion_service import get_niveles_educacion
+from app.services.catalogs.nivel_ingles_service import get_niveles_ingles
+from app.services.catalogs.rango_experiencia_service import get_rangos_experiencia
+from app.services.catalogs.rangos_salariales_service import get_all_rangos_salariales
+from app.services.catalogs.titulo_service import get_titulos
+from app.services.dashboard.cache_reportes_service import etag_coincide
+
+# Cache-Control de la URL versionada: el contenido de una versión nunca cambia
+CACHE_CONTROL_VERSIONADO = "public, max-age=31536000, immutable"
+
+
+@dataclass(frozen=True)
+class CatalogoBundle:
+    """
+    Catálogo incluido en el bundle. Usa la misma clave de caché (`nombre`, `parametros`)
+    que su endpoint `/todas`, de modo que ambos comparten la entrada serializada.
+    """
+    clave: str
+    nombre: str
+    cargar: Callable[[Session], Sequence[Any]]
+    esquema: Type[BaseModel]
+    tablas: Optional[Tuple[str, ...]] = None
+    parametros: Tuple[Any, ...] = ()
+
+
+# Catálogos que carga el formulario público, con los parámetros por defecto de cada `/todas`
+CATALOGOS_BUNDLE: List[CatalogoBundle] = [
+    CatalogoBundle("departamentos", "departamentos", obtener_todos_departamentos, DepartamentoResponse,
+                   tablas=("departamentos", "ciudades")),
+    CatalogoBundle("ciudades", "ciudades", get_ciudades, CiudadResponse, tablas=("ciudades", "departamentos")),
+    CatalogoBundle("cargos_ofrecidos", "cargos_ofrecidos", obtener_cargos_ofrecidos, CargoOfrecidoResponse),
+    CatalogoBundle("centros_costos", "centros_costos", get_centros_costos, CentroCostosResponse),
+    CatalogoBundle("niveles_educacion", "nivel_educacion", lambda db: get_niveles_educacion(db, 0, 10),
+                   NivelEducacionResponse, parametros=(0, 10)),
+    CatalogoBundle("titulos", "titulos_obtenidos", lambda db: get_titulos(db, 0, 300), TituloObtenidoResponse,
+                   tablas=("titulos_obtenidos", "nivel_educacion"), parametros=(0, 300)),
+    CatalogoBundle("instituciones", "instituciones_academicas", lambda db: get_instituciones(db, 0, 300),
+                   InstitucionAcademicaResponse, parametros=(0, 300)),
+    CatalogoBundle("niveles_ingles", "nivel_ingles", get_niveles_ingles, NivelInglesResponse),
+    CatalogoBundle("rangos_experiencia", "rangos_experiencia", get_rangos_experiencia, RangoExperienciaResponse),
+    CatalogoBundle("habilidades_blandas", "habilidades_blandas", get_habilidades_blandas, HabilidadBlandaResponse),
+    CatalogoBundle("habilidades_tecnicas", "habilidades_tecnicas", get_habilidades_tecnicas, HabilidadTecnicaResponse),
+    CatalogoBundle("herramientas", "herramientas", get_herramientas, HerramientaResponse),
+    CatalogoBundle("disponibilidades", "disponibilidad", get_all_disponibilidades, DisponibilidadResponse),
+    CatalogoBundle("rangos_salariales", "rangos_salariales", get_all_rangos_salariales, RangoSalarialResponse),
+    CatalogoBundle("motivos_salida", "motivos_salida", get_motivos_salida, MotivoSalidaResponse),
+]
+
+
+@dataclass
+class BundleSerializado:
+    """Bundle serializado en sus tres codificaciones, identificado por su versión."""
+    version: str
+    etags_catalogos: Tuple[str, ...]
+    identidad: bytes
+    gzip: bytes
+    br: bytes
+
+
+_lock = threading.Lock()
+_bundle: Optional[BundleSerializado] = None
+
+
+# ──────────────── CONSTRUCCIÓN ────────────────
+
+def _catalogo_o_vacio(db: Session, catalogo: CatalogoBundle) -> CatalogoSerializado:
+    """
+    Obtiene la entrada en caché del catálogo. Los servicios que responden 404 cuando
+    el catálogo está vacío se representan en el bundle como una lista vacía.
+    """
+    try:
+        return obtener_catalogo(
+            catalogo.nombre, lambda: catalogo.cargar(db), catalogo.esquema,
+            catalogo.tablas, catalogo.parametros,
+        )
+    except HTTPException as e:
+        if e.status_code != 404:
+            raise
+        return CatalogoSerializado(version=0, contenido=b"[]", etag='"vacio"', tablas=frozenset(), creado=0)
+
+
+def _serializar_bundle(entradas: List[Tuple[CatalogoBundle, CatalogoSerializado]]) -> BundleSerializado:
+    """Compone el JSON del bundle a partir de los listados ya serializados y lo comprime."""
+    cuerpo = b",".join(
+        b'"' + catalogo.clave.encode() + b'":' + entrada.contenido for catalogo, entrada in entradas
+    )
+    version = hashlib.sha256(cuerpo).hexdigest()[:16]
+    identidad = b'{"version":"' + version.encode() + b'","catalogos":{' + cuerpo + b"}}"
+    return BundleSerializado(
+        version=version,
+        etags_catalogos=tuple(entrada.etag for _, entrada in entradas),
+        identidad=identidad,
+        gzip=gzip.compress(identidad, compresslevel=9, mtime=0),
+        br=brotli.compress(identidad, quality=11),
+    )
+
+
+def obtener_bundle(db: Session) -> BundleSerializado:
+    """
+    Retorna el bundle de catálogos, regenerándolo solo si algún catálogo cambió.
+
+    Args:
+        db (Session): Sesión de base de datos (solo se usa si algún catálogo no está en caché).
+
+    Returns:
+        BundleSerializado: Bundle en JSON plano, gzip y Brotli.
+    """
+    global _bundle
+    entradas = [(catalogo, _catalogo_o_vacio(db, catalogo)) for catalogo in CATALOGOS_BUNDLE]
+    etags = tuple(entrada.etag for _, entrada in entradas)
+
+    with _lock:
+        vigente = _bundle is not None and _bundle.etags_catalogos == etags
+        registrar_acceso_cache("bundle_catalogos", vigente)
+        if not vigente:
+            _bundle = _serializar_bundle(entradas)
+        return _bundle
+
+
+# ──────────────── RESPUESTA HTTP ────────────────
+
+def elegir_codificacion(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Elige la codificación a usar según `Accept-Encoding`: Brotli, luego gzip, si no, ninguna.
+    """
+    aceptadas = {}
+    for parte in (accept_encoding or "").split(","):
+        nombre, _, parametros = parte.strip().partition(";")
+        calidad = 1.0
+        if parametros.strip().startswith("q="):
+            try:
+                calidad = float(parametros.strip()[2:])
+            except ValueError:
+                calidad = 0.0
+        aceptadas[nombre.strip().lower()] = calidad
+
+    for codificacion in ("br", "gzip"):
+        if aceptadas.get(codificacion, aceptadas.get("*", 0)) > 0:
+            return codificacion
+    return None
+
+
+def respuesta_bundle(
+    db: Session,
+    version_solicitada: Optional[str],
+    accept_encoding: Optional[str],
+    if_none_match: Optional[str],
+) -> Response:
+    """
+    Construye la respuesta HTTP del bundle con la codificación que acepta el cliente.
+
+    Si la petición trae la versión vigente (`?v=`), la respuesta se marca como inmutable;
+    en otro caso se sirve el bundle actual y el cliente debe revalidar con su ETag.
+
+    Args:
+        db (Session): Sesión de base de datos.
+        version_solicitada (Optional[str]): Versión pedida en la URL.
+        accept_encoding (Optional[str]): Encabezado `Accept-Encoding`.
+        if_none_match (Optional[str]): Encabezado `If-None-Match`.
+
+    Returns:
+        Response: 200 con el bundle (comprimido si corresponde) o 304.
+    """
+    bundle = obtener_bundle(db)
+    codificacion = elegir_codificacion(accept_encoding)
+
+    # Cada codificación es una representación distinta y lleva su propio ETag fuerte
+    etag = f'"{bundle.version}-{codificacion}"' if codificacion else f'"{bundle.version}"'
+    encabezados = {
+        "ETag": etag,
+        "Vary": "Accept-Encoding",
+        "X-Catalogos-Version": bundle.version,
+        "Cache-Control": CACHE_CONTROL_VERSIONADO if version_solicitada == bundle.version else "no-cache",
+    }
+    variantes = (f'"{bundle.version}"', f'"{bundle.version}-gzip"', f'"{bundle.version}-br"')
+    if any(etag_coincide(if_none_match, variante) for variante in variantes):
+        return Response(status_code=304, headers=encabezados)
+
+    if codificacion:
+        encabezados["Content-Encoding"] = codificacion
+    contenido = {"br": bundle.br, "gzip": bundle.gzip}.get(codificacion, bundle.identidad)
+    return Response(content=contenido, media_type="application/json", headers=encabezados)
@@ -0,0 +1,239 @@
+"""
+Caché en memoria de los listados completos de catálogos (`/{catalogo}/todas`).
+
+Cada listado se guarda ya serializado a JSON junto con su ETag fuerte, de modo que
+las lecturas repetidas no consultan la base de datos ni vuelven a validar los
+esquemas Pydantic. Las entradas se invalidan al confirmar cualquier transacción
+que escriba sobre las tablas de las que dependen (ver eventos de sesión al final).
+
+Los listados con paginación (`skip`/`limit`) usan una entrada por combinación de
+parámetros; para que un cliente no pueda crecer la memoria sin límite, la caché
+conserva como máximo `CATALOGOS_CACHE_MAX_ENTRADAS` y desaloja la menos usada.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple, Type
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.metricas import registrar_acceso_cache
+from app.services.dashboard.cache_reportes_service import etag_coincide
+
+# Segundos que una entrada puede servirse sin recargarse. Acota cuánto tarda un
+# worker en ver cambios hechos por otro proceso (la invalidación es local).
+CATALOGOS_CACHE_TTL_SEGUNDOS = int(os.getenv("CATALOGOS_CACHE_TTL_SEGUNDOS", "300"))
+
+# Entradas máximas en la caché (listados por combinación de parámetros)
+CATALOGOS_CACHE_MAX_ENTRADAS = int(os.getenv("CATALOGOS_CACHE_MAX_ENTRADAS", "256"))
+
+# Valor máximo de `limit` en los listados `/todas` paginados
+LIMITE_MAXIMO_TODAS = 1000
+
+# Tablas de catálogo cuyas escrituras invalidan la caché
+TABLAS_CATALOGOS = {
+    "departamentos",
+    "ciudades",
+    "cargos_ofrecidos",
+    "centros_costos",
+    "nivel_educacion",
+    "titulos_obtenidos",
+    "instituciones_academicas",
+    "nivel_ingles",
+    "rangos_experiencia",
+    "habilidades_blandas",
+    "habilidades_tecnicas",
+    "herramientas",
+    "disponibilidad",
+    "rangos_salariales",
+    "motivos_salida",
+}
+
+# Clave de `session.info` donde se acumulan las tablas de catálogo modificadas
+_CLAVE_TABLAS_MODIFICADAS = "catalogos_modificados"
+
+
+@dataclass
+class CatalogoSerializado:
+    """Listado de un catálogo ya serializado, con la versión con la que se generó."""
+    version: int
+    contenido: bytes
+    etag: str
+    tablas: FrozenSet[str]
+    creado: float
+
+
+_lock = threading.Lock()
+# Ordenadas de la menos a la más recientemente usada
+_entradas: OrderedDict[Tuple[str, Tuple[Any, ...]], CatalogoSerializado] = OrderedDict()
+_version = 0
+_versiones_tablas: Dict[str, int] = {}
+_adaptadores: Dict[Type[BaseModel], TypeAdapter] = {}
+
+
+# ──────────────── VERSIÓN E INVALIDACIÓN ────────────────
+
+def version_catalogos() -> int:
+    """Retorna la versión actual de los catálogos en este proceso."""
+    return _version
+
+
+def version_tablas(tablas: Iterable[str]) -> Tuple[int, ...]:
+    """Retorna la versión en este proceso de cada una de las tablas indicadas."""
+    with _lock:
+        return tuple(_versiones_tablas.get(tabla, 0) for tabla in tablas)
+
+
+def invalidar_catalogos(tablas: Optional[Iterable[str]] = None) -> None:
+    """
+    Descarta las entradas que dependen de alguna de las tablas indicadas.
+
+    Args:
+        tablas (Optional[Iterable[str]]): Tablas modificadas; si es None se vacía toda la caché.
+    """
+    global _version
+    with _lock:
+        _version += 1
+        tablas = set(TABLAS_CATALOGOS if tablas is None else tablas)
+        for tabla in tablas:
+            _versiones_tablas[tabla] = _versiones_tablas.get(tabla, 0) + 1
+        for clave in [c for c, e in _entradas.items() if e.tablas & tablas]:
+            del _entradas[clave]
+
+
+# ──────────────── LECTURA ────────────────
+
+def _serializar(esquema: Type[BaseModel], filas: Sequence[Any]) -> bytes:
+    """Valida las filas con el esquema de respuesta y las serializa a JSON."""
+    adaptador = _adaptadores.get(esquema)
+    if adaptador is None:
+        adaptador = _adaptadores.setdefault(esquema, TypeAdapter(List[esquema]))
+    return adaptador.dump_json(adaptador.validate_python(filas, from_attributes=True))
+
+
+def obtener_catalogo(
+    nombre: str,
+    cargar: Callable[[], Sequence[Any]],
+    esquema: Type[BaseModel],
+    tablas: Optional[Iterable[str]] = None,
+    parametros: Tuple[Any, ...] = (),
+) -> CatalogoSerializado:
+    """
+    Retorna el listado serializado del catálogo, cargándolo solo si no está en caché.
+
+    Args:
+        nombre (str): Nombre de la tabla del catálogo (también la clave de la caché).
+        cargar (Callable[[], Sequence[Any]]): Consulta que retorna las filas del catálogo.
+        esquema (Type[BaseModel]): Esquema de respuesta de cada elemento.
+        tablas (Optional[Iterable[str]]): Tablas de las que depende la respuesta
+            (por defecto, solo `nombre`).
+        parametros (Tuple[Any, ...]): Parámetros de la consulta que forman parte de la clave.
+
+    Returns:
+        CatalogoSerializado: Contenido JSON y ETag del listado.
+    """
+    clave = (nombre, parametros)
+    ahora = time.monotonic()
+    with _lock:
+        entrada = _entradas.get(clave)
+        if entrada and ahora - entrada.creado < CATALOGOS_CACHE_TTL_SEGUNDOS:
+            _entradas.move_to_end(clave)
+            registrar_acceso_cache("catalogos", True)
+            return entrada
+        version = _version
+
+    registrar_acceso_cache("catalogos", False)
+    contenido = _serializar(esquema, cargar())
+    entrada = CatalogoSerializado(
+        version=version,
+        contenido=contenido,
+        etag=f'"{hashlib.sha256(contenido).hexdigest()}"',
+        tablas=frozenset(tablas or (nombre,)),
+        creado=ahora,
+    )
+
+    with _lock:
+        # Si hubo una invalidación mientras se consultaba, el resultado puede estar
+        # desactualizado: se sirve a esta petición pero no se guarda.
+        if _version == version:
+            _entradas[clave] = entrada
+            _entradas.move_to_end(clave)
+            while len(_entradas) > CATALOGOS_CACHE_MAX_ENTRADAS:
+                _entradas.popitem(last=False)
+    return entrada
+
+
+def respuesta_catalogo(
+    if_none_match: Optional[str],
+    nombre: str,
+    cargar: Callable[[], Sequence[Any]],
+    esquema: Type[BaseModel],
+    tablas: Optional[Iterable[str]] = None,
+    parametros: Tuple[Any, ...] = (),
+) -> Response:
+    """
+    Construye la respuesta HTTP de un listado `/todas` desde la caché.
+
+    Con un `If-None-Match` que coincide con el ETag vigente se responde 304 sin cuerpo.
+
+    Args:
+        if_none_match (Optional[str]): Encabezado `If-None-Match` de la petición.
+        Demás argumentos: ver `obtener_catalogo`.
+
+    Returns:
+        Response: 200 con el JSON del catálogo o 304.
+    """
+    entrada = obtener_catalogo(nombre, cargar, esquema, tablas, parametros)
+    encabezados = {"ETag": entrada.etag, "Cache-Control": "no-cache"}
+    if etag_coincide(if_none_match, entrada.etag):
+        return Response(status_code=304, headers=encabezados)
+    return Response(content=entrada.contenido, media_type="application/json", headers=encabezados)
+
+
+# ──────────────── EVENTOS DE SESIÓN ────────────────
+
+def _registrar_tabla(session: Session, tabla: Optional[str]) -> None:
+    if tabla in TABLAS_CATALOGOS:
+        session.info.setdefault(_CLAVE_TABLAS_MODIFICADAS, set()).add(tabla)
+
+
+@event.listens_for(Session, "after_flush")
+def _registrar_catalogos_tras_flush(session, flush_context):
+    """Anota las tablas de catálogo escritas en el flush."""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        _registrar_tabla(session, getattr(obj, "__tablename__", None))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _registrar_catalogos_masivos(orm_execute_state):
+    """Anota las tablas de catálogo afectadas por INSERT/UPDATE/DELETE masivos."""
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None:
+        _registrar_tabla(orm_execute_state.session, mapper.local_table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidar_tras_commit(session):
+    """Invalida los catálogos modificados una vez que la transacción es visible."""
+    tablas = session.info.pop(_CLAVE_TABLAS_MODIFICADAS, None)
+    if tablas:
+        invalidar_catalogos(tablas)
+
+
+@event.listens_for(Session, "after_rollback")
+def _descartar_tras_rollback(session):
+    """Olvida las tablas anotadas: los cambios no llegaron a confirmarse."""
+    session.info.pop(_CLAVE_TABLAS_MODIFICADAS, None)
@@ -6,9 +6,11 @@ Incluye operaciones CRUD básicas y validaciones.
 import math
 from typing import Optional
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
 from app.models.catalogs.cargo_ofrecido import CargoOfrecido
 from app.schemas.catalogs.cargo_ofrecido import CargoOfrecidoCreate, CargoOfrecidoPaginatedResponse
+from app.utils.integridad import insertar_retornando
 from app.utils.orden_catalogos import ordenar_por_nombre
 
 
@@ -75,7 +77,7 @@ def get_cargos_con_paginacion(
 
     total = query.count()
 
-    resultados = query.order_by(CargoOfrecido.nombre_cargo.asc())\
+    resultados = ordenar_por_nombre(query, "nombre_cargo")\
         .offset(skip).limit(limit).all()
 
     page = (skip // limit) + 1 if limit > 0 else 1
@@ -105,19 +107,14 @@ def crear_cargo_ofrecido(db: Session, cargo_data: CargoOfrecidoCreate):
     Raises:
         HTTPException: Si el nombre del cargo ya existe.
     """
-    existing_cargo = db.query(CargoOfrecido).filter(
-        CargoOfrecido.nombre_cargo == cargo_data.nombre_cargo
-    ).first()
-
-    if existing_cargo:
+    try:
+        nuevo_cargo = insertar_retornando(db, CargoOfrecido, nombre_cargo=cargo_data.nombre_cargo)
+        db.commit()
+        return nuevo_cargo
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(status_code=400, detail="El cargo ya existe")
 
-    nuevo_cargo = CargoOfrecido(nombre_cargo=cargo_data.nombre_cargo)
-    db.add(nuevo_cargo)
-    db.commit()
-    db.refresh(nuevo_cargo)
-    return nuevo_cargo
-
 def actualizar_cargo_ofrecido(db: Session, id_cargo: int, cargo_data: CargoOfrecidoCreate):
     """
     Actualiza un cargo ofrecido existente.
@@ -147,7 +144,6 @@ def actualizar_cargo_ofrecido(db: Session, id_cargo: int, cargo_data: CargoOfrec
 
     cargo.nombre_cargo = cargo_data.nombre_cargo
     db.commit()
-    db.refresh(cargo)
     return cargo
 
 
@@ -7,6 +7,7 @@ from typing import List, Optional
 
 from app.models.catalogs.centro_costos import CentroCostos
 from app.schemas.catalogs.centro_costos import CentroCostosCreate, CentroCostosPaginatedResponse
+from app.utils.integridad import insertar_retornando
 from app.utils.orden_catalogos import ordenar_por_nombre
 
 
@@ -39,7 +40,7 @@ def get_centros_costos_con_paginacion(
 
     total = query.count()
 
-    resultados = query.order_by(CentroCostos.nombre_centro_costos.asc())\
+    resultados = ordenar_por_nombre(query, "nombre_centro_costos")\
         .offset(skip).limit(limit).all()
 
     page = (skip // limit) + 1 if limit > 0 else 1
@@ -60,15 +61,10 @@ def create_centro_costos(db: Session, data: CentroCostosCreate) -> Optional[Cent
     Crea un nuevo centro de costos si no existe uno con el mismo nombre.
     """
     nombre = data.nombre_centro_costos.strip()
-    existente = db.query(CentroCostos).filter(CentroCostos.nombre_centro_costos.ilike(nombre)).first()
-    if existente:
-        return None
-
-    nuevo = CentroCostos(nombre_centro_costos=nombre)
-    db.add(nuevo)
     try:
+        # La unicidad (sin distinguir mayúsculas) la garantiza el índice único sobre lower(nombre)
+        nuevo = insertar_retornando(db, CentroCostos, nombre_centro_costos=nombre)
         db.commit()
-        db.refresh(nuevo)
         return nuevo
     except IntegrityError:
         db.rollback()
@@ -94,7 +90,6 @@ def update_centro_costos(db: Session, id_centro: int, data: CentroCostosCreate)
     centro.nombre_centro_costos = nuevo_nombre
     try:
         db.commit()
-        db.refresh(centro)
         return centro
     except IntegrityError:
         db.rollback()
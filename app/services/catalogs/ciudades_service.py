@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError
 from app.models.catalogs.ciudad import Ciudad
 from app.schemas.catalogs.ciudad import CiudadCreate, CiudadPaginatedResponse
+from app.utils.integridad import insertar_retornando
 from app.utils.orden_catalogos import ordenar_por_nombre
 
 #Usdado para los selects en el frontend
@@ -31,7 +32,9 @@ def get_ciudades_por_departamento(db: Session, id_departamento: int) -> List[Ciu
     """
     Obtiene ciudades asociadas a un departamento específico.
     """
-    return db.query(Ciudad).filter(Ciudad.id_departamento == id_departamento).order_by(Ciudad.nombre_ciudad.asc()).all()
+    return ordenar_por_nombre(
+        db.query(Ciudad).filter(Ciudad.id_departamento == id_departamento), "nombre_ciudad"
+    ).all()
 
 """
 Servicio para manejar el tema de paginación y filtros de búsqueda de ciudades
@@ -52,7 +55,7 @@ def get_ciudades_con_paginacion(
 
     total = query.count()
 
-    resultados = query.order_by(Ciudad.nombre_ciudad.asc()).offset(skip).limit(limit).all()
+    resultados = ordenar_por_nombre(query, "nombre_ciudad").offset(skip).limit(limit).all()
 
     page = (skip // limit) + 1 if limit > 0 else 1
     total_pages = math.ceil(total / limit) if limit > 0 else 1
@@ -73,21 +76,15 @@ def create_ciudad(db: Session, ciudad_data: CiudadCreate) -> Optional[Ciudad]:
     """
     Crea una ciudad si no existe una con el mismo nombre dentro del mismo departamento.
     """
-    existente = db.query(Ciudad).filter(
-        Ciudad.nombre_ciudad.ilike(ciudad_data.nombre_ciudad.strip()),
-        Ciudad.id_departamento == ciudad_data.id_departamento
-    ).first()
-    if existente:
-        return None
-
-    nueva_ciudad = Ciudad(
-        nombre_ciudad=ciudad_data.nombre_ciudad.strip(),
-        id_departamento=ciudad_data.id_departamento
-    )
-    db.add(nueva_ciudad)
     try:
+        # La unicidad por departamento la garantiza el índice único sobre (lower(nombre), departamento)
+        nueva_ciudad = insertar_retornando(
+            db,
+            Ciudad,
+            nombre_ciudad=ciudad_data.nombre_ciudad.strip(),
+            id_departamento=ciudad_data.id_departamento,
+        )
         db.commit()
-        db.refresh(nueva_ciudad)
         return nueva_ciudad
     except IntegrityError:
         db.rollback()
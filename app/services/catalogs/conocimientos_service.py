@@ -7,10 +7,11 @@ Incluye validación de errores y ordenamiento alfabético.
 import math
 from typing import Optional
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from fastapi import HTTPException
 
 from app.models.conocimientos_model import HabilidadBlanda, HabilidadTecnica, Herramienta
+from app.utils.integridad import insertar_retornando
 from app.schemas.catalogs.conocimientos_schema import (
     HabilidadBlandaCreate,
     HabilidadBlandaPaginatedResponse,
@@ -56,7 +57,7 @@ def get_habilidades_blandas_con_paginacion(
         query = query.filter(HabilidadBlanda.nombre_habilidad_blanda.ilike(f"%{search}%"))
 
     total = query.count()
-    resultados = query.order_by(HabilidadBlanda.nombre_habilidad_blanda.asc())\
+    resultados = ordenar_por_nombre(query, "nombre_habilidad_blanda")\
         .offset(skip).limit(limit).all()
 
     page = (skip // limit) + 1 if limit > 0 else 1
@@ -72,18 +73,14 @@ def get_habilidades_blandas_con_paginacion(
 
 
 def create_habilidad_blanda(db: Session, data: HabilidadBlandaCreate) -> HabilidadBlanda:
-    existente = db.query(HabilidadBlanda).filter(
-        HabilidadBlanda.nombre_habilidad_blanda.ilike(data.nombre_habilidad_blanda.strip())
-    ).first()
-    if existente:
+    try:
+        nueva = insertar_retornando(db, HabilidadBlanda, nombre_habilidad_blanda=data.nombre_habilidad_blanda.strip())
+        db.commit()
+        return nueva
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(status_code=400, detail="Ya existe una habilidad blanda con ese nombre.")
 
-    nueva = HabilidadBlanda(nombre_habilidad_blanda=data.nombre_habilidad_blanda.strip())
-    db.add(nueva)
-    db.commit()
-    db.refresh(nueva)
-    return nueva
-
 #Actualizacion
 
 def update_habilidad_blanda(db: Session, id_habilidad: int, data: HabilidadBlandaCreate) -> HabilidadBlanda:
@@ -100,7 +97,6 @@ def update_habilidad_blanda(db: Session, id_habilidad: int, data: HabilidadBland
 
     habilidad.nombre_habilidad_blanda = data.nombre_habilidad_blanda.strip()
     db.commit()
-    db.refresh(habilidad)
     return habilidad
 
 # Eliminación 
@@ -144,7 +140,7 @@ def get_habilidades_tecnicas_con_paginacion(
         query = query.filter(HabilidadTecnica.nombre_habilidad_tecnica.ilike(f"%{search}%"))
 
     total = query.count()
-    resultados = query.order_by(HabilidadTecnica.nombre_habilidad_tecnica.asc())\
+    resultados = ordenar_por_nombre(query, "nombre_habilidad_tecnica")\
         .offset(skip).limit(limit).all()
 
     page = (skip // limit) + 1 if limit > 0 else 1
@@ -160,18 +156,14 @@ def get_habilidades_tecnicas_con_paginacion(
 
 #Creacion
 def create_habilidad_tecnica(db: Session, data: HabilidadTecnicaCreate) -> HabilidadTecnica:
-    existente = db.query(HabilidadTecnica).filter(
-        HabilidadTecnica.nombre_habilidad_tecnica.ilike(data.nombre_habilidad_tecnica.strip())
-    ).first()
-    if existente:
+    try:
+        nueva = insertar_retornando(db, HabilidadTecnica, nombre_habilidad_tecnica=data.nombre_habilidad_tecnica.strip())
+        db.commit()
+        return nueva
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(status_code=400, detail="Ya existe una habilidad técnica con ese nombre.")
 
-    nueva = HabilidadTecnica(nombre_habilidad_tecnica=data.nombre_habilidad_tecnica.strip())
-    db.add(nueva)
-    db.commit()
-    db.refresh(nueva)
-    return nueva
-
 #Actualizacion
 def update_habilidad_tecnica(db: Session, id_habilidad: int, data: HabilidadTecnicaCreate) -> HabilidadTecnica:
     habilidad = db.query(HabilidadTecnica).filter(HabilidadTecnica.id_habilidad_tecnica == id_habilidad).first()
@@ -187,7 +179,6 @@ def update_habilidad_tecnica(db: Session, id_habilidad: int, data: HabilidadTecn
 
     habilidad.nombre_habilidad_tecnica = data.nombre_habilidad_tecnica.strip()
     db.commit()
-    db.refresh(habilidad)
     return habilidad
 
 #Eliminacion
@@ -229,7 +220,7 @@ def get_herramientas_con_paginacion(
         query = query.filter(Herramienta.nombre_herramienta.ilike(f"%{search}%"))
 
     total = query.count()
-    resultados = query.order_by(Herramienta.nombre_herramienta.asc())\
+    resultados = ordenar_por_nombre(query, "nombre_herramienta")\
         .offset(skip).limit(limit).all()
 
     page = (skip // limit) + 1 if limit > 0 else 1
@@ -244,17 +235,13 @@ def get_herramientas_con_paginacion(
     )
 #ACreación
 def create_herramienta(db: Session, data: HerramientaCreate) -> Herramienta:
-    existente = db.query(Herramienta).filter(
-        Herramienta.nombre_herramienta.ilike(data.nombre_herramienta.strip())
-    ).first()
-    if existente:
+    try:
+        nueva = insertar_retornando(db, Herramienta, nombre_herramienta=data.nombre_herramienta.strip())
+        db.commit()
+        return nueva
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(status_code=400, detail="Ya existe una herramienta con ese nombre.")
-
-    nueva = Herramienta(nombre_herramienta=data.nombre_herramienta.strip())
-    db.add(nueva)
-    db.commit()
-    db.refresh(nueva)
-    return nueva
 #Actualizacion
 def update_herramienta(db: Session, id_herramienta: int, data: HerramientaCreate) -> Herramienta:
     herramienta = db.query(Herramienta).filter(Herramienta.id_herramienta == id_herramienta).first()
@@ -270,7 +257,6 @@ def update_herramienta(db: Session, id_herramienta: int, data: HerramientaCreate
 
     herramienta.nombre_herramienta = data.nombre_herramienta.strip()
     db.commit()
-    db.refresh(herramienta)
     return herramienta
 
 #Eliminacion
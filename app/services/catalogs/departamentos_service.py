@@ -1,10 +1,10 @@
 """Servicios para la gestión de departamentos."""
 
 import math
-from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.models.catalogs.ciudad import Departamento
+from app.utils.integridad import insertar_retornando
 from app.schemas.catalogs.ciudad import (
     DepartamentoCreate,
     DepartamentoPaginatedResponse,
@@ -57,20 +57,10 @@ def get_departamentos_con_paginacion(
 def crear_departamento(db: Session, departamento_data: DepartamentoCreate) -> Optional[Departamento]:
     nombre = departamento_data.nombre_departamento.strip()
 
-    existente = db.query(Departamento).filter(
-        func.lower(func.trim(Departamento.nombre_departamento)) ==
-        func.lower(func.trim(nombre))
-    ).first()
-
-
-    if existente:
-        return None
-
-    nuevo_departamento = Departamento(nombre_departamento=nombre)
-    db.add(nuevo_departamento)
     try:
+        # La unicidad la garantiza el índice único sobre lower(trim(nombre))
+        nuevo_departamento = insertar_retornando(db, Departamento, nombre_departamento=nombre)
         db.commit()
-        db.refresh(nuevo_departamento)
         return nuevo_departamento
     except IntegrityError:
         db.rollback()
@@ -102,7 +92,6 @@ def actualizar_departamento(db: Session, id_departamento: int, datos_update: Dep
     departamento.nombre_departamento = nuevo_nombre
     try:
         db.commit()
-        db.refresh(departamento)
         return departamento
     except IntegrityError:
         db.rollback()
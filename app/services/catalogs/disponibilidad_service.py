@@ -92,7 +92,6 @@ def create_disponibilidad(db: Session, disponibilidad_data: DisponibilidadCreate
         )
         db.add(nueva_disponibilidad)
         db.commit()
-        db.refresh(nueva_disponibilidad)
         return nueva_disponibilidad
     except IntegrityError:
         db.rollback()
@@ -115,7 +114,6 @@ def update_disponibilidad(db: Session, disponibilidad_id: int, disponibilidad_da
     if disponibilidad_data.descripcion_disponibilidad:
         disponibilidad.descripcion_disponibilidad = disponibilidad_data.descripcion_disponibilidad
     db.commit()
-    db.refresh(disponibilidad)
     return disponibilidad
 
 
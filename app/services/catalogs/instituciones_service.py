@@ -73,7 +73,7 @@ def get_instituciones_academicas_con_paginacion(
 
     total = query.count()
 
-    resultados = query.order_by(InstitucionAcademica.nombre_institucion.asc())\
+    resultados = ordenar_por_nombre(query, "nombre_institucion")\
         .offset(skip).limit(limit).all()
 
     page = (skip // limit) + 1 if limit > 0 else 1
@@ -110,7 +110,6 @@ def create_institucion(db: Session, institucion: InstitucionAcademicaCreate):
         db_institucion = InstitucionAcademica(**institucion.model_dump())
         db.add(db_institucion)
         db.commit()
-        db.refresh(db_institucion)
         return db_institucion
     except Exception as e:
         raise HTTPException(
@@ -144,7 +143,6 @@ def update_institucion(db: Session, institucion_id: int, institucion_update: Ins
         for key, value in institucion_update.model_dump(exclude_unset=True).items():
             setattr(db_institucion, key, value)
         db.commit()
-        db.refresh(db_institucion)
         return db_institucion
     except Exception as e:
         raise HTTPException(
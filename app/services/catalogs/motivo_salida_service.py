@@ -60,7 +60,7 @@ def get_motivos_salida_con_paginacion(
 
     total = query.count()
 
-    resultados = query.order_by(MotivoSalida.descripcion_motivo.asc())\
+    resultados = ordenar_por_nombre(query, "descripcion_motivo")\
         .offset(skip).limit(limit).all()
 
     page = (skip // limit) + 1 if limit > 0 else 1
@@ -95,7 +95,6 @@ def create_motivo_salida(db: Session, motivo_data: MotivoSalidaCreate):
         nuevo_motivo = MotivoSalida(**motivo_data.dict())
         db.add(nuevo_motivo)
         db.commit()
-        db.refresh(nuevo_motivo)
         return nuevo_motivo
     except SQLAlchemyError as e:
         db.rollback()
@@ -126,7 +125,6 @@ def update_motivo_salida(db: Session, motivo_id: int, motivo_data: MotivoSalidaU
             setattr(motivo, key, value)
         
         db.commit()
-        db.refresh(motivo)
         return motivo
     except SQLAlchemyError as e:
         db.rollback()
@@ -62,7 +62,6 @@ def create_nivel_educacion(db: Session, nivel_educacion_data: NivelEducacionCrea
     nuevo_nivel = NivelEducacion(**nivel_educacion_data.model_dump())
     db.add(nuevo_nivel)
     db.commit()
-    db.refresh(nuevo_nivel)
     return nuevo_nivel
 
 
@@ -88,7 +87,6 @@ def update_nivel_educacion(db: Session, id_nivel_educacion: int, nivel_educacion
         setattr(nivel, key, value)
 
     db.commit()
-    db.refresh(nivel)
     return nivel
 
 
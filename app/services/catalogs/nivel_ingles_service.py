@@ -6,8 +6,10 @@ Incluye operaciones CRUD: listar, obtener, crear, actualizar y eliminar.
 import math
 from typing import Optional
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
 from app.models.catalogs.nivel_ingles import NivelIngles
+from app.utils.integridad import insertar_retornando
 from app.schemas.catalogs.nivel_ingles import NivelInglesCreate, NivelInglesPaginatedResponse, NivelInglesUpdate
 
 
@@ -73,18 +75,14 @@ def create_nivel_ingles(db: Session, nivel_ingles_data: NivelInglesCreate):
     Raises:
         HTTPException: Si el nivel ya existe.
     """
-    existe = db.query(NivelIngles).filter(
-        NivelIngles.nivel == nivel_ingles_data.nivel
-    ).first()
-    if existe:
+    try:
+        nuevo_nivel = insertar_retornando(db, NivelIngles, nivel=nivel_ingles_data.nivel)
+        db.commit()
+        return nuevo_nivel
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(status_code=400, detail="El nivel de inglés ya existe")
 
-    nuevo_nivel = NivelIngles(nivel=nivel_ingles_data.nivel)
-    db.add(nuevo_nivel)
-    db.commit()
-    db.refresh(nuevo_nivel)
-    return nuevo_nivel
-
 
 def update_nivel_ingles(db: Session, nivel_ingles_id: int, nivel_ingles_data: NivelInglesUpdate):
     """
@@ -109,7 +107,6 @@ def update_nivel_ingles(db: Session, nivel_ingles_id: int, nivel_ingles_data: Ni
 
     nivel_ingles.nivel = nivel_ingles_data.nivel
     db.commit()
-    db.refresh(nivel_ingles)
     return nivel_ingles
 
 
@@ -6,8 +6,10 @@ Incluye funciones CRUD: listar, obtener, crear, actualizar y eliminar.
 import math
 from typing import Optional
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
 from app.models.catalogs.rango_experiencia import RangoExperiencia
+from app.utils.integridad import insertar_retornando
 from app.schemas.catalogs.rango_experiencia import RangoExperienciaCreate, RangoExperienciaPaginatedResponse, RangoExperienciaUpdate
 
 
@@ -95,19 +97,14 @@ def create_rango_experiencia(db: Session, rango_data: RangoExperienciaCreate):
     Raises:
         HTTPException: Si ya existe un rango con la misma descripción.
     """
-    existe = db.query(RangoExperiencia).filter(
-        RangoExperiencia.descripcion_rango == rango_data.descripcion_rango
-    ).first()
-
-    if existe:
+    try:
+        nuevo_rango = insertar_retornando(db, RangoExperiencia, descripcion_rango=rango_data.descripcion_rango)
+        db.commit()
+        return nuevo_rango
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(status_code=400, detail="El rango de experiencia ya existe")
 
-    nuevo_rango = RangoExperiencia(descripcion_rango=rango_data.descripcion_rango)
-    db.add(nuevo_rango)
-    db.commit()
-    db.refresh(nuevo_rango)
-    return nuevo_rango
-
 
 def update_rango_experiencia(db: Session, rango_experiencia_id: int, rango_data: RangoExperienciaUpdate):
     """
@@ -135,7 +132,6 @@ def update_rango_experiencia(db: Session, rango_experiencia_id: int, rango_data:
         rango.descripcion_rango = rango_data.descripcion_rango
 
     db.commit()
-    db.refresh(rango)
     return rango
 
 
@@ -90,7 +90,6 @@ def create_rango_salarial(db: Session, rango_data: RangoSalarialCreate):
         nuevo_rango = RangoSalarial(descripcion_rango=rango_data.descripcion_rango)
         db.add(nuevo_rango)
         db.commit()
-        db.refresh(nuevo_rango)
         return nuevo_rango
     except IntegrityError:
         db.rollback()
@@ -115,7 +114,6 @@ def update_rango_salarial(db: Session, rango_id: int, rango_data: RangoSalarialU
         rango.descripcion_rango = rango_data.descripcion_rango
 
     db.commit()
-    db.refresh(rango)
     return rango
 
 
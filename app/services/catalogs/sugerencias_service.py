@@ -0,0 +1,268 @@
+"""
+Autocompletado en memoria para los catálogos grandes (instituciones, títulos,
+ciudades y cargos).
+
+Cada catálogo tiene un índice con sus nombres normalizados (sin tildes y en
+minúsculas) en arreglos ordenados: uno con el nombre completo y otro con cada
+palabra. Una búsqueda por prefijo es una bisección sobre esos arreglos, sin
+consultar la base de datos. Cuando cambia alguna de sus tablas (según la caché de
+catálogos) o vence su TTL se vuelven a leer las filas, pero solo las nuevas,
+modificadas o eliminadas se normalizan y se reubican en el índice.
+"""
+
+import heapq
+import threading
+import time
+import unicodedata
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.metricas import registrar_acceso_cache
+from app.models.catalogs.cargo_ofrecido import CargoOfrecido
+from app.models.catalogs.ciudad import Ciudad, Departamento
+from app.models.catalogs.instituciones import InstitucionAcademica
+from app.models.catalogs.nivel_educacion import NivelEducacion
+from app.models.catalogs.titulo import TituloObtenido
+from app.schemas.catalogs.sugerencias import SugerenciaCatalogo
+from app.services.catalogs.cache_catalogos_service import CATALOGOS_CACHE_TTL_SEGUNDOS, version_tablas
+
+# Fila de un índice: (id, nombre, detalle)
+FilaSugerencia = Tuple[int, str, Optional[str]]
+
+# Proporción de filas cambiadas a partir de la cual el índice se construye de nuevo
+# en lugar de actualizarse fila por fila
+FRACCION_RECONSTRUCCION = 0.25
+
+
+def normalizar_texto(valor: Optional[str]) -> str:
+    """Quita tildes, pasa a minúsculas y deja solo letras y números separados por un espacio."""
+    texto = unicodedata.normalize("NFKD", valor or "").encode("ascii", "ignore").decode().lower()
+    return " ".join("".join(c if c.isalnum() else " " for c in texto).split())
+
+
+# ──────────────── ÍNDICE ────────────────
+
+class IndiceSugerencias:
+    """
+    Índice de prefijos de un catálogo.
+
+    `_nombres` tiene los nombres completos normalizados y `_palabras` cada palabra
+    de cada nombre; ambos ordenados, con la posición de la fila en `_posiciones_*`.
+    Una fila eliminada deja su posición en None (ver `actualizado`).
+    """
+
+    def __init__(self, filas: Sequence[FilaSugerencia]):
+        self.filas: List[Optional[FilaSugerencia]] = [tuple(fila) for fila in filas]
+        self._posicion_id = {fila[0]: i for i, fila in enumerate(self.filas)}
+        normalizados = [normalizar_texto(nombre) for _, nombre, _ in self.filas]
+        self._normalizados: List[Optional[str]] = normalizados
+        self._palabras_fila = [tuple(n.split()) for n in normalizados]
+
+        nombres = sorted((n, i) for i, n in enumerate(normalizados))
+        self._nombres = [n for n, _ in nombres]
+        self._posiciones_nombres = [i for _, i in nombres]
+
+        palabras = sorted(
+            (palabra, i) for i, fila in enumerate(self._palabras_fila) for palabra in set(fila)
+        )
+        self._palabras = [p for p, _ in palabras]
+        self._posiciones_palabras = [i for _, i in palabras]
+
+    def actualizado(self, filas: Sequence[FilaSugerencia]) -> "IndiceSugerencias":
+        """
+        Retorna un índice con `filas` a partir de este, sin modificarlo (puede estar en
+        uso por otras búsquedas).
+
+        Solo las filas nuevas, modificadas o eliminadas se normalizan y se insertan o
+        quitan de los arreglos ordenados. Si cambió más de `FRACCION_RECONSTRUCCION`
+        del catálogo, o las posiciones vacías ya son la mitad, se construye de nuevo.
+        """
+        filas = {fila[0]: tuple(fila) for fila in filas}
+        quitadas = [i for id_, i in self._posicion_id.items() if filas.get(id_) != self.filas[i]]
+        agregadas = [
+            fila for id_, fila in filas.items()
+            if id_ not in self._posicion_id or self.filas[self._posicion_id[id_]] != fila
+        ]
+        if not quitadas and not agregadas:
+            return self
+        vacias = len(self.filas) - len(self._posicion_id) + len(quitadas)
+        if len(quitadas) + len(agregadas) > FRACCION_RECONSTRUCCION * len(filas) or vacias * 2 > len(self.filas):
+            return IndiceSugerencias(list(filas.values()))
+
+        indice = IndiceSugerencias.__new__(IndiceSugerencias)
+        for atributo, valor in vars(self).items():
+            setattr(indice, atributo, valor.copy())
+        for i in quitadas:
+            indice._quitar_fila(i)
+        for fila in agregadas:
+            indice._agregar_fila(fila)
+        return indice
+
+    def _quitar_fila(self, i: int) -> None:
+        for claves, posiciones, clave in (
+            (self._nombres, self._posiciones_nombres, self._normalizados[i]),
+            *((self._palabras, self._posiciones_palabras, p) for p in set(self._palabras_fila[i])),
+        ):
+            k = bisect_left(claves, clave)
+            while posiciones[k] != i:
+                k += 1
+            del claves[k], posiciones[k]
+        del self._posicion_id[self.filas[i][0]]
+        self.filas[i] = self._normalizados[i] = None
+        self._palabras_fila[i] = ()
+
+    def _agregar_fila(self, fila: FilaSugerencia) -> None:
+        # La nueva posición es la mayor, así que va después de las claves iguales
+        i = len(self.filas)
+        normalizado = normalizar_texto(fila[1])
+        self.filas.append(fila)
+        self._posicion_id[fila[0]] = i
+        self._normalizados.append(normalizado)
+        self._palabras_fila.append(tuple(normalizado.split()))
+        for claves, posiciones, clave in (
+            (self._nombres, self._posiciones_nombres, normalizado),
+            *((self._palabras, self._posiciones_palabras, p) for p in set(self._palabras_fila[i])),
+        ):
+            k = bisect_right(claves, clave)
+            claves.insert(k, clave)
+            posiciones.insert(k, i)
+
+    @staticmethod
+    def _rango(claves: List[str], prefijo: str) -> Tuple[int, int]:
+        """Rango [inicio, fin) de las claves que empiezan por `prefijo`, por bisección."""
+        return bisect_left(claves, prefijo), bisect_left(claves, prefijo + "\uffff")
+
+    def buscar(self, consulta: str, limite: int) -> List[FilaSugerencia]:
+        """
+        Retorna las filas que coinciden con la consulta, ordenadas por relevancia.
+
+        Primero las que empiezan por la consulta completa; luego aquellas en las que
+        cada palabra de la consulta es prefijo de alguna de sus palabras. Dentro de
+        cada grupo, los nombres más cortos primero.
+        """
+        consulta = normalizar_texto(consulta)
+        if not consulta:
+            return []
+        palabras_consulta = consulta.split()
+
+        inicio, fin = self._rango(self._nombres, consulta)
+        ranking: Dict[int, int] = {i: 0 for i in self._posiciones_nombres[inicio:fin]}
+
+        # Se recorren solo las filas de la palabra de la consulta con menos coincidencias
+        rangos = [self._rango(self._palabras, palabra) for palabra in palabras_consulta]
+        inicio, fin = min(rangos, key=lambda r: r[1] - r[0])
+        for i in self._posiciones_palabras[inicio:fin]:
+            if i in ranking:
+                continue
+            palabras = self._palabras_fila[i]
+            if all(any(p.startswith(q) for p in palabras) for q in palabras_consulta):
+                ranking[i] = 1
+
+        orden = heapq.nsmallest(
+            limite, ranking, key=lambda i: (ranking[i], len(self.filas[i][1]), self.filas[i][1])
+        )
+        return [self.filas[i] for i in orden]
+
+
+# ──────────────── CATÁLOGOS CON SUGERENCIAS ────────────────
+
+@dataclass(frozen=True)
+class FuenteSugerencias:
+    """Catálogo indexado: tablas de las que depende y consulta de sus filas."""
+    tablas: Tuple[str, ...]
+    cargar: Callable[[Session], Sequence[FilaSugerencia]]
+
+
+def _cargar_instituciones(db: Session) -> Sequence[FilaSugerencia]:
+    filas = db.query(InstitucionAcademica.id_institucion, InstitucionAcademica.nombre_institucion)
+    return [(id_, nombre, None) for id_, nombre in filas]
+
+
+def _cargar_titulos(db: Session) -> Sequence[FilaSugerencia]:
+    return db.query(
+        TituloObtenido.id_titulo, TituloObtenido.nombre_titulo, NivelEducacion.descripcion_nivel
+    ).outerjoin(NivelEducacion, TituloObtenido.id_nivel_educacion == NivelEducacion.id_nivel_educacion).all()
+
+
+def _cargar_ciudades(db: Session) -> Sequence[FilaSugerencia]:
+    return db.query(
+        Ciudad.id_ciudad, Ciudad.nombre_ciudad, Departamento.nombre_departamento
+    ).outerjoin(Departamento, Ciudad.id_departamento == Departamento.id_departamento).all()
+
+
+def _cargar_cargos(db: Session) -> Sequence[FilaSugerencia]:
+    filas = db.query(CargoOfrecido.id_cargo, CargoOfrecido.nombre_cargo)
+    return [(id_, nombre, None) for id_, nombre in filas]
+
+
+FUENTES_SUGERENCIAS: Dict[str, FuenteSugerencias] = {
+    "instituciones": FuenteSugerencias(("instituciones_academicas",), _cargar_instituciones),
+    "titulos": FuenteSugerencias(("titulos_obtenidos", "nivel_educacion"), _cargar_titulos),
+    "ciudades": FuenteSugerencias(("ciudades", "departamentos"), _cargar_ciudades),
+    "cargos": FuenteSugerencias(("cargos_ofrecidos",), _cargar_cargos),
+}
+
+_lock = threading.Lock()
+# catálogo -> (versión de sus tablas, momento de construcción, índice)
+_indices: Dict[str, Tuple[Tuple[int, ...], float, IndiceSugerencias]] = {}
+
+
+def obtener_indice(db: Session, catalogo: str) -> IndiceSugerencias:
+    """
+    Retorna el índice del catálogo, actualizándolo si sus tablas cambiaron o venció el TTL.
+
+    Args:
+        db (Session): Sesión de base de datos (solo se usa al actualizar).
+        catalogo (str): Clave del catálogo en `FUENTES_SUGERENCIAS`.
+
+    Returns:
+        IndiceSugerencias: Índice vigente del catálogo.
+    """
+    fuente = FUENTES_SUGERENCIAS[catalogo]
+    version = version_tablas(fuente.tablas)
+    ahora = time.monotonic()
+    with _lock:
+        actual = _indices.get(catalogo)
+    vigente = actual and actual[0] == version and ahora - actual[1] < CATALOGOS_CACHE_TTL_SEGUNDOS
+    registrar_acceso_cache("sugerencias", bool(vigente))
+    if vigente:
+        return actual[2]
+
+    # La versión se toma antes de consultar: si el catálogo cambia durante la carga,
+    # la siguiente búsqueda verá otra versión y volverá a actualizar el índice.
+    filas = fuente.cargar(db)
+    indice = actual[2].actualizado(filas) if actual else IndiceSugerencias(filas)
+    with _lock:
+        _indices[catalogo] = (version, ahora, indice)
+    return indice
+
+
+def sugerir(db: Session, catalogo: str, consulta: str, limite: int = 10) -> List[SugerenciaCatalogo]:
+    """
+    Retorna las sugerencias de un catálogo para el texto escrito por el usuario.
+
+    La búsqueda no distingue mayúsculas ni tildes y coincide por prefijo del nombre
+    completo o de cada palabra (ej. 'nac col' → 'Universidad Nacional de Colombia').
+
+    Args:
+        db (Session): Sesión de base de datos.
+        catalogo (str): 'instituciones', 'titulos', 'ciudades' o 'cargos'.
+        consulta (str): Texto escrito.
+        limite (int): Número máximo de sugerencias.
+
+    Returns:
+        List[SugerenciaCatalogo]: Sugerencias ordenadas por relevancia.
+
+    Raises:
+        HTTPException: 404 si el catálogo no tiene autocompletado.
+    """
+    if catalogo not in FUENTES_SUGERENCIAS:
+        raise HTTPException(status_code=404, detail="Catálogo sin sugerencias")
+    return [
+        SugerenciaCatalogo(id=id_, nombre=nombre, detalle=detalle)
+        for id_, nombre, detalle in obtener_indice(db, catalogo).buscar(consulta, limite)
+    ]
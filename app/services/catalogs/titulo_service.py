@@ -60,7 +60,7 @@ def get_titulos_con_filtros(
 
     total = query.count()
 
-    resultados = query.order_by(TituloObtenido.nombre_titulo.asc())\
+    resultados = ordenar_por_nombre(query, "nombre_titulo")\
         .offset(skip).limit(limit).all()
 
     page = (skip // limit) + 1 if limit > 0 else 1
@@ -85,7 +85,6 @@ def create_titulo(db: Session, titulo: TituloObtenidoCreate):
         db_titulo = TituloObtenido(**titulo.model_dump())
         db.add(db_titulo)
         db.commit()
-        db.refresh(db_titulo)
         return db_titulo
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error al crear el título: {str(e)}")
@@ -103,7 +102,6 @@ def update_titulo(db: Session, titulo_id: int, titulo_update: TituloObtenidoUpda
         for key, value in titulo_update.model_dump(exclude_unset=True).items():
             setattr(db_titulo, key, value)
         db.commit()
-        db.refresh(db_titulo)
         return db_titulo
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error al actualizar el título: {str(e)}")
@@ -3,59 +3,207 @@ Servicios para la gestión de conocimientos (habilidades blandas, técnicas y he
 asociados a un candidato.
 """
 
+from typing import List
+from sqlalchemy import delete, insert, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
-from app.models.conocimientos_model import CandidatoConocimiento
-from app.schemas.conocimientos_candidato_schema import CandidatoConocimientoCreate
+from app.models.conocimientos_model import (
+    CandidatoConocimiento,
+    HabilidadBlanda,
+    HabilidadTecnica,
+    Herramienta,
+)
+from app.schemas.conocimientos_candidato_schema import (
+    CandidatoConocimientoBase,
+    CandidatoConocimientoCreate,
+    CandidatoConocimientoItem,
+    ConocimientosReemplazoResponse,
+)
 from app.models.candidato_model import Candidato
+from app.utils.validacion_catalogos import validar_referencias_catalogos
 
+# Campo (y columna del catálogo) que corresponde a cada tipo de conocimiento
+CAMPOS_POR_TIPO = {
+    "blanda": ("id_habilidad_blanda", HabilidadBlanda.id_habilidad_blanda),
+    "tecnica": ("id_habilidad_tecnica", HabilidadTecnica.id_habilidad_tecnica),
+    "herramienta": ("id_herramienta", Herramienta.id_herramienta),
+}
 
-def create_conocimiento(db: Session, conocimiento_data: CandidatoConocimientoCreate) -> CandidatoConocimiento:
+
+def referencias_conocimientos(conocimientos: List[CandidatoConocimientoBase]) -> list:
+    """
+    Verifica que cada conocimiento informe solo el ID de catálogo de su tipo y
+    agrupa los IDs por catálogo para validarlos en bloque.
+
+    Args:
+        conocimientos (List[CandidatoConocimientoBase]): Conocimientos a registrar.
+
+    Returns:
+        list: Referencias (campo, columna, ids) para `validar_referencias_catalogos`.
+
+    Raises:
+        HTTPException: 400 si el ID informado no corresponde al tipo de conocimiento.
     """
-    Crea un nuevo conocimiento (blando, técnico o herramienta) asociado a un candidato específico.
+    for conocimiento in conocimientos:
+        campo_tipo, _ = CAMPOS_POR_TIPO[conocimiento.tipo_conocimiento]
+        for campo, _ in CAMPOS_POR_TIPO.values():
+            informado = getattr(conocimiento, campo) is not None
+            if informado != (campo == campo_tipo):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Un conocimiento de tipo '{conocimiento.tipo_conocimiento}' debe informar solo '{campo_tipo}'",
+                )
+
+    return [
+        (campo, columna, [getattr(c, campo) for c in conocimientos if c.tipo_conocimiento == tipo])
+        for tipo, (campo, columna) in CAMPOS_POR_TIPO.items()
+    ]
+
+
+def crear_conocimientos_lote(db: Session, conocimientos: List[CandidatoConocimientoCreate]) -> List[int]:
+    """
+    Crea varios conocimientos en bloque, en una sola transacción.
+
+    Se verifica la existencia de los candidatos en una consulta, los IDs de catálogo
+    en otra y todas las filas se insertan con un único `INSERT ... RETURNING`.
+    Si algo falla no se guarda ningún conocimiento.
 
     Args:
         db (Session): Sesión activa de la base de datos.
-        conocimiento_data (CandidatoConocimientoCreate): Datos del conocimiento a registrar.
+        conocimientos (List[CandidatoConocimientoCreate]): Conocimientos a registrar.
 
     Returns:
-        CandidatoConocimiento: Objeto del conocimiento creado.
+        List[int]: IDs de los conocimientos creados, en el orden recibido.
 
     Raises:
-        HTTPException: 
-            - 404 si el candidato no existe.
-            - 400 si hay un error de integridad en la base de datos.
-            - 500 si ocurre un error inesperado durante la operación.
+        HTTPException:
+            - 404 si algún candidato no existe.
+            - 400 si un conocimiento no es coherente con su tipo o hay un error de integridad.
+            - 422 si algún ID de catálogo no existe.
     """
-    try:
-        candidato = db.query(Candidato).filter(Candidato.id_candidato == conocimiento_data.id_candidato).first()
-        if not candidato:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Candidato no encontrado"
-            )
+    if not conocimientos:
+        return []
 
-        nuevo_conocimiento = CandidatoConocimiento(**conocimiento_data.model_dump())
-        db.add(nuevo_conocimiento)
-        db.commit()
-        db.refresh(nuevo_conocimiento)
-        return nuevo_conocimiento
+    ids_candidatos = {c.id_candidato for c in conocimientos}
+    existentes = set(db.scalars(select(Candidato.id_candidato).where(Candidato.id_candidato.in_(ids_candidatos))))
+    if existentes != ids_candidatos:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Candidato no encontrado"
+        )
+
+    validar_referencias_catalogos(db, referencias_conocimientos(conocimientos))
 
+    try:
+        ids = list(db.scalars(
+            insert(CandidatoConocimiento).returning(CandidatoConocimiento.id_conocimiento, sort_by_parameter_order=True),
+            [c.model_dump() for c in conocimientos],
+        ))
+        db.commit()
+        return ids
     except IntegrityError:
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Error de integridad en la base de datos"
         )
-    except Exception as e:
+
+
+def _clave_conocimiento(conocimiento) -> tuple:
+    """Identifica un conocimiento por su tipo y su ID de catálogo."""
+    return (
+        conocimiento.tipo_conocimiento,
+        conocimiento.id_habilidad_blanda,
+        conocimiento.id_habilidad_tecnica,
+        conocimiento.id_herramienta,
+    )
+
+
+def reemplazar_conocimientos_candidato(
+    db: Session, id_candidato: int, conocimientos: List[CandidatoConocimientoItem]
+) -> ConocimientosReemplazoResponse:
+    """
+    Deja al candidato exactamente con los conocimientos indicados.
+
+    Calcula la diferencia con los registros actuales: borra en un solo `DELETE` los
+    que sobran (incluidos duplicados) e inserta en un solo `INSERT` los que faltan;
+    los que ya existían conservan su ID.
+
+    Args:
+        db (Session): Sesión activa de la base de datos.
+        id_candidato (int): ID del candidato.
+        conocimientos (List[CandidatoConocimientoItem]): Conjunto final de conocimientos.
+
+    Returns:
+        ConocimientosReemplazoResponse: Cantidades agregadas/eliminadas e IDs vigentes.
+
+    Raises:
+        HTTPException:
+            - 404 si el candidato no existe.
+            - 400 si un conocimiento no es coherente con su tipo o hay un error de integridad.
+            - 422 si algún ID de catálogo no existe.
+    """
+    if db.get(Candidato, id_candidato) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Candidato no encontrado"
+        )
+
+    validar_referencias_catalogos(db, referencias_conocimientos(conocimientos))
+
+    deseados = {}
+    for conocimiento in conocimientos:
+        deseados.setdefault(_clave_conocimiento(conocimiento), conocimiento)
+
+    actuales = db.execute(
+        select(
+            CandidatoConocimiento.id_conocimiento,
+            CandidatoConocimiento.tipo_conocimiento,
+            CandidatoConocimiento.id_habilidad_blanda,
+            CandidatoConocimiento.id_habilidad_tecnica,
+            CandidatoConocimiento.id_herramienta,
+        )
+        .where(CandidatoConocimiento.id_candidato == id_candidato)
+        .order_by(CandidatoConocimiento.id_conocimiento)
+    ).all()
+
+    conservados = {}
+    ids_eliminar = []
+    for fila in actuales:
+        clave = _clave_conocimiento(fila)
+        if clave in deseados and clave not in conservados:
+            conservados[clave] = fila.id_conocimiento
+        else:
+            ids_eliminar.append(fila.id_conocimiento)
+    nuevos = [c for clave, c in deseados.items() if clave not in conservados]
+
+    try:
+        if ids_eliminar:
+            db.execute(
+                delete(CandidatoConocimiento).where(CandidatoConocimiento.id_conocimiento.in_(ids_eliminar))
+            )
+        ids_nuevos = []
+        if nuevos:
+            ids_nuevos = list(db.scalars(
+                insert(CandidatoConocimiento).returning(CandidatoConocimiento.id_conocimiento, sort_by_parameter_order=True),
+                [{**c.model_dump(), "id_candidato": id_candidato} for c in nuevos],
+            ))
+        db.commit()
+    except IntegrityError:
         db.rollback()
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error interno: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Error de integridad en la base de datos"
         )
 
+    return ConocimientosReemplazoResponse(
+        agregados=len(ids_nuevos),
+        eliminados=len(ids_eliminar),
+        ids_conocimientos=sorted([*conservados.values(), *ids_nuevos]),
+    )
+
 
 def get_conocimiento(db: Session, id_conocimiento: int) -> CandidatoConocimiento:
     """
@@ -0,0 +1,198 @@
+"""Caché en disco, direccionada por contenido, para los reportes generados (Excel/PDF)."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.metricas import registrar_acceso_cache
+from app.models.version_datos_model import AMBITO_CANDIDATOS, VersionDatos
+
+logger = logging.getLogger(__name__)
+
+# Directorio donde se guardan los reportes en caché
+REPORTES_CACHE_DIR = os.getenv("REPORTES_CACHE_DIR", "cache_reportes")
+
+# Tamaño máximo del directorio de caché antes de desalojar por LRU
+REPORTES_CACHE_MAX_MB = int(os.getenv("REPORTES_CACHE_MAX_MB", "500"))
+
+_lock_desalojo = threading.Lock()
+
+
+@dataclass
+class ArtefactoReporte:
+    """
+    Archivo de reporte disponible en la caché.
+
+    Atributos:
+        ruta (str): Ruta del archivo en disco.
+        etag (str): ETag fuerte derivado de la clave de contenido.
+        temporal (bool): El archivo no quedó en la caché; quien lo recibe debe eliminarlo.
+    """
+    ruta: str
+    etag: str
+    temporal: bool = False
+
+
+# ──────────────── CLAVES Y ETAGS ────────────────
+
+def obtener_version_datos(db: Session, ambito: str = AMBITO_CANDIDATOS) -> int:
+    """Retorna la versión actual de los datos del ámbito (0 si nunca se han modificado)."""
+    version = db.query(VersionDatos.version).filter(VersionDatos.ambito == ambito).scalar()
+    return version or 0
+
+
+def calcular_clave_reporte(tipo: str, filtros: dict, version: int) -> str:
+    """
+    Calcula la clave de contenido de un reporte.
+
+    Args:
+        tipo (str): Tipo de reporte (ej. 'excel', 'pdf').
+        filtros (dict): Filtros aplicados al reporte.
+        version (int): Versión de los datos.
+
+    Returns:
+        str: Hash SHA-256 en hexadecimal.
+    """
+    base = json.dumps(
+        {"tipo": tipo, "filtros": filtros, "version": version},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(base.encode("utf-8")).hexdigest()
+
+
+def clave_reporte_actual(db: Session, tipo: str, filtros: dict) -> str:
+    """Calcula la clave del reporte para la versión de datos vigente."""
+    return calcular_clave_reporte(tipo, filtros, obtener_version_datos(db))
+
+
+def construir_etag(clave: str) -> str:
+    """Construye un ETag fuerte a partir de la clave del reporte."""
+    return f'"{clave}"'
+
+
+def etag_coincide(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Indica si el encabezado `If-None-Match` coincide con el ETag del reporte.
+
+    Acepta listas separadas por comas, el comodín `*` y ETags débiles (`W/`).
+    """
+    if not if_none_match:
+        return False
+    for candidato in if_none_match.split(","):
+        candidato = candidato.strip()
+        if candidato == "*":
+            return True
+        if candidato.startswith("W/"):
+            candidato = candidato[2:]
+        if candidato == etag:
+            return True
+    return False
+
+
+# ──────────────── LECTURA Y ESCRITURA ────────────────
+
+def obtener_o_generar_reporte(
+    db: Session,
+    tipo: str,
+    filtros: dict,
+    extension: str,
+    generar: Callable[[], BytesIO],
+    clave: Optional[str] = None,
+) -> ArtefactoReporte:
+    """
+    Retorna el reporte desde la caché o lo genera y lo almacena.
+
+    Si los datos cambian mientras se genera (la versión leída después ya no es la
+    misma), el archivo no se guarda en la caché: se entrega como temporal, porque su
+    contenido puede no corresponder a la versión con la que se indexaría.
+
+    Args:
+        db (Session): Sesión de base de datos (para obtener la versión de datos).
+        tipo (str): Tipo de reporte.
+        filtros (dict): Filtros aplicados al reporte.
+        extension (str): Extensión del archivo ('xlsx', 'pdf').
+        generar (Callable[[], BytesIO]): Función que genera el contenido si no está en caché.
+        clave (Optional[str]): Clave ya calculada, para evitar consultar de nuevo la versión.
+
+    Returns:
+        ArtefactoReporte: Ruta del archivo, su ETag y si es temporal.
+    """
+    clave = clave or clave_reporte_actual(db, tipo, filtros)
+    ruta = os.path.join(REPORTES_CACHE_DIR, f"{clave}.{extension}")
+
+    if os.path.exists(ruta):
+        try:
+            os.utime(ruta)  # Marca el acceso para el desalojo LRU
+            registrar_acceso_cache("reportes", True)
+            return ArtefactoReporte(ruta=ruta, etag=construir_etag(clave))
+        except FileNotFoundError:
+            pass  # Desalojado entre la comprobación y el acceso; se regenera
+
+    registrar_acceso_cache("reportes", False)
+    contenido = generar()
+    os.makedirs(REPORTES_CACHE_DIR, exist_ok=True)
+    ruta_temporal = f"{ruta}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(ruta_temporal, "wb") as archivo:
+        archivo.write(contenido.getbuffer())
+
+    if clave_reporte_actual(db, tipo, filtros) != clave:
+        return ArtefactoReporte(ruta=ruta_temporal, etag=construir_etag(clave), temporal=True)
+
+    os.replace(ruta_temporal, ruta)
+    desalojar_reportes_lru(conservar=ruta)
+    return ArtefactoReporte(ruta=ruta, etag=construir_etag(clave))
+
+
+def desalojar_reportes_lru(max_bytes: Optional[int] = None, conservar: Optional[str] = None) -> int:
+    """
+    Elimina los reportes usados menos recientemente hasta respetar el tamaño máximo.
+
+    Args:
+        max_bytes (Optional[int]): Límite en bytes (por defecto, `REPORTES_CACHE_MAX_MB`).
+        conservar (Optional[str]): Ruta que no debe desalojarse (el reporte recién generado).
+
+    Returns:
+        int: Número de archivos eliminados.
+    """
+    max_bytes = REPORTES_CACHE_MAX_MB * 1024 * 1024 if max_bytes is None else max_bytes
+    eliminados = 0
+
+    with _lock_desalojo:
+        try:
+            entradas = [e for e in os.scandir(REPORTES_CACHE_DIR) if e.is_file() and not e.name.endswith(".tmp")]
+        except FileNotFoundError:
+            return 0
+
+        archivos = []
+        for entrada in entradas:
+            try:
+                stat = entrada.stat()
+            except FileNotFoundError:
+                continue
+            archivos.append((stat.st_mtime, stat.st_size, entrada.path))
+
+        total = sum(tamano for _, tamano, _ in archivos)
+        for _, tamano, ruta in sorted(archivos):
+            if total <= max_bytes:
+                break
+            if ruta == conservar:
+                continue
+            try:
+                os.remove(ruta)
+                eliminados += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"No se pudo desalojar el reporte {ruta}: {e}")
+                continue
+            total -= tamano
+
+    return eliminados
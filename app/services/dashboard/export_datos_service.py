@@ -0,0 +1,210 @@
+"""Exportaciones planas de candidatos (CSV y Parquet) para análisis de datos.
+
+Ambos formatos usan la misma consulta y el mismo mapeo de columnas que el Excel
+(`consulta_exportacion_candidatos`), pero sin pasar por pandas ni por el ORM:
+
+  - CSV: en PostgreSQL se transmite directamente desde `COPY (SELECT ...) TO STDOUT`
+    con `copy_expert` de psycopg2; en otros motores se escribe fila a fila.
+  - Parquet: se lee con un cursor del lado del servidor y se escribe por grupos
+    de filas con pyarrow (dependencia opcional).
+"""
+
+import csv
+import io
+import os
+import queue
+import tempfile
+import threading
+from typing import Iterator, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import Boolean, Date, DateTime, Integer, Select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.services.dashboard.export_service import consulta_exportacion_candidatos
+
+# Filas por grupo (row group) en Parquet y por lote leído del cursor
+PARQUET_FILAS_POR_GRUPO = int(os.getenv("PARQUET_FILAS_POR_GRUPO", "50000"))
+
+# Tamaño máximo de la cola entre el hilo de COPY y la respuesta HTTP (en fragmentos)
+_CSV_FRAGMENTOS_EN_COLA = 64
+_FIN = object()
+
+
+# ───────────────────────── CSV ─────────────────────────
+
+class _EscritorCola:
+    """Objeto tipo archivo que entrega a una cola los fragmentos escritos por `copy_expert`."""
+
+    def __init__(self, cola: queue.Queue, cancelado: threading.Event):
+        self.cola = cola
+        self.cancelado = cancelado
+
+    def write(self, datos) -> int:
+        if isinstance(datos, str):
+            datos = datos.encode("utf-8")
+        while True:
+            if self.cancelado.is_set():
+                raise IOError("Exportación CSV cancelada por el cliente")
+            try:
+                self.cola.put(datos, timeout=1)
+                return len(datos)
+            except queue.Full:
+                continue
+
+
+def _sql_literal_postgres(engine: Engine, cursor, stmt: Select) -> str:
+    """Compila la consulta con los parámetros ya interpolados por psycopg2 (COPY no admite parámetros)."""
+    compilado = stmt.compile(dialect=engine.dialect)
+    return cursor.mogrify(str(compilado), compilado.params).decode("utf-8")
+
+
+def _copiar_csv_postgres(engine: Engine, stmt: Select, escritor: _EscritorCola) -> None:
+    """Ejecuta `COPY (consulta) TO STDOUT` y envía la salida al escritor."""
+    conexion = engine.raw_connection()
+    try:
+        cursor = conexion.cursor()
+        consulta = _sql_literal_postgres(engine, cursor, stmt)
+        cursor.copy_expert(
+            f"COPY ({consulta}) TO STDOUT WITH (FORMAT csv, HEADER true, ENCODING 'UTF8')",
+            escritor,
+        )
+        cursor.close()
+    finally:
+        conexion.close()
+
+
+def _escribir_csv_generico(engine: Engine, stmt: Select, escritor: _EscritorCola) -> None:
+    """Alternativa para motores sin COPY: escribe el CSV fila a fila con un cursor en streaming."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    with engine.connect() as conexion:
+        resultado = conexion.execution_options(stream_results=True).execute(stmt)
+        writer.writerow(resultado.keys())
+        for particion in resultado.partitions(1000):
+            for fila in particion:
+                writer.writerow(["t" if v is True else "f" if v is False else v for v in fila])
+            escritor.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            escritor.write(buffer.getvalue())
+
+
+def exportar_candidatos_csv(db: Session, año: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Genera el CSV de candidatos como un iterador de fragmentos de bytes.
+
+    La consulta se ejecuta en un hilo aparte que escribe en una cola acotada;
+    si el cliente cierra la conexión, el iterador se cierra y la copia se aborta.
+
+    Args:
+        db (Session): Sesión de base de datos (se usa su motor para abrir la conexión de COPY).
+        año (Optional[int]): Año opcional de registro para filtrar.
+
+    Returns:
+        Iterator[bytes]: Fragmentos del CSV listos para un StreamingResponse.
+    """
+    engine = db.get_bind()
+    stmt = consulta_exportacion_candidatos(año)
+    cola: queue.Queue = queue.Queue(maxsize=_CSV_FRAGMENTOS_EN_COLA)
+    cancelado = threading.Event()
+    escritor = _EscritorCola(cola, cancelado)
+    copiar = _copiar_csv_postgres if engine.dialect.name == "postgresql" else _escribir_csv_generico
+
+    def productor():
+        try:
+            copiar(engine, stmt, escritor)
+            cola.put(_FIN)
+        except Exception as e:
+            if not cancelado.is_set():
+                cola.put(e)
+
+    def consumidor():
+        hilo = threading.Thread(target=productor, name="export-csv", daemon=True)
+        hilo.start()
+        try:
+            while True:
+                fragmento = cola.get()
+                if fragmento is _FIN:
+                    return
+                if isinstance(fragmento, Exception):
+                    raise fragmento
+                yield fragmento
+        finally:
+            cancelado.set()
+
+    return consumidor()
+
+
+# ───────────────────────── PARQUET ─────────────────────────
+
+def _esquema_arrow(pa, stmt: Select):
+    """Deriva el esquema de pyarrow a partir de los tipos SQL de la consulta."""
+    campos = []
+    for columna in stmt.selected_columns:
+        tipo = columna.type
+        if isinstance(tipo, Boolean):
+            tipo_arrow = pa.bool_()
+        elif isinstance(tipo, Integer):
+            tipo_arrow = pa.int64()
+        elif isinstance(tipo, DateTime):
+            tipo_arrow = pa.timestamp("us")
+        elif isinstance(tipo, Date):
+            tipo_arrow = pa.date32()
+        else:
+            tipo_arrow = pa.string()
+        campos.append(pa.field(columna.name, tipo_arrow))
+    return pa.schema(campos)
+
+
+def exportar_candidatos_parquet(db: Session, año: Optional[int] = None) -> str:
+    """
+    Escribe el Parquet de candidatos en un archivo temporal, por grupos de filas.
+
+    Las filas se leen con un cursor del lado del servidor (`stream_results`), de modo
+    que en memoria solo hay un grupo a la vez.
+
+    Args:
+        db (Session): Sesión de base de datos (se usa su motor para el cursor en streaming).
+        año (Optional[int]): Año opcional de registro para filtrar.
+
+    Returns:
+        str: Ruta del archivo temporal generado (el llamador debe eliminarlo).
+
+    Raises:
+        HTTPException: 501 si pyarrow no está instalado.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise HTTPException(
+            status_code=501,
+            detail="La exportación Parquet requiere el paquete 'pyarrow' en el servidor",
+        )
+
+    engine = db.get_bind()
+    stmt = consulta_exportacion_candidatos(año)
+    esquema = _esquema_arrow(pa, stmt)
+    descriptor, ruta = tempfile.mkstemp(prefix="candidatos_", suffix=".parquet")
+    os.close(descriptor)
+
+    try:
+        with engine.connect() as conexion, pq.ParquetWriter(ruta, esquema, compression="zstd") as writer:
+            resultado = conexion.execution_options(
+                stream_results=True, max_row_buffer=PARQUET_FILAS_POR_GRUPO
+            ).execute(stmt)
+            for particion in resultado.partitions(PARQUET_FILAS_POR_GRUPO):
+                columnas = list(zip(*particion))
+                tabla = pa.Table.from_arrays(
+                    [pa.array(valores, type=campo.type) for valores, campo in zip(columnas, esquema)],
+                    schema=esquema,
+                )
+                writer.write_table(tabla)
+    except Exception:
+        os.remove(ruta)
+        raise
+
+    return ruta
@@ -0,0 +1,343 @@
+"""Servicio para ejecutar exportaciones de reportes (Excel/PDF) en segundo plano."""
+
+import logging
+import os
+import shutil
+import socket
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.core.tiempo_limite_sentencias import fijar_clase_sentencias
+from app.models.export_job_model import ExportJob
+from app.schemas.dashboard.export_job_schema import ExportJobCreate, ExportJobResponse
+from app.services.dashboard.cache_reportes_service import obtener_o_generar_reporte
+from app.services.dashboard.export_pdf_service import exportar_estadisticas_pdf_reportlab
+from app.services.dashboard.export_service import exportar_candidatos_detallados_excel
+
+logger = logging.getLogger(__name__)
+
+# Directorio local donde se guardan los archivos generados
+EXPORTS_DIR = os.getenv("EXPORTS_DIR", "exports")
+
+# Horas que se conserva un archivo generado antes de ser eliminado por el job de limpieza
+EXPORTS_TTL_HORAS = int(os.getenv("EXPORTS_TTL_HORAS", "24"))
+
+# Número de hilos que procesan trabajos de exportación en este worker
+EXPORTS_WORKERS = int(os.getenv("EXPORTS_WORKERS", "2"))
+
+# Minutos sin actualizarse tras los cuales un trabajo PENDIENTE o EN_PROCESO se
+# considera abandonado (ej. el worker que lo tenía se reinició)
+EXPORTS_JOB_ESTANCADO_MINUTOS = int(os.getenv("EXPORTS_JOB_ESTANCADO_MINUTOS", "30"))
+
+# Segundos entre latidos de un trabajo EN_PROCESO (renuevan `fecha_actualizacion`
+# mientras se genera el reporte); deben ser bastante menos que el umbral anterior
+EXPORTS_LATIDO_SEGUNDOS = int(os.getenv("EXPORTS_LATIDO_SEGUNDOS", "60"))
+
+# Los hilos usan el statement_timeout de las exportaciones en todas sus sesiones
+_executor = ThreadPoolExecutor(
+    max_workers=EXPORTS_WORKERS,
+    thread_name_prefix="export-job",
+    initializer=fijar_clase_sentencias,
+    initargs=("exportacion",),
+)
+
+# Configuración por tipo de reporte: generador, extensión y nombre de descarga
+_TIPOS_REPORTE = {
+    "excel": (exportar_candidatos_detallados_excel, "xlsx", "candidatos_detallados.xlsx"),
+    "pdf": (exportar_estadisticas_pdf_reportlab, "pdf", "estadisticas_report.pdf"),
+}
+
+MEDIA_TYPES = {
+    "excel": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "pdf": "application/pdf",
+}
+
+
+# ──────────────── CREACIÓN Y CONSULTA ────────────────
+
+def crear_export_job(db: Session, data: ExportJobCreate) -> ExportJob:
+    """
+    Registra un nuevo trabajo de exportación y lo encola en el pool de workers.
+
+    Args:
+        db (Session): Sesión de base de datos.
+        data (ExportJobCreate): Tipo de reporte y filtro opcional por año.
+
+    Returns:
+        ExportJob: Trabajo creado en estado PENDIENTE.
+    """
+    ahora = datetime.now()
+    job = ExportJob(
+        id=str(uuid.uuid4()),
+        tipo=data.tipo,
+        año=data.año,
+        estado="PENDIENTE",
+        progreso=0,
+        fecha_creacion=ahora,
+        fecha_actualizacion=ahora,
+        fecha_expiracion=ahora + timedelta(hours=EXPORTS_TTL_HORAS),
+    )
+    db.add(job)
+    db.commit()
+
+    _executor.submit(ejecutar_export_job, job.id)
+    return job
+
+
+def obtener_export_job(db: Session, job_id: str) -> ExportJob:
+    """
+    Obtiene un trabajo de exportación por su ID.
+
+    Raises:
+        HTTPException: 404 si el trabajo no existe.
+    """
+    job = db.get(ExportJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Trabajo de exportación no encontrado")
+    return job
+
+
+def mapear_export_job(job: ExportJob) -> ExportJobResponse:
+    """Convierte un trabajo en su esquema de respuesta, incluyendo la URL de descarga si aplica."""
+    respuesta = ExportJobResponse.model_validate(job)
+    if job.estado == "COMPLETADO":
+        respuesta.url_descarga = f"/reportes/exportaciones/{job.id}/descarga"
+    return respuesta
+
+
+def obtener_archivo_export_job(db: Session, job_id: str) -> ExportJob:
+    """
+    Valida que el archivo de un trabajo esté listo para descargarse.
+
+    Raises:
+        HTTPException: 404 si el trabajo o su archivo no existen,
+                       409 si el trabajo aún no ha terminado o falló.
+    """
+    job = obtener_export_job(db, job_id)
+    if job.estado != "COMPLETADO":
+        raise HTTPException(
+            status_code=409,
+            detail=f"El archivo aún no está disponible (estado: {job.estado})",
+        )
+    if not job.ruta_archivo or not os.path.exists(job.ruta_archivo):
+        raise HTTPException(status_code=404, detail="El archivo generado ya no está disponible")
+    return job
+
+
+# ──────────────── EJECUCIÓN EN SEGUNDO PLANO ────────────────
+
+def _actualizar_job_propio(db: Session, job_id: str, propietario: str, **campos) -> bool:
+    """
+    Actualiza el trabajo solo si sigue EN_PROCESO y a nombre de `propietario`.
+
+    Returns:
+        bool: False si el trabajo ya no es de este worker (ej. la recuperación de
+        estancados lo marcó como FALLIDO).
+    """
+    actualizados = (
+        db.query(ExportJob)
+        .filter(ExportJob.id == job_id, ExportJob.estado == "EN_PROCESO", ExportJob.propietario == propietario)
+        .update({**campos, "fecha_actualizacion": datetime.now()}, synchronize_session=False)
+    )
+    db.commit()
+    return bool(actualizados)
+
+
+def _latir(job_id: str, propietario: str, detener: threading.Event) -> None:
+    """Renueva `fecha_actualizacion` del trabajo cada `EXPORTS_LATIDO_SEGUNDOS` hasta que se detenga."""
+    while not detener.wait(EXPORTS_LATIDO_SEGUNDOS):
+        db = SessionLocal()
+        try:
+            if not _actualizar_job_propio(db, job_id, propietario):
+                return
+        except Exception:
+            logger.warning(f"No se pudo registrar el latido del trabajo {job_id}", exc_info=True)
+        finally:
+            db.close()
+
+
+def ejecutar_export_job(job_id: str) -> None:
+    """
+    Genera el archivo de un trabajo de exportación y lo escribe en disco.
+
+    Se ejecuta dentro del pool de hilos con su propia sesión de base de datos.
+    El trabajo se toma con un UPDATE condicionado a PENDIENTE que lo deja a nombre
+    de este worker, así que si se encoló en dos workers (ver
+    `recuperar_export_jobs_estancados`) solo uno lo procesa. Mientras se genera, un
+    hilo de latido renueva `fecha_actualizacion` para que no se dé por abandonado;
+    los cambios de estado posteriores solo se aplican si el trabajo sigue siendo de
+    este worker. El contenido se obtiene de la caché de reportes (o se genera si no
+    existe) y se copia primero a un temporal que luego se renombra, para que nunca
+    se sirva un archivo a medio escribir.
+
+    Args:
+        job_id (str): ID del trabajo a procesar.
+    """
+    propietario = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:12]}"
+    detener_latido = threading.Event()
+    db = SessionLocal()
+    try:
+        tomado = (
+            db.query(ExportJob)
+            .filter(ExportJob.id == job_id, ExportJob.estado == "PENDIENTE")
+            .update(
+                {
+                    "estado": "EN_PROCESO",
+                    "progreso": 10,
+                    "propietario": propietario,
+                    "fecha_actualizacion": datetime.now(),
+                },
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        if not tomado:
+            return
+
+        threading.Thread(
+            target=_latir, args=(job_id, propietario, detener_latido),
+            name=f"export-job-latido-{job_id[:8]}", daemon=True,
+        ).start()
+
+        job = db.get(ExportJob, job_id)
+        generador, extension, nombre_archivo = _TIPOS_REPORTE[job.tipo]
+
+        artefacto = obtener_o_generar_reporte(
+            db,
+            job.tipo,
+            {"año": job.año},
+            extension,
+            lambda: generador(db, job.año),
+        )
+        if not _actualizar_job_propio(db, job_id, propietario, progreso=80):
+            logger.warning(f"El trabajo de exportación {job_id} dejó de pertenecer a este worker")
+            if artefacto.temporal:
+                os.remove(artefacto.ruta)
+            return
+
+        os.makedirs(EXPORTS_DIR, exist_ok=True)
+        ruta = os.path.join(EXPORTS_DIR, f"{job.id}.{extension}")
+        ruta_temporal = f"{ruta}.tmp"
+        if artefacto.temporal:
+            shutil.move(artefacto.ruta, ruta_temporal)
+        else:
+            shutil.copyfile(artefacto.ruta, ruta_temporal)
+        os.replace(ruta_temporal, ruta)
+
+        completado = _actualizar_job_propio(
+            db,
+            job_id,
+            propietario,
+            estado="COMPLETADO",
+            progreso=100,
+            ruta_archivo=ruta,
+            nombre_archivo=nombre_archivo,
+            fecha_expiracion=datetime.now() + timedelta(hours=EXPORTS_TTL_HORAS),
+        )
+        if not completado:
+            logger.warning(f"El trabajo de exportación {job_id} dejó de pertenecer a este worker")
+            os.remove(ruta)
+    except Exception as e:
+        logger.exception(f"Error al ejecutar el trabajo de exportación {job_id}")
+        db.rollback()
+        _actualizar_job_propio(db, job_id, propietario, estado="FALLIDO", error=str(e))
+    finally:
+        detener_latido.set()
+        db.close()
+
+
+# ──────────────── LIMPIEZA ────────────────
+
+def eliminar_export_jobs_expirados(db: Session, ahora: Optional[datetime] = None) -> dict:
+    """
+    Elimina los trabajos expirados junto con sus archivos en disco.
+
+    Args:
+        db (Session): Sesión de base de datos.
+        ahora (Optional[datetime]): Fecha de referencia (por defecto, la actual).
+
+    Returns:
+        dict: Número de trabajos eliminados.
+    """
+    ahora = ahora or datetime.now()
+    expirados = db.query(ExportJob).filter(ExportJob.fecha_expiracion < ahora).all()
+
+    for job in expirados:
+        if job.ruta_archivo and os.path.exists(job.ruta_archivo):
+            try:
+                os.remove(job.ruta_archivo)
+            except OSError as e:
+                logger.warning(f"No se pudo eliminar el archivo {job.ruta_archivo}: {e}")
+        db.delete(job)
+
+    db.commit()
+    return {"eliminados": len(expirados)}
+
+
+def recuperar_export_jobs_estancados(db: Session, ahora: Optional[datetime] = None) -> dict:
+    """
+    Recupera los trabajos que quedaron abandonados al reiniciarse o caerse un worker.
+
+    El pool de hilos vive en memoria, así que un trabajo encolado o en curso en un
+    worker que se detuvo no termina nunca. Los que siguen PENDIENTE (nunca
+    empezaron) se vuelven a encolar en este worker; los EN_PROCESO se marcan como
+    FALLIDO, porque no se sabe si fue el propio reporte el que tumbó el proceso.
+    Un trabajo EN_PROCESO vivo no se ve afectado: su latido renueva
+    `fecha_actualizacion` cada `EXPORTS_LATIDO_SEGUNDOS`.
+
+    Args:
+        db (Session): Sesión de base de datos.
+        ahora (Optional[datetime]): Fecha de referencia (por defecto, la actual).
+
+    Returns:
+        dict: Número de trabajos reencolados y marcados como fallidos.
+    """
+    ahora = ahora or datetime.now()
+    limite = ahora - timedelta(minutes=EXPORTS_JOB_ESTANCADO_MINUTOS)
+    estancados = (
+        db.query(ExportJob)
+        .filter(
+            ExportJob.estado.in_(("PENDIENTE", "EN_PROCESO")),
+            ExportJob.fecha_actualizacion < limite,
+        )
+        .all()
+    )
+
+    # Condicionado al estado y la fecha leídos: si otro worker lo tomó entretanto, no se toca
+    reencolados, fallidos = [], 0
+    for job in estancados:
+        seguimiento = db.query(ExportJob).filter(
+            ExportJob.id == job.id,
+            ExportJob.estado == job.estado,
+            ExportJob.fecha_actualizacion == job.fecha_actualizacion,
+        )
+        if job.estado == "PENDIENTE":
+            if seguimiento.update({"fecha_actualizacion": ahora}, synchronize_session=False):
+                reencolados.append(job.id)
+        elif seguimiento.update(
+            {
+                "estado": "FALLIDO",
+                "error": "El trabajo se interrumpió antes de terminar; vuelve a solicitar la exportación",
+                "fecha_actualizacion": ahora,
+            },
+            synchronize_session=False,
+        ):
+            fallidos += 1
+    db.commit()
+
+    for job_id in reencolados:
+        _executor.submit(ejecutar_export_job, job_id)
+
+    if reencolados or fallidos:
+        logger.warning(
+            "Trabajos de exportación estancados recuperados",
+            extra={"reencolados": len(reencolados), "fallidos": fallidos},
+        )
+    return {"reencolados": len(reencolados), "fallidos": fallidos}
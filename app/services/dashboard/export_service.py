@@ -1,144 +1,220 @@
-from typing import Optional
+from typing import List, Optional, Tuple
 from io import BytesIO
-import pandas as pd
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import extract
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl import Workbook
-from openpyxl.worksheet.table import Table, TableStyleInfo
-from openpyxl.styles import Alignment
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import ColumnElement, Integer, Select, extract, func, select
 
 from app.models.candidato_model import Candidato
-from app.models.catalogs.ciudad import Ciudad
+from app.models.catalogs.ciudad import Ciudad, Departamento
+from app.models.catalogs.cargo_ofrecido import CargoOfrecido
+from app.models.catalogs.centro_costos import CentroCostos
+from app.models.catalogs.nivel_educacion import NivelEducacion
+from app.models.catalogs.titulo import TituloObtenido
+from app.models.catalogs.instituciones import InstitucionAcademica
+from app.models.catalogs.nivel_ingles import NivelIngles
+from app.models.catalogs.rango_experiencia import RangoExperiencia
 from app.models.educacion_model import Educacion
 from app.models.experiencia_model import ExperienciaLaboral
-from app.models.conocimientos_model import CandidatoConocimiento
-from app.models.preferencias import PreferenciaDisponibilidad
+from app.models.conocimientos_model import (
+    CandidatoConocimiento,
+    HabilidadBlanda,
+    HabilidadTecnica,
+    Herramienta,
+)
+from app.models.preferencias import (
+    Disponibilidad,
+    MotivoSalida,
+    PreferenciaDisponibilidad,
+    RangoSalarial,
+)
+
+
+# ───────────────────────── MAPEO DE COLUMNAS ─────────────────────────
+
+def columnas_exportacion_candidatos() -> Tuple[List[Tuple[str, ColumnElement]], list]:
+    """
+    Mapeo compartido (encabezado → expresión SQL) de la exportación de candidatos.
+
+    Lo usan el Excel y las exportaciones planas (CSV/Parquet), de modo que todos
+    los formatos tienen las mismas columnas en el mismo orden. De cada candidato
+    se toma el primer registro de educación, experiencia y preferencias, y los
+    conocimientos se agregan como listas separadas por comas.
+
+    Returns:
+        Tuple[List[Tuple[str, ColumnElement]], list]: Columnas (encabezado, expresión)
+        y los joins externos (modelo, condición) necesarios para resolverlas.
+    """
+    motivo_candidato = aliased(MotivoSalida)
+    motivo_preferencia = aliased(MotivoSalida)
+    educacion_sub = aliased(Educacion)
+    experiencia_sub = aliased(ExperienciaLaboral)
+    preferencia_sub = aliased(PreferenciaDisponibilidad)
+
+    primera_educacion = (
+        select(func.min(educacion_sub.id_educacion))
+        .where(educacion_sub.id_candidato == Candidato.id_candidato)
+        .correlate(Candidato)
+        .scalar_subquery()
+    )
+    primera_experiencia = (
+        select(func.min(experiencia_sub.id_experiencia))
+        .where(experiencia_sub.id_candidato == Candidato.id_candidato)
+        .correlate(Candidato)
+        .scalar_subquery()
+    )
+    primera_preferencia = (
+        select(func.min(preferencia_sub.id_preferencia))
+        .where(preferencia_sub.id_candidato == Candidato.id_candidato)
+        .correlate(Candidato)
+        .scalar_subquery()
+    )
+
+    def conocimientos(tipo: str, modelo, id_col, nombre_col):
+        return (
+            select(func.aggregate_strings(nombre_col, ", "))
+            .select_from(CandidatoConocimiento)
+            .join(modelo, id_col == getattr(CandidatoConocimiento, id_col.key))
+            .where(
+                CandidatoConocimiento.id_candidato == Candidato.id_candidato,
+                CandidatoConocimiento.tipo_conocimiento == tipo,
+            )
+            .correlate(Candidato)
+            .scalar_subquery()
+        )
+
+    columnas = [
+        ("#", func.row_number(type_=Integer).over(order_by=(Candidato.fecha_registro, Candidato.id_candidato))),
+        ("ID del Candidato", Candidato.id_candidato),
+        ("Nombre Completo", Candidato.nombre_completo),
+        ("Correo Electrónico", Candidato.correo_electronico),
+        ("CC", Candidato.cc),
+        ("Fecha de Nacimiento", Candidato.fecha_nacimiento),
+        ("Teléfono", Candidato.telefono),
+        ("Departamento de Residencia", Departamento.nombre_departamento),
+        ("Ciudad/Municipio", Ciudad.nombre_ciudad),
+        ("Descripción del Perfil", Candidato.descripcion_perfil),
+        ("Cargo de Interés", CargoOfrecido.nombre_cargo),
+        ("Nombre (Otro Cargo)", Candidato.nombre_cargo_otro),
+        ("¿Traba Actualemente en Joyco?", Candidato.trabaja_actualmente_joyco),
+        ("Centro de Costos", CentroCostos.nombre_centro_costos),
+        ("Nombre (Otro Centro de Costos)", Candidato.nombre_centro_costos_otro),
+        ("¿Ha Trabajado en Joyco?", Candidato.ha_trabajado_joyco),
+        ("Motivo de Salida", motivo_candidato.descripcion_motivo),
+        ("Nombre (Otro Motivo de Salida)", Candidato.otro_motivo_salida),
+        ("Tiene Referido", Candidato.tiene_referido),
+        ("Nombre del Referido", Candidato.nombre_referido),
+        ("Estado", Candidato.estado),
+        ("¿Formulario Completo?", Candidato.formulario_completo),
+        ("¿Acpetó Política de Datos?", Candidato.acepta_politica_datos),
+        # Educación
+        ("Ultimo Nivel Educativo", NivelEducacion.descripcion_nivel),
+        ("Título Obtenido", TituloObtenido.nombre_titulo),
+        ("Nombre (Otro Título)", Educacion.nombre_titulo_otro),
+        ("Institución Académica", InstitucionAcademica.nombre_institucion),
+        ("Nombre (Otro Institución Académica)", Educacion.nombre_institucion_otro),
+        ("Año de Graduación", Educacion.anio_graduacion),
+        ("Nivel de Inglés", NivelIngles.nivel),
+        # Experiencia
+        ("Experiencia Laboral", RangoExperiencia.descripcion_rango),
+        ("Última Empresa", ExperienciaLaboral.ultima_empresa),
+        ("Último Cargo", ExperienciaLaboral.ultimo_cargo),
+        ("Funciones Relizadas", ExperienciaLaboral.funciones),
+        ("Desde", ExperienciaLaboral.fecha_inicio),
+        ("Hasta", ExperienciaLaboral.fecha_fin),
+        # Conocimientos
+        ("Habilidades Blandas", conocimientos(
+            "blanda", HabilidadBlanda, HabilidadBlanda.id_habilidad_blanda, HabilidadBlanda.nombre_habilidad_blanda)),
+        ("Habilidades Técnicas", conocimientos(
+            "tecnica", HabilidadTecnica, HabilidadTecnica.id_habilidad_tecnica, HabilidadTecnica.nombre_habilidad_tecnica)),
+        ("Herramientas", conocimientos(
+            "herramienta", Herramienta, Herramienta.id_herramienta, Herramienta.nombre_herramienta)),
+        # Preferencias
+        ("¿Disponibilidad de Viajar?", PreferenciaDisponibilidad.disponibilidad_viajar),
+        ("¿Disponibilidad de Inicio?", Disponibilidad.descripcion_disponibilidad),
+        ("Pretensión Salarial", RangoSalarial.descripcion_rango),
+        ("¿Trabaja Actualmente?", PreferenciaDisponibilidad.trabaja_actualmente),
+        ("Motivo de Salida (Preferencias)", motivo_preferencia.descripcion_motivo),
+        ("Nombre (Otro Motivo de Salida (Preferencias))", PreferenciaDisponibilidad.otro_motivo_salida),
+        ("Razón para Trabajar en Joyco", PreferenciaDisponibilidad.razon_trabajar_joyco),
+        # Fecha al final
+        ("Fecha de Registro", Candidato.fecha_registro),
+    ]
+
+    joins = [
+        (Ciudad, Ciudad.id_ciudad == Candidato.id_ciudad),
+        (Departamento, Departamento.id_departamento == Ciudad.id_departamento),
+        (CargoOfrecido, CargoOfrecido.id_cargo == Candidato.id_cargo),
+        (CentroCostos, CentroCostos.id_centro_costos == Candidato.id_centro_costos),
+        (motivo_candidato, motivo_candidato.id_motivo_salida == Candidato.id_motivo_salida),
+        (Educacion, Educacion.id_educacion == primera_educacion),
+        (NivelEducacion, NivelEducacion.id_nivel_educacion == Educacion.id_nivel_educacion),
+        (TituloObtenido, TituloObtenido.id_titulo == Educacion.id_titulo),
+        (InstitucionAcademica, InstitucionAcademica.id_institucion == Educacion.id_institucion),
+        (NivelIngles, NivelIngles.id_nivel_ingles == Educacion.id_nivel_ingles),
+        (ExperienciaLaboral, ExperienciaLaboral.id_experiencia == primera_experiencia),
+        (RangoExperiencia, RangoExperiencia.id_rango_experiencia == ExperienciaLaboral.id_rango_experiencia),
+        (PreferenciaDisponibilidad, PreferenciaDisponibilidad.id_preferencia == primera_preferencia),
+        (Disponibilidad, Disponibilidad.id_disponibilidad == PreferenciaDisponibilidad.id_disponibilidad_inicio),
+        (RangoSalarial, RangoSalarial.id_rango_salarial == PreferenciaDisponibilidad.id_rango_salarial),
+        (motivo_preferencia, motivo_preferencia.id_motivo_salida == PreferenciaDisponibilidad.id_motivo_salida),
+    ]
+    return columnas, joins
+
+
+def consulta_exportacion_candidatos(año: Optional[int] = None) -> Select:
+    """
+    Construye la consulta plana (una fila por candidato) de la exportación.
+
+    Args:
+        año (Optional[int]): Año opcional de registro para filtrar.
+
+    Returns:
+        Select: Consulta con una columna etiquetada por cada encabezado del mapeo.
+    """
+    columnas, joins = columnas_exportacion_candidatos()
+    query = select(*[expr.label(encabezado) for encabezado, expr in columnas]).select_from(Candidato)
+    for modelo, condicion in joins:
+        query = query.outerjoin(modelo, condicion)
+    if año:
+        query = query.where(extract("year", Candidato.fecha_registro) == año)
+    return query.order_by(Candidato.fecha_registro, Candidato.id_candidato)
+
+
+# ───────────────────────── EXCEL ─────────────────────────
 
 def exportar_candidatos_detallados_excel(db: Session, año: Optional[int] = None) -> BytesIO:
     """
     Genera un archivo Excel con toda la información detallada de cada candidato.
     Si se especifica un año, solo se exportan los registrados ese año.
     """
+    # openpyxl se importa aquí y no al cargar el módulo: es la dependencia más
+    # pesada del arranque y solo la necesitan las exportaciones a Excel.
+    from openpyxl import Workbook
+    from openpyxl.worksheet.table import Table, TableStyleInfo
+    from openpyxl.styles import Alignment
 
-    # 1. Consultar candidatos con joins
-    query = (
-        db.query(Candidato)
-        .options(
-            joinedload(Candidato.ciudad).joinedload(Ciudad.departamento),
-            joinedload(Candidato.ciudad),
-            joinedload(Candidato.cargo),
-            joinedload(Candidato.centro_costos),
-            joinedload(Candidato.motivo_salida),
-            joinedload(Candidato.educaciones).joinedload(Educacion.nivel_educacion),
-            joinedload(Candidato.educaciones).joinedload(Educacion.titulo),
-            joinedload(Candidato.educaciones).joinedload(Educacion.institucion),
-            joinedload(Candidato.educaciones).joinedload(Educacion.nivel_ingles),
-            joinedload(Candidato.experiencias).joinedload(ExperienciaLaboral.rango_experiencia),
-            joinedload(Candidato.conocimientos).joinedload(CandidatoConocimiento.habilidad_blanda),
-            joinedload(Candidato.conocimientos).joinedload(CandidatoConocimiento.habilidad_tecnica),
-            joinedload(Candidato.conocimientos).joinedload(CandidatoConocimiento.herramienta),
-            joinedload(Candidato.preferencias).joinedload(PreferenciaDisponibilidad.disponibilidad),
-            joinedload(Candidato.preferencias).joinedload(PreferenciaDisponibilidad.rango_salarial),
-            joinedload(Candidato.preferencias).joinedload(PreferenciaDisponibilidad.motivo_salida),
-        )
-    )
-    if año:
-        query = query.filter(extract("year", Candidato.fecha_registro) == año)
-
-    candidatos = query.all()
-
-    # 2. Construir registros
-    registros = []
-    candidatos.sort(key=lambda c: c.fecha_registro)
-    for idx, c in enumerate(candidatos, start=1):
-
-        educ = c.educaciones[0] if c.educaciones else None
-        exp = c.experiencias[0] if c.experiencias else None
-        pref = c.preferencias[0] if c.preferencias else None
-
-        hb = [ci.habilidad_blanda.nombre_habilidad_blanda for ci in c.conocimientos if ci.tipo_conocimiento == "blanda" and ci.habilidad_blanda]
-        ht = [ci.habilidad_tecnica.nombre_habilidad_tecnica for ci in c.conocimientos if ci.tipo_conocimiento == "tecnica" and ci.habilidad_tecnica]
-        hr = [ci.herramienta.nombre_herramienta for ci in c.conocimientos if ci.tipo_conocimiento == "herramienta" and ci.herramienta]
-
-        registros.append({
-            "#": idx,
-            "ID del Candidato": c.id_candidato,
-            "Nombre Completo": c.nombre_completo,
-            "Correo Electrónico": c.correo_electronico,
-            "CC": c.cc,
-            "Fecha de Nacimiento": c.fecha_nacimiento,
-            "Teléfono": c.telefono,
-            "Departamento de Residencia": c.ciudad.departamento.nombre_departamento if c.ciudad and c.ciudad.departamento else None,
-            "Ciudad/Municipio": c.ciudad.nombre_ciudad if c.ciudad else None,
-            "Descripción del Perfil": c.descripcion_perfil,
-            "Cargo de Interés": c.cargo.nombre_cargo if c.cargo else None,
-            "Nombre (Otro Cargo)": c.nombre_cargo_otro,
-            "¿Traba Actualemente en Joyco?": c.trabaja_actualmente_joyco,
-            "Centro de Costos": c.centro_costos.nombre_centro_costos if c.centro_costos else None,
-            "Nombre (Otro Centro de Costos)": c.nombre_centro_costos_otro,
-            "¿Ha Trabajado en Joyco?": c.ha_trabajado_joyco,
-            "Motivo de Salida": c.motivo_salida.descripcion_motivo if c.motivo_salida else None,
-            "Nombre (Otro Motivo de Salida)": c.otro_motivo_salida,
-            "Tiene Referido": c.tiene_referido,
-            "Nombre del Referido": c.nombre_referido,
-            "Estado": c.estado,
-            "¿Formulario Completo?": c.formulario_completo,
-            "¿Acpetó Política de Datos?": c.acepta_politica_datos,
-            # Educación
-            "Ultimo Nivel Educativo": educ.nivel_educacion.descripcion_nivel if educ else None,
-            "Título Obtenido": educ.titulo.nombre_titulo if educ and educ.titulo else None,
-            "Nombre (Otro Título)": educ.nombre_titulo_otro if educ else None,
-            "Institución Académica": educ.institucion.nombre_institucion if educ and educ.institucion else None,
-            "Nombre (Otro Institución Académica)": educ.nombre_institucion_otro if educ else None,
-            "Año de Graduación": educ.anio_graduacion if educ else None,
-            "Nivel de Inglés": educ.nivel_ingles.nivel if educ and educ.nivel_ingles else None,
-            # Experiencia
-            "Experiencia Laboral": exp.rango_experiencia.descripcion_rango if exp else None,
-            "Última Empresa": exp.ultima_empresa if exp else None,
-            "Último Cargo": exp.ultimo_cargo if exp else None,
-            "Funciones Relizadas": exp.funciones if exp else None,
-            "Desde": exp.fecha_inicio if exp else None,
-            "Hasta": exp.fecha_fin if exp else None,
-            # Conocimientos
-            "Habilidades Blandas": ", ".join(hb),
-            "Habilidades Técnicas": ", ".join(ht),
-            "Herramientas": ", ".join(hr),
-            # Preferencias
-            "¿Disponibilidad de Viajar?": pref.disponibilidad_viajar if pref else None,
-            "¿Disponibilidad de Inicio?": pref.disponibilidad.descripcion_disponibilidad if pref else None,
-            "Pretensión Salarial": pref.rango_salarial.descripcion_rango if pref else None,
-            "¿Trabaja Actualmente?": pref.trabaja_actualmente if pref else None,
-            "Motivo de Salida": pref.motivo_salida.descripcion_motivo if pref and pref.motivo_salida else None,
-            "Nombre (Otro Motivo de Salida (Preferencias))": pref.otro_motivo_salida if pref else None,
-            "Razón para Trabajar en Joyco": pref.razon_trabajar_joyco if pref else None,
-            # Fecha al final
-            "Fecha de Registro": c.fecha_registro,
-        })
-
-    df = pd.DataFrame(registros)
+    # 1. Consultar candidatos como filas planas
+    resultado = db.execute(consulta_exportacion_candidatos(año))
+    encabezados = list(resultado.keys())
+    filas = resultado.all()
 
     # Crear archivo Excel
     wb = Workbook()
     ws = wb.active
     ws.title = "Candidatos"
 
-    if not df.empty:
-        # Ordenar y mover columna
-        df.sort_values(by="Fecha de Registro", ascending=True, inplace=True)
-        columnas_ordenadas = [col for col in df.columns if col != "Fecha de Registro"] + ["Fecha de Registro"]
-        df = df[columnas_ordenadas]
-
+    if filas:
         # Escribir filas al worksheet
-        for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=True), start=1):
-            ws.append(row)
-            for cell in ws[r_idx]:
-                cell.alignment = Alignment(wrap_text=True, vertical="top")
+        anchos = [len(encabezado) for encabezado in encabezados]
+        alineacion = Alignment(wrap_text=True, vertical="top")
+        for r_idx, row in enumerate([encabezados, *filas], start=1):
+            ws.append(list(row))
+            for c_idx, cell in enumerate(ws[r_idx]):
+                cell.alignment = alineacion
+                anchos[c_idx] = max(anchos[c_idx], len(str(cell.value if cell.value is not None else "")))
 
         # Ajuste de anchos
-        for col in ws.columns:
-            max_length = max(len(str(cell.value or "")) for cell in col)
-            ws.column_dimensions[col[0].column_letter].width = min(max_length + 2, 50)
+        for c_idx, col in enumerate(ws.iter_cols(max_row=1)):
+            ws.column_dimensions[col[0].column_letter].width = min(anchos[c_idx] + 2, 50)
 
         # Estilo de tabla
         tab = Table(displayName="TablaCandidatos", ref=ws.dimensions)
@@ -156,4 +232,3 @@ def exportar_candidatos_detallados_excel(db: Session, año: Optional[int] = None
     wb.save(output)
     output.seek(0)
     return output
-
@@ -0,0 +1,227 @@
+"""Renderizado de PDF de estadísticas con ReportLab, pensado para ejecutarse en un pool de procesos.
+
+Este módulo no depende de la base de datos: recibe los datos de las seis
+secciones de estadísticas como diccionarios y devuelve los bytes del PDF.
+Así puede importarse en procesos hijos sin cargar SQLAlchemy ni los modelos.
+"""
+
+import os
+from io import BytesIO
+from typing import Optional
+
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfbase import pdfmetrics
+from reportlab.platypus import (
+    SimpleDocTemplate,
+    Paragraph,
+    Table,
+    TableStyle,
+    Spacer,
+    Image,
+)
+from reportlab.lib import colors
+from reportlab.lib.styles import getSampleStyleSheet
+
+from app.schemas.dashboard.stats_personal_schema import EstadisticasPersonalesResponse
+from app.schemas.dashboard.stats_educacion_schema import EstadisticasEducacionResponse
+from app.schemas.dashboard.stats_experiencia_schema import EstadisticasExperienciaResponse
+from app.schemas.dashboard.stats_conocimientos_schema import EstadisticasConocimientosResponse
+from app.schemas.dashboard.stats_preferencias_schema import EstadisticasPreferenciasResponse
+from app.schemas.dashboard.stats_proceso_schema import EstadisticasProcesoResponse
+
+# Ruta del logo incluido en el encabezado del reporte
+LOGO_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "static", "LogoJoyco.png")
+
+# Fuentes usadas por las tablas y estilos del reporte
+_FUENTES = ("Helvetica", "Helvetica-Bold", "Helvetica-Oblique", "Times-Roman")
+
+# Recursos precargados una sola vez por proceso
+_logo_bytes: Optional[bytes] = None
+_styles = None
+
+
+def inicializar_worker_pdf() -> None:
+    """
+    Precarga en el proceso actual el logo, las fuentes y la hoja de estilos.
+
+    Se usa como `initializer` del pool de procesos, de modo que cada worker
+    lee el logo y las métricas de las fuentes una sola vez, y no en cada PDF.
+    """
+    global _logo_bytes, _styles
+    if _logo_bytes is not None:
+        return
+
+    with open(LOGO_PATH, "rb") as archivo:
+        _logo_bytes = archivo.read()
+    for fuente in _FUENTES:
+        pdfmetrics.getFont(fuente)
+    _styles = getSampleStyleSheet()
+
+    # Renderizado mínimo para calentar el decodificador de imágenes y el layout
+    SimpleDocTemplate(BytesIO(), pagesize=A4).build([
+        Image(BytesIO(_logo_bytes), width=100, height=50),
+        Paragraph("warm-up", _styles["Normal"]),
+    ])
+
+
+def renderizar_estadisticas_pdf(datos: dict, año: Optional[int], generado: str) -> bytes:
+    """
+    Construye el PDF de estadísticas a partir de datos planos.
+
+    Args:
+        datos (dict): Secciones 'personal', 'educacion', 'experiencia',
+            'conocimientos', 'preferencias' y 'proceso' como diccionarios
+            (resultado de `model_dump()` de cada respuesta de estadísticas).
+        año (Optional[int]): Año filtrado, si aplica.
+        generado (str): Fecha y hora de generación a mostrar en el encabezado.
+
+    Returns:
+        bytes: Contenido del PDF.
+    """
+    inicializar_worker_pdf()
+
+    personal       = EstadisticasPersonalesResponse.model_validate(datos["personal"])
+    educacion      = EstadisticasEducacionResponse.model_validate(datos["educacion"])
+    experiencia    = EstadisticasExperienciaResponse.model_validate(datos["experiencia"])
+    conocimientos  = EstadisticasConocimientosResponse.model_validate(datos["conocimientos"])
+    preferencias    = EstadisticasPreferenciasResponse.model_validate(datos["preferencias"])
+    proceso        = EstadisticasProcesoResponse.model_validate(datos["proceso"])
+
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4)
+    styles = _styles
+    elements = []
+
+    # Logo y encabezado
+    elements.append(Image(BytesIO(_logo_bytes), width=100, height=50))
+    elements.append(Spacer(1, 12))
+    elements.append(Paragraph("Reporte de Estadísticas", styles["Title"]))
+    elements.append(Paragraph(f"Generado: {generado}", styles["Normal"]))
+    if año:
+        elements.append(Paragraph(f"Año filtrado: {año}", styles["Normal"]))
+    elements.append(Spacer(1, 24))
+
+    def add_section(title, rows):
+        elements.append(Paragraph(title, styles["Heading2"]))
+        if not rows:
+            elements.append(Paragraph("Sin datos disponibles.", styles["Normal"]))
+        else:
+            table_data = [["Etiqueta", "Cantidad"], *rows]
+            tbl = Table(table_data, colWidths=[300, 100])
+            tbl.setStyle(TableStyle([
+                ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+                ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ]))
+            elements.append(tbl)
+        elements.append(Spacer(1, 12))
+# ───────────────────────── PERSONAL ─────────────────────────
+    elements.append(Paragraph("📍 Estadísticas Personales", styles["Heading2"]))
+
+    # Anuales
+    add_section("Top ciudades (anual)", [(i.label, i.count) for i in personal.top_ciudades_anual])
+    add_section("Top departamentos (anual)", [(i.label, i.count) for i in personal.top_departamentos_anual])
+    add_section("Top centros de costos (anual)", [(i.label, i.count) for i in personal.top_centros_costos_anual])
+    add_section("Top cargos (anual)", [(i.label, i.count) for i in personal.top_cargos_anual])
+    add_section("Top nombres de referidos", [(i.label, i.count) for i in personal.top_nombres_referidos])
+    add_section("Rangos de edad", [(i.label, i.count) for i in personal.rangos_edad])
+    add_section("Estados de los candidatos", [(i.label, i.count) for i in personal.estado_candidatos])
+    add_section("Estadísticas booleanas", [
+        ("Referidos", personal.estadisticas_booleanas.referidos),
+        ("No referidos", personal.estadisticas_booleanas.no_referidos),
+        ("Formularios completos", personal.estadisticas_booleanas.formularios_completos),
+        ("Formularios incompletos", personal.estadisticas_booleanas.formularios_incompletos),
+        ("Trabaja en Joyco", personal.estadisticas_booleanas.trabaja_actualmente_joyco),
+        ("Ha trabajado en Joyco", personal.estadisticas_booleanas.ha_trabajado_joyco),
+    ])
+
+    # Mensuales
+    add_section("Candidatos registrados por mes", [(f"Mes {i.month}", i.count) for i in personal.candidatos_por_mes])
+    add_section("Top ciudad por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in personal.top_ciudades_por_mes])
+    add_section("Top departamento por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in personal.top_departamentos_por_mes])
+    add_section("Top centro de costos por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in personal.top_centros_costos_por_mes])
+    add_section("Top cargo por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in personal.top_cargos_por_mes])
+
+# ───────────────────────── EDUCACIÓN ─────────────────────────
+    elements.append(Paragraph("🎓 Estadísticas de Educación", styles["Heading2"]))
+
+    # Anuales
+    add_section("Top niveles educativos (anual)", [(i.label, i.count) for i in educacion.top_niveles_educacion_anual])
+    add_section("Top títulos obtenidos (anual)", [(i.label, i.count) for i in educacion.top_titulos_obtenidos_anual])
+    add_section("Top instituciones académicas (anual)", [(i.label, i.count) for i in educacion.top_instituciones_academicas_anual])
+    add_section("Distribución del nivel de inglés (anual)", [(i.label, i.count) for i in educacion.distribucion_nivel_ingles_anual])
+    """
+    This services isn't doing for the year
+    """
+    add_section("Distribución por año de graduación", [(i.label, i.count) for i in educacion.distribucion_anio_graduacion]) 
+
+    # Mensuales
+    add_section("Educaciones registradas por mes", [(f"Mes {i.month}", i.count) for i in educacion.educaciones_por_mes])
+    add_section("Top nivel educativo por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in educacion.top_niveles_por_mes])
+    add_section("Top título obtenido por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in educacion.top_titulos_por_mes])
+    add_section("Top institución académica por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in educacion.top_instituciones_por_mes])
+    add_section("Nivel de inglés más frecuente por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in educacion.distribucion_nivel_ingles_por_mes])
+
+    # ───────────────────────── EXPERIENCIA ────────────────────────
+    elements.append(Paragraph("💼 Estadísticas de Experiencia", styles["Heading2"]))
+
+    # Anuales
+    add_section("Top rangos de experiencia (anual)", [(i.label, i.count) for i in experiencia.top_rangos_experiencia_anual])
+    add_section("Top últimos cargos (anual)", [(i.label, i.count) for i in experiencia.top_ultimos_cargos_anual])
+    add_section("Top últimas empresas (anual)", [(i.label, i.count) for i in experiencia.top_ultimas_empresas_anual])
+    add_section("Distribución de duración de la experiencia", [(i.label, i.count) for i in experiencia.distribucion_duracion])
+
+    # Mensuales
+    add_section("Experiencias registradas por mes", [(f"Mes {i.month}", i.count) for i in experiencia.experiencias_por_mes])
+    add_section("Top rango de experiencia por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in experiencia.top_rangos_por_mes])
+    add_section("Top último cargo por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in experiencia.top_ultimos_cargos_por_mes])
+    add_section("Top última empresa por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in experiencia.top_ultimas_empresas_por_mes])
+    
+        # ───────────────────────── CONOCIMIENTOS ─────────────────────
+    elements.append(Paragraph("🧠 Estadísticas de Conocimientos", styles["Heading2"]))
+
+    # Anuales
+    add_section("Top habilidades blandas (anual)", [(i.label, i.count) for i in conocimientos.top_habilidades_blandas_anual])
+    add_section("Top habilidades técnicas (anual)", [(i.label, i.count) for i in conocimientos.top_habilidades_tecnicas_anual])
+    add_section("Top herramientas (anual)", [(i.label, i.count) for i in conocimientos.top_herramientas_anual])
+
+    # Mensuales
+    add_section("Conocimientos registrados por mes", [(f"Mes {i.month}", i.count) for i in conocimientos.conocimientos_por_mes])
+    add_section("Top habilidad blanda por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in conocimientos.top_habilidades_blandas_por_mes])
+    add_section("Top habilidad técnica por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in conocimientos.top_habilidades_tecnicas_por_mes])
+    add_section("Top herramienta por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in conocimientos.top_herramientas_por_mes])
+
+# ───────────────────────── PREFERENCIAS ──────────────────────
+    elements.append(Paragraph("📌 Estadísticas de Preferencias", styles["Heading2"]))
+
+    # Anuales
+    add_section("Top disponibilidad de inicio (anual)", [(i.label, i.count) for i in preferencias.top_disponibilidad_inicio_anual])
+    add_section("Top rangos salariales (anual)", [(i.label, i.count) for i in preferencias.top_rangos_salariales_anual])
+    add_section("Top motivos de salida (anual)", [(i.label, i.count) for i in preferencias.top_motivos_salida_anual])
+    add_section("Disponibilidad para viajar (anual)", [(i.label, i.count) for i in preferencias.disponibilidad_viajar_anual])
+    add_section("Situación laboral actual (anual)", [(i.label, i.count) for i in preferencias.situacion_laboral_actual_anual])
+
+    # Mensuales
+    add_section("Preferencias registradas por mes", [(f"Mes {i.month}", i.count) for i in preferencias.preferencias_por_mes])
+    add_section("Top disponibilidad de inicio por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in preferencias.top_disponibilidad_inicio_por_mes])
+    add_section("Top rango salarial por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in preferencias.top_rangos_salariales_por_mes])
+    add_section("Top motivo de salida por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in preferencias.top_motivos_salida_por_mes])
+    add_section("Disponibilidad para viajar por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in preferencias.disponibilidad_viajar_por_mes])
+    add_section("Situación laboral actual por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in preferencias.situacion_laboral_actual_por_mes])
+
+    # ───────────────────────── PROCESO ───────────────────────────
+    elements.append(Paragraph("📈 Estadísticas del Proceso de Selección", styles["Heading2"]))
+
+    # Anuales
+    add_section("Top estados de candidatos (anual)", [(i.label, i.count) for i in proceso.top_estados_anual])
+
+    # Mensuales
+    add_section("Candidatos registrados por mes", [(f"Mes {i.month}", i.count) for i in proceso.candidatos_por_mes])
+    add_section("Top estado por mes", [(f"Mes {i.month}: {i.label}", i.count) for i in proceso.top_estados_por_mes])
+
+
+    # Construir y devolver
+    doc.build(elements)
+    return buffer.getvalue()
@@ -45,7 +45,6 @@ def create_educacion(db: Session, educacion_data: EducacionCreate) -> Educacion:
     try:
         db.add(nueva_educacion)
         db.commit()
-        db.refresh(nueva_educacion)
         return nueva_educacion
     except IntegrityError:
         db.rollback()
@@ -131,7 +130,6 @@ def update_educacion(db: Session, id_educacion: int, educacion_data: EducacionUp
         setattr(educacion, key, value)
 
     db.commit()
-    db.refresh(educacion)
     return educacion
 
 
@@ -0,0 +1,100 @@
+"""
+Servicio para ejecutar jobs programados con exclusión a nivel de clúster y
+registrar cada ejecución (duración, filas afectadas, errores).
+"""
+
+import logging
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.bloqueos import bloqueo_asesor
+from app.core.database import SessionLocal
+from app.models.ejecucion_job_model import EjecucionJob
+
+logger = logging.getLogger(__name__)
+
+# Función con la que una tarea informa las filas afectadas que ya confirmó
+RegistrarAvance = Callable[[int], None]
+
+
+def ejecutar_job_registrado(
+    nombre_job: str, tarea: Callable[[Session, RegistrarAvance], int]
+) -> Optional[EjecucionJob]:
+    """
+    Ejecuta un job solo si este proceso obtiene su advisory lock y registra la ejecución.
+
+    Si otro worker ya está ejecutando el mismo job, la llamada no hace nada. Una
+    tarea que confirma por partes informa su avance con la función que recibe; si
+    falla a mitad, la ejecución queda FALLIDO con las filas que ya había confirmado.
+
+    Args:
+        nombre_job (str): Nombre del job (también se usa como nombre del bloqueo).
+        tarea (Callable[[Session, RegistrarAvance], int]): Función que realiza el trabajo
+            y retorna las filas afectadas.
+
+    Returns:
+        Optional[EjecucionJob]: Registro de la ejecución, o None si se omitió por el bloqueo.
+    """
+    with bloqueo_asesor(f"job:{nombre_job}") as adquirido:
+        if not adquirido:
+            logger.info(f"Job '{nombre_job}' omitido: otro proceso lo está ejecutando")
+            return None
+
+        db = SessionLocal()
+        try:
+            ejecucion = EjecucionJob(nombre_job=nombre_job, estado="EN_CURSO", fecha_inicio=datetime.now())
+            db.add(ejecucion)
+            db.commit()
+
+            confirmadas: Optional[int] = None
+
+            def registrar_avance(filas: int) -> None:
+                nonlocal confirmadas
+                confirmadas = filas
+
+            inicio = time.perf_counter()
+            try:
+                ejecucion.filas_afectadas = tarea(db, registrar_avance)
+                ejecucion.estado = "COMPLETADO"
+            except Exception as e:
+                db.rollback()
+                logger.exception(f"Error en el job '{nombre_job}'")
+                ejecucion.estado = "FALLIDO"
+                ejecucion.detalle = str(e)
+                ejecucion.filas_afectadas = confirmadas
+
+            ejecucion.fecha_fin = datetime.now()
+            ejecucion.duracion_ms = int((time.perf_counter() - inicio) * 1000)
+            db.commit()
+            return ejecucion
+        finally:
+            db.close()
+
+
+def obtener_ultima_ejecucion(db: Session, nombre_job: str) -> EjecucionJob:
+    """
+    Retorna la ejecución más reciente de un job.
+
+    Args:
+        db (Session): Sesión de base de datos.
+        nombre_job (str): Nombre del job.
+
+    Returns:
+        EjecucionJob: Última ejecución registrada.
+
+    Raises:
+        HTTPException: 404 si el job no tiene ejecuciones registradas.
+    """
+    ejecucion = (
+        db.query(EjecucionJob)
+        .filter(EjecucionJob.nombre_job == nombre_job)
+        .order_by(EjecucionJob.fecha_inicio.desc(), EjecucionJob.id.desc())
+        .first()
+    )
+    if not ejecucion:
+        raise HTTPException(status_code=404, detail="No hay ejecuciones registradas para este job")
+    return ejecucion
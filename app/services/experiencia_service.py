@@ -30,7 +30,6 @@ def create_experiencia(db: Session, experiencia_data: ExperienciaLaboralCreate):
     try:
         db.add(nueva_experiencia)
         db.commit()
-        db.refresh(nueva_experiencia)
         return nueva_experiencia
     except IntegrityError:
         db.rollback()
@@ -138,8 +137,6 @@ def update_experiencia(
         setattr(experiencia, key, value)
 
     db.commit()
-    db.refresh(experiencia)
-
     return experiencia
 
 
@@ -0,0 +1,155 @@
+"""
+Servicio para las claves de idempotencia de las solicitudes de creación: reserva de
+la clave, registro de la respuesta y purga de las claves expiradas.
+"""
+
+import os
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from sqlalchemy import and_, delete, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.clave_idempotencia_model import ClaveIdempotencia
+
+# Horas durante las que un reintento con la misma clave recibe la respuesta original
+IDEMPOTENCIA_TTL_HORAS = int(os.getenv("IDEMPOTENCIA_TTL_HORAS", "24"))
+
+# Minutos tras los cuales una reserva sin respuesta se considera abandonada (el worker
+# murió sin liberarla) y otra solicitud con la misma clave puede tomarla. Debe superar
+# la duración de la solicitud más lenta (ej. una importación masiva).
+IDEMPOTENCIA_RESERVA_MINUTOS = int(os.getenv("IDEMPOTENCIA_RESERVA_MINUTOS", "15"))
+
+
+def reservar_clave(
+    db: Session, clave: str, ruta: str, hash_solicitud: str
+) -> Tuple[bool, ClaveIdempotencia]:
+    """
+    Registra la clave como "en curso" antes de procesar la solicitud.
+
+    La llave primaria garantiza que solo una de varias solicitudes concurrentes con
+    la misma clave obtiene la reserva. Una clave expirada, o una reserva en curso
+    con más de `IDEMPOTENCIA_RESERVA_MINUTOS` (su solicitud murió sin liberarla), se
+    toma con un UPDATE condicionado, que también gana una sola solicitud.
+
+    Args:
+        db (Session): Sesión de base de datos.
+        clave (str): Valor del encabezado `Idempotency-Key`.
+        ruta (str): Método y ruta de la solicitud.
+        hash_solicitud (str): SHA-256 del cuerpo de la solicitud.
+
+    Returns:
+        Tuple[bool, ClaveIdempotencia]: (True, reserva de esta solicitud) si la clave
+        quedó reservada; si no, (False, registro existente en curso o con la
+        respuesta original). La `fecha_creacion` de la reserva identifica al dueño
+        en `guardar_respuesta` y `liberar_clave`.
+
+    Raises:
+        RuntimeError: Si la clave se purgó una y otra vez entre el INSERT y la lectura.
+    """
+    for _ in range(2):
+        ahora = datetime.now()
+        reserva = ClaveIdempotencia(
+            clave=clave,
+            ruta=ruta,
+            hash_solicitud=hash_solicitud,
+            fecha_creacion=ahora,
+            fecha_expiracion=ahora + timedelta(hours=IDEMPOTENCIA_TTL_HORAS),
+        )
+        try:
+            db.add(reserva)
+            db.commit()
+            return True, reserva
+        except IntegrityError:
+            db.rollback()
+
+        tomada = db.execute(
+            update(ClaveIdempotencia)
+            .where(
+                ClaveIdempotencia.clave == clave,
+                or_(
+                    ClaveIdempotencia.fecha_expiracion <= ahora,
+                    and_(
+                        ClaveIdempotencia.codigo_estado.is_(None),
+                        ClaveIdempotencia.fecha_creacion
+                        < ahora - timedelta(minutes=IDEMPOTENCIA_RESERVA_MINUTOS),
+                    ),
+                ),
+            )
+            .values(
+                ruta=ruta,
+                hash_solicitud=hash_solicitud,
+                codigo_estado=None,
+                tipo_contenido=None,
+                cuerpo_respuesta=None,
+                fecha_creacion=reserva.fecha_creacion,
+                fecha_expiracion=reserva.fecha_expiracion,
+            ),
+            execution_options={"synchronize_session": False},
+        ).rowcount
+        db.commit()
+        if tomada:
+            return True, reserva
+
+        existente = db.get(ClaveIdempotencia, clave)
+        if existente is not None:
+            return False, existente
+        # Se purgó entre el INSERT y la lectura: se vuelve a intentar
+    raise RuntimeError(f"No se pudo reservar la clave de idempotencia '{clave}'")
+
+
+def guardar_respuesta(
+    db: Session,
+    clave: str,
+    fecha_reserva: datetime,
+    codigo_estado: int,
+    tipo_contenido: Optional[str],
+    cuerpo: bytes,
+) -> None:
+    """
+    Guarda la respuesta de la solicitud original para devolverla a los reintentos.
+
+    Solo si la reserva sigue siendo de esta solicitud (`fecha_reserva`): si otra la
+    tomó por vencida, su respuesta no se sobrescribe.
+    """
+    db.execute(
+        update(ClaveIdempotencia)
+        .where(ClaveIdempotencia.clave == clave, ClaveIdempotencia.fecha_creacion == fecha_reserva)
+        .values(codigo_estado=codigo_estado, tipo_contenido=tipo_contenido, cuerpo_respuesta=cuerpo),
+        execution_options={"synchronize_session": False},
+    )
+    db.commit()
+
+
+def liberar_clave(db: Session, clave: str, fecha_reserva: datetime) -> None:
+    """Elimina la reserva en curso de esta solicitud (falló) para que el cliente pueda reintentar."""
+    db.execute(
+        delete(ClaveIdempotencia).where(
+            ClaveIdempotencia.clave == clave,
+            ClaveIdempotencia.fecha_creacion == fecha_reserva,
+            ClaveIdempotencia.codigo_estado.is_(None),
+        ),
+        execution_options={"synchronize_session": False},
+    )
+    db.commit()
+
+
+def eliminar_claves_expiradas(db: Session, ahora: Optional[datetime] = None) -> int:
+    """
+    Elimina las claves de idempotencia expiradas.
+
+    Args:
+        db (Session): Sesión de base de datos.
+        ahora (Optional[datetime]): Fecha de referencia (por defecto, la actual).
+
+    Returns:
+        int: Claves eliminadas.
+    """
+    ahora = ahora or datetime.now()
+    resultado = db.execute(
+        delete(ClaveIdempotencia).where(ClaveIdempotencia.fecha_expiracion <= ahora),
+        execution_options={"synchronize_session": False},
+    )
+    db.commit()
+    return resultado.rowcount
@@ -0,0 +1,625 @@
+"""
+Servicio de importación masiva de candidatos desde archivos CSV o Excel (XLSX).
+
+El archivo se lee en streaming y se carga por lotes en las tablas de staging
+(`COPY` en PostgreSQL). Los nombres de catálogo se resuelven a IDs y las filas se
+validan con sentencias en bloque sobre staging; las filas válidas se insertan en
+`candidatos` y en sus tablas hijas con un `INSERT ... SELECT` por tabla, todo en
+una sola transacción.
+
+Columnas reconocidas (la cabecera no distingue mayúsculas, tildes ni espacios):
+
+- Candidato: nombre_completo, correo_electronico, cc, fecha_nacimiento, telefono,
+  departamento (opcional, desambigua la ciudad), ciudad, cargo, descripcion_perfil,
+  trabaja_actualmente_joyco, ha_trabajado_joyco, tiene_referido, nombre_referido,
+  acepta_politica_datos.
+- Educación: nivel_educacion, titulo, institucion, anio_graduacion, nivel_ingles.
+- Experiencia: rango_experiencia, ultima_empresa, ultimo_cargo, funciones,
+  fecha_inicio, fecha_fin.
+- Preferencias: disponibilidad_viajar, disponibilidad_inicio, rango_salarial,
+  trabaja_actualmente, motivo_salida.
+- Conocimientos: habilidades_blandas, habilidades_tecnicas, herramientas
+  (varios nombres separados por ';').
+"""
+
+import csv
+import io
+import logging
+import os
+import time
+import unicodedata
+import uuid
+from datetime import date, datetime
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import HTTPException
+from pydantic import validate_email
+from sqlalchemy import and_, case, delete, exists, func, insert, literal, or_, select, true, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.candidato_model import Candidato
+from app.models.catalogs.cargo_ofrecido import CargoOfrecido
+from app.models.catalogs.ciudad import Ciudad, Departamento
+from app.models.catalogs.instituciones import InstitucionAcademica
+from app.models.catalogs.nivel_educacion import NivelEducacion
+from app.models.catalogs.nivel_ingles import NivelIngles
+from app.models.catalogs.rango_experiencia import RangoExperiencia
+from app.models.catalogs.titulo import TituloObtenido
+from app.models.conocimientos_model import (
+    CandidatoConocimiento,
+    HabilidadBlanda,
+    HabilidadTecnica,
+    Herramienta,
+)
+from app.models.educacion_model import Educacion
+from app.models.experiencia_model import ExperienciaLaboral
+from app.models.importacion_model import StagingCandidato, StagingConocimiento
+from app.models.preferencias import (
+    Disponibilidad,
+    MotivoSalida,
+    PreferenciaDisponibilidad,
+    RangoSalarial,
+)
+from app.schemas.candidato_schema import CandidatoCreate
+from app.schemas.importacion_schema import FilaInvalidaImportacion, ImportacionCandidatosResponse
+from app.services.candidato_service import conflicto_unicidad_candidato
+from app.utils.carga_masiva import copiar_filas
+
+logger = logging.getLogger(__name__)
+
+# Filas que se acumulan en memoria antes de enviarlas a staging
+TAMANO_LOTE_IMPORTACION = int(os.getenv("TAMANO_LOTE_IMPORTACION", "5000"))
+
+# Máximo de filas inválidas detalladas en la respuesta
+LIMITE_REPORTE_IMPORTACION = int(os.getenv("LIMITE_REPORTE_IMPORTACION", "1000"))
+
+EXTENSIONES_IMPORTACION = (".csv", ".xlsx")
+
+SEPARADOR_CONOCIMIENTOS = ";"
+
+SEPARADOR_ERRORES = "; "
+
+
+# ──────────────── COLUMNAS DEL ARCHIVO ────────────────
+
+COLUMNAS_TEXTO = (
+    "nombre_completo", "correo_electronico", "cc", "telefono", "departamento", "ciudad",
+    "cargo", "descripcion_perfil", "nombre_referido", "nivel_educacion", "titulo",
+    "institucion", "nivel_ingles", "rango_experiencia", "ultima_empresa", "ultimo_cargo",
+    "funciones", "disponibilidad_inicio", "rango_salarial", "motivo_salida",
+)
+COLUMNAS_FECHA = ("fecha_nacimiento", "fecha_inicio", "fecha_fin")
+COLUMNAS_BOOLEANAS = (
+    "trabaja_actualmente_joyco", "ha_trabajado_joyco", "tiene_referido",
+    "acepta_politica_datos", "disponibilidad_viajar", "trabaja_actualmente",
+)
+COLUMNAS_ENTERAS = ("anio_graduacion",)
+
+# Columna del archivo → tipo de conocimiento
+COLUMNAS_CONOCIMIENTOS = {
+    "habilidades_blandas": "blanda",
+    "habilidades_tecnicas": "tecnica",
+    "herramientas": "herramienta",
+}
+
+COLUMNAS_OBLIGATORIAS = (
+    "nombre_completo", "correo_electronico", "cc", "fecha_nacimiento", "telefono",
+    "ciudad", "cargo",
+)
+
+# Validaciones del formulario público que también aplican a la importación
+VALIDADORES_CANDIDATO = {
+    "nombre_completo": CandidatoCreate.validar_nombre_completo,
+    "cc": CandidatoCreate.validar_cc,
+    "telefono": CandidatoCreate.validar_telefono,
+    "fecha_nacimiento": CandidatoCreate.validar_fecha_nacimiento,
+    "descripcion_perfil": CandidatoCreate.validar_descripcion_perfil,
+    "nombre_referido": CandidatoCreate.validar_nombre_referido,
+}
+
+FORMATOS_FECHA = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y")
+VALORES_VERDADEROS = {"si", "sí", "s", "true", "verdadero", "1", "x", "yes"}
+VALORES_FALSOS = {"no", "n", "false", "falso", "0"}
+
+
+# ──────────────── LECTURA DEL ARCHIVO ────────────────
+
+def normalizar_cabecera(valor) -> str:
+    """Convierte un encabezado a snake_case sin tildes (ej. 'Correo electrónico' → 'correo_electronico')."""
+    texto = unicodedata.normalize("NFKD", str(valor or "")).encode("ascii", "ignore").decode()
+    return "_".join(texto.strip().lower().split())
+
+
+def _filas_csv(archivo: BinaryIO) -> Iterator[tuple]:
+    texto = io.TextIOWrapper(archivo, encoding="utf-8-sig", newline="")
+    muestra = texto.read(4096)
+    texto.seek(0)
+    try:
+        dialecto = csv.Sniffer().sniff(muestra, delimiters=",;\t")
+    except csv.Error:
+        dialecto = csv.excel
+    yield from csv.reader(texto, dialecto)
+
+
+def _filas_xlsx(archivo: BinaryIO) -> Iterator[tuple]:
+    from openpyxl import load_workbook
+
+    libro = load_workbook(archivo, read_only=True, data_only=True)
+    try:
+        yield from libro.active.iter_rows(values_only=True)
+    finally:
+        libro.close()
+
+
+def leer_filas(archivo: BinaryIO, nombre_archivo: str) -> Iterator[Tuple[int, Dict[str, object]]]:
+    """
+    Lee un CSV o XLSX fila por fila sin cargarlo completo en memoria.
+
+    Yields:
+        Tuple[int, Dict[str, object]]: Número de fila en el archivo y valores por
+        columna normalizada. Se omiten las filas vacías.
+
+    Raises:
+        HTTPException: 400 si la extensión no es soportada o faltan columnas obligatorias.
+    """
+    extension = os.path.splitext(nombre_archivo or "")[1].lower()
+    if extension not in EXTENSIONES_IMPORTACION:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Formato no soportado. Use uno de: {', '.join(EXTENSIONES_IMPORTACION)}",
+        )
+    filas = _filas_csv(archivo) if extension == ".csv" else _filas_xlsx(archivo)
+
+    cabecera = [normalizar_cabecera(c) for c in next(filas, ())]
+    faltantes = [c for c in COLUMNAS_OBLIGATORIAS if c not in cabecera]
+    if faltantes:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Faltan columnas obligatorias en el archivo: {', '.join(faltantes)}",
+        )
+
+    for numero, valores in enumerate(filas, start=2):
+        if not any(v not in (None, "") for v in valores):
+            continue
+        yield numero, dict(zip(cabecera, valores))
+
+
+# ──────────────── CONVERSIÓN POR FILA ────────────────
+
+def _texto(valor) -> Optional[str]:
+    if valor is None:
+        return None
+    if isinstance(valor, float) and valor.is_integer():
+        valor = int(valor)  # Excel guarda cédulas y teléfonos como números
+    texto = str(valor).strip()
+    return texto or None
+
+
+def _fecha(valor) -> Optional[date]:
+    if isinstance(valor, datetime):
+        return valor.date()
+    if isinstance(valor, date):
+        return valor
+    texto = _texto(valor)
+    if texto is None:
+        return None
+    for formato in FORMATOS_FECHA:
+        try:
+            return datetime.strptime(texto, formato).date()
+        except ValueError:
+            continue
+    raise ValueError("fecha inválida")
+
+
+def _booleano(valor) -> Optional[bool]:
+    if isinstance(valor, bool):
+        return valor
+    texto = _texto(valor)
+    if texto is None:
+        return None
+    texto = texto.lower()
+    if texto in VALORES_VERDADEROS:
+        return True
+    if texto in VALORES_FALSOS:
+        return False
+    raise ValueError("valor booleano inválido")
+
+
+def _entero(valor) -> Optional[int]:
+    texto = _texto(valor)
+    if texto is None:
+        return None
+    try:
+        return int(texto)
+    except ValueError:
+        raise ValueError("número inválido")
+
+
+def convertir_fila(
+    id_importacion: str, numero: int, crudo: Dict[str, object]
+) -> Tuple[Dict[str, object], List[Dict[str, object]]]:
+    """
+    Convierte una fila del archivo a una fila de staging y sus conocimientos.
+
+    Aquí solo se validan tipos y formatos (una fila a la vez); los catálogos y los
+    duplicados se validan después en bloque sobre staging.
+
+    Returns:
+        Tuple: Fila para `staging_candidatos` y filas para `staging_conocimientos`.
+    """
+    errores = []
+    fila = {"id_importacion": id_importacion, "fila": numero}
+
+    for columna in COLUMNAS_TEXTO:
+        fila[columna] = _texto(crudo.get(columna))
+    for columnas, convertir in (
+        (COLUMNAS_FECHA, _fecha), (COLUMNAS_BOOLEANAS, _booleano), (COLUMNAS_ENTERAS, _entero)
+    ):
+        for columna in columnas:
+            try:
+                fila[columna] = convertir(crudo.get(columna))
+            except ValueError as e:
+                fila[columna] = None
+                errores.append(f"{columna}: {e}")
+
+    for columna in COLUMNAS_BOOLEANAS:
+        if fila[columna] is None:
+            fila[columna] = False
+
+    for columna in COLUMNAS_OBLIGATORIAS:
+        if fila[columna] is None and not any(e.startswith(f"{columna}:") for e in errores):
+            errores.append(f"{columna}: es obligatorio")
+
+    for columna, validar in VALIDADORES_CANDIDATO.items():
+        if fila[columna] is not None:
+            try:
+                validar(fila[columna])
+            except ValueError as e:
+                errores.append(f"{columna}: {e}")
+
+    if fila["correo_electronico"]:
+        try:
+            fila["correo_electronico"] = validate_email(fila["correo_electronico"])[1]
+        except ValueError:
+            errores.append("correo_electronico: correo inválido")
+
+    if fila["nivel_educacion"] and not fila["nivel_ingles"]:
+        errores.append("nivel_ingles: es obligatorio cuando se informa la educación")
+    if any(fila[c] for c in ("rango_experiencia", "ultima_empresa", "ultimo_cargo", "fecha_inicio")):
+        for columna in ("rango_experiencia", "ultima_empresa", "ultimo_cargo", "fecha_inicio"):
+            if not fila[columna]:
+                errores.append(f"{columna}: es obligatorio cuando se informa la experiencia")
+    if bool(fila["disponibilidad_inicio"]) != bool(fila["rango_salarial"]):
+        errores.append("disponibilidad_inicio y rango_salarial deben informarse juntos")
+
+    fila["errores"] = SEPARADOR_ERRORES.join(errores) or None
+
+    conocimientos = []
+    for columna, tipo in COLUMNAS_CONOCIMIENTOS.items():
+        nombres = _texto(crudo.get(columna)) or ""
+        unicos = dict.fromkeys(n.strip() for n in nombres.split(SEPARADOR_CONOCIMIENTOS) if n.strip())
+        conocimientos += [
+            {"id_importacion": id_importacion, "fila": numero, "tipo_conocimiento": tipo, "nombre": n}
+            for n in unicos
+        ]
+    return fila, conocimientos
+
+
+def cargar_staging(db: Session, id_importacion: str, archivo: BinaryIO, nombre_archivo: str) -> int:
+    """
+    Carga el archivo en las tablas de staging por lotes de `TAMANO_LOTE_IMPORTACION` filas.
+
+    Returns:
+        int: Filas de datos leídas.
+    """
+    conexion = db.connection()
+    total = 0
+    filas, conocimientos = [], []
+
+    def _enviar_lote():
+        copiar_filas(conexion, StagingCandidato.__table__, filas)
+        copiar_filas(conexion, StagingConocimiento.__table__, conocimientos)
+        filas.clear()
+        conocimientos.clear()
+
+    for numero, crudo in leer_filas(archivo, nombre_archivo):
+        fila, conocimientos_fila = convertir_fila(id_importacion, numero, crudo)
+        filas.append(fila)
+        conocimientos.extend(conocimientos_fila)
+        total += 1
+        if len(filas) >= TAMANO_LOTE_IMPORTACION:
+            _enviar_lote()
+    _enviar_lote()
+    return total
+
+
+# ──────────────── RESOLUCIÓN Y VALIDACIÓN EN BLOQUE ────────────────
+
+def _actualizar_staging(db: Session, modelo, id_importacion: str, valores: dict, *condiciones) -> None:
+    db.execute(
+        update(modelo)
+        .where(modelo.id_importacion == id_importacion, *condiciones)
+        .values(valores),
+        execution_options={"synchronize_session": False},
+    )
+
+
+def _id_por_nombre(columna_id, columna_nombre, nombre, *condiciones):
+    """Subconsulta correlacionada: ID del catálogo cuyo nombre coincide sin distinguir mayúsculas."""
+    return (
+        select(func.min(columna_id))
+        .where(func.lower(columna_nombre) == func.lower(nombre), *condiciones)
+        .scalar_subquery()
+    )
+
+
+def resolver_catalogos(db: Session, id_importacion: str) -> None:
+    """Resuelve los nombres de catálogo de staging a sus IDs con una sentencia por catálogo."""
+    S = StagingCandidato
+
+    id_ciudad = (
+        select(func.min(Ciudad.id_ciudad))
+        .join(Departamento, Departamento.id_departamento == Ciudad.id_departamento)
+        .where(
+            func.lower(Ciudad.nombre_ciudad) == func.lower(S.ciudad),
+            or_(
+                S.departamento.is_(None),
+                func.lower(func.trim(Departamento.nombre_departamento)) == func.lower(S.departamento),
+            ),
+        )
+        .scalar_subquery()
+    )
+
+    resoluciones = [
+        (S.id_ciudad, S.ciudad, id_ciudad),
+        (S.id_cargo, S.cargo, _id_por_nombre(CargoOfrecido.id_cargo, CargoOfrecido.nombre_cargo, S.cargo)),
+        (S.id_nivel_educacion, S.nivel_educacion, _id_por_nombre(
+            NivelEducacion.id_nivel_educacion, NivelEducacion.descripcion_nivel, S.nivel_educacion)),
+        (S.id_nivel_ingles, S.nivel_ingles, _id_por_nombre(
+            NivelIngles.id_nivel_ingles, NivelIngles.nivel, S.nivel_ingles)),
+        (S.id_institucion, S.institucion, _id_por_nombre(
+            InstitucionAcademica.id_institucion, InstitucionAcademica.nombre_institucion, S.institucion)),
+        (S.id_rango_experiencia, S.rango_experiencia, _id_por_nombre(
+            RangoExperiencia.id_rango_experiencia, RangoExperiencia.descripcion_rango, S.rango_experiencia)),
+        (S.id_disponibilidad_inicio, S.disponibilidad_inicio, _id_por_nombre(
+            Disponibilidad.id_disponibilidad, Disponibilidad.descripcion_disponibilidad, S.disponibilidad_inicio)),
+        (S.id_rango_salarial, S.rango_salarial, _id_por_nombre(
+            RangoSalarial.id_rango_salarial, RangoSalarial.descripcion_rango, S.rango_salarial)),
+        (S.id_motivo_salida, S.motivo_salida, _id_por_nombre(
+            MotivoSalida.id_motivo_salida, MotivoSalida.descripcion_motivo, S.motivo_salida)),
+    ]
+    for destino, nombre, subconsulta in resoluciones:
+        _actualizar_staging(db, S, id_importacion, {destino: subconsulta}, nombre.isnot(None))
+
+    # El título depende del nivel educativo ya resuelto
+    id_titulo = _id_por_nombre(
+        TituloObtenido.id_titulo, TituloObtenido.nombre_titulo, S.titulo,
+        or_(S.id_nivel_educacion.is_(None), TituloObtenido.id_nivel_educacion == S.id_nivel_educacion),
+    )
+    _actualizar_staging(db, S, id_importacion, {S.id_titulo: id_titulo}, S.titulo.isnot(None))
+
+    K = StagingConocimiento
+    for tipo, destino, columna_id, columna_nombre in (
+        ("blanda", K.id_habilidad_blanda, HabilidadBlanda.id_habilidad_blanda, HabilidadBlanda.nombre_habilidad_blanda),
+        ("tecnica", K.id_habilidad_tecnica, HabilidadTecnica.id_habilidad_tecnica, HabilidadTecnica.nombre_habilidad_tecnica),
+        ("herramienta", K.id_herramienta, Herramienta.id_herramienta, Herramienta.nombre_herramienta),
+    ):
+        _actualizar_staging(
+            db, K, id_importacion, {destino: _id_por_nombre(columna_id, columna_nombre, K.nombre)},
+            K.tipo_conocimiento == tipo,
+        )
+
+
+def _marcar_error(db: Session, id_importacion: str, mensaje, *condiciones) -> None:
+    """Agrega `mensaje` a los errores de las filas de staging que cumplen las condiciones."""
+    S = StagingCandidato
+    errores = case(
+        (S.errores.is_(None), mensaje),
+        else_=S.errores + SEPARADOR_ERRORES + mensaje,
+    )
+    _actualizar_staging(db, S, id_importacion, {S.errores: errores}, *condiciones)
+
+
+def validar_staging(db: Session, id_importacion: str) -> None:
+    """Marca las filas con catálogos inexistentes, conocimientos desconocidos o duplicados."""
+    S = StagingCandidato
+
+    for etiqueta, nombre, id_resuelto in (
+        ("ciudad", S.ciudad, S.id_ciudad),
+        ("cargo", S.cargo, S.id_cargo),
+        ("nivel_educacion", S.nivel_educacion, S.id_nivel_educacion),
+        ("titulo", S.titulo, S.id_titulo),
+        ("institucion", S.institucion, S.id_institucion),
+        ("nivel_ingles", S.nivel_ingles, S.id_nivel_ingles),
+        ("rango_experiencia", S.rango_experiencia, S.id_rango_experiencia),
+        ("disponibilidad_inicio", S.disponibilidad_inicio, S.id_disponibilidad_inicio),
+        ("rango_salarial", S.rango_salarial, S.id_rango_salarial),
+        ("motivo_salida", S.motivo_salida, S.id_motivo_salida),
+    ):
+        _marcar_error(
+            db, id_importacion, literal(f"{etiqueta}: no existe en el catálogo '") + nombre + "'",
+            nombre.isnot(None), id_resuelto.is_(None),
+        )
+
+    K = StagingConocimiento
+    sin_resolver = and_(
+        K.id_importacion == S.id_importacion,
+        K.fila == S.fila,
+        K.id_habilidad_blanda.is_(None),
+        K.id_habilidad_tecnica.is_(None),
+        K.id_herramienta.is_(None),
+    )
+    _marcar_error(
+        db, id_importacion,
+        literal("conocimiento no existe en el catálogo: '")
+        + select(func.min(K.nombre)).where(sin_resolver).scalar_subquery() + "'",
+        exists().where(sin_resolver),
+    )
+
+    # Repetidas dentro del archivo: se conserva la primera aparición (una ordenación por columna)
+    for columna, mensaje in (("cc", "cc: repetida en el archivo"),
+                             ("correo_electronico", "correo_electronico: repetido en el archivo")):
+        orden = (
+            select(
+                S.id,
+                func.row_number()
+                .over(partition_by=getattr(S, columna), order_by=S.fila)
+                .label("aparicion"),
+            )
+            .where(S.id_importacion == id_importacion, getattr(S, columna).isnot(None))
+            .subquery()
+        )
+        _marcar_error(
+            db, id_importacion, mensaje,
+            S.id.in_(select(orden.c.id).where(orden.c.aparicion > 1)),
+        )
+
+    for columna, mensaje in (("cc", "cc: la cédula ya está registrada"),
+                             ("correo_electronico", "correo_electronico: el correo ya está registrado")):
+        _marcar_error(
+            db, id_importacion, mensaje,
+            exists().where(getattr(Candidato, columna) == getattr(S, columna)),
+        )
+
+
+# ──────────────── FUSIÓN EN LAS TABLAS FINALES ────────────────
+
+def fusionar_staging(db: Session, id_importacion: str) -> int:
+    """
+    Inserta las filas válidas de staging en `candidatos` y sus tablas hijas.
+
+    Returns:
+        int: Candidatos creados.
+    """
+    S = StagingCandidato
+    validas = and_(S.id_importacion == id_importacion, S.errores.is_(None))
+
+    # Los candidatos importados se marcan completos para que el job de limpieza no los borre
+    columnas_candidato = [
+        "nombre_completo", "correo_electronico", "cc", "fecha_nacimiento", "telefono",
+        "id_ciudad", "descripcion_perfil", "id_cargo", "trabaja_actualmente_joyco",
+        "ha_trabajado_joyco", "tiene_referido", "nombre_referido", "acepta_politica_datos",
+    ]
+    resultado = db.execute(
+        insert(Candidato).from_select(
+            [*columnas_candidato, "estado", "formulario_completo"],
+            select(*(getattr(S, c) for c in columnas_candidato), literal("EN_PROCESO"), true())
+            .where(validas)
+            .order_by(S.fila),
+        )
+    )
+    importados = resultado.rowcount
+
+    # La cédula es única: con ella se enlaza cada fila de staging con su candidato
+    _actualizar_staging(
+        db, S, id_importacion,
+        {S.id_candidato: select(Candidato.id_candidato).where(Candidato.cc == S.cc).scalar_subquery()},
+        S.errores.is_(None),
+    )
+    con_candidato = and_(validas, S.id_candidato.isnot(None))
+
+    db.execute(insert(Educacion).from_select(
+        ["id_candidato", "id_nivel_educacion", "id_titulo", "id_institucion", "anio_graduacion", "id_nivel_ingles"],
+        select(S.id_candidato, S.id_nivel_educacion, S.id_titulo, S.id_institucion, S.anio_graduacion, S.id_nivel_ingles)
+        .where(con_candidato, S.id_nivel_educacion.isnot(None)),
+    ))
+    db.execute(insert(ExperienciaLaboral).from_select(
+        ["id_candidato", "id_rango_experiencia", "ultima_empresa", "ultimo_cargo", "funciones", "fecha_inicio", "fecha_fin"],
+        select(S.id_candidato, S.id_rango_experiencia, S.ultima_empresa, S.ultimo_cargo, S.funciones, S.fecha_inicio, S.fecha_fin)
+        .where(con_candidato, S.ultima_empresa.isnot(None)),
+    ))
+    db.execute(insert(PreferenciaDisponibilidad).from_select(
+        ["id_candidato", "disponibilidad_viajar", "id_disponibilidad_inicio", "id_rango_salarial", "trabaja_actualmente", "id_motivo_salida"],
+        select(S.id_candidato, S.disponibilidad_viajar, S.id_disponibilidad_inicio, S.id_rango_salarial, S.trabaja_actualmente, S.id_motivo_salida)
+        .where(con_candidato, S.id_disponibilidad_inicio.isnot(None)),
+    ))
+
+    K = StagingConocimiento
+    db.execute(insert(CandidatoConocimiento).from_select(
+        ["id_candidato", "tipo_conocimiento", "id_habilidad_blanda", "id_habilidad_tecnica", "id_herramienta"],
+        select(S.id_candidato, K.tipo_conocimiento, K.id_habilidad_blanda, K.id_habilidad_tecnica, K.id_herramienta)
+        .join(S, and_(S.id_importacion == K.id_importacion, S.fila == K.fila))
+        .where(con_candidato),
+    ))
+    return importados
+
+
+def _reporte_invalidas(db: Session, id_importacion: str) -> Tuple[int, List[FilaInvalidaImportacion]]:
+    S = StagingCandidato
+    invalidas = and_(S.id_importacion == id_importacion, S.errores.isnot(None))
+    total = db.scalar(select(func.count()).select_from(S).where(invalidas))
+    detalle = db.execute(
+        select(S.fila, S.errores).where(invalidas).order_by(S.fila).limit(LIMITE_REPORTE_IMPORTACION)
+    ).all()
+    return total, [
+        FilaInvalidaImportacion(fila=fila, errores=errores.split(SEPARADOR_ERRORES))
+        for fila, errores in detalle
+    ]
+
+
+# ──────────────── IMPORTACIÓN COMPLETA ────────────────
+
+def importar_candidatos(db: Session, archivo: BinaryIO, nombre_archivo: str) -> ImportacionCandidatosResponse:
+    """
+    Importa candidatos desde un archivo CSV o XLSX.
+
+    Las filas inválidas no detienen la importación: se reportan y el resto se inserta.
+    Todo ocurre en una transacción; las filas de staging se eliminan al terminar.
+
+    Args:
+        db (Session): Sesión de base de datos.
+        archivo (BinaryIO): Contenido del archivo.
+        nombre_archivo (str): Nombre del archivo (define el formato por su extensión).
+
+    Returns:
+        ImportacionCandidatosResponse: Totales y detalle de las filas rechazadas.
+
+    Raises:
+        HTTPException:
+            - 400 si el formato no es soportado, faltan columnas o el archivo no tiene filas.
+            - 409 si otro proceso registró la misma cédula o correo durante la importación.
+    """
+    inicio = time.perf_counter()
+    id_importacion = uuid.uuid4().hex
+
+    try:
+        total_filas = cargar_staging(db, id_importacion, archivo, nombre_archivo)
+        if not total_filas:
+            raise HTTPException(status_code=400, detail="El archivo no contiene filas de datos")
+
+        resolver_catalogos(db, id_importacion)
+        validar_staging(db, id_importacion)
+        importados = fusionar_staging(db, id_importacion)
+        invalidas, filas_invalidas = _reporte_invalidas(db, id_importacion)
+
+        for modelo in (StagingConocimiento, StagingCandidato):
+            db.execute(
+                delete(modelo).where(modelo.id_importacion == id_importacion),
+                execution_options={"synchronize_session": False},
+            )
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        conflicto = conflicto_unicidad_candidato(e)
+        if conflicto:
+            raise conflicto
+        logger.error(f"Error de integridad en la importación {id_importacion}: {e}")
+        raise HTTPException(status_code=500, detail="Error al importar los candidatos")
+    except Exception:
+        db.rollback()
+        raise
+
+    segundos = round(time.perf_counter() - inicio, 3)
+    logger.info(
+        f"Importación {id_importacion}: {importados} candidatos creados, "
+        f"{invalidas} filas inválidas de {total_filas} en {segundos}s"
+    )
+    return ImportacionCandidatosResponse(
+        id_importacion=id_importacion,
+        total_filas=total_filas,
+        importados=importados,
+        invalidas=invalidas,
+        filas_invalidas=filas_invalidas,
+        segundos=segundos,
+    )
@@ -0,0 +1,140 @@
+"""
+Servicio para registrar la postulación completa de un candidato (datos personales,
+educación, experiencia, conocimientos y preferencias) en una sola transacción.
+"""
+
+import logging
+
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from fastapi import HTTPException
+
+from app.models.candidato_model import Candidato
+from app.models.educacion_model import Educacion
+from app.models.experiencia_model import ExperienciaLaboral
+from app.models.conocimientos_model import CandidatoConocimiento
+from app.models.preferencias import (
+    Disponibilidad,
+    MotivoSalida,
+    PreferenciaDisponibilidad,
+    RangoSalarial,
+)
+from app.models.catalogs.ciudad import Ciudad
+from app.models.catalogs.cargo_ofrecido import CargoOfrecido
+from app.models.catalogs.centro_costos import CentroCostos
+from app.models.catalogs.nivel_educacion import NivelEducacion
+from app.models.catalogs.titulo import TituloObtenido
+from app.models.catalogs.instituciones import InstitucionAcademica
+from app.models.catalogs.nivel_ingles import NivelIngles
+from app.models.catalogs.rango_experiencia import RangoExperiencia
+from app.schemas.postulacion_schema import PostulacionCreate, PostulacionResponse
+from app.services.candidato_service import conflicto_unicidad_candidato
+from app.services.conocimientos_candidato_service import referencias_conocimientos
+from app.utils.validacion_catalogos import validar_referencias_catalogos
+
+logger = logging.getLogger(__name__)
+
+
+def _validar_postulacion(db: Session, postulacion: PostulacionCreate) -> None:
+    """
+    Valida la postulación antes de escribir: catálogos en bloque y fechas.
+    La unicidad de correo y cédula la garantiza la base de datos al insertar.
+
+    Raises:
+        HTTPException:
+            - 400 si el año de graduación es anterior al de nacimiento o si un
+              conocimiento no es coherente con su tipo.
+            - 422 si algún ID de catálogo no existe.
+    """
+    candidato = postulacion.candidato
+    educacion = postulacion.educacion
+    experiencia = postulacion.experiencia
+    preferencias = postulacion.preferencias
+
+    referencias = [
+        ("id_ciudad", Ciudad.id_ciudad, [candidato.id_ciudad]),
+        ("id_cargo", CargoOfrecido.id_cargo, [candidato.id_cargo]),
+        ("id_centro_costos", CentroCostos.id_centro_costos, [candidato.id_centro_costos]),
+        ("id_motivo_salida", MotivoSalida.id_motivo_salida,
+         [candidato.id_motivo_salida, preferencias.id_motivo_salida]),
+        ("id_nivel_educacion", NivelEducacion.id_nivel_educacion, [educacion.id_nivel_educacion]),
+        ("id_titulo", TituloObtenido.id_titulo, [educacion.id_titulo]),
+        ("id_institucion", InstitucionAcademica.id_institucion, [educacion.id_institucion]),
+        ("id_nivel_ingles", NivelIngles.id_nivel_ingles, [educacion.id_nivel_ingles]),
+        ("id_rango_experiencia", RangoExperiencia.id_rango_experiencia,
+         [experiencia.id_rango_experiencia if experiencia else None]),
+        ("id_disponibilidad_inicio", Disponibilidad.id_disponibilidad, [preferencias.id_disponibilidad_inicio]),
+        ("id_rango_salarial", RangoSalarial.id_rango_salarial, [preferencias.id_rango_salarial]),
+    ]
+    referencias += referencias_conocimientos(postulacion.conocimientos)
+    validar_referencias_catalogos(db, referencias)
+
+    if educacion.anio_graduacion and educacion.anio_graduacion < candidato.fecha_nacimiento.year:
+        raise HTTPException(
+            status_code=400,
+            detail=f"El año de graduación ({educacion.anio_graduacion}) no puede ser anterior al año de nacimiento ({candidato.fecha_nacimiento.year})."
+        )
+
+
+def crear_postulacion(db: Session, postulacion: PostulacionCreate) -> PostulacionResponse:
+    """
+    Registra la postulación completa de un candidato en una sola transacción.
+
+    Se valida todo antes de escribir; luego se inserta el candidato (ya marcado como
+    formulario completo) y, con su ID, todos los registros hijos en un único flush.
+    Si algo falla no queda ningún registro parcial.
+
+    Args:
+        db (Session): Sesión de base de datos.
+        postulacion (PostulacionCreate): Formulario completo.
+
+    Returns:
+        PostulacionResponse: IDs de todos los registros creados.
+
+    Raises:
+        HTTPException:
+            - 400 / 422 si la validación falla (ver `_validar_postulacion`).
+            - 409 si el correo o la cédula ya están registrados.
+            - 500 si ocurre un error al guardar en la base de datos.
+    """
+    _validar_postulacion(db, postulacion)
+
+    candidato = Candidato(**postulacion.candidato.model_dump(), formulario_completo=True)
+    try:
+        db.add(candidato)
+        db.flush()  # Obtiene el ID del candidato para los registros hijos
+
+        id_candidato = candidato.id_candidato
+        educacion = Educacion(**postulacion.educacion.model_dump(), id_candidato=id_candidato)
+        experiencia = (
+            ExperienciaLaboral(**postulacion.experiencia.model_dump(), id_candidato=id_candidato)
+            if postulacion.experiencia else None
+        )
+        conocimientos = [
+            CandidatoConocimiento(**c.model_dump(), id_candidato=id_candidato)
+            for c in postulacion.conocimientos
+        ]
+        preferencia = PreferenciaDisponibilidad(**postulacion.preferencias.model_dump(), id_candidato=id_candidato)
+
+        db.add_all([educacion, *([experiencia] if experiencia else []), *conocimientos, preferencia])
+        db.flush()  # Un INSERT (multi-fila) por tabla hija
+
+        respuesta = PostulacionResponse(
+            id_candidato=id_candidato,
+            id_educacion=educacion.id_educacion,
+            id_experiencia=experiencia.id_experiencia if experiencia else None,
+            ids_conocimientos=[c.id_conocimiento for c in conocimientos],
+            id_preferencia=preferencia.id_preferencia,
+            formulario_completo=True,
+        )
+        db.commit()
+        return respuesta
+    except IntegrityError as e:
+        db.rollback()
+        conflicto = conflicto_unicidad_candidato(e)
+        if conflicto:
+            raise conflicto
+        logger.error(f"Error de integridad al registrar la postulación: {e}")
+        raise HTTPException(
+            status_code=500, detail="Error al registrar la postulación en la base de datos"
+        )
@@ -39,7 +39,6 @@ def crear_preferencia(db: Session, preferencia_data: PreferenciaDisponibilidadCr
     nueva_preferencia = PreferenciaDisponibilidad(**preferencia_data.dict())
     db.add(nueva_preferencia)
     db.commit()
-    db.refresh(nueva_preferencia)
     return nueva_preferencia
 
 
@@ -63,7 +62,6 @@ def actualizar_preferencia(db: Session, id_candidato: int, preferencia_data: Pre
         setattr(preferencia, key, value)
 
     db.commit()
-    db.refresh(preferencia)
     return preferencia
 
 
@@ -1,9 +1,10 @@
 from typing import Optional
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func, extract, desc
+from sqlalchemy import delete, or_, func, extract, desc
 from app.models.solicitud_eliminacion_model import SolicitudEliminacion
 from app.schemas.candidato_schema import EliminacionCandidatosResponse
+from app.utils.lotes import condicion_ids, en_lotes, ids_unicos
 from app.schemas.solicitud_eliminacion_schema import (
     ConteoSolicitudesEliminacion,
     SolicitudEliminacionCreate,
@@ -91,7 +92,6 @@ def crear_solicitud_eliminacion(
     nueva_solicitud = SolicitudEliminacion(**data.model_dump())
     db.add(nueva_solicitud)
     db.commit()
-    db.refresh(nueva_solicitud)
     return nueva_solicitud
 
 
@@ -120,7 +120,6 @@ def update_solicitud_eliminacion(
 
     try:
         db.commit()
-        db.refresh(solicitud)
         return solicitud
     except Exception:
         db.rollback()
@@ -156,16 +155,28 @@ def eliminar_solicitudes_por_lote(
     if not payload.ids:
         raise HTTPException(status_code=400, detail="La lista de solicitudes está vacía.")
 
-    eliminados = []
-    for id_solicitud in payload.ids:
-        solicitud = db.query(SolicitudEliminacion).filter(SolicitudEliminacion.id == id_solicitud).first()
-        if solicitud:
-            db.delete(solicitud)
-            eliminados.append(id_solicitud)
+    # DELETE ... RETURNING por lotes, en una sola transacción
+    ids = ids_unicos(payload.ids)
+    dialecto = db.get_bind().dialect.name
+    borrados = set()
+    try:
+        for lote in en_lotes(ids):
+            resultado = db.execute(
+                delete(SolicitudEliminacion)
+                .where(condicion_ids(SolicitudEliminacion.id, lote, dialecto))
+                .returning(SolicitudEliminacion.id),
+                execution_options={"synchronize_session": False},
+            )
+            borrados.update(resultado.scalars())
+    except Exception:
+        db.rollback()
+        raise HTTPException(status_code=500, detail="Error al eliminar las solicitudes.")
 
-    if not eliminados:
+    if not borrados:
+        db.rollback()
         raise HTTPException(status_code=404, detail="No se encontró ninguna solicitud válida para eliminar.")
 
+    eliminados = [id_solicitud for id_solicitud in ids if id_solicitud in borrados]
     try:
         db.commit()
         return EliminacionCandidatosResponse(eliminados=len(eliminados), detalles=eliminados)
@@ -55,7 +55,6 @@ def create_usuario(db: Session, usuario: usuario_schema.UsuarioCreate):
     )
     db.add(db_usuario)
     db.commit()
-    db.refresh(db_usuario)
     return db_usuario
 
 def update_usuario(db: Session, id: int, data: usuario_schema.UsuarioUpdate) -> Usuario | None:
@@ -67,7 +66,6 @@ def update_usuario(db: Session, id: int, data: usuario_schema.UsuarioUpdate) ->
         setattr(usuario, key, value)
         
     db.commit()
-    db.refresh(usuario)
     return usuario
 
 def delete_usuario(db: Session, id: int) -> bool:
@@ -0,0 +1,39 @@
+# utils/carga_masiva.py
+import csv
+import io
+from typing import Dict, List
+
+from sqlalchemy import Table
+from sqlalchemy.engine import Connection
+
+
+def copiar_filas(conexion: Connection, tabla: Table, filas: List[Dict]) -> None:
+    """
+    Carga filas en una tabla en una sola operación.
+
+    En PostgreSQL usa `COPY ... FROM STDIN` (psycopg2 `copy_expert`) dentro de la
+    transacción de la conexión; en otros motores, un `executemany`. Todas las filas
+    deben tener las mismas llaves.
+    """
+    if not filas:
+        return
+    if conexion.dialect.name != "postgresql":
+        conexion.execute(tabla.insert(), filas)
+        return
+
+    columnas = list(filas[0].keys())
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for fila in filas:
+        # En formato CSV de COPY, el campo vacío sin comillas es NULL
+        writer.writerow(["" if fila[c] is None else fila[c] for c in columnas])
+    buffer.seek(0)
+
+    cursor = conexion.connection.driver_connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {tabla.name} ({', '.join(columnas)}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+    finally:
+        cursor.close()
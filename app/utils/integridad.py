@@ -0,0 +1,45 @@
+# utils/integridad.py
+import re
+from typing import Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+# SQLite no reporta el nombre de la restricción, solo las columnas o el índice
+_SQLITE_UNIQUE = re.compile(r"UNIQUE constraint failed: (.+)$")
+_SQLITE_INDICE = re.compile(r"index '([^']+)'")
+
+
+def restriccion_violada(error: IntegrityError) -> Optional[str]:
+    """
+    Retorna el nombre de la restricción que provocó el `IntegrityError`.
+
+    En PostgreSQL se toma de `diag.constraint_name` (psycopg2). En SQLite se
+    reconstruye con la convención de nombres de PostgreSQL (`tabla_columna_key`)
+    o se toma el nombre del índice único, para que los servicios puedan usar
+    los mismos nombres en ambos motores.
+    """
+    original = getattr(error, "orig", None)
+    diag = getattr(original, "diag", None)
+    if diag is not None and getattr(diag, "constraint_name", None):
+        return diag.constraint_name
+
+    coincidencia = _SQLITE_UNIQUE.search(str(original))
+    if not coincidencia:
+        return None
+    detalle = coincidencia.group(1).strip()
+    indice = _SQLITE_INDICE.search(detalle)
+    if indice:
+        return indice.group(1)
+    columnas = [c.strip() for c in detalle.split(",")]
+    tabla = columnas[0].split(".")[0]
+    return f"{tabla}_{'_'.join(c.split('.')[-1] for c in columnas)}_key"
+
+
+def insertar_retornando(db: Session, modelo, **valores):
+    """
+    Inserta una fila con `INSERT ... RETURNING` y retorna la instancia ORM ya poblada
+    (ID y valores por defecto del servidor) en una sola ida y vuelta a la base de datos.
+    """
+    return db.scalars(insert(modelo).values(**valores).returning(modelo)).one()
@@ -0,0 +1,33 @@
+# utils/lotes.py
+import os
+from typing import Iterable, Iterator, List
+
+from sqlalchemy import Integer, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+
+# Máximo de IDs por sentencia en las operaciones masivas
+TAMANO_LOTE_IDS = int(os.getenv("TAMANO_LOTE_IDS", "1000"))
+
+
+def ids_unicos(ids: Iterable[int]) -> List[int]:
+    """Elimina IDs repetidos conservando el orden en que llegaron."""
+    return list(dict.fromkeys(ids))
+
+
+def en_lotes(ids: List[int], tamano: int = None) -> Iterator[List[int]]:
+    """Divide una lista de IDs en lotes de tamaño acotado."""
+    tamano = tamano or TAMANO_LOTE_IDS
+    for inicio in range(0, len(ids), tamano):
+        yield ids[inicio:inicio + tamano]
+
+
+def condicion_ids(columna, ids: List[int], dialecto: str):
+    """
+    Filtro `columna IN ids` para sentencias masivas.
+
+    En PostgreSQL se genera `columna = ANY(:ids)` con un único parámetro de tipo
+    arreglo (el plan no depende del número de IDs); en otros motores, `IN (...)`.
+    """
+    if dialecto == "postgresql":
+        return columna == any_(bindparam("ids", ids, type_=ARRAY(Integer)))
+    return columna.in_(ids)
@@ -1,15 +1,30 @@
 # utils/orden_catalogos.py
-from sqlalchemy import asc, case
+from sqlalchemy import Boolean, Column, Computed, Index, asc
+
+
+def columna_es_otro(campo: str) -> Column:
+    """
+    Crea la columna `es_otro` de un catálogo: verdadera cuando el nombre es 'Otro' u 'Otros'.
+
+    Es una columna generada (almacenada) por la base de datos, así que se mantiene
+    sola en cada INSERT y UPDATE, incluidas las sentencias masivas.
+    """
+    return Column(Boolean, Computed(f"lower({campo}) IN ('otro', 'otros')", persisted=True))
+
+
+def indice_orden(tabla: str, campo: str) -> Index:
+    """Índice compuesto (`es_otro`, nombre) que sirve el orden de `ordenar_por_nombre`."""
+    return Index(f"ix_{tabla}_orden", "es_otro", campo)
 
 
 def ordenar_por_nombre(query, campo):
     """
     Recibe un query y el nombre del campo string a ordenar.
     Devuelve el query ordenado alfabéticamente, dejando 'Otro' u 'Otros' de últimos.
+
+    El orden usa la columna precalculada `es_otro`, de modo que el índice
+    (`es_otro`, nombre) del catálogo puede resolverlo sin ordenar en memoria.
     """
-    columna = getattr(query.column_descriptions[0]["entity"], campo)
+    modelo = query.column_descriptions[0]["entity"]
 
-    return query.order_by(
-        case((columna.ilike("otro"), 1), (columna.ilike("otros"), 1), else_=0),
-        asc(columna),
-    )
+    return query.order_by(asc(modelo.es_otro), asc(getattr(modelo, campo)))
@@ -0,0 +1,58 @@
+# utils/validacion_catalogos.py
+from typing import Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import literal, select, union_all
+from sqlalchemy.orm import Session
+
+
+def validar_referencias_catalogos(
+    db: Session, referencias: List[Tuple[str, object, Iterable[Optional[int]]]]
+) -> None:
+    """
+    Verifica en una sola consulta que todos los IDs referenciados existan en sus catálogos.
+
+    Cada referencia es una tupla (campo, columna_pk, ids), por ejemplo
+    ("id_ciudad", Ciudad.id_ciudad, [3]). Los IDs nulos se ignoran y las referencias
+    al mismo campo se agrupan, de modo que se ejecuta un único `UNION ALL` con un
+    `SELECT ... WHERE pk IN (...)` por catálogo.
+
+    Args:
+        db (Session): Sesión de base de datos.
+        referencias (List[Tuple[str, object, Iterable[Optional[int]]]]): Referencias a validar.
+
+    Raises:
+        HTTPException: 422 si algún ID no existe, indicando el campo y los IDs inválidos.
+    """
+    solicitados: dict = {}
+    columnas: dict = {}
+    for campo, columna, ids in referencias:
+        ids = {i for i in ids if i is not None}
+        if ids:
+            solicitados.setdefault(campo, set()).update(ids)
+            columnas[campo] = columna
+
+    if not solicitados:
+        return
+
+    consultas = [
+        select(literal(campo).label("campo"), columnas[campo].label("id")).where(columnas[campo].in_(ids))
+        for campo, ids in solicitados.items()
+    ]
+    consulta = consultas[0] if len(consultas) == 1 else union_all(*consultas)
+
+    encontrados: dict = {}
+    for campo, id_encontrado in db.execute(consulta):
+        encontrados.setdefault(campo, set()).add(id_encontrado)
+
+    invalidos = {
+        campo: sorted(ids - encontrados.get(campo, set()))
+        for campo, ids in solicitados.items()
+        if ids - encontrados.get(campo, set())
+    }
+    if invalidos:
+        detalle = "; ".join(f"{campo}: {ids}" for campo, ids in invalidos.items())
+        raise HTTPException(
+            status_code=422,
+            detail=f"Referencias a catálogos inexistentes ({detalle})",
+        )
@@ -0,0 +1,127 @@
+"""Benchmark: tiempo de arranque de la API.
+
+Cada repetición corre en un intérprete nuevo (los módulos ya importados no cuentan)
+y mide:
+
+  - ``importacion``: ``import app.main`` (construye la app con todas las rutas).
+  - ``lifespan``: arranque del ciclo de vida (scheduler) al abrir el TestClient.
+  - ``primera_peticion``: la primera petición servida (``GET /docs``).
+  - ``openapi``: la primera generación del esquema (``GET /openapi.json``).
+
+Además registra qué dependencias pesadas de las exportaciones quedaron cargadas
+tras importar la app; deberían cargarse solo con la primera exportación.
+
+Uso::
+
+    python -m benchmarks.bench_arranque --repeticiones 10 --salida arranque.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks.suite import _resumen_tiempos
+
+# Módulos que no deberían importarse al arrancar la API
+MODULOS_PESADOS = ("openpyxl", "reportlab", "pandas", "pyarrow")
+
+# Marca de la línea con el resultado del proceso hijo (la app también escribe en stdout)
+_PREFIJO_RESULTADO = "RESULTADO_ARRANQUE "
+
+
+def _medir_en_este_proceso() -> dict:
+    """Mide el arranque en el proceso actual. Debe llamarse en un intérprete recién iniciado."""
+    t0 = time.perf_counter()
+    from app.main import app
+    importacion = time.perf_counter() - t0
+    modulos = sorted(m for m in MODULOS_PESADOS if m in sys.modules)
+
+    from fastapi.testclient import TestClient
+
+    t0 = time.perf_counter()
+    with TestClient(app) as cliente:
+        lifespan = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        cliente.get("/docs").raise_for_status()
+        primera_peticion = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        cliente.get("/openapi.json").raise_for_status()
+        openapi = time.perf_counter() - t0
+
+    return {
+        "importacion": importacion,
+        "lifespan": lifespan,
+        "primera_peticion": primera_peticion,
+        "openapi": openapi,
+        "modulos_pesados": modulos,
+    }
+
+
+def medir_arranque(repeticiones: int, database_url: str = None) -> dict:
+    """
+    Ejecuta `repeticiones` arranques en procesos nuevos y resume los tiempos.
+
+    Args:
+        repeticiones (int): Número de procesos a lanzar.
+        database_url (str): URL de la base para los procesos (por defecto, la del entorno).
+
+    Returns:
+        dict: Resumen por etapa y módulos pesados cargados al importar la app.
+    """
+    entorno = dict(os.environ)
+    if database_url:
+        entorno["DATABASE_URL"] = database_url
+
+    muestras = {"importacion": [], "lifespan": [], "primera_peticion": [], "openapi": []}
+    modulos = set()
+    for _ in range(repeticiones):
+        proceso = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_arranque", "--hijo"],
+            capture_output=True, text=True, env=entorno,
+        )
+        lineas = [l for l in proceso.stdout.splitlines() if l.startswith(_PREFIJO_RESULTADO)]
+        if proceso.returncode != 0 or not lineas:
+            error = (proceso.stderr.strip().splitlines() or ["sin salida"])[-1]
+            return {"error": error}
+        resultado = json.loads(lineas[-1][len(_PREFIJO_RESULTADO):])
+        for etapa in muestras:
+            muestras[etapa].append(resultado[etapa])
+        modulos.update(resultado["modulos_pesados"])
+
+    resumen = {etapa: _resumen_tiempos(valores) for etapa, valores in muestras.items()}
+    resumen["modulos_pesados_al_importar"] = sorted(modulos)
+    return resumen
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL", "sqlite:///bench.db"),
+                        help="Base de datos de la app (el arranque no la consulta)")
+    parser.add_argument("--repeticiones", type=int, default=5, help="Arranques a medir")
+    parser.add_argument("--salida", help="Archivo JSON donde guardar el reporte")
+    parser.add_argument("--hijo", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.hijo:
+        print(_PREFIJO_RESULTADO + json.dumps(_medir_en_este_proceso()))
+        return
+
+    reporte = {
+        "benchmark": "arranque",
+        "parametros": {"repeticiones": args.repeticiones},
+        "resultados": medir_arranque(args.repeticiones, args.database_url),
+    }
+    salida = json.dumps(reporte, indent=2, ensure_ascii=False, sort_keys=True)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            archivo.write(salida + "\n")
+    print(salida)
+
+
+if __name__ == "__main__":
+    main()
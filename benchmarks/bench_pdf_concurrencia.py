@@ -0,0 +1,146 @@
+"""Benchmark: latencia de otras rutas de la API mientras se generan PDFs en paralelo.
+
+Levanta la API (un solo proceso uvicorn) en un hilo y mide la latencia de una
+ruta liviana en tres escenarios:
+
+  - ``sin_carga``: sin generación de PDF.
+  - ``pdf_en_linea``: PDFs renderizados en el mismo proceso (``PDF_WORKERS=0``).
+  - ``pdf_pool_procesos``: PDFs renderizados en el pool de procesos.
+
+Uso (requiere ``DATABASE_URL`` apuntando a una base con datos)::
+
+    python -m benchmarks.bench_pdf_concurrencia --pdfs 4 --sondeos 200 --salida pdf.json
+"""
+
+import argparse
+import json
+import socket
+import statistics
+import threading
+import time
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+from app.core.database import SessionLocal
+from app.routes.catalogs import departamentos
+from app.routes.Dashboard import stats_routes
+from app.services.dashboard import export_pdf_service
+
+RUTAS_SONDEO = ("/departamentos/todas", "/reportes/anios-disponibles")
+
+
+def _crear_app() -> FastAPI:
+    """App mínima con las rutas usadas como sondeo de latencia."""
+    app = FastAPI()
+    app.include_router(departamentos.router)
+    app.include_router(stats_routes.router)
+    return app
+
+
+def _puerto_libre() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _percentiles(muestras: list) -> dict:
+    ordenadas = sorted(muestras)
+    def p(q):
+        return round(ordenadas[min(len(ordenadas) - 1, int(q * len(ordenadas)))] * 1000, 2)
+    return {
+        "n": len(ordenadas),
+        "media_ms": round(statistics.mean(ordenadas) * 1000, 2),
+        "p50_ms": p(0.50),
+        "p95_ms": p(0.95),
+        "p99_ms": p(0.99),
+        "max_ms": round(ordenadas[-1] * 1000, 2),
+    }
+
+
+def _generar_pdfs(detener: threading.Event, generados: list) -> None:
+    """Genera PDFs en bucle hasta que se indique detener (simula el endpoint de exportación)."""
+    db = SessionLocal()
+    try:
+        while not detener.is_set():
+            export_pdf_service.exportar_estadisticas_pdf_reportlab(db)
+            generados.append(1)
+    finally:
+        db.close()
+
+
+def _medir_escenario(base_url: str, sondeos: int, pdfs: int) -> dict:
+    detener = threading.Event()
+    generados: list = []
+    hilos = [threading.Thread(target=_generar_pdfs, args=(detener, generados)) for _ in range(pdfs)]
+    for hilo in hilos:
+        hilo.start()
+    if pdfs:
+        time.sleep(0.5)  # Dejar que la generación arranque antes de medir
+
+    latencias = []
+    inicio = time.perf_counter()
+    with httpx.Client(base_url=base_url, timeout=60) as cliente:
+        for i in range(sondeos):
+            t0 = time.perf_counter()
+            cliente.get(RUTAS_SONDEO[i % len(RUTAS_SONDEO)]).raise_for_status()
+            latencias.append(time.perf_counter() - t0)
+    duracion = time.perf_counter() - inicio
+
+    detener.set()
+    for hilo in hilos:
+        hilo.join()
+
+    resultado = _percentiles(latencias)
+    resultado["pdfs_generados"] = len(generados)
+    resultado["pdfs_por_segundo"] = round(len(generados) / duracion, 2)
+    return resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdfs", type=int, default=4, help="Hilos generando PDFs en paralelo")
+    parser.add_argument("--sondeos", type=int, default=200, help="Peticiones de sondeo por escenario")
+    parser.add_argument("--workers-pool", type=int, default=2, help="Procesos del pool de renderizado")
+    parser.add_argument("--salida", help="Archivo JSON donde guardar el resultado")
+    args = parser.parse_args()
+
+    puerto = _puerto_libre()
+    servidor = uvicorn.Server(uvicorn.Config(_crear_app(), host="127.0.0.1", port=puerto, log_level="warning"))
+    hilo_servidor = threading.Thread(target=servidor.run, daemon=True)
+    hilo_servidor.start()
+    while not servidor.started:
+        time.sleep(0.05)
+    base_url = f"http://127.0.0.1:{puerto}"
+
+    resultados = {"sin_carga": _medir_escenario(base_url, args.sondeos, 0)}
+
+    export_pdf_service.cerrar_pool_pdf()
+    export_pdf_service.PDF_WORKERS = 0
+    resultados["pdf_en_linea"] = _medir_escenario(base_url, args.sondeos, args.pdfs)
+
+    export_pdf_service.PDF_WORKERS = args.workers_pool
+    with SessionLocal() as db:
+        export_pdf_service.exportar_estadisticas_pdf_reportlab(db)  # Calentar el pool
+    resultados["pdf_pool_procesos"] = _medir_escenario(base_url, args.sondeos, args.pdfs)
+    export_pdf_service.cerrar_pool_pdf()
+
+    servidor.should_exit = True
+    hilo_servidor.join()
+
+    reporte = {
+        "benchmark": "pdf_concurrencia",
+        "parametros": vars(args),
+        "rutas_sondeo": list(RUTAS_SONDEO),
+        "resultados": resultados,
+    }
+    salida = json.dumps(reporte, indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            archivo.write(salida)
+    print(salida)
+
+
+if __name__ == "__main__":
+    main()
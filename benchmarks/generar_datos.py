@@ -0,0 +1,438 @@
+"""Generador de datos sintéticos: catálogos + N candidatos con educación, experiencia,
+conocimientos y preferencias con distribuciones realistas.
+
+En PostgreSQL la carga se hace con ``COPY ... FROM STDIN`` (psycopg2 ``copy_expert``);
+en otros motores (ej. SQLite) con ``executemany`` por lotes.
+
+Uso::
+
+    DATABASE_URL=postgresql://... python -m benchmarks.generar_datos --candidatos 10000
+    python -m benchmarks.generar_datos --database-url sqlite:///bench.db --candidatos 1000 --reiniciar
+"""
+
+import argparse
+import csv
+import io
+import os
+import random
+import time
+from datetime import date, datetime, timedelta
+
+# ───────────────────────── CATÁLOGOS SINTÉTICOS ─────────────────────────
+
+DEPARTAMENTOS = {
+    "Antioquia": ["Medellín", "Bello", "Itagüí", "Envigado", "Rionegro"],
+    "Cundinamarca": ["Bogotá", "Soacha", "Chía", "Zipaquirá", "Facatativá"],
+    "Valle del Cauca": ["Cali", "Palmira", "Buenaventura", "Tuluá"],
+    "Atlántico": ["Barranquilla", "Soledad", "Malambo"],
+    "Santander": ["Bucaramanga", "Floridablanca", "Girón"],
+    "Bolívar": ["Cartagena", "Magangué", "Turbaco"],
+    "Risaralda": ["Pereira", "Dosquebradas", "Santa Rosa de Cabal"],
+    "Caldas": ["Manizales", "Villamaría", "Chinchiná"],
+    "Tolima": ["Ibagué", "Espinal", "Melgar"],
+    "Norte de Santander": ["Cúcuta", "Ocaña", "Pamplona"],
+}
+
+CARGOS = [
+    "Auxiliar de Bodega", "Operario de Producción", "Analista Contable", "Asistente Administrativo",
+    "Coordinador Logístico", "Desarrollador de Software", "Analista de Datos", "Técnico de Mantenimiento",
+    "Vendedor", "Supervisor de Planta", "Jefe de Compras", "Auxiliar de Calidad", "Conductor",
+    "Analista de Talento Humano", "Ingeniero de Procesos", "Mercaderista", "Recepcionista",
+    "Auxiliar de Cartera", "Diseñador Gráfico", "Otro",
+]
+
+CENTROS_COSTOS = [
+    "Producción", "Logística", "Administración", "Comercial", "Tecnología",
+    "Talento Humano", "Calidad", "Mantenimiento", "Compras", "Otro",
+]
+
+NIVELES_EDUCACION = {
+    "Bachiller": ["Bachiller Académico", "Bachiller Técnico"],
+    "Técnico": ["Técnico en Logística", "Técnico en Sistemas", "Técnico en Mecánica", "Técnico en Contabilidad"],
+    "Tecnólogo": ["Tecnólogo en Gestión Administrativa", "Tecnólogo en Producción Industrial", "Tecnólogo en Desarrollo de Software"],
+    "Profesional": ["Ingeniería Industrial", "Ingeniería de Sistemas", "Administración de Empresas", "Contaduría Pública", "Psicología"],
+    "Especialización": ["Especialización en Gerencia de Proyectos", "Especialización en Finanzas"],
+    "Maestría": ["Maestría en Administración (MBA)", "Maestría en Analítica de Datos"],
+}
+
+INSTITUCIONES = [
+    "SENA", "Universidad de Antioquia", "Universidad Nacional de Colombia", "Universidad del Valle",
+    "Universidad EAFIT", "Universidad de los Andes", "Pontificia Universidad Javeriana",
+    "Universidad Industrial de Santander", "Universidad del Norte", "Universidad Pontificia Bolivariana",
+    "Politécnico Colombiano Jaime Isaza Cadavid", "Institución Universitaria Pascual Bravo",
+    "Universidad Tecnológica de Pereira", "Universidad de Caldas", "Universidad del Tolima",
+    "Universidad Francisco de Paula Santander", "Corporación Universitaria Minuto de Dios",
+    "Fundación Universitaria Los Libertadores", "Universidad Cooperativa de Colombia", "Otro",
+]
+
+NIVELES_INGLES = ["Ninguno", "A1", "A2", "B1", "B2", "C1", "C2"]
+
+RANGOS_EXPERIENCIA = ["Sin experiencia", "Menos de 1 año", "1 a 3 años", "3 a 5 años", "Más de 5 años"]
+
+HABILIDADES_BLANDAS = [
+    "Trabajo en equipo", "Comunicación asertiva", "Liderazgo", "Adaptabilidad", "Resolución de problemas",
+    "Pensamiento crítico", "Gestión del tiempo", "Empatía", "Creatividad", "Negociación",
+    "Orientación al cliente", "Proactividad", "Responsabilidad", "Tolerancia a la presión", "Otro",
+]
+
+HABILIDADES_TECNICAS = [
+    "Excel avanzado", "Python", "SQL", "Contabilidad", "Manejo de inventarios", "Soldadura",
+    "Electricidad industrial", "Mantenimiento preventivo", "Power BI", "Java", "JavaScript",
+    "Atención al cliente", "Ventas consultivas", "Normas ISO", "Buenas prácticas de manufactura",
+    "Montacargas", "Diseño gráfico", "Nómina", "Facturación electrónica", "Otro",
+]
+
+HERRAMIENTAS = [
+    "Microsoft Office", "SAP", "Siigo", "World Office", "AutoCAD", "Git", "Docker", "Jira",
+    "Power BI", "Tableau", "Photoshop", "Illustrator", "Salesforce", "Google Workspace", "Otro",
+]
+
+DISPONIBILIDADES = ["Inmediata", "15 días", "1 mes", "Más de 1 mes"]
+
+RANGOS_SALARIALES = [
+    "Menos de 1 SMMLV", "1 a 2 SMMLV", "2 a 3 SMMLV", "3 a 5 SMMLV", "5 a 8 SMMLV", "Más de 8 SMMLV",
+]
+
+MOTIVOS_SALIDA = [
+    "Mejor oferta laboral", "Terminación de contrato", "Crecimiento profesional",
+    "Motivos personales", "Reubicación", "Otro",
+]
+
+ESTADOS = [("EN_PROCESO", 55), ("ENTREVISTA", 15), ("ADMITIDO", 8), ("DESCARTADO", 20), ("CONTRATADO", 2)]
+
+NOMBRES = [
+    "Juan", "María", "Carlos", "Ana", "Luis", "Laura", "Andrés", "Camila", "Jorge", "Valentina",
+    "Felipe", "Daniela", "Santiago", "Natalia", "Diego", "Paula", "Sebastián", "Juliana", "Mateo", "Sara",
+]
+APELLIDOS = [
+    "García", "Rodríguez", "Martínez", "López", "González", "Hernández", "Pérez", "Sánchez",
+    "Ramírez", "Torres", "Gómez", "Díaz", "Vargas", "Rojas", "Moreno", "Jiménez", "Restrepo", "Cardona",
+]
+EMPRESAS = [
+    "Alimentos del Valle S.A.S.", "Logística Andina", "Textiles Medellín", "Comercializadora Caribe",
+    "Tecnologías del Norte", "Grupo Industrial Santander", "Distribuidora Central", "Servicios Integrales",
+]
+
+
+def _elegir_ponderado(rnd: random.Random, opciones: list, pesos: list):
+    return rnd.choices(opciones, weights=pesos, k=1)[0]
+
+
+# ───────────────────────── CARGA ─────────────────────────
+
+def _insertar(conexion, tabla, filas: list) -> None:
+    """Inserta filas en una tabla: COPY en PostgreSQL, executemany en otros motores."""
+    if not filas:
+        return
+    if conexion.dialect.name == "postgresql":
+        columnas = list(filas[0].keys())
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for fila in filas:
+            writer.writerow(["" if fila[c] is None else fila[c] for c in columnas])
+        buffer.seek(0)
+        cursor = conexion.connection.driver_connection.cursor()
+        cursor.copy_expert(
+            f"COPY {tabla.name} ({', '.join(columnas)}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+        cursor.close()
+    else:
+        conexion.execute(tabla.insert(), filas)
+
+
+def _ajustar_secuencias(conexion, tablas) -> None:
+    """En PostgreSQL, mueve las secuencias de las PK seriales al máximo id cargado."""
+    if conexion.dialect.name != "postgresql":
+        return
+    from sqlalchemy import text
+
+    for tabla in tablas:
+        pk = list(tabla.primary_key.columns)[0].name
+        conexion.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{tabla.name}', '{pk}'), "
+            f"COALESCE((SELECT MAX({pk}) FROM {tabla.name}), 1))"
+        ))
+
+
+def _siguiente_id(conexion, columna) -> int:
+    from sqlalchemy import func, select
+
+    return (conexion.execute(select(func.max(columna))).scalar() or 0) + 1
+
+
+def sembrar_catalogos(conexion) -> dict:
+    """
+    Inserta los catálogos sintéticos si están vacíos y retorna sus IDs por catálogo.
+
+    Returns:
+        dict: Listas de IDs por catálogo (y títulos agrupados por nivel educativo).
+    """
+    from sqlalchemy import func, select
+
+    from app.models.catalogs import (
+        CargoOfrecido, CentroCostos, Ciudad, Departamento, InstitucionAcademica,
+        NivelEducacion, NivelIngles, RangoExperiencia, TituloObtenido,
+    )
+    from app.models import (
+        Disponibilidad, HabilidadBlanda, HabilidadTecnica, Herramienta, MotivoSalida, RangoSalarial,
+    )
+
+    simples = [
+        (CargoOfrecido, "nombre_cargo", CARGOS),
+        (CentroCostos, "nombre_centro_costos", CENTROS_COSTOS),
+        (InstitucionAcademica, "nombre_institucion", INSTITUCIONES),
+        (NivelIngles, "nivel", NIVELES_INGLES),
+        (RangoExperiencia, "descripcion_rango", RANGOS_EXPERIENCIA),
+        (HabilidadBlanda, "nombre_habilidad_blanda", HABILIDADES_BLANDAS),
+        (HabilidadTecnica, "nombre_habilidad_tecnica", HABILIDADES_TECNICAS),
+        (Herramienta, "nombre_herramienta", HERRAMIENTAS),
+        (Disponibilidad, "descripcion_disponibilidad", DISPONIBILIDADES),
+        (RangoSalarial, "descripcion_rango", RANGOS_SALARIALES),
+        (MotivoSalida, "descripcion_motivo", MOTIVOS_SALIDA),
+    ]
+    for modelo, campo, valores in simples:
+        if conexion.execute(select(func.count()).select_from(modelo)).scalar() == 0:
+            conexion.execute(modelo.__table__.insert(), [{campo: v} for v in valores])
+
+    if conexion.execute(select(func.count()).select_from(Departamento)).scalar() == 0:
+        for departamento, ciudades in DEPARTAMENTOS.items():
+            id_dep = conexion.execute(
+                Departamento.__table__.insert().values(nombre_departamento=departamento)
+            ).inserted_primary_key[0]
+            conexion.execute(
+                Ciudad.__table__.insert(),
+                [{"nombre_ciudad": c, "id_departamento": id_dep} for c in ciudades],
+            )
+
+    if conexion.execute(select(func.count()).select_from(NivelEducacion)).scalar() == 0:
+        for nivel, titulos in NIVELES_EDUCACION.items():
+            id_nivel = conexion.execute(
+                NivelEducacion.__table__.insert().values(descripcion_nivel=nivel)
+            ).inserted_primary_key[0]
+            conexion.execute(
+                TituloObtenido.__table__.insert(),
+                [{"nombre_titulo": t, "id_nivel_educacion": id_nivel} for t in titulos],
+            )
+
+    def ids(columna):
+        return [fila[0] for fila in conexion.execute(select(columna).order_by(columna))]
+
+    titulos_por_nivel: dict = {}
+    for id_titulo, id_nivel in conexion.execute(
+        select(TituloObtenido.id_titulo, TituloObtenido.id_nivel_educacion)
+    ):
+        titulos_por_nivel.setdefault(id_nivel, []).append(id_titulo)
+
+    return {
+        "ciudades": ids(Ciudad.id_ciudad),
+        "cargos": ids(CargoOfrecido.id_cargo),
+        "centros_costos": ids(CentroCostos.id_centro_costos),
+        "niveles_educacion": ids(NivelEducacion.id_nivel_educacion),
+        "titulos_por_nivel": titulos_por_nivel,
+        "instituciones": ids(InstitucionAcademica.id_institucion),
+        "niveles_ingles": ids(NivelIngles.id_nivel_ingles),
+        "rangos_experiencia": ids(RangoExperiencia.id_rango_experiencia),
+        "habilidades_blandas": ids(HabilidadBlanda.id_habilidad_blanda),
+        "habilidades_tecnicas": ids(HabilidadTecnica.id_habilidad_tecnica),
+        "herramientas": ids(Herramienta.id_herramienta),
+        "disponibilidades": ids(Disponibilidad.id_disponibilidad),
+        "rangos_salariales": ids(RangoSalarial.id_rango_salarial),
+        "motivos_salida": ids(MotivoSalida.id_motivo_salida),
+    }
+
+
+def _generar_lote(rnd: random.Random, catalogos: dict, desde_id: int, cantidad: int, ids_hijos: dict) -> dict:
+    """Genera las filas de un lote de candidatos y de sus tablas hijas."""
+    hoy = datetime.now()
+    filas = {"candidatos": [], "educacion": [], "experiencia_laboral": [],
+             "candidato_conocimientos": [], "preferencias_disponibilidad": []}
+    estados, pesos_estado = zip(*ESTADOS)
+    niveles = catalogos["niveles_educacion"]
+    # Más peso a niveles intermedios (técnico/tecnólogo/profesional)
+    pesos_nivel = [15, 25, 20, 30, 7, 3][: len(niveles)] or [1] * len(niveles)
+
+    for id_candidato in range(desde_id, desde_id + cantidad):
+        nacimiento = date(rnd.randint(1965, 2005), rnd.randint(1, 12), rnd.randint(1, 28))
+        registro = hoy - timedelta(days=rnd.triangular(0, 3 * 365, 60), seconds=rnd.randint(0, 86399))
+        trabaja_joyco = rnd.random() < 0.08
+        ha_trabajado = trabaja_joyco or rnd.random() < 0.12
+        tiene_referido = rnd.random() < 0.3
+        completo = rnd.random() < 0.85
+        nombre = f"{rnd.choice(NOMBRES)} {rnd.choice(APELLIDOS)} {rnd.choice(APELLIDOS)}"
+
+        filas["candidatos"].append({
+            "id_candidato": id_candidato,
+            "nombre_completo": nombre,
+            "correo_electronico": f"candidato{id_candidato}@ejemplo.com",
+            "cc": str(1_000_000_000 + id_candidato),
+            "fecha_nacimiento": nacimiento,
+            "telefono": f"3{rnd.randint(0, 299_999_999):09d}",
+            "id_ciudad": rnd.choice(catalogos["ciudades"]),
+            "descripcion_perfil": f"Perfil con interés en {rnd.choice(CARGOS).lower()}.",
+            "id_cargo": rnd.choice(catalogos["cargos"]),
+            "nombre_cargo_otro": None,
+            "trabaja_actualmente_joyco": trabaja_joyco,
+            "ha_trabajado_joyco": ha_trabajado,
+            "id_motivo_salida": rnd.choice(catalogos["motivos_salida"]) if ha_trabajado and not trabaja_joyco else None,
+            "otro_motivo_salida": None,
+            "tiene_referido": tiene_referido,
+            "nombre_referido": f"{rnd.choice(NOMBRES)} {rnd.choice(APELLIDOS)}" if tiene_referido else None,
+            "id_centro_costos": rnd.choice(catalogos["centros_costos"]) if trabaja_joyco else None,
+            "nombre_centro_costos_otro": None,
+            "fecha_registro": registro,
+            "estado": _elegir_ponderado(rnd, estados, pesos_estado),
+            "formulario_completo": completo,
+            "acepta_politica_datos": True,
+        })
+
+        if not completo and rnd.random() < 0.5:
+            continue  # Formulario abandonado tras los datos personales
+
+        id_nivel = _elegir_ponderado(rnd, niveles, pesos_nivel)
+        titulos = catalogos["titulos_por_nivel"].get(id_nivel, [])
+        ids_hijos["educacion"] += 1
+        filas["educacion"].append({
+            "id_educacion": ids_hijos["educacion"],
+            "id_candidato": id_candidato,
+            "id_nivel_educacion": id_nivel,
+            "id_titulo": rnd.choice(titulos) if titulos else None,
+            "id_institucion": rnd.choice(catalogos["instituciones"]),
+            "anio_graduacion": min(nacimiento.year + rnd.randint(17, 30), hoy.year),
+            "id_nivel_ingles": _elegir_ponderado(
+                rnd, catalogos["niveles_ingles"], [25, 25, 20, 15, 10, 4, 1][: len(catalogos["niveles_ingles"])]
+            ),
+            "nombre_titulo_otro": None,
+            "nombre_institucion_otro": None,
+        })
+
+        inicio = date(rnd.randint(max(nacimiento.year + 18, 1990), hoy.year - 1), rnd.randint(1, 12), 1)
+        fin = None if rnd.random() < 0.4 else min(inicio + timedelta(days=rnd.randint(90, 2500)), hoy.date())
+        ids_hijos["experiencia_laboral"] += 1
+        filas["experiencia_laboral"].append({
+            "id_experiencia": ids_hijos["experiencia_laboral"],
+            "id_candidato": id_candidato,
+            "id_rango_experiencia": _elegir_ponderado(
+                rnd, catalogos["rangos_experiencia"], [10, 20, 35, 20, 15][: len(catalogos["rangos_experiencia"])]
+            ),
+            "ultima_empresa": rnd.choice(EMPRESAS),
+            "ultimo_cargo": rnd.choice(CARGOS),
+            "funciones": "Funciones propias del cargo.",
+            "fecha_inicio": inicio,
+            "fecha_fin": fin,
+        })
+
+        for tipo, clave, columna, minimo, maximo in (
+            ("blanda", "habilidades_blandas", "id_habilidad_blanda", 3, 8),
+            ("tecnica", "habilidades_tecnicas", "id_habilidad_tecnica", 2, 10),
+            ("herramienta", "herramientas", "id_herramienta", 1, 6),
+        ):
+            disponibles = catalogos[clave]
+            for id_catalogo in rnd.sample(disponibles, min(len(disponibles), rnd.randint(minimo, maximo))):
+                ids_hijos["candidato_conocimientos"] += 1
+                filas["candidato_conocimientos"].append({
+                    "id_conocimiento": ids_hijos["candidato_conocimientos"],
+                    "id_candidato": id_candidato,
+                    "tipo_conocimiento": tipo,
+                    "id_habilidad_blanda": id_catalogo if columna == "id_habilidad_blanda" else None,
+                    "id_habilidad_tecnica": id_catalogo if columna == "id_habilidad_tecnica" else None,
+                    "id_herramienta": id_catalogo if columna == "id_herramienta" else None,
+                })
+
+        trabaja = rnd.random() < 0.55
+        ids_hijos["preferencias_disponibilidad"] += 1
+        filas["preferencias_disponibilidad"].append({
+            "id_preferencia": ids_hijos["preferencias_disponibilidad"],
+            "id_candidato": id_candidato,
+            "disponibilidad_viajar": rnd.random() < 0.45,
+            "id_disponibilidad_inicio": rnd.choice(catalogos["disponibilidades"]),
+            "id_rango_salarial": _elegir_ponderado(
+                rnd, catalogos["rangos_salariales"], [5, 35, 25, 20, 10, 5][: len(catalogos["rangos_salariales"])]
+            ),
+            "trabaja_actualmente": trabaja,
+            "id_motivo_salida": rnd.choice(catalogos["motivos_salida"]) if trabaja else None,
+            "razon_trabajar_joyco": "Interés en crecer profesionalmente.",
+            "otro_motivo_salida": None,
+        })
+
+    return filas
+
+
+def generar_datos(engine, candidatos: int, semilla: int = 42, lote: int = 5000) -> dict:
+    """
+    Siembra catálogos (si están vacíos) y genera `candidatos` candidatos sintéticos.
+
+    Args:
+        engine: Motor de SQLAlchemy de la base destino.
+        candidatos (int): Número de candidatos a generar.
+        semilla (int): Semilla del generador aleatorio (resultados reproducibles).
+        lote (int): Candidatos por lote de carga.
+
+    Returns:
+        dict: Filas insertadas por tabla y duración en segundos.
+    """
+    from app.models import (
+        Candidato, CandidatoConocimiento, Educacion, ExperienciaLaboral, PreferenciaDisponibilidad,
+    )
+
+    tablas = {
+        "candidatos": Candidato.__table__,
+        "educacion": Educacion.__table__,
+        "experiencia_laboral": ExperienciaLaboral.__table__,
+        "candidato_conocimientos": CandidatoConocimiento.__table__,
+        "preferencias_disponibilidad": PreferenciaDisponibilidad.__table__,
+    }
+    rnd = random.Random(semilla)
+    inicio = time.perf_counter()
+    totales = {nombre: 0 for nombre in tablas}
+
+    with engine.begin() as conexion:
+        catalogos = sembrar_catalogos(conexion)
+        desde_id = _siguiente_id(conexion, Candidato.id_candidato)
+        ids_hijos = {
+            "educacion": _siguiente_id(conexion, Educacion.id_educacion) - 1,
+            "experiencia_laboral": _siguiente_id(conexion, ExperienciaLaboral.id_experiencia) - 1,
+            "candidato_conocimientos": _siguiente_id(conexion, CandidatoConocimiento.id_conocimiento) - 1,
+            "preferencias_disponibilidad": _siguiente_id(conexion, PreferenciaDisponibilidad.id_preferencia) - 1,
+        }
+
+        for offset in range(0, candidatos, lote):
+            cantidad = min(lote, candidatos - offset)
+            filas = _generar_lote(rnd, catalogos, desde_id + offset, cantidad, ids_hijos)
+            for nombre, tabla in tablas.items():
+                _insertar(conexion, tabla, filas[nombre])
+                totales[nombre] += len(filas[nombre])
+
+        _ajustar_secuencias(conexion, tablas.values())
+
+    return {"filas": totales, "segundos": round(time.perf_counter() - inicio, 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidatos", type=int, default=1000, help="Número de candidatos a generar")
+    parser.add_argument("--semilla", type=int, default=42, help="Semilla aleatoria")
+    parser.add_argument("--lote", type=int, default=5000, help="Candidatos por lote de carga")
+    parser.add_argument("--database-url", help="URL de la base destino (por defecto, DATABASE_URL)")
+    parser.add_argument("--reiniciar", action="store_true", help="Eliminar y recrear todas las tablas antes de cargar")
+    args = parser.parse_args()
+
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+
+    from app.core.database import Base, engine
+    import app.models  # noqa: F401  (registra los modelos en Base.metadata)
+    import app.models.catalogs  # noqa: F401
+
+    if args.reiniciar:
+        Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    resultado = generar_datos(engine, args.candidatos, args.semilla, args.lote)
+    print(f"✅ Datos sintéticos generados en {resultado['segundos']} s")
+    for tabla, filas in resultado["filas"].items():
+        print(f"   {tabla}: {filas} filas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""Suite de benchmarks de extremo a extremo sobre datos sintéticos.
+
+Para cada tamaño (por defecto 1k, 10k y 100k candidatos) recrea el esquema, genera
+los datos con ``benchmarks.generar_datos`` y mide:
+
+  - Endpoints de candidatos: ``/candidatos/resumen``, ``/candidatos/detalle-lista``
+    y ``/candidatos/{id}/detalle`` (vía TestClient, incluyendo serialización).
+  - Cada servicio de estadísticas del dashboard.
+  - Las exportaciones Excel y PDF (sin la caché de reportes) y las planas CSV/Parquet.
+
+Antes de los tamaños mide también el arranque de la API (importación y primera
+petición, ver ``benchmarks.bench_arranque``), que no depende del volumen de datos.
+
+El resultado es un JSON estable (claves ordenadas) pensado para compararse con
+``diff`` entre versiones.
+
+Uso::
+
+    python -m benchmarks.suite --database-url postgresql://.../cv_bench --salida bench.json
+    python -m benchmarks.suite --tamanos 1000,10000 --repeticiones 3
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+
+def _resumen_tiempos(muestras: list) -> dict:
+    ordenadas = sorted(muestras)
+    def p(q):
+        return round(ordenadas[min(len(ordenadas) - 1, int(q * len(ordenadas)))] * 1000, 2)
+    return {
+        "n": len(ordenadas),
+        "media_ms": round(statistics.mean(ordenadas) * 1000, 2),
+        "p50_ms": p(0.50),
+        "p95_ms": p(0.95),
+        "min_ms": round(ordenadas[0] * 1000, 2),
+        "max_ms": round(ordenadas[-1] * 1000, 2),
+    }
+
+
+def _medir(operacion, repeticiones: int, calentamiento: int = 1) -> dict:
+    """Ejecuta la operación `calentamiento + repeticiones` veces y resume los tiempos medidos."""
+    try:
+        for _ in range(calentamiento):
+            operacion()
+        muestras = []
+        for _ in range(repeticiones):
+            t0 = time.perf_counter()
+            operacion()
+            muestras.append(time.perf_counter() - t0)
+        return _resumen_tiempos(muestras)
+    except Exception as e:
+        # Solo la primera línea: el reporte debe seguir siendo comparable con diff
+        return {"error": f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}"}
+
+
+def _commit_git() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return "desconocido"
+
+
+def _crear_app():
+    """App mínima con las rutas de candidatos."""
+    from fastapi import FastAPI
+
+    from app.routes import candidato_route
+
+    app = FastAPI()
+    app.include_router(candidato_route.router)
+    return app
+
+
+def _operaciones(cliente, SessionLocal, ids_candidatos: list, año: int) -> dict:
+    """Construye el diccionario nombre → función a medir."""
+    from app.services.dashboard import export_pdf_service
+    from app.services.dashboard.export_datos_service import (
+        exportar_candidatos_csv,
+        exportar_candidatos_parquet,
+    )
+    from app.services.dashboard.export_service import exportar_candidatos_detallados_excel
+    from app.services.dashboard.stats_conocimientos_service import obtener_estadisticas_conocimientos
+    from app.services.dashboard.stats_educacion_service import obtener_estadisticas_educacion
+    from app.services.dashboard.stats_experiencia_service import obtener_estadisticas_experiencia
+    from app.services.dashboard.stats_general_service import obtener_estadisticas_generales
+    from app.services.dashboard.stats_personal_service import obtener_estadisticas_personales
+    from app.services.dashboard.stats_preferencias_service import obtener_estadisticas_preferencias
+    from app.services.dashboard.stats_proceso_service import obtener_estadisticas_proceso
+
+    rnd = random.Random(0)
+
+    def get(url):
+        def llamar():
+            cliente.get(url() if callable(url) else url).raise_for_status()
+        return llamar
+
+    def con_sesion(funcion, *args):
+        def llamar():
+            with SessionLocal() as db:
+                funcion(db, *args)
+        return llamar
+
+    def csv_completo():
+        with SessionLocal() as db:
+            for _ in exportar_candidatos_csv(db):
+                pass
+
+    def parquet_completo():
+        with SessionLocal() as db:
+            os.remove(exportar_candidatos_parquet(db))
+
+    operaciones = {
+        "endpoints.candidatos_resumen": get("/candidatos/resumen?skip=0&limit=10"),
+        "endpoints.candidatos_resumen_filtrado": get("/candidatos/resumen?skip=0&limit=10&search=garcia"),
+        "endpoints.candidatos_resumen_pagina_profunda": get(
+            f"/candidatos/resumen?skip={max(len(ids_candidatos) - 10, 0)}&limit=10"
+        ),
+        "endpoints.candidatos_detalle_lista": get("/candidatos/detalle-lista?skip=0&limit=10"),
+        "endpoints.candidato_detalle": get(lambda: f"/candidatos/{rnd.choice(ids_candidatos)}/detalle"),
+    }
+    for nombre, funcion in (
+        ("personales", obtener_estadisticas_personales),
+        ("educacion", obtener_estadisticas_educacion),
+        ("experiencia", obtener_estadisticas_experiencia),
+        ("conocimientos", obtener_estadisticas_conocimientos),
+        ("preferencias", obtener_estadisticas_preferencias),
+        ("proceso", obtener_estadisticas_proceso),
+        ("generales", obtener_estadisticas_generales),
+    ):
+        operaciones[f"estadisticas.{nombre}"] = con_sesion(funcion, None)
+        operaciones[f"estadisticas.{nombre}_anio"] = con_sesion(funcion, año)
+
+    operaciones.update({
+        "exportaciones.excel": con_sesion(exportar_candidatos_detallados_excel, None),
+        "exportaciones.pdf": con_sesion(export_pdf_service.exportar_estadisticas_pdf_reportlab, None),
+        "exportaciones.csv": csv_completo,
+        "exportaciones.parquet": parquet_completo,
+    })
+    return operaciones
+
+
+def ejecutar_tamano(tamano: int, repeticiones: int, semilla: int, filtro: str = None) -> dict:
+    """Recrea el esquema, genera `tamano` candidatos y mide todas las operaciones."""
+    from fastapi.testclient import TestClient
+    from sqlalchemy import select
+
+    import app.models  # noqa: F401  (registra los modelos en Base.metadata)
+    import app.models.catalogs  # noqa: F401
+    from app.core.database import Base, SessionLocal, engine
+    from app.models import Candidato
+    from benchmarks.generar_datos import generar_datos
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    carga = generar_datos(engine, tamano, semilla)
+
+    with SessionLocal() as db:
+        ids_candidatos = list(db.scalars(select(Candidato.id_candidato)))
+    año = datetime.now().year
+
+    resultados = {}
+    with TestClient(_crear_app()) as cliente:
+        for nombre, operacion in _operaciones(cliente, SessionLocal, ids_candidatos, año).items():
+            if filtro and filtro not in nombre:
+                continue
+            print(f"  · {nombre}", file=sys.stderr)
+            resultados[nombre] = _medir(operacion, repeticiones)
+
+    return {"carga": carga, "operaciones": resultados}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL", "sqlite:///bench.db"),
+                        help="Base de datos desechable para el benchmark (se recrea en cada tamaño)")
+    parser.add_argument("--tamanos", default="1000,10000,100000", help="Tamaños separados por comas")
+    parser.add_argument("--repeticiones", type=int, default=5, help="Mediciones por operación")
+    parser.add_argument("--semilla", type=int, default=42, help="Semilla de los datos sintéticos")
+    parser.add_argument("--filtro", help="Medir solo las operaciones cuyo nombre contenga este texto")
+    parser.add_argument("--salida", help="Archivo JSON donde guardar el reporte")
+    args = parser.parse_args()
+
+    # El motor se crea al importar app.core.database: fijar la URL antes de cualquier import de la app
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("PDF_WORKERS", "0")
+
+    from app.core.database import engine
+    from benchmarks.bench_arranque import medir_arranque
+
+    tamanos = [int(t) for t in args.tamanos.split(",") if t.strip()]
+    reporte = {
+        "benchmark": "suite",
+        "metadatos": {
+            "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": _commit_git(),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "motor": engine.dialect.name,
+            "repeticiones": args.repeticiones,
+            "semilla": args.semilla,
+        },
+        "tamanos": {},
+    }
+    if not args.filtro or args.filtro in "arranque":
+        print("▶ arranque", file=sys.stderr)
+        reporte["arranque"] = medir_arranque(args.repeticiones, args.database_url)
+    for tamano in tamanos:
+        print(f"▶ {tamano} candidatos", file=sys.stderr)
+        reporte["tamanos"][str(tamano)] = ejecutar_tamano(tamano, args.repeticiones, args.semilla, args.filtro)
+
+    salida = json.dumps(reporte, indent=2, ensure_ascii=False, sort_keys=True)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            archivo.write(salida + "\n")
+    print(salida)
+
+
+if __name__ == "__main__":
+    main()
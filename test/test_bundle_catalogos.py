@@ -0,0 +1,158 @@
+"""
+Bundle de catálogos: negociación de `Accept-Encoding` (Brotli, gzip o sin comprimir),
+ETag por representación, 304 con `If-None-Match` y caché de la URL versionada.
+"""
+
+import gzip
+import json
+import os
+from collections import OrderedDict
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import brotli
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base, SessionLocal, get_db
+import app.models  # noqa: F401  (registra todos los modelos)
+import app.models.catalogs  # noqa: F401
+from app.models.catalogs.cargo_ofrecido import CargoOfrecido
+from app.models.catalogs.ciudad import Ciudad, Departamento
+from app.routes.catalogs import bundle
+from app.services.catalogs import bundle_catalogos_service, cache_catalogos_service
+from app.services.catalogs.bundle_catalogos_service import CACHE_CONTROL_VERSIONADO, elegir_codificacion
+
+
+@pytest.mark.parametrize("accept_encoding,esperada", [
+    ("gzip, deflate, br", "br"),
+    ("gzip", "gzip"),
+    ("br;q=0, gzip;q=0.5", "gzip"),
+    ("*", "br"),
+    ("*;q=0", None),
+    ("identity", None),
+    ("gzip;q=abc", None),
+    (None, None),
+])
+def test_elegir_codificacion(accept_encoding, esperada):
+    assert elegir_codificacion(accept_encoding) == esperada
+
+
+@pytest.fixture
+def motor(monkeypatch):
+    """Base SQLite en memoria con algunos catálogos, y cachés de catálogos y bundle vacías."""
+    monkeypatch.setattr(cache_catalogos_service, "_entradas", OrderedDict())
+    monkeypatch.setattr(bundle_catalogos_service, "_bundle", None)
+    motor = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(motor)
+
+    db = SessionLocal(bind=motor)
+    departamento = Departamento(nombre_departamento="Antioquia")
+    db.add(departamento)
+    db.flush()
+    db.add_all([
+        Ciudad(nombre_ciudad="Medellín", id_departamento=departamento.id_departamento),
+        CargoOfrecido(nombre_cargo="Desarrollador"),
+    ])
+    db.commit()
+    db.close()
+    yield motor
+    motor.dispose()
+
+
+@pytest.fixture
+def cliente(motor):
+    app = FastAPI()
+    app.include_router(bundle.router)
+
+    def _get_db():
+        db = SessionLocal(bind=motor)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = _get_db
+    return TestClient(app)
+
+
+def pedir(cliente, accept_encoding="identity", **encabezados):
+    # `stream` evita que el cliente descomprima el cuerpo: se compara lo que envió el servidor
+    with cliente.stream(
+        "GET", "/catalogos/bundle", params=encabezados.pop("params", None),
+        headers={"Accept-Encoding": accept_encoding, **encabezados},
+    ) as respuesta:
+        respuesta.contenido = b"".join(respuesta.iter_raw())
+    return respuesta
+
+
+def test_sin_compresion_sirve_el_json_con_su_version(cliente):
+    respuesta = pedir(cliente)
+
+    documento = json.loads(respuesta.contenido)
+    version = respuesta.headers["X-Catalogos-Version"]
+    assert respuesta.status_code == 200
+    assert "Content-Encoding" not in respuesta.headers
+    assert respuesta.headers["ETag"] == f'"{version}"'
+    assert respuesta.headers["Vary"] == "Accept-Encoding"
+    assert documento["version"] == version
+    assert [c["nombre_cargo"] for c in documento["catalogos"]["cargos_ofrecidos"]] == ["Desarrollador"]
+    assert documento["catalogos"]["herramientas"] == []
+
+
+@pytest.mark.parametrize("accept_encoding,codificacion,descomprimir", [
+    ("gzip, br", "br", brotli.decompress),
+    ("gzip", "gzip", gzip.decompress),
+])
+def test_sirve_la_representacion_comprimida_con_su_propio_etag(
+    cliente, accept_encoding, codificacion, descomprimir
+):
+    plano = pedir(cliente)
+    respuesta = pedir(cliente, accept_encoding)
+
+    version = plano.headers["X-Catalogos-Version"]
+    assert respuesta.headers["Content-Encoding"] == codificacion
+    assert respuesta.headers["ETag"] == f'"{version}-{codificacion}"'
+    assert descomprimir(respuesta.contenido) == plano.contenido
+
+
+@pytest.mark.parametrize("if_none_match", ["{plano}", "{gzip}", "W/{br}", '"otro", {br}', "*"])
+def test_if_none_match_de_cualquier_representacion_responde_304(cliente, if_none_match):
+    version = pedir(cliente).headers["X-Catalogos-Version"]
+    etags = {"plano": f'"{version}"', "gzip": f'"{version}-gzip"', "br": f'"{version}-br"'}
+
+    respuesta = pedir(cliente, "gzip", **{"If-None-Match": if_none_match.format(**etags)})
+
+    assert respuesta.status_code == 304
+    assert respuesta.contenido == b""
+    assert respuesta.headers["ETag"] == f'"{version}-gzip"'
+
+
+def test_etag_de_otra_version_no_responde_304(cliente):
+    assert pedir(cliente, **{"If-None-Match": '"0000000000000000"'}).status_code == 200
+
+
+def test_solo_la_url_de_la_version_vigente_es_inmutable(cliente):
+    version = pedir(cliente).headers["X-Catalogos-Version"]
+
+    assert pedir(cliente, params={"v": version}).headers["Cache-Control"] == CACHE_CONTROL_VERSIONADO
+    assert pedir(cliente, params={"v": "vieja"}).headers["Cache-Control"] == "no-cache"
+    assert pedir(cliente).headers["Cache-Control"] == "no-cache"
+
+
+def test_la_version_cambia_cuando_cambia_un_catalogo(cliente, motor):
+    antes = pedir(cliente).headers["X-Catalogos-Version"]
+
+    db = SessionLocal(bind=motor)
+    db.add(CargoOfrecido(nombre_cargo="Analista"))
+    db.commit()
+    db.close()
+    despues = pedir(cliente)
+
+    assert despues.headers["X-Catalogos-Version"] != antes
+    assert pedir(cliente, **{"If-None-Match": f'"{antes}"'}).status_code == 200
@@ -0,0 +1,137 @@
+"""
+Middleware de idempotencia: repetición de la respuesta original, 409 mientras la
+solicitud original sigue en curso, 422 si la clave se reutiliza con otra solicitud
+y liberación de la clave cuando la respuesta es 5xx.
+"""
+
+import hashlib
+import os
+from datetime import datetime, timedelta
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base, SessionLocal, engine
+from app.core.idempotencia import ENCABEZADO_IDEMPOTENCIA, ENCABEZADO_REPETIDA, IdempotenciaMiddleware
+import app.models  # noqa: F401  (registra todos los modelos)
+import app.models.catalogs  # noqa: F401
+from app.models.clave_idempotencia_model import ClaveIdempotencia
+from app.services.idempotencia_service import IDEMPOTENCIA_RESERVA_MINUTOS, reservar_clave
+
+# Hash que calcula el middleware para el cuerpo `{}` que envía `post`
+HASH_CUERPO_VACIO = hashlib.sha256(b"{}").hexdigest()
+
+
+@pytest.fixture
+def motor():
+    """Base SQLite en memoria compartida por todas las conexiones (StaticPool)."""
+    motor = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(motor)
+    # El middleware abre sus propias sesiones con SessionLocal
+    SessionLocal.configure(bind=motor)
+    yield motor
+    SessionLocal.configure(bind=engine)
+    motor.dispose()
+
+
+@pytest.fixture
+def llamadas():
+    return []
+
+
+@pytest.fixture
+def cliente(motor, llamadas):
+    """Aplicación mínima con el middleware: un endpoint que crea y otro que falla una vez."""
+    app = FastAPI()
+    app.add_middleware(IdempotenciaMiddleware)
+
+    @app.post("/recursos", status_code=201)
+    def crear_recurso(cuerpo: dict):
+        llamadas.append(cuerpo)
+        return {"id": len(llamadas), **cuerpo}
+
+    @app.post("/inestable")
+    def crear_inestable():
+        llamadas.append("inestable")
+        if len(llamadas) == 1:
+            return JSONResponse(status_code=503, content={"detail": "No disponible"})
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def post(cliente, ruta, cuerpo=None, clave="clave-1"):
+    return cliente.post(ruta, json=cuerpo or {}, headers={ENCABEZADO_IDEMPOTENCIA: clave})
+
+
+def test_reintento_recibe_la_respuesta_original_sin_ejecutar_el_endpoint(cliente, llamadas):
+    primera = post(cliente, "/recursos", {"nombre": "a"})
+    segunda = post(cliente, "/recursos", {"nombre": "a"})
+
+    assert primera.status_code == segunda.status_code == 201
+    assert segunda.json() == primera.json() == {"id": 1, "nombre": "a"}
+    assert segunda.headers[ENCABEZADO_REPETIDA] == "true"
+    assert ENCABEZADO_REPETIDA not in primera.headers
+    assert len(llamadas) == 1
+
+
+def test_sin_encabezado_no_aplica(cliente, llamadas):
+    for _ in range(2):
+        assert cliente.post("/recursos", json={"nombre": "a"}).status_code == 201
+    assert len(llamadas) == 2
+
+
+def test_solicitud_en_curso_responde_409(cliente, motor, llamadas):
+    with SessionLocal() as db:
+        reservada, _ = reservar_clave(db, "clave-1", "POST /recursos", HASH_CUERPO_VACIO)
+    assert reservada
+
+    respuesta = post(cliente, "/recursos")
+
+    assert respuesta.status_code == 409
+    assert llamadas == []
+
+
+def test_reserva_abandonada_se_retoma(cliente, motor, llamadas):
+    with SessionLocal() as db:
+        reservar_clave(db, "clave-1", "POST /recursos", HASH_CUERPO_VACIO)
+        db.query(ClaveIdempotencia).update({
+            "fecha_creacion": datetime.now() - timedelta(minutes=IDEMPOTENCIA_RESERVA_MINUTOS + 1)
+        })
+        db.commit()
+
+    respuesta = post(cliente, "/recursos")
+
+    assert respuesta.status_code == 201
+    assert len(llamadas) == 1
+
+
+@pytest.mark.parametrize("ruta,cuerpo", [("/recursos", {"nombre": "b"}), ("/inestable", None)])
+def test_clave_reutilizada_con_otra_solicitud_responde_422(cliente, llamadas, ruta, cuerpo):
+    assert post(cliente, "/recursos", {"nombre": "a"}).status_code == 201
+
+    respuesta = post(cliente, ruta, cuerpo)
+
+    assert respuesta.status_code == 422
+    assert len(llamadas) == 1
+
+
+def test_respuesta_5xx_libera_la_clave(cliente, motor, llamadas):
+    fallida = post(cliente, "/inestable")
+    with SessionLocal() as db:
+        assert db.get(ClaveIdempotencia, "clave-1") is None
+
+    reintento = post(cliente, "/inestable")
+    repetida = post(cliente, "/inestable")
+
+    assert (fallida.status_code, reintento.status_code) == (503, 200)
+    assert repetida.headers[ENCABEZADO_REPETIDA] == "true"
+    assert llamadas == ["inestable", "inestable"]
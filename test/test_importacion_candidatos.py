@@ -0,0 +1,159 @@
+"""
+Importación masiva de candidatos: validación por fila, resolución de catálogos,
+duplicados (en el archivo y ya registrados) y fusión parcial de las filas válidas.
+
+Corre sobre SQLite en memoria; allí `copiar_filas` usa `executemany` en lugar de `COPY`.
+"""
+
+import io
+import os
+from datetime import date
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base, SessionLocal
+import app.models  # noqa: F401  (registra todos los modelos)
+import app.models.catalogs  # noqa: F401
+from app.models.candidato_model import Candidato
+from app.models.catalogs.cargo_ofrecido import CargoOfrecido
+from app.models.catalogs.ciudad import Ciudad, Departamento
+from app.models.catalogs.nivel_educacion import NivelEducacion
+from app.models.catalogs.nivel_ingles import NivelIngles
+from app.models.conocimientos_model import CandidatoConocimiento, HabilidadTecnica
+from app.models.educacion_model import Educacion
+from app.models.importacion_model import StagingCandidato, StagingConocimiento
+from app.services.importacion_candidatos_service import convertir_fila, importar_candidatos
+
+CABECERA = (
+    "Nombre completo,Correo electrónico,CC,Fecha nacimiento,Teléfono,Ciudad,Cargo,"
+    "Nivel educacion,Nivel ingles,Habilidades tecnicas"
+)
+
+
+@pytest.fixture
+def db():
+    """Sesión sobre una base SQLite en memoria (StaticPool) con catálogos y un candidato existente."""
+    motor = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(motor)
+
+    sesion = SessionLocal(bind=motor)
+    departamento = Departamento(nombre_departamento="Antioquia")
+    sesion.add(departamento)
+    sesion.flush()
+    sesion.add_all([
+        Ciudad(nombre_ciudad="Medellín", id_departamento=departamento.id_departamento),
+        CargoOfrecido(nombre_cargo="Desarrollador"),
+        NivelEducacion(descripcion_nivel="Pregrado"),
+        NivelIngles(nivel="B2"),
+        HabilidadTecnica(nombre_habilidad_tecnica="Python"),
+    ])
+    sesion.flush()
+    sesion.add(Candidato(
+        nombre_completo="Carlos Ruiz", correo_electronico="carlos@correo.com", cc="100000001",
+        fecha_nacimiento=date(1990, 1, 1), telefono="3000000001", id_ciudad=1, id_cargo=1,
+        trabaja_actualmente_joyco=False, ha_trabajado_joyco=False, tiene_referido=False,
+    ))
+    sesion.commit()
+    yield sesion
+    sesion.close()
+    motor.dispose()
+
+
+def importar(db, *filas, nombre_archivo="candidatos.csv"):
+    contenido = "\n".join((CABECERA, *filas)).encode("utf-8")
+    return importar_candidatos(db, io.BytesIO(contenido), nombre_archivo)
+
+
+def errores_por_fila(resultado):
+    return {f.fila: f.errores for f in resultado.filas_invalidas}
+
+
+def test_convertir_fila_valida_formatos_y_obligatorios():
+    fila, conocimientos = convertir_fila("imp", 2, {
+        "nombre_completo": "Ana Perez", "correo_electronico": "ana@correo.com", "cc": "12ab",
+        "fecha_nacimiento": "05/05/1995", "telefono": 3001234567.0, "ciudad": "Medellín",
+        "tiene_referido": "sí", "ha_trabajado_joyco": "tal vez",
+        "habilidades_tecnicas": "Python; SQL;Python",
+    })
+
+    assert fila["fecha_nacimiento"] == date(1995, 5, 5)
+    assert fila["telefono"] == "3001234567"
+    assert fila["tiene_referido"] is True
+    errores = fila["errores"].split("; ")
+    assert "cargo: es obligatorio" in errores
+    assert "ha_trabajado_joyco: valor booleano inválido" in errores
+    assert any(e.startswith("cc: ") for e in errores)
+    assert [c["nombre"] for c in conocimientos] == ["Python", "SQL"]
+
+
+def test_importa_las_filas_validas_y_reporta_las_invalidas(db):
+    resultado = importar(
+        db,
+        "Ana Perez,ana@correo.com,200000001,1995-05-05,3001234567,medellín,DESARROLLADOR,Pregrado,b2,Python",
+        "Luis Gomez,luis@correo.com,12ab,1995-05-05,123,Medellín,Desarrollador,,,",
+        "Marta Diaz,marta@correo.com,200000003,1995-05-05,3001234569,Gotham,Desarrollador,,,",
+        "Ana Repetida,otra@correo.com,200000001,1995-05-05,3001234570,Medellín,Desarrollador,,,",
+        "Pedro Ruiz,pedro@correo.com,100000001,1995-05-05,3001234571,Medellín,Desarrollador,,,",
+        "Sara Mora,sara@correo.com,200000006,1995-05-05,3001234572,Medellín,Desarrollador,,,Cobol",
+    )
+
+    assert (resultado.total_filas, resultado.importados, resultado.invalidas) == (6, 1, 5)
+    errores = errores_por_fila(resultado)
+    assert set(errores) == {3, 4, 5, 6, 7}
+    assert {e.split(":")[0] for e in errores[3]} == {"cc", "telefono"}
+    assert errores[4] == ["ciudad: no existe en el catálogo 'Gotham'"]
+    assert errores[5] == ["cc: repetida en el archivo"]
+    assert errores[6] == ["cc: la cédula ya está registrada"]
+    assert errores[7] == ["conocimiento no existe en el catálogo: 'Cobol'"]
+
+
+def test_fusiona_la_fila_valida_con_sus_tablas_hijas(db):
+    importar(
+        db,
+        "Ana Perez,ana@correo.com,200000001,1995-05-05,3001234567,medellín,DESARROLLADOR,Pregrado,b2,Python",
+        "Marta Diaz,marta@correo.com,200000003,1995-05-05,3001234569,Gotham,Desarrollador,,,",
+    )
+
+    ana = db.scalars(select(Candidato).where(Candidato.cc == "200000001")).one()
+    assert (ana.id_ciudad, ana.id_cargo, ana.formulario_completo) == (1, 1, True)
+    assert db.scalar(select(func.count()).select_from(Candidato)) == 2
+
+    educacion = db.scalars(select(Educacion).where(Educacion.id_candidato == ana.id_candidato)).one()
+    assert (educacion.id_nivel_educacion, educacion.id_nivel_ingles) == (1, 1)
+    conocimiento = db.scalars(
+        select(CandidatoConocimiento).where(CandidatoConocimiento.id_candidato == ana.id_candidato)
+    ).one()
+    assert (conocimiento.tipo_conocimiento, conocimiento.id_habilidad_tecnica) == ("tecnica", 1)
+
+    for modelo in (StagingCandidato, StagingConocimiento):
+        assert db.scalar(select(func.count()).select_from(modelo)) == 0
+
+
+def test_el_duplicado_dentro_del_archivo_conserva_la_primera_aparicion(db):
+    resultado = importar(
+        db,
+        "Ana Perez,ana@correo.com,200000001,1995-05-05,3001234567,Medellín,Desarrollador,,,",
+        "Ana Perez,ana@correo.com,200000002,1995-05-05,3001234568,Medellín,Desarrollador,,,",
+    )
+
+    assert resultado.importados == 1
+    assert errores_por_fila(resultado) == {3: ["correo_electronico: repetido en el archivo"]}
+
+
+@pytest.mark.parametrize("nombre_archivo,contenido", [
+    ("candidatos.txt", CABECERA),
+    ("candidatos.csv", "nombre_completo,cc"),
+    ("candidatos.csv", CABECERA),
+])
+def test_rechaza_archivos_sin_formato_columnas_o_filas(db, nombre_archivo, contenido):
+    with pytest.raises(HTTPException) as error:
+        importar_candidatos(db, io.BytesIO(contenido.encode("utf-8")), nombre_archivo)
+
+    assert error.value.status_code == 400
@@ -0,0 +1,161 @@
+"""
+Cuenta las sentencias SQL que ejecuta cada endpoint de escritura.
+
+Con `expire_on_commit=False` los objetos siguen cargados después del commit, así que
+serializar la respuesta no vuelve a consultar la fila recién escrita. Las pruebas
+comparan el conteo contra la configuración anterior (expirar al hacer commit), que
+obligaba a un SELECT adicional por escritura.
+"""
+
+import os
+import re
+from contextlib import contextmanager
+from datetime import date
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base, SessionLocal, get_db
+import app.models  # noqa: F401  (registra todos los modelos)
+import app.models.catalogs  # noqa: F401
+from app.models.candidato_model import Candidato
+from app.models.catalogs.cargo_ofrecido import CargoOfrecido
+from app.models.catalogs.ciudad import Ciudad, Departamento
+from app.models.catalogs.nivel_educacion import NivelEducacion
+from app.models.catalogs.nivel_ingles import NivelIngles
+from app.models.educacion_model import Educacion
+from app.models.preferencias import Disponibilidad
+from app.routes import candidato_route, educacion_route, solicitudes_eliminacion_route
+from app.routes.catalogs import disponibilidad
+
+# (método, ruta, cuerpo, tabla escrita)
+ENDPOINTS_ESCRITURA = [
+    ("post", "/candidatos/", {
+        "nombre_completo": "Ana Perez", "correo_electronico": "ana@correo.com", "cc": "123456789",
+        "fecha_nacimiento": "1995-05-05", "telefono": "3001234567", "id_ciudad": 1, "id_cargo": 1,
+        "trabaja_actualmente_joyco": False, "ha_trabajado_joyco": False, "tiene_referido": False,
+        "acepta_politica_datos": True,
+    }, "candidatos"),
+    ("put", "/candidatos/1", {"descripcion_perfil": "Perfil actualizado"}, "candidatos"),
+    ("put", "/candidatos/1/completar", None, "candidatos"),
+    ("put", "/educaciones/1", {"anio_graduacion": 2015}, "educacion"),
+    ("post", "/solicitudes-eliminacion/", {
+        "nombre_completo": "Luis Gomez", "cc": "987654321", "correo": "luis@correo.com",
+        "motivo": "Otro",
+    }, "solicitudes_eliminacion"),
+    ("post", "/disponibilidades/", {"descripcion_disponibilidad": "Un mes"}, "disponibilidad"),
+    ("put", "/disponibilidades/1", {"descripcion_disponibilidad": "Inmediata (actualizada)"}, "disponibilidad"),
+]
+
+
+def crear_motor():
+    """Base SQLite en memoria compartida por todas las conexiones (StaticPool), con datos mínimos."""
+    motor = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(motor)
+
+    db = SessionLocal(bind=motor)
+    departamento = Departamento(nombre_departamento="Antioquia")
+    db.add(departamento)
+    db.flush()
+    db.add_all([
+        Ciudad(nombre_ciudad="Medellín", id_departamento=departamento.id_departamento),
+        CargoOfrecido(nombre_cargo="Desarrollador"),
+        NivelEducacion(descripcion_nivel="Pregrado"),
+        NivelIngles(nivel="B2"),
+        Disponibilidad(descripcion_disponibilidad="Inmediata"),
+    ])
+    db.flush()
+    db.add(Candidato(
+        nombre_completo="Carlos Ruiz", correo_electronico="carlos@correo.com", cc="100000001",
+        fecha_nacimiento=date(1990, 1, 1), telefono="3000000001", id_ciudad=1, id_cargo=1,
+        trabaja_actualmente_joyco=False, ha_trabajado_joyco=False, tiene_referido=False,
+    ))
+    db.flush()
+    db.add(Educacion(id_candidato=1, id_nivel_educacion=1, id_nivel_ingles=1, anio_graduacion=2012))
+    db.commit()
+    db.close()
+    return motor
+
+
+@pytest.fixture
+def cliente():
+    app = FastAPI()
+    for router in (candidato_route.router, educacion_route.router,
+                   solicitudes_eliminacion_route.router, disponibilidad.router):
+        app.include_router(router)
+    yield TestClient(app)
+    SessionLocal.configure(expire_on_commit=False)
+
+
+@contextmanager
+def capturar_sentencias(motor):
+    """Registra el SQL de cada sentencia ejecutada dentro del bloque."""
+    sentencias = []
+
+    def _registrar(conn, cursor, statement, parameters, context, executemany):
+        sentencias.append(statement)
+
+    event.listen(motor, "before_cursor_execute", _registrar)
+    try:
+        yield sentencias
+    finally:
+        event.remove(motor, "before_cursor_execute", _registrar)
+
+
+def ejecutar(cliente, metodo, ruta, cuerpo, expire_on_commit):
+    """Ejecuta el endpoint sobre una base nueva con la configuración de sesión indicada y retorna su SQL."""
+    motor = crear_motor()
+    SessionLocal.configure(expire_on_commit=expire_on_commit)
+
+    def _get_db():
+        db = SessionLocal(bind=motor)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    cliente.app.dependency_overrides[get_db] = _get_db
+    try:
+        with capturar_sentencias(motor) as sentencias:
+            respuesta = getattr(cliente, metodo)(ruta, json=cuerpo)
+    finally:
+        motor.dispose()
+    assert respuesta.status_code < 300, respuesta.text
+    return sentencias
+
+
+def _es_select_de(sentencia: str, tabla: str) -> bool:
+    return bool(re.match(rf"\s*SELECT\b.*\bFROM {tabla}\b", sentencia, re.S | re.I))
+
+
+def _es_escritura_de(sentencia: str, tabla: str) -> bool:
+    return bool(re.match(rf"\s*(INSERT INTO|UPDATE) {tabla}\b", sentencia, re.I))
+
+
+@pytest.mark.parametrize("metodo,ruta,cuerpo,tabla", ENDPOINTS_ESCRITURA)
+def test_no_relee_la_fila_despues_de_escribir(cliente, metodo, ruta, cuerpo, tabla):
+    sentencias = ejecutar(cliente, metodo, ruta, cuerpo, expire_on_commit=False)
+
+    escrituras = [i for i, s in enumerate(sentencias) if _es_escritura_de(s, tabla)]
+    assert escrituras, f"No se ejecutó ninguna escritura sobre {tabla}"
+    posteriores = sentencias[escrituras[-1] + 1:]
+    assert not [s for s in posteriores if _es_select_de(s, tabla)]
+
+
+@pytest.mark.parametrize("metodo,ruta,cuerpo,tabla", ENDPOINTS_ESCRITURA)
+def test_ahorra_una_sentencia_por_escritura(cliente, metodo, ruta, cuerpo, tabla):
+    antes = ejecutar(cliente, metodo, ruta, cuerpo, expire_on_commit=True)
+    despues = ejecutar(cliente, metodo, ruta, cuerpo, expire_on_commit=False)
+
+    assert len(despues) == len(antes) - 1
+
+
+def test_sesion_no_expira_al_hacer_commit():
+    assert SessionLocal.kw["expire_on_commit"] is False
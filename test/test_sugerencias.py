@@ -0,0 +1,117 @@
+"""
+Autocompletado de catálogos: coincidencia sin tildes ni mayúsculas, por prefijo del
+nombre completo o de cada palabra, y orden de relevancia.
+"""
+
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base, SessionLocal
+import app.models  # noqa: F401  (registra todos los modelos)
+import app.models.catalogs  # noqa: F401
+from app.models.catalogs.instituciones import InstitucionAcademica
+from app.services.catalogs import sugerencias_service
+from app.services.catalogs.sugerencias_service import IndiceSugerencias, normalizar_texto, sugerir
+
+INSTITUCIONES = [
+    (1, "Universidad Nacional de Colombia", None),
+    (2, "Universidad de Antioquia", None),
+    (3, "Nacional de Aprendizaje", None),
+    (4, "Politécnico Colombiano Jaime Isaza Cadavid", None),
+    (5, "Institución Universitaria Colegio Mayor de Antioquia", None),
+]
+
+
+def ids(filas):
+    return [fila[0] for fila in filas]
+
+
+@pytest.fixture
+def indice():
+    return IndiceSugerencias(INSTITUCIONES)
+
+
+def test_normalizar_texto_quita_tildes_mayusculas_y_signos():
+    assert normalizar_texto("  Politécnico  JAIME-Isaza ") == "politecnico jaime isaza"
+    assert normalizar_texto(None) == ""
+
+
+@pytest.mark.parametrize("consulta,esperados", [
+    ("POLITECNICO", [4]),
+    ("politécnico", [4]),
+    ("nac col", [1]),
+    ("col nac", [1]),
+    ("antioq", [2, 5]),
+    ("xyz", []),
+    ("  ", []),
+])
+def test_coincide_sin_tildes_por_prefijo_de_cada_palabra(indice, consulta, esperados):
+    assert ids(indice.buscar(consulta, 10)) == esperados
+
+
+def test_prefijo_del_nombre_completo_va_antes_que_prefijo_de_palabra(indice):
+    # 'Nacional de Aprendizaje' empieza por la consulta; la Nacional de Colombia solo la contiene
+    assert ids(indice.buscar("nacional", 10)) == [3, 1]
+
+
+def test_dentro_de_cada_grupo_los_nombres_mas_cortos_primero(indice):
+    assert ids(indice.buscar("universi", 10)) == [2, 1, 5]
+
+
+def test_respeta_el_limite(indice):
+    assert ids(indice.buscar("universi", 2)) == [2, 1]
+
+
+def test_actualizar_aplica_solo_los_cambios_sin_modificar_el_indice_original(indice, monkeypatch):
+    monkeypatch.setattr(sugerencias_service, "FRACCION_RECONSTRUCCION", 1)
+    filas = [fila for fila in INSTITUCIONES if fila[0] != 3]
+    filas[0] = (1, "Universidad Nacional Abierta", None)
+    filas.append((6, "Nacional de Colombia", None))
+
+    actualizado = indice.actualizado(filas)
+
+    assert ids(actualizado.buscar("nacional", 10)) == [6, 1]
+    assert ids(actualizado.buscar("nac col", 10)) == [6]
+    assert ids(actualizado.buscar("nacional", 10)) == ids(IndiceSugerencias(filas).buscar("nacional", 10))
+    assert ids(indice.buscar("nacional", 10)) == [3, 1]
+    assert indice.actualizado(INSTITUCIONES) is indice
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """Sesión sobre SQLite en memoria, con los índices de sugerencias vacíos."""
+    monkeypatch.setattr(sugerencias_service, "_indices", {})
+    motor = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(motor)
+    sesion = SessionLocal(bind=motor)
+    sesion.add_all([InstitucionAcademica(nombre_institucion=nombre) for _, nombre, _ in INSTITUCIONES])
+    sesion.commit()
+    yield sesion
+    sesion.close()
+    motor.dispose()
+
+
+def test_el_indice_se_reconstruye_cuando_cambia_el_catalogo(db):
+    assert [s.nombre for s in sugerir(db, "instituciones", "nac")] == [
+        "Nacional de Aprendizaje", "Universidad Nacional de Colombia",
+    ]
+
+    db.add(InstitucionAcademica(nombre_institucion="Nacional"))
+    db.commit()
+
+    assert sugerir(db, "instituciones", "nac")[0].nombre == "Nacional"
+
+
+def test_catalogo_sin_sugerencias_responde_404(db):
+    with pytest.raises(HTTPException) as error:
+        sugerir(db, "departamentos", "ant")
+
+    assert error.value.status_code == 404